@@ -0,0 +1,198 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Binding a parameterized circuit to many sets of values at once."""
+
+import copy
+
+import numpy as np
+
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.parameter import Parameter
+from qiskit.circuit.parameterexpression import ParameterExpression, _lambdify
+
+
+class BatchBinder:
+    """Bind a parameterized circuit to each row of a 2D array of values.
+
+    The position of every parameter expression in the circuit (the parameters of its operations
+    and its global phase) is recorded once, and the expressions are compiled into a single
+    vectorized function.  Each bound circuit is built by replacing only the parameterized
+    operations of the circuit; the other operations are shared with it.
+
+    Args:
+        circuit (QuantumCircuit): The parameterized circuit.
+        parameters (Sequence[Parameter]): The parameters of the columns of the values, which must
+            include all the parameters of ``circuit``.
+    """
+
+    def __init__(self, circuit, parameters):
+        # pylint: disable=cyclic-import
+        from qiskit.circuit.quantumcircuit import QuantumCircuit
+
+        self.circuit = circuit
+        self._parameter_indices = {param: i for i, param in enumerate(parameters)}
+
+        # The slots of the parameter expressions, as (instruction index, parameter index) pairs,
+        # with the global phase as (None, None).
+        self._slots = []
+        expressions = []
+        self._fast = not _has_parameterized_calibrations(circuit)
+        for index, instruction in enumerate(circuit.data):
+            operation = instruction.operation
+            for param_index, param in enumerate(operation.params):
+                if isinstance(param, ParameterExpression) and param.parameters:
+                    self._slots.append((index, param_index))
+                    expressions.append(param)
+                    if not _has_derived_definition(operation):
+                        self._fast = False
+                elif isinstance(param, QuantumCircuit) and param.parameters:
+                    self._fast = False
+        global_phase = circuit.global_phase
+        if isinstance(global_phase, ParameterExpression) and global_phase.parameters:
+            self._slots.append((None, None))
+            expressions.append(global_phase)
+        self._evaluate = _vectorize(expressions, self._parameter_indices)
+
+        # The slots of each parameterized instruction.
+        self._instruction_slots = {}
+        for slot, (index, param_index) in enumerate(self._slots):
+            if index is not None:
+                self._instruction_slots.setdefault(index, []).append((param_index, slot))
+
+    def bind_iter(self, values):
+        """Bind the circuit to each row of the 2D array ``values``, lazily.
+
+        The values of all the bindings are evaluated eagerly, so invalid values raise from this
+        call rather than from the first iteration.
+
+        Raises:
+            CircuitError: if a parameter of an operation evaluates to a complex number.
+        """
+        if len(values) == 0:
+            return iter([])
+        if not self._fast:
+            return self._assign_iter(values)
+        slot_values = self._evaluate(values)
+        if np.iscomplexobj(slot_values):
+            phase_slot = len(self._slots) - 1 if self._slots[-1:] == [(None, None)] else None
+            imaginary = np.abs(slot_values.imag) > 1e-10
+            if phase_slot is not None:
+                imaginary[:, phase_slot] = False
+            if imaginary.any():
+                raise CircuitError("Bound parameter expression is complex.")
+            slot_values = slot_values.real
+        return self._bind_iter(slot_values.tolist())
+
+    def _assign_iter(self, values):
+        present = set(self.circuit.parameters)
+        for row in values:
+            yield self.circuit.assign_parameters(
+                {
+                    param: value
+                    for param, value in zip(self._parameter_indices, row.tolist())
+                    if param in present
+                }
+            )
+
+    def _bind_iter(self, slot_values):
+        # pylint: disable=cyclic-import
+        from qiskit.circuit.quantumcircuit import QuantumCircuit
+
+        template = self.circuit
+        data = template._data
+        global_phase_slot = len(self._slots) - 1 if self._slots[-1:] == [(None, None)] else None
+        for row in slot_values:
+            bound = template.copy_empty_like()
+            QuantumCircuit._increment_instances()
+            bound._name_update()
+            bound._parameters = None
+            bound_data = data.copy()
+            for index, slots in self._instruction_slots.items():
+                instruction = data[index]
+                operation = _copy_with_params(instruction.operation)
+                params = operation.params
+                for param_index, slot in slots:
+                    params[param_index] = operation.validate_parameter(row[slot])
+                bound_data[index] = instruction.replace(operation=operation)
+            bound._data = bound_data
+            if global_phase_slot is not None:
+                bound.global_phase = row[global_phase_slot]
+            yield bound
+
+
+def _has_derived_definition(operation):
+    """Whether the definition of ``operation`` (and of its base gate, for controlled gates) is
+    rebuilt from its parameters when it is reset."""
+    if operation._definition is not None and not type(operation).__module__.startswith(
+        "qiskit.circuit.library.standard_gates"
+    ):
+        return False
+    base_gate = getattr(operation, "base_gate", None)
+    return base_gate is None or _has_derived_definition(base_gate)
+
+
+def _copy_with_params(operation):
+    """Copy ``operation`` with its own list of parameters and without its derived definition.
+
+    The parameters of a controlled gate are those of its base gate, which is copied as well."""
+    operation = copy.copy(operation)
+    operation._definition = None
+    base_gate = getattr(operation, "base_gate", None)
+    if base_gate is not None:
+        operation.base_gate = _copy_with_params(base_gate)
+    else:
+        operation._params = operation._params.copy()
+    return operation
+
+
+def _has_parameterized_calibrations(circuit):
+    return any(
+        isinstance(param, ParameterExpression)
+        for calibrations in circuit.calibrations.values()
+        for _, params in calibrations
+        for param in params
+    )
+
+
+def _vectorize(expressions, parameter_indices):
+    """Build a function mapping a 2D array of parameter values to a 2D array of the values of
+    ``expressions``, with one row for each row of parameter values."""
+    # Expressions that are just one of the parameters are evaluated by selecting its column, the
+    # others are compiled like in ParameterExpression.lambdify, which caches them.
+    columns = []
+    symbolic = []
+    for slot, expression in enumerate(expressions):
+        if isinstance(expression, Parameter):
+            columns.append((slot, parameter_indices[expression]))
+        else:
+            params = list(expression._parameter_symbols)
+            function = _lambdify(
+                expression._symbol_expr,
+                tuple(expression._parameter_symbols[param] for param in params),
+            )
+            symbolic.append((slot, function, [parameter_indices[param] for param in params]))
+
+    num_slots = len(expressions)
+    column_slots = np.array([slot for slot, _ in columns], dtype=int)
+    column_indices = np.array([index for _, index in columns], dtype=int)
+
+    def evaluate(values):
+        values = np.asarray(values, dtype=float)
+        results = [function(values[:, indices].T) for _, function, indices in symbolic]
+        out = np.empty((values.shape[0], num_slots), dtype=np.result_type(float, *results))
+        out[:, column_slots] = values[:, column_indices]
+        for (slot, _, _), result in zip(symbolic, results):
+            out[:, slot] = result
+        return out
+
+    return evaluate
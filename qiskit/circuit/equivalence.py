@@ -13,6 +13,7 @@
 """Gate equivalence library."""
 
 from collections import namedtuple
+import uuid
 
 from retworkx.visualization import graphviz_draw
 import retworkx as rx
@@ -42,6 +43,7 @@ class EquivalenceLibrary:
         self._base = base
 
         self._map = {}
+        self._version = uuid.uuid4()
 
     def add_equivalence(self, gate, equivalent_circuit):
         """Add a new equivalence to the library. Future queries for the Gate
@@ -69,6 +71,7 @@ class EquivalenceLibrary:
             self._map[key] = Entry(search_base=True, equivalences=[])
 
         self._map[key].equivalences.append(equiv)
+        self._version = uuid.uuid4()
 
     def has_entry(self, gate):
         """Check if a library contains any decompositions for gate.
@@ -108,6 +111,7 @@ class EquivalenceLibrary:
         equivs = [Equivalence(params=gate.params.copy(), circuit=equiv.copy()) for equiv in entry]
 
         self._map[key] = Entry(search_base=False, equivalences=equivs)
+        self._version = uuid.uuid4()
 
     def get_entry(self, gate):
         """Gets the set of QuantumCircuits circuits from the library which
@@ -197,6 +201,17 @@ class EquivalenceLibrary:
 
         return graph
 
+    def _get_version(self):
+        """Return a hashable token which changes whenever the equivalences of the library, or of
+        its base libraries, are changed.
+
+        The token is kept when the library is copied or pickled, so that the results derived from
+        the library, like the basis searches of the :class:`.BasisTranslator`, can be reused by
+        the copies of the library.
+        """
+        base_version = self._base._get_version() if self._base is not None else None
+        return (self._version, base_version)
+
     def _get_all_keys(self):
         base_keys = self._base._get_all_keys() if self._base is not None else set()
 
@@ -12,8 +12,9 @@
 """
 ParameterExpression Class to enable creating simple expressions of Parameters.
 """
-from typing import Callable, Dict, Set, Union
+from typing import Callable, Dict, Optional, Sequence, Set, Union
 
+import functools
 import numbers
 import operator
 
@@ -191,6 +192,69 @@ class ParameterExpression:
 
         return ParameterExpression(new_parameter_symbols, substituted_symbol_expr)
 
+    def lambdify(self, parameters: Optional[Sequence] = None) -> Callable:
+        """Compile the expression into a numeric function of the values of its parameters.
+
+        The returned function takes one value for each of ``parameters``, in order, and returns
+        the value of the expression.  The values can be NumPy arrays, which are broadcast
+        together, in which case the expression is evaluated for all the elements at once::
+
+            import numpy as np
+            from qiskit.circuit import Parameter
+
+            x, y = Parameter("x"), Parameter("y")
+            evaluate = (2 * x + y.sin()).lambdify([x, y])
+            evaluate(0.5, 0.25)  # a float
+            evaluate(np.linspace(0, 1, 1000), 0.25)  # an array of 1000 floats
+
+        This is much faster than :meth:`bind` when the same expression is evaluated for many
+        values.  The compiled function is cached, so compiling an equal expression again is cheap.
+
+        Args:
+            parameters (Sequence[Parameter]): The parameters of the arguments of the function,
+                which must include all the parameters of the expression.  Parameters that are
+                not in the expression are ignored.  Defaults to the parameters of the expression
+                sorted by name.
+
+        Returns:
+            A function returning a ``float`` (or an array of them) if the values of the
+            expression are real, otherwise a ``complex`` (or an array of them).
+
+        Raises:
+            CircuitError: If the expression contains parameters that are not in ``parameters``.
+        """
+        if parameters is None:
+            parameters = sorted(self.parameters, key=lambda param: param.name)
+        parameters = list(parameters)
+        missing = self.parameters.difference(parameters)
+        if missing:
+            raise CircuitError(
+                f"Cannot compile the expression without the parameters ({[str(p) for p in missing]})"
+            )
+        used = [index for index, param in enumerate(parameters) if param in self._parameters]
+        function = _lambdify(
+            self._symbol_expr, tuple(self._parameter_symbols[parameters[i]] for i in used)
+        )
+        num_parameters = len(parameters)
+
+        def evaluate(*values):
+            if len(values) != num_parameters:
+                raise TypeError(
+                    f"The expression takes {num_parameters} values, but {len(values)} were given."
+                )
+            values = numpy.broadcast_arrays(*(values[i] for i in used), *values)
+            shape = values[0].shape if values else ()
+            arguments = numpy.array(values[: len(used)], dtype=float).reshape(
+                len(used), int(numpy.prod(shape))
+            )
+            result = numpy.broadcast_to(function(arguments), arguments.shape[1:])
+            if numpy.iscomplexobj(result) and not result.imag.any():
+                result = result.real
+            result = result.reshape(shape)
+            return result[()] if not shape else result
+
+        return evaluate
+
     def _raise_if_passed_unknown_parameters(self, parameters):
         unknown_parameters = parameters - self.parameters
         if unknown_parameters:
@@ -543,6 +607,31 @@ class ParameterExpression:
         return self._symbol_expr
 
 
+@functools.lru_cache(maxsize=1024)
+def _lambdify(expr, symbols):
+    """Compile ``expr`` into a function of a 2D array with one row of values for each of
+    ``symbols``, returning an array with one value for each column."""
+    if not symbols:
+        value = complex(expr)
+        return lambda arguments: numpy.full(arguments.shape[1:], value)
+    if _optionals.HAS_SYMENGINE:
+        import symengine
+
+        try:
+            function = symengine.Lambdify(symbols, [expr], real=False)
+            return lambda arguments: function(arguments.T).reshape(arguments.shape[1:])
+        except RuntimeError:
+            # Symengine can't compile some functions to complex arithmetic, so these fall back
+            # to sympy.
+            pass
+    import sympy
+
+    function = sympy.lambdify(
+        [sympy.sympify(symbol) for symbol in symbols], sympy.sympify(expr), modules="numpy"
+    )
+    return lambda arguments: numpy.asarray(function(*arguments), dtype=complex)
+
+
 # Redefine the type so external imports get an evaluated reference; Sphinx needs this to understand
 # the type hints.
 ParameterValueType = Union[ParameterExpression, float]
@@ -59,6 +59,7 @@ from .quantumcircuitdata import QuantumCircuitData, CircuitInstruction
 from .delay import Delay
 from .measure import Measure
 from .reset import Reset
+from ._batch_binding import BatchBinder
 
 try:
     import pygments
@@ -2603,9 +2604,13 @@ class QuantumCircuit:
 
     def assign_parameters(
         self,
-        parameters: Union[Mapping[Parameter, ParameterValueType], Sequence[ParameterValueType]],
+        parameters: Union[
+            Mapping[Parameter, ParameterValueType],
+            Sequence[ParameterValueType],
+            Sequence[Sequence[float]],
+        ],
         inplace: bool = False,
-    ) -> Optional["QuantumCircuit"]:
+    ) -> Optional[Union["QuantumCircuit", List["QuantumCircuit"]]]:
         """Assign parameters to new parameters or values.
 
         If ``parameters`` is passed as a dictionary, the keys must be :class:`.Parameter`
@@ -2618,19 +2623,29 @@ class QuantumCircuit:
 
         The values can be assigned to the current circuit object or to a copy of it.
 
+        If ``parameters`` is passed as a 2D array (or a list of lists) of numeric values, each row
+        is a set of values in the order of :attr:`parameters`, and a list with one bound copy of the
+        circuit for each row is returned.  The position of the parameters in the circuit and the
+        parameter expressions are only processed once for the whole batch, which is much faster
+        than binding each row separately.  The bound circuits share the operations of this circuit
+        that do not depend on the parameters, so these should not be mutated in place.
+
         Args:
-            parameters: Either a dictionary or iterable specifying the new parameter values.
+            parameters: Either a dictionary or iterable specifying the new parameter values, or a
+                2D array of numeric values with one row for each set of values.
             inplace: If False, a copy of the circuit with the bound parameters is returned.
-                If True the circuit instance itself is modified.
+                If True the circuit instance itself is modified.  Must be False if a 2D array
+                of values is given.
 
         Raises:
             CircuitError: If parameters is a dict and contains parameters not present in the
                 circuit.
             ValueError: If parameters is a list/array and the length mismatches the number of free
-                parameters in the circuit.
+                parameters in the circuit, or if it is a 2D array and ``inplace`` is True.
 
         Returns:
-            A copy of the circuit with bound parameters, if ``inplace`` is False, otherwise None.
+            A copy of the circuit with bound parameters, or a list of copies for a 2D array of
+            values, if ``inplace`` is False, otherwise None.
 
         Examples:
 
@@ -2671,7 +2686,33 @@ class QuantumCircuit:
                 print('The original circuit is unchanged:')
                 print(circuit.draw())
 
+            Bind a batch of sets of values at once.
+
+            .. jupyter-execute::
+
+                import numpy as np
+                from qiskit.circuit import QuantumCircuit, ParameterVector
+
+                circuit = QuantumCircuit(2)
+                params = ParameterVector('P', 2)
+                circuit.ry(params[0], 0)
+                circuit.crx(params[1], 0, 1)
+
+                bound_circuits = circuit.assign_parameters(np.random.random((100, 2)))
+                print(bound_circuits[0].draw())
+
         """
+        if _is_batch_of_values(parameters):
+            if inplace:
+                raise ValueError("A batch of parameter values cannot be assigned in place.")
+            values = np.asarray(parameters)
+            if values.ndim != 2 or values.shape[1] != self.num_parameters:
+                raise ValueError(
+                    "Mismatching number of values and parameters. Each row of a batch of values "
+                    f"must have one value for each of the {self.num_parameters} parameters."
+                )
+            return list(BatchBinder(self, self.parameters).bind_iter(values))
+
         # replace in self or in a copy depending on the value of in_place
         if inplace:
             bound_circuit = self
@@ -2715,8 +2756,8 @@ class QuantumCircuit:
         return None if inplace else bound_circuit
 
     def bind_parameters(
-        self, values: Union[Mapping[Parameter, float], Sequence[float]]
-    ) -> "QuantumCircuit":
+        self, values: Union[Mapping[Parameter, float], Sequence[float], Sequence[Sequence[float]]]
+    ) -> Union["QuantumCircuit", List["QuantumCircuit"]]:
         """Assign numeric parameters to values yielding a new circuit.
 
         If the values are given as list or array they are bound to the circuit in the order
@@ -2726,14 +2767,16 @@ class QuantumCircuit:
         circuit, use the :meth:`assign_parameters` method.
 
         Args:
-            values: ``{parameter: value, ...}`` or ``[value1, value2, ...]``
+            values: ``{parameter: value, ...}``, ``[value1, value2, ...]``, or a 2D array of
+                values with one row for each set of values.
 
         Raises:
             CircuitError: If values is a dict and contains parameters not present in the circuit.
             TypeError: If values contains a ParameterExpression.
 
         Returns:
-            Copy of self with assignment substitution.
+            Copy of self with assignment substitution, or a list of copies for a 2D array of
+            values.
         """
         if isinstance(values, dict):
             if any(isinstance(value, ParameterExpression) for value in values.values()):
@@ -4978,7 +5021,11 @@ def _circuit_from_qasm(qasm: Qasm) -> "QuantumCircuit":
     # pylint: disable=cyclic-import
     from qiskit.converters import ast_to_dag
     from qiskit.converters import dag_to_circuit
+    from qiskit.qasm.fastparser import circuit_from_qasm
 
+    circuit = circuit_from_qasm(qasm)
+    if circuit is not None:
+        return circuit
     ast = qasm.parse()
     dag = ast_to_dag(ast)
     return dag_to_circuit(dag)
@@ -4992,6 +5039,15 @@ def _standard_compare(value1, value2):
     return 0
 
 
+def _is_batch_of_values(parameters):
+    """Whether ``parameters`` is a 2D array of values rather than a single set of values."""
+    if isinstance(parameters, np.ndarray):
+        return parameters.ndim == 2
+    if isinstance(parameters, (Mapping, ParameterVector)) or not isinstance(parameters, Sequence):
+        return False
+    return len(parameters) > 0 and isinstance(parameters[0], (Sequence, np.ndarray))
+
+
 def _compare_parameters(param1: Parameter, param2: Parameter) -> int:
     if isinstance(param1, ParameterVectorElement) and isinstance(param2, ParameterVectorElement):
         # if they belong to a vector with the same name, sort by index
@@ -26,11 +26,22 @@ Circuit and Pulse Compilation Functions
    assemble
    schedule
    transpile
+   transpile_iter
+   transpile_template
    sequence
 
+Parameter Binding
+=================
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   TranspiledTemplate
+
 """
 
 from .assembler import assemble
-from .transpiler import transpile
+from .transpiler import transpile, transpile_iter, transpile_template
+from .template import TranspiledTemplate
 from .scheduler import schedule
 from .sequencer import sequence
@@ -0,0 +1,124 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A transpiled parameterized circuit that can be bound to many sets of values."""
+
+from typing import Iterator, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.circuit._batch_binding import BatchBinder
+from qiskit.circuit.exceptions import CircuitError
+
+
+class TranspiledTemplate:
+    """A parameterized circuit that was transpiled once, to be bound to many sets of values.
+
+    When the template is built, the position of every parameter expression in the circuit (the
+    parameters of its operations and its global phase) is recorded, and the expressions are
+    compiled into a single vectorized function.  Binding a 2D array of values then evaluates all
+    the expressions for all the rows at once, and each bound circuit is built by replacing only
+    the parameterized operations of the template, without walking the :class:`.ParameterTable`
+    for each parameter::
+
+        from qiskit.compiler import transpile_template
+
+        template = transpile_template(ansatz, backend=backend, optimization_level=3)
+        bound_circuits = template.bind(np.random.random((1000, ansatz.num_parameters)))
+
+    Bound circuits share the operations of the template that do not depend on the parameters, so
+    these should not be mutated in place.
+
+    Circuits that contain parameterized control-flow blocks, parameterized pulse calibrations or
+    parameterized operations with a custom definition are supported, but are bound by
+    :meth:`.QuantumCircuit.assign_parameters` instead.
+
+    Args:
+        circuit: The transpiled parameterized circuit.
+        parameters: The parameters of the values passed to :meth:`bind`, in order.  This can
+            include parameters that are no longer in ``circuit``, for example because the
+            transpiler optimized away the operations that used them, in which case their values
+            are ignored.  Defaults to ``circuit.parameters``.
+
+    Raises:
+        CircuitError: if ``circuit`` depends on parameters that are not in ``parameters``.
+    """
+
+    def __init__(self, circuit: QuantumCircuit, parameters: Optional[Sequence[Parameter]] = None):
+        self.circuit = circuit
+        self.parameters = list(circuit.parameters if parameters is None else parameters)
+        missing = set(circuit.parameters).difference(self.parameters)
+        if missing:
+            missing = ", ".join(sorted(map(str, missing)))
+            raise CircuitError(
+                f"The circuit depends on parameters ({missing}) that are not in the template "
+                "parameters."
+            )
+        self._parameter_indices = {param: i for i, param in enumerate(self.parameters)}
+        self._binder = BatchBinder(circuit, self.parameters)
+
+    @property
+    def num_parameters(self) -> int:
+        """The number of values of each binding."""
+        return len(self.parameters)
+
+    def _values_array(self, values):
+        if isinstance(values, Mapping):
+            columns = [None] * len(self.parameters)
+            for param, column in values.items():
+                if param not in self._parameter_indices:
+                    raise CircuitError(f"Cannot bind parameter ({param}) not in the template.")
+                columns[self._parameter_indices[param]] = np.atleast_1d(np.asarray(column))
+            unbound = [str(param) for param, col in zip(self.parameters, columns) if col is None]
+            if unbound:
+                raise CircuitError(f"No values given for the parameters ({', '.join(unbound)}).")
+            values = np.column_stack(columns) if columns else np.zeros((1, 0))
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values.reshape(1, -1)
+        if values.ndim != 2 or values.shape[1] != len(self.parameters):
+            raise ValueError(
+                f"Expected an array of shape (num_bindings, {len(self.parameters)}) of parameter "
+                f"values, but got shape {values.shape}."
+            )
+        return values
+
+    def bind(
+        self, values: Union[np.ndarray, Sequence[Sequence[float]], Mapping[Parameter, Sequence]]
+    ) -> List[QuantumCircuit]:
+        """Bind the template to each row of ``values``.
+
+        Args:
+            values: Either a 2D array of shape ``(num_bindings, num_parameters)`` whose columns
+                are in the order of :attr:`parameters`, a 1D array for a single binding, or a
+                mapping from each parameter to a 1D array of its values.
+
+        Returns:
+            One bound circuit for each binding.
+
+        Raises:
+            ValueError: if the shape of ``values`` does not match the parameters.
+            CircuitError: if ``values`` is a mapping that does not contain exactly the template
+                parameters, or if a parameter of an operation evaluates to a complex number.
+        """
+        return list(self.bind_iter(values))
+
+    def bind_iter(
+        self, values: Union[np.ndarray, Sequence[Sequence[float]], Mapping[Parameter, Sequence]]
+    ) -> Iterator[QuantumCircuit]:
+        """Like :meth:`bind`, but build the bound circuits lazily as they are iterated over.
+
+        The values of all the bindings are evaluated eagerly, so invalid input raises from this
+        call rather than from the first iteration.
+        """
+        return self._binder.bind_iter(self._values_array(values))
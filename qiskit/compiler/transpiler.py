@@ -20,12 +20,13 @@ import os
 import pickle
 import sys
 from time import time
-from typing import List, Union, Dict, Callable, Any, Optional, Tuple, Iterable
+from typing import List, Union, Dict, Callable, Any, Optional, Tuple, Iterable, Iterator
 import warnings
 
 from qiskit import user_config
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.quantumregister import Qubit
+from qiskit.compiler.template import TranspiledTemplate
 from qiskit.converters import isinstanceint, isinstancelist, dag_to_circuit, circuit_to_dag
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.providers.backend import Backend
@@ -35,10 +36,12 @@ from qiskit.pulse import Schedule, InstructionScheduleMap
 from qiskit.tools import parallel
 from qiskit.transpiler import Layout, CouplingMap, PropertySet
 from qiskit.transpiler.basepasses import BasePass
+from qiskit.transpiler.cache import get_active_cache
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.instruction_durations import InstructionDurations, InstructionDurationsType
 from qiskit.transpiler.passes import ApplyLayout
 from qiskit.transpiler.passmanager_config import PassManagerConfig
+from qiskit.transpiler.profiler import PassProfiler, get_active_profiler
 from qiskit.transpiler.preset_passmanagers import (
     level_0_pass_manager,
     level_1_pass_manager,
@@ -50,9 +53,8 @@ from qiskit.transpiler.target import Target, target_to_backend_properties
 
 if sys.version_info >= (3, 8):
     from multiprocessing.shared_memory import SharedMemory  # pylint: disable=no-name-in-module
-    from multiprocessing.managers import SharedMemoryManager  # pylint: disable=no-name-in-module
 else:
-    from shared_memory import SharedMemory, SharedMemoryManager
+    from shared_memory import SharedMemory
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +92,9 @@ def transpile(
 
     Transpilation is done in parallel using multiprocessing.
 
+    Inside a :class:`~qiskit.transpiler.TranspileCache` context, circuits that were already
+    transpiled with the same arguments are not compiled again.
+
     Args:
         circuits: Circuit(s) to transpile
         backend: If set, transpiler options are automatically grabbed from
@@ -294,6 +299,129 @@ def transpile(
         else:
             return circuits[0]
 
+    unique_transpile_args, shared_args = _prepare_transpile_args(
+        circuits,
+        backend=backend,
+        basis_gates=basis_gates,
+        inst_map=inst_map,
+        coupling_map=coupling_map,
+        backend_properties=backend_properties,
+        initial_layout=initial_layout,
+        layout_method=layout_method,
+        routing_method=routing_method,
+        translation_method=translation_method,
+        scheduling_method=scheduling_method,
+        instruction_durations=instruction_durations,
+        dt=dt,
+        approximation_degree=approximation_degree,
+        timing_constraints=timing_constraints,
+        seed_transpiler=seed_transpiler,
+        optimization_level=optimization_level,
+        callback=callback,
+        output_name=output_name,
+        unitary_synthesis_method=unitary_synthesis_method,
+        unitary_synthesis_plugin_config=unitary_synthesis_plugin_config,
+        target=target,
+        init_method=init_method,
+        optimization_method=optimization_method,
+    )
+    circuits = list(_transpile_circuits_iter(circuits, unique_transpile_args, shared_args))
+    end_time = time()
+    _log_transpile_time(start_time, end_time)
+
+    if arg_circuits_list:
+        return circuits
+    else:
+        return circuits[0]
+
+
+def transpile_iter(
+    circuits: Iterable[QuantumCircuit], ordered: bool = True, **transpile_args: Any
+) -> Iterator[Union[QuantumCircuit, Tuple[int, QuantumCircuit]]]:
+    """Transpile several circuits, yielding each output circuit as soon as it is available.
+
+    This accepts the same keyword arguments as :func:`.transpile` and produces the same circuits,
+    but rather than waiting for the whole batch to finish it returns an iterator.  When the
+    circuits are transpiled in parallel (see :func:`~qiskit.tools.parallel_imap`), the output
+    circuits become available while the remaining ones are still being compiled.
+
+    The arguments are validated eagerly, so invalid input raises from this call rather than
+    from the first iteration.
+
+    Args:
+        circuits: The circuits to transpile.
+        ordered: If ``True`` (the default), yield the output circuits in the same order as
+            ``circuits``.  If ``False``, yield ``(index, circuit)`` pairs in the order in which
+            the circuits finish compiling, where ``index`` is the position of the input circuit
+            in ``circuits``.
+        transpile_args: Keyword arguments accepted by :func:`.transpile`.  Arguments given as
+            a list must have one entry per circuit.
+
+    Returns:
+        An iterator over the transpiled circuits, or ``(index, circuit)`` pairs if ``ordered``
+        is ``False``.
+
+    Raises:
+        TranspilerError: in case of bad inputs to transpiler (like conflicting parameters)
+            or errors in passes
+    """
+    circuits = list(circuits)
+    if circuits and all(isinstance(c, Schedule) for c in circuits):
+        warnings.warn("Transpiling schedules is not supported yet.", UserWarning)
+        return iter(circuits) if ordered else enumerate(circuits)
+    if not circuits:
+        return iter([])
+    unique_transpile_args, shared_args = _prepare_transpile_args(circuits, **transpile_args)
+    return _transpile_circuits_iter(circuits, unique_transpile_args, shared_args, ordered)
+
+
+def transpile_template(circuit: QuantumCircuit, **transpile_args: Any) -> TranspiledTemplate:
+    """Transpile a parameterized circuit once, into a template that can be bound many times.
+
+    This is the same as ``TranspiledTemplate(transpile(circuit, **transpile_args),
+    circuit.parameters)``, so the values given to :meth:`.TranspiledTemplate.bind` are in the
+    order of the parameters of the input circuit, even if the transpiler removed some of them.
+
+    Args:
+        circuit: The parameterized circuit to transpile.
+        transpile_args: Keyword arguments accepted by :func:`.transpile`.
+
+    Returns:
+        TranspiledTemplate: The template of the transpiled circuit.
+
+    Raises:
+        TranspilerError: in case of bad inputs to transpiler (like conflicting parameters)
+            or errors in passes
+    """
+    return TranspiledTemplate(transpile(circuit, **transpile_args), circuit.parameters)
+
+
+def _prepare_transpile_args(
+    circuits,
+    backend=None,
+    basis_gates=None,
+    inst_map=None,
+    coupling_map=None,
+    backend_properties=None,
+    initial_layout=None,
+    layout_method=None,
+    routing_method=None,
+    translation_method=None,
+    scheduling_method=None,
+    instruction_durations=None,
+    dt=None,
+    approximation_degree=None,
+    timing_constraints=None,
+    seed_transpiler=None,
+    optimization_level=None,
+    callback=None,
+    output_name=None,
+    unitary_synthesis_method="default",
+    unitary_synthesis_plugin_config=None,
+    target=None,
+    init_method=None,
+    optimization_method=None,
+):
     if optimization_level is None:
         # Take optimization level from the configuration or 1 as default.
         config = user_config.get_config()
@@ -343,45 +471,134 @@ def transpile(
     else:
         cmap_conf = [shared_args["coupling_map"]] * len(circuits)
     _check_circuits_coupling_map(circuits, cmap_conf, backend)
+    return unique_transpile_args, shared_args
+
+
+def _transpile_circuits_iter(circuits, unique_transpile_args, shared_args, ordered=True):
+    cache = get_active_cache()
+    if cache is None:
+        yield from _compile_circuits_iter(circuits, unique_transpile_args, shared_args, ordered)
+        return
+
+    shared_fingerprint = cache.shared_fingerprint(shared_args)
+    outputs = {}
+    # Indices of the circuits to compile, and of the later circuits with the same key as each.
+    to_compile = []
+    duplicates = {}
+    compiled_index_of_key = {}
+    keys = []
+    for index, (circuit, unique_args) in enumerate(zip(circuits, unique_transpile_args)):
+        key = cache.key(circuit, unique_args, shared_fingerprint)
+        keys.append(key)
+        if key is not None and key in compiled_index_of_key:
+            duplicates[compiled_index_of_key[key]].append(index)
+            continue
+        output = None
+        if key is not None:
+            output = cache.get(key, circuit, unique_args["output_name"])
+        if output is not None:
+            outputs[index] = output
+            continue
+        to_compile.append(index)
+        if key is not None:
+            compiled_index_of_key[key] = index
+            duplicates[index] = []
+
+    def _finish(compiled_index, output):
+        # Store a compiled circuit and serve the circuits with the same key from the cache.
+        key = keys[compiled_index]
+        if key is not None:
+            cache.put(key, circuits[compiled_index], output)
+            for index in duplicates[compiled_index]:
+                duplicate = cache.get(
+                    key, circuits[index], unique_transpile_args[index]["output_name"]
+                )
+                if duplicate is None:
+                    # The output could not be cached, so compile this one too.
+                    duplicate = next(
+                        _compile_circuits_iter(
+                            [circuits[index]], [unique_transpile_args[index]], shared_args
+                        )
+                    )
+                outputs[index] = duplicate
+
+    compiled = _compile_circuits_iter(
+        [circuits[index] for index in to_compile],
+        [unique_transpile_args[index] for index in to_compile],
+        shared_args,
+        ordered=False,
+    )
+    if ordered:
+        next_index = 0
+        while next_index in outputs:
+            yield outputs.pop(next_index)
+            next_index += 1
+        for position, output in compiled:
+            outputs[to_compile[position]] = output
+            _finish(to_compile[position], output)
+            while next_index in outputs:
+                yield outputs.pop(next_index)
+                next_index += 1
+    else:
+        for index in list(outputs):
+            yield index, outputs.pop(index)
+        for position, output in compiled:
+            index = to_compile[position]
+            _finish(index, output)
+            yield index, output
+            for duplicate in duplicates.get(index, ()):
+                yield duplicate, outputs.pop(duplicate)
+
+
+def _compile_circuits_iter(circuits, unique_transpile_args, shared_args, ordered=True):
     if (
         len(circuits) > 1
         and os.getenv("QISKIT_IN_PARALLEL", "FALSE") == "FALSE"
-        and parallel.PARALLEL_DEFAULT
+        and (parallel.PARALLEL_DEFAULT or parallel.get_worker_pool() is not None)
     ):
-        with SharedMemoryManager() as smm:
-            with io.BytesIO() as buf:
-                pickle.dump(shared_args, buf)
-                data = buf.getvalue()
-            smb = smm.SharedMemory(size=len(data))
+        with io.BytesIO() as buf:
+            pickle.dump(shared_args, buf)
+            data = buf.getvalue()
+        profiler = get_active_profiler()
+        task_kwargs = {} if profiler is None else {"profile": profiler.track_memory}
+        smb = SharedMemory(create=True, size=len(data))
+        try:
             smb.buf[: len(data)] = data[:]
             # Transpile circuits in parallel
-            circuits = parallel.parallel_map(
+            results = parallel.parallel_imap(
                 _transpile_circuit,
-                list(zip(circuits, cycle([smb.name]), unique_transpile_args)),
+                list(zip(circuits, cycle([(smb.name, len(data))]), unique_transpile_args)),
+                task_kwargs=task_kwargs,
+                ordered=ordered,
             )
+            if profiler is None:
+                yield from results
+            else:
+                for result in results:
+                    # Worker processes send back the profile of each circuit with it.
+                    if ordered:
+                        result, report = result
+                    else:
+                        index, (circuit, report) = result
+                        result = (index, circuit)
+                    profiler.report.merge(report)
+                    yield result
+        finally:
+            smb.close()
+            smb.unlink()
     else:
-        output_circuits = []
-        for circuit, unique_args in zip(circuits, unique_transpile_args):
+        for index, (circuit, unique_args) in enumerate(zip(circuits, unique_transpile_args)):
             transpile_config, pass_manager = _combine_args(shared_args, unique_args)
-            output_circuits.append(
-                _serial_transpile_circuit(
-                    circuit,
-                    pass_manager,
-                    transpile_config["callback"],
-                    transpile_config["output_name"],
-                    transpile_config["backend_num_qubits"],
-                    transpile_config["faulty_qubits_map"],
-                    transpile_config["pass_manager_config"].backend_properties,
-                )
+            output_circuit = _serial_transpile_circuit(
+                circuit,
+                pass_manager,
+                transpile_config["callback"],
+                transpile_config["output_name"],
+                transpile_config["backend_num_qubits"],
+                transpile_config["faulty_qubits_map"],
+                transpile_config["pass_manager_config"].backend_properties,
             )
-        circuits = output_circuits
-    end_time = time()
-    _log_transpile_time(start_time, end_time)
-
-    if arg_circuits_list:
-        return circuits
-    else:
-        return circuits[0]
+            yield output_circuit if ordered else (index, output_circuit)
 
 
 def _check_circuits_coupling_map(circuits, cmap_conf, backend):
@@ -469,43 +686,49 @@ def _serial_transpile_circuit(
     return result
 
 
-def _transpile_circuit(circuit_config_tuple: Tuple[QuantumCircuit, str, Dict]) -> QuantumCircuit:
+def _transpile_circuit(
+    circuit_config_tuple: Tuple[QuantumCircuit, str, Dict], profile: Optional[bool] = None
+) -> QuantumCircuit:
     """Select a PassManager and run a single circuit through it.
     Args:
         circuit_config_tuple (tuple):
             circuit (QuantumCircuit): circuit to transpile
-            name (str): The name of the shared memory object containing a pickled dict of shared
-                arguments between parallel works
+            shm (tuple): The name and size of the shared memory object containing a pickled dict
+                of shared arguments between parallel works
             unique_config (dict): configuration dictating unique arguments for transpile.
+        profile: If not ``None``, run the pass manager inside a :class:`.PassProfiler` with
+            ``track_memory=profile``.
     Returns:
-        The transpiled circuit
+        The transpiled circuit, or a tuple of the transpiled circuit and its
+        :class:`.PassProfile` if ``profile`` is set.
     Raises:
         TranspilerError: if transpile_config is not valid or transpilation incurs error
     """
-    circuit, name, unique_config = circuit_config_tuple
+    circuit, (name, size), unique_config = circuit_config_tuple
     existing_shm = SharedMemory(name=name)
     try:
-        with io.BytesIO(existing_shm.buf) as buf:
-            shared_transpiler_args = pickle.load(buf)
+        # Workers keep the unpickled arguments (including the Target) cached between tasks.
+        shared_transpiler_args = parallel.cached_loads(bytes(existing_shm.buf[:size]))
     finally:
         existing_shm.close()
 
     transpile_config, pass_manager = _combine_args(shared_transpiler_args, unique_config)
     pass_manager_config = transpile_config["pass_manager_config"]
 
-    result = pass_manager.run(
-        circuit, callback=transpile_config["callback"], output_name=transpile_config["output_name"]
+    args = (
+        circuit,
+        pass_manager,
+        transpile_config["callback"],
+        transpile_config["output_name"],
+        transpile_config["backend_num_qubits"],
+        transpile_config["faulty_qubits_map"],
+        pass_manager_config.backend_properties,
     )
-
-    if transpile_config["faulty_qubits_map"]:
-        return _remap_circuit_faulty_backend(
-            result,
-            transpile_config["backend_num_qubits"],
-            pass_manager_config.backend_properties,
-            transpile_config["faulty_qubits_map"],
-        )
-
-    return result
+    if profile is None:
+        return _serial_transpile_circuit(*args)
+    with PassProfiler(track_memory=profile) as profiler:
+        result = _serial_transpile_circuit(*args)
+    return result, profiler.report
 
 
 def _remap_circuit_faulty_backend(circuit, num_qubits, backend_prop, faulty_qubits_map):
@@ -15,11 +15,15 @@
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 
 
-def circuit_to_dag(circuit):
+def circuit_to_dag(circuit, copy_operations=True):
     """Build a ``DAGCircuit`` object from a ``QuantumCircuit``.
 
     Args:
         circuit (QuantumCircuit): the input circuit.
+        copy_operations (bool): whether the operations of the DAG are copies of those of the
+            circuit.  If ``False``, the operations are shared with the circuit, so this should only
+            be used when the circuit is not used anymore, because changes to the operations of
+            either are seen by the other.
 
     Return:
         DAGCircuit: the DAG representing the input circuit.
@@ -58,10 +62,17 @@ def circuit_to_dag(circuit):
     for register in circuit.cregs:
         dagcircuit.add_creg(register)
 
-    for instruction in circuit.data:
-        dagcircuit.apply_operation_back(
-            instruction.operation.copy(), instruction.qubits, instruction.clbits
+    if copy_operations:
+        operations = (
+            (instruction.operation.copy(), instruction.qubits, instruction.clbits)
+            for instruction in circuit.data
         )
+    else:
+        operations = (
+            (instruction.operation, instruction.qubits, instruction.clbits)
+            for instruction in circuit.data
+        )
+    dagcircuit._apply_operations_back(operations)
 
     dagcircuit.duration = circuit.duration
     dagcircuit.unit = circuit.unit
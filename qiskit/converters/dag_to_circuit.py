@@ -12,14 +12,18 @@
 
 """Helper function for converting a dag to a circuit."""
 
-from qiskit.circuit import QuantumCircuit, CircuitInstruction
+from qiskit.circuit import QuantumCircuit, CircuitInstruction, Instruction
 
 
-def dag_to_circuit(dag):
+def dag_to_circuit(dag, copy_operations=True):
     """Build a ``QuantumCircuit`` object from a ``DAGCircuit``.
 
     Args:
         dag (DAGCircuit): the input dag.
+        copy_operations (bool): whether the operations of the circuit are copies of those of the
+            DAG.  If ``False``, the operations are shared with the DAG, so this should only be used
+            when the DAG is not used anymore, because changes to the operations of either are seen
+            by the other.
 
     Return:
         QuantumCircuit: the circuit representing the input dag.
@@ -58,8 +62,19 @@ def dag_to_circuit(dag):
     circuit.metadata = dag.metadata
     circuit.calibrations = dag.calibrations
 
-    for node in dag.topological_op_nodes():
-        circuit._append(CircuitInstruction(node.op.copy(), node.qargs, node.cargs))
+    if copy_operations:
+        circuit._data = [
+            CircuitInstruction(node.op.copy(), node.qargs, node.cargs)
+            for node in dag.topological_op_nodes()
+        ]
+    else:
+        circuit._data = [
+            CircuitInstruction(node.op, node.qargs, node.cargs)
+            for node in dag.topological_op_nodes()
+        ]
+    for instruction in circuit._data:
+        if isinstance(instruction.operation, Instruction) and instruction.operation.params:
+            circuit._update_parameter_table(instruction)
 
     circuit.duration = dag.duration
     circuit.unit = dag.unit
@@ -95,6 +95,11 @@ class DAGCircuit:
         self.duration = None
         self.unit = "dt"
 
+        # Number of modifications made to the circuit.  This is compared before and after running
+        # a pass to find out if it changed the circuit, so every method that modifies the graph,
+        # the wires or the circuit-level data has to increment it.
+        self._modification_count = 0
+
     @_optionals.HAS_NETWORKX.require_in_call
     @deprecate_function(
         "The to_networkx() method is deprecated and will be removed in a future release."
@@ -172,6 +177,7 @@ class DAGCircuit:
         Args:
             angle (float, ParameterExpression)
         """
+        self._modification_count += 1
         if isinstance(angle, ParameterExpression):
             self._global_phase = angle
         else:
@@ -200,6 +206,7 @@ class DAGCircuit:
                 {'gate_name': {(qubits, gate_params): schedule}}
         """
         self._calibrations = defaultdict(dict, calibrations)
+        self._modification_count += 1
 
     def add_calibration(self, gate, qubits, schedule, params=None):
         """Register a low-level, custom pulse definition for the given gate.
@@ -219,6 +226,7 @@ class DAGCircuit:
             ] = schedule
         else:
             self._calibrations[gate][(tuple(qubits), tuple(params or []))] = schedule
+        self._modification_count += 1
 
     def has_calibration_for(self, node):
         """Return True if the dag has a calibration defined for the node operation. In this
@@ -274,6 +282,7 @@ class DAGCircuit:
         if qreg.name in self.qregs:
             raise DAGCircuitError("duplicate register %s" % qreg.name)
         self.qregs[qreg.name] = qreg
+        self._modification_count += 1
         existing_qubits = set(self.qubits)
         for j in range(qreg.size):
             if qreg[j] not in existing_qubits:
@@ -287,6 +296,7 @@ class DAGCircuit:
         if creg.name in self.cregs:
             raise DAGCircuitError("duplicate register %s" % creg.name)
         self.cregs[creg.name] = creg
+        self._modification_count += 1
         existing_clbits = set(self.clbits)
         for j in range(creg.size):
             if creg[j] not in existing_clbits:
@@ -306,6 +316,7 @@ class DAGCircuit:
         """
         if wire not in self._wires:
             self._wires.add(wire)
+            self._modification_count += 1
 
             inp_node = DAGInNode(wire=wire)
             outp_node = DAGOutNode(wire=wire)
@@ -374,6 +385,7 @@ class DAGCircuit:
 
         for creg in cregs:
             del self.cregs[creg.name]
+        self._modification_count += 1
 
     def _is_wire_idle(self, wire):
         """Check if a wire is idle.
@@ -410,6 +422,7 @@ class DAGCircuit:
         self._multi_graph.remove_node(inp_node._node_id)
         self._multi_graph.remove_node(oup_node._node_id)
         self._wires.remove(wire)
+        self._modification_count += 1
         del self.input_map[wire]
         del self.output_map[wire]
 
@@ -497,6 +510,7 @@ class DAGCircuit:
         node_index = self._multi_graph.add_node(new_node)
         new_node._node_id = node_index
         self._increment_op(op)
+        self._modification_count += 1
         return node_index
 
     @deprecate_function(
@@ -574,6 +588,65 @@ class DAGCircuit:
         )
         return self._multi_graph[node_index]
 
+    def _apply_operations_back(self, operations):
+        """Apply operations to the output of the circuit in bulk.
+
+        This is equivalent to calling :meth:`apply_operation_back` on each ``(op, qargs, cargs)``
+        of ``operations`` in turn, down to the order of the edges of each node, but all the
+        operations are checked before the graph is modified, and then all their nodes and edges
+        are added at once.
+
+        Args:
+            operations (Iterable[tuple]): the ``(op, qargs, cargs)`` of each operation, where
+                ``qargs`` and ``cargs`` are tuples.
+
+        Raises:
+            DAGCircuitError: if an operation uses a bit or a register that is not in the circuit.
+        """
+        output_map = self.output_map
+        nodes = []
+        node_wires = []
+        # The position of the last operation on each wire.
+        last_positions = {}
+        for position, (op, qargs, cargs) in enumerate(operations):
+            condition = getattr(op, "condition", None)
+            if condition is None and not cargs:
+                wires = qargs
+            else:
+                self._check_condition(op.name, condition)
+                # The same order of the classical wires as in apply_operation_back.
+                wires = qargs + tuple(set(self._bits_in_condition(condition)).union(cargs))
+            for wire in wires:
+                if wire not in output_map:
+                    raise DAGCircuitError(f"(qu)bit {wire} not found in {output_map}")
+                last_positions[wire] = position
+            nodes.append(DAGOpNode(op=op, qargs=qargs, cargs=cargs))
+            node_wires.append(wires)
+
+        # The last node of each wire, and the edge of the wire in the graph, which is replaced.
+        graph = self._multi_graph
+        previous = {}
+        for wire in last_positions:
+            output_index = output_map[wire]._node_id
+            previous[wire] = graph.predecessor_indices(output_index)[0]
+        graph.remove_edges_from([(previous[wire], output_map[wire]._node_id) for wire in previous])
+        # The edges of each node are added in the order of apply_operation_back, so that the
+        # successors and predecessors of the nodes are iterated in the same order.
+        node_indices = graph.add_nodes_from(nodes)
+        edges = []
+        for position, (node_index, wires) in enumerate(zip(node_indices, node_wires)):
+            for wire in wires:
+                output_node = output_map[wire]
+                edges.append((previous[wire], node_index, output_node.wire))
+                previous[wire] = node_index
+                if last_positions[wire] == position:
+                    edges.append((node_index, output_node._node_id, output_node.wire))
+        graph.add_edges_from(edges)
+        for node_index, node in zip(node_indices, nodes):
+            node._node_id = node_index
+            self._increment_op(node.op)
+        self._modification_count += len(nodes)
+
     def apply_operation_front(self, op, qargs=(), cargs=()):
         """Apply an operation to the input of the circuit.
 
@@ -1106,6 +1179,7 @@ class DAGCircuit:
             ) from ex
 
         self._increment_op(op)
+        self._modification_count += 1
 
         for nd in node_block:
             self._decrement_op(nd.op)
@@ -1259,6 +1333,7 @@ class DAGCircuit:
             node._node_id, in_dag._multi_graph, edge_map_fn, filter_fn, edge_weight_map
         )
         self._decrement_op(node.op)
+        self._modification_count += 1
 
         # Iterate over nodes of input_circuit and update wires in node objects migrated
         # from in_dag
@@ -1313,6 +1388,7 @@ class DAGCircuit:
                 )
             )
 
+        self._modification_count += 1
         if inplace:
             if op.name != node.op.name:
                 self._increment_op(op)
@@ -1504,6 +1580,7 @@ class DAGCircuit:
             node._node_id, use_outgoing=False, condition=lambda edge1, edge2: edge1 == edge2
         )
         self._decrement_op(node.op)
+        self._modification_count += 1
 
     def remove_ancestors_of(self, node):
         """Remove all of the ancestor operation nodes of node."""
@@ -19,18 +19,26 @@ from collections.abc import Iterable, Sequence
 from typing import Any
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from qiskit.circuit import Parameter, QuantumCircuit
 from qiskit.circuit.parametertable import ParameterView
 from qiskit.exceptions import QiskitError
 from qiskit.opflow import PauliSumOp
-from qiskit.quantum_info import Statevector
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 
 from .base_estimator import BaseEstimator
 from .estimator_result import EstimatorResult
 from .primitive_job import PrimitiveJob
-from .utils import _circuit_key, bound_circuit_to_instruction, init_circuit, init_observable
+from .utils import (
+    _batch_chunks,
+    _bound_statevectors,
+    _circuit_key,
+    _inline_parameterized,
+    bound_circuits_to_statevectors,
+    init_circuit,
+    init_observable,
+)
 
 
 class Estimator(BaseEstimator):
@@ -84,6 +92,11 @@ class Estimator(BaseEstimator):
             options=options,
         )
         self._is_closed = False
+        # Circuits to bind, with their parameterized composite operations inlined, by circuit index.
+        self._bind_templates: dict[int, QuantumCircuit] = {}
+        # Sparse matrices of the observables and of their squares, by observable index.
+        self._observable_matrices: dict[int, csr_matrix] = {}
+        self._squared_observable_matrices: dict[int, csr_matrix] = {}
 
     def _call(
         self,
@@ -105,36 +118,69 @@ class Estimator(BaseEstimator):
             rng = np.random.default_rng(seed)
 
         # Initialize metadata
-        metadata: list[dict[str, Any]] = [{}] * len(circuits)
+        metadata: list[dict[str, Any]] = [{} for _ in range(len(circuits))]
 
-        bound_circuits = []
         for i, value in zip(circuits, parameter_values):
             if len(value) != len(self._parameters[i]):
                 raise QiskitError(
                     f"The number of values ({len(value)}) does not match "
                     f"the number of parameters ({len(self._parameters[i])})."
                 )
-            bound_circuits.append(
-                self._circuits[i]
-                if len(value) == 0
-                else self._circuits[i].bind_parameters(dict(zip(self._parameters[i], value)))
-            )
-        sorted_observables = [self._observables[i] for i in observables]
-        expectation_values = []
-        for circ, obs, metadatum in zip(bound_circuits, sorted_observables, metadata):
-            if circ.num_qubits != obs.num_qubits:
+        for i, j in zip(circuits, observables):
+            if self._circuits[i].num_qubits != self._observables[j].num_qubits:
                 raise QiskitError(
-                    f"The number of qubits of a circuit ({circ.num_qubits}) does not match "
-                    f"the number of qubits of a observable ({obs.num_qubits})."
+                    f"The number of qubits of a circuit ({self._circuits[i].num_qubits}) does not "
+                    f"match the number of qubits of a observable "
+                    f"({self._observables[j].num_qubits})."
                 )
-            final_state = Statevector(bound_circuit_to_instruction(circ))
-            expectation_value = final_state.expectation_value(obs)
+
+        # The parameter sets of each circuit are bound and simulated together as one batch, and
+        # the expectation values of each observable are evaluated for the whole batch at once.
+        # Large batches are split into chunks whose statevectors fit in a memory limit.
+        batches: dict[int, list[int]] = {}
+        for k, i in enumerate(circuits):
+            batches.setdefault(i, []).append(k)
+        exact_values = np.zeros(len(circuits), dtype=complex)
+        squared_values = np.zeros(len(circuits), dtype=complex)
+        for i, batch in batches.items():
+            circuit = self._circuits[i]
+            if circuit.num_parameters == 0:
+                chunks = [batch]
+                states = np.broadcast_to(
+                    bound_circuits_to_statevectors([circuit]), (len(batch), 2**circuit.num_qubits)
+                )
+            else:
+                if i not in self._bind_templates:
+                    self._bind_templates[i] = _inline_parameterized(circuit)
+                chunks = _batch_chunks(batch, circuit.num_qubits)
+            for chunk in chunks:
+                if circuit.num_parameters != 0:
+                    states = _bound_statevectors(
+                        self._bind_templates[i],
+                        self._parameters[i],
+                        [parameter_values[k] for k in chunk],
+                    )
+                rows_of_observable: dict[int, list[int]] = {}
+                for row, k in enumerate(chunk):
+                    rows_of_observable.setdefault(observables[k], []).append(row)
+                for j, rows in rows_of_observable.items():
+                    indices = [chunk[row] for row in rows]
+                    exact_values[indices] = _expectation_values(
+                        states[rows], self._observable_matrix(j)
+                    )
+                    if shots is not None:
+                        squared_values[indices] = _expectation_values(
+                            states[rows], self._squared_observable_matrix(j)
+                        )
+
+        expectation_values = []
+        for k, metadatum in enumerate(metadata):
+            expectation_value = exact_values[k]
             if shots is None:
                 expectation_values.append(expectation_value)
             else:
                 expectation_value = np.real_if_close(expectation_value)
-                sq_obs = (obs @ obs).simplify()
-                sq_exp_val = np.real_if_close(final_state.expectation_value(sq_obs))
+                sq_exp_val = np.real_if_close(squared_values[k])
                 variance = sq_exp_val - expectation_value**2
                 standard_deviation = np.sqrt(variance / shots)
                 expectation_value_with_error = rng.normal(expectation_value, standard_deviation)
@@ -147,6 +193,19 @@ class Estimator(BaseEstimator):
     def close(self):
         self._is_closed = True
 
+    def _observable_matrix(self, index: int) -> csr_matrix:
+        if index not in self._observable_matrices:
+            self._observable_matrices[index] = self._observables[index].to_matrix(sparse=True)
+        return self._observable_matrices[index]
+
+    def _squared_observable_matrix(self, index: int) -> csr_matrix:
+        if index not in self._squared_observable_matrices:
+            observable = self._observables[index]
+            self._squared_observable_matrices[index] = (
+                (observable @ observable).simplify().to_matrix(sparse=True)
+            )
+        return self._squared_observable_matrices[index]
+
     def _run(
         self,
         circuits: Sequence[QuantumCircuit],
@@ -175,8 +234,28 @@ class Estimator(BaseEstimator):
                 observable_indices.append(len(self._observables))
                 self._observable_ids[id(observable)] = len(self._observables)
                 self._observables.append(init_observable(observable))
-        job = PrimitiveJob(
-            self._call, circuit_indices, observable_indices, parameter_values, **run_options
-        )
+        slices = PrimitiveJob._batch_slices(len(circuit_indices), run_options)
+        if len(slices) == 1:
+            job = PrimitiveJob(
+                self._call, circuit_indices, observable_indices, parameter_values, **run_options
+            )
+        else:
+            batches = [
+                (circuit_indices[s], observable_indices[s], parameter_values[s]) for s in slices
+            ]
+            job = PrimitiveJob._split(self._call, batches, _combine_results, **run_options)
         job.submit()
         return job
+
+
+def _expectation_values(states: np.ndarray, matrix: csr_matrix) -> np.ndarray:
+    """The expectation values of ``matrix`` for each row of ``states``."""
+    return np.einsum("ij,ji->i", states.conj(), matrix @ states.T)
+
+
+def _combine_results(results: list[EstimatorResult]) -> EstimatorResult:
+    """Concatenate the results of the batches of a job."""
+    return EstimatorResult(
+        np.concatenate([result.values for result in results]),
+        [metadatum for result in results for metadatum in result.metadata],
+    )
@@ -13,17 +13,38 @@
 Job implementation for the reference implementations of Primitives.
 """
 
+import asyncio
+import os
+import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 
 from qiskit.providers import JobError, JobStatus, JobV1
 
+# The smallest number of items of a job that is split across the workers of the executor.
+_MIN_SPLIT_SIZE = 64
+
+_EXECUTOR_LOCK = threading.Lock()
+# Marks the threads that are running a job, so that jobs submitted from within a job are run
+# in place instead of waiting for a free worker of the executor, which could deadlock.
+_WORKER_STATE = threading.local()
+
 
 class PrimitiveJob(JobV1):
     """
     PrimitiveJob class for the reference implemetations of Primitives.
+
+    Jobs run asynchronously on an executor shared by all the primitive jobs, which is a
+    :class:`~concurrent.futures.ThreadPoolExecutor` by default and can be replaced with
+    :meth:`set_executor`, for example by a :class:`~concurrent.futures.ProcessPoolExecutor`.
+    A submitted job can be awaited in a coroutine to get its result::
+
+        result = await estimator.run(circuits, observables, parameter_values)
     """
 
+    _executor = None
+    _num_workers = 1
+
     def __init__(self, function, *args, **kwargs):
         """
         Args:
@@ -32,37 +53,147 @@ class PrimitiveJob(JobV1):
         job_id = str(uuid.uuid4())
         super().__init__(None, job_id)
         self._future = None
+        self._futures = None
         self._function = function
         self._args = args
         self._kwargs = kwargs
+        self._batches = None
+        self._combine = None
+
+    @classmethod
+    def _split(cls, function, batches, combine, **kwargs):
+        """Create a job that runs ``function(*args, **kwargs)`` for each ``args`` of ``batches``
+        as separate tasks of the executor, whose results are combined by ``combine``."""
+        job = cls(function, **kwargs)
+        job._batches = batches
+        job._combine = combine
+        return job
+
+    @classmethod
+    def set_executor(cls, executor: Executor = None, num_workers: int = 1):
+        """Set the executor that runs the primitive jobs.
+
+        Args:
+            executor: The executor of the jobs that are submitted from now on.  If ``None``,
+                a shared :class:`~concurrent.futures.ThreadPoolExecutor` is used.  The caller
+                owns the executor, and is responsible for shutting it down.
+            num_workers: The number of workers of ``executor``, which is the largest number of
+                tasks a job is split into.  Jobs are not split with the default of 1.  This is
+                ignored if ``executor`` is ``None``.
+
+        Raises:
+            ValueError: if ``num_workers`` is less than 1.
+        """
+        if num_workers < 1:
+            raise ValueError(f"The number of workers must be at least 1, not {num_workers}.")
+        with _EXECUTOR_LOCK:
+            PrimitiveJob._executor = executor
+            PrimitiveJob._num_workers = num_workers
+
+    @classmethod
+    def get_executor(cls) -> Executor:
+        """Return the executor that runs the primitive jobs."""
+        with _EXECUTOR_LOCK:
+            if PrimitiveJob._executor is None:
+                # The default number of workers of a ThreadPoolExecutor.
+                PrimitiveJob._num_workers = min(32, (os.cpu_count() or 1) + 4)
+                PrimitiveJob._executor = ThreadPoolExecutor(
+                    max_workers=PrimitiveJob._num_workers, thread_name_prefix="qiskit_primitive"
+                )
+            return PrimitiveJob._executor
+
+    @classmethod
+    def _batch_slices(cls, num_items: int, run_options: dict) -> list:
+        """Split the items of a job into slices to run as separate tasks of the executor.
+
+        Jobs that sample with a fixed seed are not split, because their results would depend on
+        how they are split."""
+        if run_options.get("shots") is not None and run_options.get("seed") is not None:
+            return [slice(None)]
+        cls.get_executor()
+        num_batches = max(1, min(PrimitiveJob._num_workers, num_items // _MIN_SPLIT_SIZE))
+        bounds = [num_items * k // num_batches for k in range(num_batches + 1)]
+        return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
 
     def submit(self):
         if self._future is not None:
             raise JobError("Primitive job has already been submitted.")
 
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(self._function, *self._args, **self._kwargs)
-        self._future = future
+        if self._batches is None:
+            self._future = _submit(self._function, self._args, self._kwargs)
+            self._futures = [self._future]
+        else:
+            self._futures = [_submit(self._function, args, self._kwargs) for args in self._batches]
+            self._future = _gather(self._futures, self._combine)
 
     def result(self):
         """Return the results of the job."""
         self._check_submitted()
         return self._future.result()
 
+    def __await__(self):
+        self._check_submitted()
+        return asyncio.wrap_future(self._future).__await__()
+
     def cancel(self):
         self._check_submitted()
-        return self._future.cancel()
+        cancelled = [future.cancel() for future in self._futures]
+        return all(cancelled)
 
     def status(self):
         self._check_submitted()
-        if self._future.running():
-            return JobStatus.RUNNING
-        elif self._future.cancelled():
+        if any(future.cancelled() for future in self._futures):
             return JobStatus.CANCELLED
-        elif self._future.done() and self._future.exception() is None:
-            return JobStatus.DONE
-        return JobStatus.ERROR
+        elif self._future.done():
+            return JobStatus.DONE if self._future.exception() is None else JobStatus.ERROR
+        elif any(future.running() or future.done() for future in self._futures):
+            return JobStatus.RUNNING
+        return JobStatus.QUEUED
 
     def _check_submitted(self):
         if self._future is None:
             raise JobError("Job not submitted yet!. You have to .submit() first!")
+
+
+def _submit(function, args, kwargs):
+    """Submit ``function(*args, **kwargs)`` to the executor, or run it in place if this is
+    called from within a job."""
+    if getattr(_WORKER_STATE, "active", False):
+        future = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(function(*args, **kwargs))
+        except BaseException as exc:  # pylint: disable=broad-except
+            future.set_exception(exc)
+        return future
+    return PrimitiveJob.get_executor().submit(_run_job, function, args, kwargs)
+
+
+def _run_job(function, args, kwargs):
+    _WORKER_STATE.active = True
+    try:
+        return function(*args, **kwargs)
+    finally:
+        _WORKER_STATE.active = False
+
+
+def _gather(futures, combine):
+    """A future of ``combine`` of the results of ``futures``, once they are all done."""
+    gathered = Future()
+    gathered.set_running_or_notify_cancel()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def done_callback(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        try:
+            gathered.set_result(combine([future.result() for future in futures]))
+        except BaseException as exc:  # pylint: disable=broad-except
+            gathered.set_exception(exc)
+
+    for future in futures:
+        future.add_done_callback(done_callback)
+    return gathered
@@ -23,15 +23,17 @@ import numpy as np
 from qiskit.circuit import Parameter, QuantumCircuit
 from qiskit.circuit.parametertable import ParameterView
 from qiskit.exceptions import QiskitError
-from qiskit.quantum_info import Statevector
 from qiskit.result import QuasiDistribution
 
 from .base_sampler import BaseSampler
 from .primitive_job import PrimitiveJob
 from .sampler_result import SamplerResult
 from .utils import (
+    _batch_chunks,
+    _bound_statevectors,
     _circuit_key,
-    bound_circuit_to_instruction,
+    _inline_parameterized,
+    bound_circuits_to_statevectors,
     final_measurement_mapping,
     init_circuit,
 )
@@ -83,6 +85,8 @@ class Sampler(BaseSampler):
             preprocessed_circuits = None
         super().__init__(preprocessed_circuits, parameters, options)
         self._is_closed = False
+        # Circuits to bind, with their parameterized composite operations inlined, by circuit index.
+        self._bind_templates: dict[int, QuantumCircuit] = {}
 
     def _call(
         self,
@@ -103,33 +107,65 @@ class Sampler(BaseSampler):
             rng = np.random.default_rng(seed)
 
         # Initialize metadata
-        metadata: list[dict[str, Any]] = [{}] * len(circuits)
+        metadata: list[dict[str, Any]] = [{} for _ in range(len(circuits))]
 
-        bound_circuits = []
-        qargs_list = []
         for i, value in zip(circuits, parameter_values):
             if len(value) != len(self._parameters[i]):
                 raise QiskitError(
                     f"The number of values ({len(value)}) does not match "
                     f"the number of parameters ({len(self._parameters[i])})."
                 )
-            bound_circuits.append(
-                self._circuits[i]
-                if len(value) == 0
-                else self._circuits[i].bind_parameters(dict(zip(self._parameters[i], value)))
-            )
-            qargs_list.append(self._qargs_list[i])
-        probabilities = [
-            Statevector(bound_circuit_to_instruction(circ)).probabilities(qargs=qargs)
-            for circ, qargs in zip(bound_circuits, qargs_list)
-        ]
+
+        # The parameter sets of each circuit are bound and simulated together as one batch, and
+        # the probabilities of the measured qubits are computed for the whole batch at once.
+        # Large batches are split into chunks whose statevectors fit in a memory limit.
+        batches: dict[int, list[int]] = {}
+        for k, i in enumerate(circuits):
+            batches.setdefault(i, []).append(k)
+        probabilities: list[np.ndarray] = [None] * len(circuits)
+        for i, batch in batches.items():
+            circuit = self._circuits[i]
+            if circuit.num_parameters == 0:
+                chunks = [batch]
+                states = bound_circuits_to_statevectors([circuit])
+            else:
+                if i not in self._bind_templates:
+                    self._bind_templates[i] = _inline_parameterized(circuit)
+                chunks = _batch_chunks(batch, circuit.num_qubits)
+            for chunk in chunks:
+                if circuit.num_parameters != 0:
+                    states = _bound_statevectors(
+                        self._bind_templates[i],
+                        self._parameters[i],
+                        [parameter_values[k] for k in chunk],
+                    )
+                chunk_probabilities = np.broadcast_to(
+                    _marginal_probabilities(states, self._qargs_list[i]),
+                    (len(chunk), 2 ** len(self._qargs_list[i])),
+                )
+                for row, k in enumerate(chunk):
+                    probabilities[k] = chunk_probabilities[row]
+
         if shots is not None:
-            probabilities = [
-                rng.multinomial(shots, probability) / shots for probability in probabilities
-            ]
+            # Sample consecutive distributions over the same number of outcomes with a single
+            # call, which draws the same samples as sampling them one by one.
+            start = 0
+            while start < len(probabilities):
+                stop = start + 1
+                while stop < len(probabilities) and len(probabilities[stop]) == len(
+                    probabilities[start]
+                ):
+                    stop += 1
+                samples = rng.multinomial(shots, np.array(probabilities[start:stop])) / shots
+                probabilities[start:stop] = list(samples)
+                start = stop
             for metadatum in metadata:
                 metadatum["shots"] = shots
-        quasis = [QuasiDistribution(dict(enumerate(p))) for p in probabilities]
+
+        quasis = [
+            QuasiDistribution(dict(zip(range(len(probability)), probability.tolist())))
+            for probability in probabilities
+        ]
 
         return SamplerResult(quasis, metadata)
 
@@ -156,7 +192,12 @@ class Sampler(BaseSampler):
                 self._circuits.append(circuit)
                 self._qargs_list.append(qargs)
                 self._parameters.append(parameters[i])
-        job = PrimitiveJob(self._call, circuit_indices, parameter_values, **run_options)
+        slices = PrimitiveJob._batch_slices(len(circuit_indices), run_options)
+        if len(slices) == 1:
+            job = PrimitiveJob(self._call, circuit_indices, parameter_values, **run_options)
+        else:
+            batches = [(circuit_indices[s], parameter_values[s]) for s in slices]
+            job = PrimitiveJob._split(self._call, batches, _combine_results, **run_options)
         job.submit()
         return job
 
@@ -168,3 +209,25 @@ class Sampler(BaseSampler):
         qargs = [q for _, q in c_q_mapping]
         circuit = circuit.remove_final_measurements(inplace=False)
         return circuit, qargs
+
+
+def _combine_results(results: list[SamplerResult]) -> SamplerResult:
+    """Concatenate the results of the batches of a job."""
+    return SamplerResult(
+        [quasi_dist for result in results for quasi_dist in result.quasi_dists],
+        [metadatum for result in results for metadatum in result.metadata],
+    )
+
+
+def _marginal_probabilities(states: np.ndarray, qargs: list[int]) -> np.ndarray:
+    """The probabilities of the outcomes of measuring the qubits ``qargs`` of a batch of
+    statevectors, one row for each statevector, where ``qargs[0]`` is the least significant bit
+    of the outcomes."""
+    num_qubits = int(np.log2(states.shape[1]))
+    probabilities = np.reshape(np.abs(states) ** 2, (len(states),) + (2,) * num_qubits)
+    # Qubit 0 is the least significant bit, so it is the last axis of each state.
+    kept = sorted(qargs, reverse=True)
+    traced = tuple(num_qubits - qubit for qubit in range(num_qubits) if qubit not in qargs)
+    probabilities = np.sum(probabilities, axis=traced)
+    order = [0] + [1 + kept.index(qubit) for qubit in reversed(qargs)]
+    return np.reshape(np.transpose(probabilities, order), (len(states), 2 ** len(qargs)))
@@ -15,10 +15,14 @@ Utility functions for primitives
 
 from __future__ import annotations
 
-from qiskit.circuit import Instruction, ParameterExpression, QuantumCircuit
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+
+from qiskit.circuit import Barrier, Instruction, Parameter, ParameterExpression, QuantumCircuit
 from qiskit.extensions.quantum_initializer.initializer import Initialize
 from qiskit.opflow import PauliSumOp
-from qiskit.quantum_info import SparsePauliOp, Statevector
+from qiskit.quantum_info import Operator, SparsePauliOp, Statevector
 from qiskit.quantum_info.operators.base_operator import BaseOperator
 from qiskit.quantum_info.operators.symplectic.base_pauli import BasePauli
 
@@ -167,3 +171,176 @@ def bound_circuit_to_instruction(circuit: QuantumCircuit) -> Instruction:
     )
     inst.definition = circuit
     return inst
+
+
+def _inline_parameterized(circuit: QuantumCircuit) -> QuantumCircuit:
+    """Replace the parameterized composite operations of ``circuit`` by their definitions.
+
+    Binding a parameterized circuit has to rebind the definitions of composite operations,
+    such as the blocks of a :class:`~qiskit.circuit.library.NLocal` circuit, which is much
+    slower than binding the standard gates they consist of.  The definitions are equivalent for
+    simulation, so a circuit that is bound many times is inlined once instead.
+
+    Args:
+        circuit: Input quantum circuit.
+
+    Returns:
+        A circuit equivalent to ``circuit`` whose only parameterized operations are standard gates
+        or operations without a definition.
+    """
+    inlined = QuantumCircuit(
+        circuit.qubits,
+        circuit.clbits,
+        *circuit.qregs,
+        *circuit.cregs,
+        name=circuit.name,
+        global_phase=circuit.global_phase,
+    )
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if (
+            operation.is_parameterized()
+            and not type(operation).__module__.startswith("qiskit.circuit.library.standard_gates")
+            and isinstance(operation.definition, QuantumCircuit)
+            and not instruction.clbits
+            and getattr(operation, "condition", None) is None
+        ):
+            inlined.compose(
+                _inline_parameterized(operation.definition),
+                instruction.qubits,
+                inplace=True,
+            )
+        else:
+            inlined._append(instruction)
+    if inlined.parameters != circuit.parameters:
+        # The definitions are not in terms of the parameters of the operations.
+        return circuit
+    return inlined
+
+
+# The largest size in bytes of a batch of statevectors that are evolved together.  Evolving a
+# batch allocates a few arrays of its size, so larger batches are split into chunks of this size.
+_BATCH_MEMORY_LIMIT = 2**26
+
+
+def _batch_chunks(batch: Sequence, num_qubits: int) -> Iterator[Sequence]:
+    """Split a batch into consecutive chunks whose statevectors of ``num_qubits`` qubits fit in
+    ``_BATCH_MEMORY_LIMIT``, with at least one item in each chunk."""
+    size = max(1, _BATCH_MEMORY_LIMIT // (16 * 2**num_qubits))
+    for start in range(0, len(batch), size):
+        yield batch[start : start + size]
+
+
+def bound_circuits_to_statevectors(circuits: Sequence[QuantumCircuit]) -> np.ndarray:
+    """Simulate the final statevectors of bound quantum circuits of the same structure.
+
+    The circuits are typically copies of one parameterized circuit bound to different values,
+    which only differ in the parameters of their operations.  They are evolved together as a
+    stacked array of shape ``(len(circuits), 2 ** num_qubits)``, so an operation that is shared by
+    all the circuits is only converted to a matrix once and every operation is applied to the
+    whole batch in a single NumPy call.  Large batches are evolved in chunks to bound the memory
+    of the intermediate arrays.  If the circuits contain operations that cannot be batched, each
+    circuit is simulated separately with :class:`~qiskit.quantum_info.Statevector`.
+
+    Args:
+        circuits: Input quantum circuits, whose parameters must all be bound.
+
+    Returns:
+        The final statevectors, one row for each circuit.
+    """
+    num_qubits = circuits[0].num_qubits
+    states = np.empty((len(circuits), 2**num_qubits), dtype=complex)
+    start = 0
+    for chunk in _batch_chunks(circuits, num_qubits):
+        state = np.zeros((len(chunk), 2**num_qubits), dtype=complex)
+        state[:, 0] = 1
+        state = state.reshape((len(chunk),) + (2,) * num_qubits)
+        try:
+            state = _evolve_batch(state, chunk, list(range(num_qubits)))
+        except _UnbatchableCircuits:
+            state = [Statevector(bound_circuit_to_instruction(circuit)).data for circuit in chunk]
+        states[start : start + len(chunk)] = np.reshape(state, (len(chunk), 2**num_qubits))
+        start += len(chunk)
+    return states
+
+
+def _bound_statevectors(
+    template: QuantumCircuit, parameters: Sequence[Parameter], parameter_values: np.ndarray
+) -> np.ndarray:
+    """Simulate the final statevectors of a circuit bound to each of a batch of parameter sets.
+
+    Args:
+        template: The parameterized circuit, typically with its parameterized composite operations
+            inlined by :func:`_inline_parameterized`.
+        parameters: The parameters of the columns of ``parameter_values``.
+        parameter_values: The parameter sets, one row for each statevector.
+
+    Returns:
+        The final statevectors, one row for each parameter set.
+    """
+    positions = {param: n for n, param in enumerate(parameters)}
+    columns = [positions[param] for param in template.parameters]
+    values = np.asarray(parameter_values, dtype=float)
+    return bound_circuits_to_statevectors(template.assign_parameters(values[:, columns]))
+
+
+class _UnbatchableCircuits(Exception):
+    """The circuits contain an operation that cannot be applied to a batch of states."""
+
+
+def _evolve_batch(state, circuits, qargs):
+    """Apply ``circuits[i]`` to the state ``state[i]`` on the qubits ``qargs`` of the states."""
+    first = circuits[0]
+    # Accessing ``data`` builds the circuits that are built lazily, like blueprint circuits.
+    data = [circuit.data for circuit in circuits]
+    if any(len(circuit_data) != len(data[0]) for circuit_data in data):
+        raise _UnbatchableCircuits
+    if any(circuit.global_phase for circuit in circuits):
+        phases = np.exp(1j * np.array([float(circuit.global_phase) for circuit in circuits]))
+        state = state * phases.reshape((-1,) + (1,) * (state.ndim - 1))
+    qubits = {qubit: qargs[i] for i, qubit in enumerate(first.qubits)}
+    for index, instruction in enumerate(data[0]):
+        operation = instruction.operation
+        if isinstance(operation, Barrier):
+            continue
+        if instruction.clbits:
+            raise _UnbatchableCircuits
+        operations = [circuit_data[index].operation for circuit_data in data]
+        new_qargs = [qubits[qubit] for qubit in instruction.qubits]
+        if all(other is operation for other in operations):
+            matrix = Operator._instruction_to_matrix(operation)
+            if matrix is not None:
+                state = _apply_matrix(state, matrix, new_qargs)
+                continue
+            definitions = [operation.definition] * len(circuits)
+        else:
+            if any(other.name != operation.name for other in operations):
+                raise _UnbatchableCircuits
+            matrices = [Operator._instruction_to_matrix(other) for other in operations]
+            if all(matrix is not None for matrix in matrices):
+                state = _apply_matrix(state, np.array(matrices), new_qargs)
+                continue
+            definitions = [other.definition for other in operations]
+        if any(not isinstance(definition, QuantumCircuit) for definition in definitions):
+            raise _UnbatchableCircuits
+        state = _evolve_batch(state, definitions, new_qargs)
+    return state
+
+
+def _apply_matrix(state, matrix, qargs):
+    """Apply ``matrix`` (or the stack of matrices ``matrix[i]`` to ``state[i]``) to the qubits
+    ``qargs`` of a batch of states of shape ``(batch,) + (2,) * num_qubits``."""
+    num_qubits = state.ndim - 1
+    # Qubit 0 is the least significant bit, so it is the last axis of each state.  The target
+    # axes are moved to the end, most significant first, to match the indices of the matrix.
+    axes = [num_qubits - qubit for qubit in reversed(qargs)]
+    dim = 2 ** len(qargs)
+    moved = np.moveaxis(state, axes, range(num_qubits + 1 - len(qargs), num_qubits + 1))
+    shape = moved.shape
+    flat = moved.reshape(shape[0], -1, dim)
+    if matrix.ndim == 2:
+        flat = flat @ matrix.T
+    else:
+        flat = flat @ np.transpose(matrix, (0, 2, 1))
+    moved = flat.reshape(shape)
+    return np.moveaxis(moved, range(num_qubits + 1 - len(qargs), num_qubits + 1), axes)
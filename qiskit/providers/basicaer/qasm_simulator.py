@@ -39,6 +39,7 @@ import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.utils.multiprocessing import local_hardware_info
+from qiskit.tools.parallel import parallel_map
 from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.result import Result
 from qiskit.providers.backend import BackendV1
@@ -52,6 +53,15 @@ from .basicaertools import einsum_vecmul_index
 
 logger = logging.getLogger(__name__)
 
+# The smallest total size of the experiments of a qobj, as the sum of the statevector dimension
+# times the number of instructions of each experiment, that is run in parallel processes.
+_PARALLEL_MIN_COST = 2**22
+
+# The largest size in bytes of the stacked statevectors of the branches of the shots of an
+# experiment with mid-circuit measurements.  The shots are simulated in chunks whose branches fit
+# in this size, and one by one if less than two statevectors fit.
+_BRANCH_MEMORY_LIMIT = 2**26
+
 
 class QasmSimulatorPy(BackendV1):
     """Python implementation of a qasm simulator."""
@@ -436,8 +446,21 @@ class QasmSimulatorPy(BackendV1):
         self._memory = getattr(qobj.config, "memory", False)
         self._qobj_config = qobj.config
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        experiments = qobj.experiments
+        cost = sum(
+            2**experiment.config.n_qubits * len(experiment.instructions)
+            for experiment in experiments
+        )
+        if len(experiments) > 1 and cost >= _PARALLEL_MIN_COST:
+            # Draw the seeds here, so that the experiments without a seed do not get the same
+            # seeds from the copies of the global random state in the worker processes.
+            seeds = [self._get_seed_simulator(experiment) for experiment in experiments]
+            result_list = parallel_map(
+                _run_experiment, list(zip(experiments, seeds)), task_args=(self,)
+            )
+        else:
+            for experiment in experiments:
+                result_list.append(self.run_experiment(experiment))
         end = time.time()
         result = {
             "backend_name": self.name(),
@@ -453,11 +476,209 @@ class QasmSimulatorPy(BackendV1):
 
         return Result.from_dict(result)
 
-    def run_experiment(self, experiment):
+    def _get_seed_simulator(self, experiment):
+        """Get the seed of an experiment looking in circuit, qobj, and then random."""
+        if hasattr(experiment.config, "seed_simulator"):
+            return experiment.config.seed_simulator
+        if hasattr(self._qobj_config, "seed_simulator"):
+            return self._qobj_config.seed_simulator
+        # For compatibility on Windows force dyte to be int32
+        # and set the maximum value to be (2 ** 31) - 1
+        return np.random.randint(2147483647, dtype="int32")
+
+    def _run_shot_branches(self, experiment, global_phase, shots):
+        """Simulate shots of an experiment whose measurements cannot be sampled.
+
+        Instead of simulating each shot separately, the shots are grouped into branches that
+        have the same statevector and classical state.  All the shots start in a single branch,
+        and each branch is split in two at a measurement or reset, where the number of shots with
+        each outcome is drawn from a binomial distribution.  The gates are applied at once to
+        the stacked statevectors of all the branches that meet their condition.
+
+        Args:
+            experiment (QobjExperiment): experiment from qobj experiments list
+            global_phase (float): the global phase of the experiment.
+            shots (int): the number of shots to simulate.
+
+        Returns:
+            list: A list of memory values in hex format for the shots, grouped by branch.
+
+        Raises:
+            BasicAerError: if an operation is not supported.
+        """
+        self._initialize_statevector()
+        states = np.exp(1j * global_phase) * self._statevector[np.newaxis]
+        shots = [shots]
+        memories = [0]
+        registers = [0]
+        for operation in experiment.instructions:
+            branches = [
+                index
+                for index, (classical_memory, classical_register) in enumerate(
+                    zip(memories, registers)
+                )
+                if _condition_is_met(operation, classical_memory, classical_register)
+            ]
+            if not branches:
+                continue
+            selection = slice(None) if len(branches) == len(shots) else branches
+
+            if operation.name in ("unitary", "CX", "cx") or operation.name in SINGLE_QUBIT_GATES:
+                if operation.name == "unitary":
+                    gate = operation.params[0]
+                    qubits = operation.qubits
+                elif operation.name in SINGLE_QUBIT_GATES:
+                    gate = single_gate_matrix(operation.name, getattr(operation, "params", None))
+                    qubits = [operation.qubits[0]]
+                else:
+                    gate = cx_gate_matrix()
+                    qubits = operation.qubits[:2]
+                states[selection] = self._add_branch_unitary(states[selection], gate, qubits)
+            elif operation.name in ("id", "u0", "barrier"):
+                pass
+            elif operation.name in ("measure", "reset"):
+                qubit = operation.qubits[0]
+                reset = operation.name == "reset"
+                states, shots, parents, outcomes = self._split_branches(
+                    states, shots, branches, qubit, reset
+                )
+                memories = [memories[parent] for parent in parents]
+                registers = [registers[parent] for parent in parents]
+                if not reset:
+                    cmembit = operation.memory[0]
+                    cregbit = operation.register[0] if hasattr(operation, "register") else None
+                    for index, outcome in enumerate(outcomes):
+                        if outcome is None:
+                            continue
+                        membit = 1 << cmembit
+                        memories[index] = (memories[index] & (~membit)) | (outcome << cmembit)
+                        if cregbit is not None:
+                            regbit = 1 << cregbit
+                            registers[index] = (registers[index] & (~regbit)) | (outcome << cregbit)
+            elif operation.name == "bfunc":
+                cregbit = operation.register
+                cmembit = operation.memory if hasattr(operation, "memory") else None
+                for index in branches:
+                    outcome = _evaluate_bfunc(operation, registers[index])
+                    regbit = 1 << cregbit
+                    registers[index] = (registers[index] & (~regbit)) | (int(outcome) << cregbit)
+                    if cmembit is not None:
+                        membit = 1 << cmembit
+                        memories[index] = (memories[index] & (~membit)) | (int(outcome) << cmembit)
+            else:
+                backend = self.name()
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise BasicAerError(err_msg.format(backend, operation.name))
+
+        if self._number_of_cmembits == 0:
+            return []
+        return [
+            hex(classical_memory)
+            for classical_memory, num_shots in zip(memories, shots)
+            for _ in range(num_shots)
+        ]
+
+    def _add_branch_unitary(self, states, gate, qubits):
+        """Apply an N-qubit unitary matrix to a stack of statevectors.
+
+        Args:
+            states (np.ndarray): the statevectors, reshaped to rank-N tensors and stacked
+                along the first axis.
+            gate (matrix_like): an N-qubit unitary matrix
+            qubits (list): the list of N-qubits.
+
+        Returns:
+            np.ndarray: the stack of evolved statevectors.
+        """
+        num_qubits = len(qubits)
+        indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
+        gate_indexes, tensor_indexes = indexes.split(", ")
+        tensor_in, tensor_out = tensor_indexes.split("->")
+        gate_tensor = np.reshape(np.array(gate, dtype=complex), num_qubits * [2, 2])
+        return np.einsum(
+            f"{gate_indexes}, ...{tensor_in}->...{tensor_out}",
+            gate_tensor,
+            states,
+            dtype=complex,
+            casting="no",
+        )
+
+    def _split_branches(self, states, shots, branches, qubit, reset):
+        """Split branches by the outcome of measuring a qubit.
+
+        Args:
+            states (np.ndarray): the stacked statevectors of the branches.
+            shots (list[int]): the number of shots of each branch.
+            branches (list[int]): the branches to split.
+            qubit (int): the measured qubit.
+            reset (bool): whether to reset the qubit to 0 after the measurement.
+
+        Returns:
+            tuple: ``(states, shots, parents, outcomes)`` of the new branches, where ``parents``
+            is the index of the branch that each new branch comes from, and ``outcomes`` is
+            the measurement outcome of each new branch, or None if it was not split.
+        """
+        selected = np.array(branches)
+        axis = self._number_of_qubits - qubit
+        sum_axes = tuple(range(1, self._number_of_qubits))
+        probabilities = np.sum(np.abs(np.take(states[selected], 1, axis=axis)) ** 2, axis=sum_axes)
+        probabilities = np.clip(probabilities, 0, 1)
+        selected_shots = np.array(shots)[selected]
+        ones = self._local_random.binomial(selected_shots, probabilities)
+        zeros = selected_shots - ones
+
+        index_zero = [slice(None)] * (self._number_of_qubits + 1)
+        index_zero[axis] = 0
+        index_zero = tuple(index_zero)
+        index_one = list(index_zero)
+        index_one[axis] = 1
+        index_one = tuple(index_one)
+        scale_shape = (-1,) + self._number_of_qubits * (1,)
+
+        zero_states = states[selected[zeros > 0]].copy()
+        zero_states[index_one] = 0
+        zero_states /= np.reshape(np.sqrt(1 - probabilities[zeros > 0]), scale_shape)
+        one_states = np.zeros_like(states[selected[ones > 0]])
+        target = index_zero if reset else index_one
+        one_states[target] = states[selected[ones > 0]][index_one]
+        one_states /= np.reshape(np.sqrt(probabilities[ones > 0]), scale_shape)
+
+        zero_parents = list(selected[zeros > 0])
+        one_parents = list(selected[ones > 0])
+        zero_shots = list(zeros[zeros > 0])
+        one_shots = list(ones[ones > 0])
+        if reset and zero_parents and one_parents:
+            # Both outcomes of a reset leave the classical state alone, so merge the branches of
+            # a qubit that was not entangled with the others.
+            position = {parent: index for index, parent in enumerate(zero_parents)}
+            keep = []
+            for index, parent in enumerate(one_parents):
+                if parent in position and np.allclose(
+                    one_states[index], zero_states[position[parent]], rtol=0, atol=1e-12
+                ):
+                    zero_shots[position[parent]] += one_shots[index]
+                else:
+                    keep.append(index)
+            one_states = one_states[keep]
+            one_parents = [one_parents[index] for index in keep]
+            one_shots = [one_shots[index] for index in keep]
+
+        unselected = np.setdiff1d(np.arange(len(shots)), selected)
+        states = np.concatenate([states[unselected], zero_states, one_states])
+        parents = list(unselected) + zero_parents + one_parents
+        outcomes = [None] * len(unselected) + [0] * len(zero_parents) + [1] * len(one_parents)
+        shots = [shots[index] for index in unselected] + [
+            int(num) for num in zero_shots + one_shots
+        ]
+        return states, shots, parents, outcomes
+
+    def run_experiment(self, experiment, seed_simulator=None):
         """Run an experiment (circuit) and return a single experiment result.
 
         Args:
             experiment (QobjExperiment): experiment from qobj experiments list
+            seed_simulator (int): the seed of the simulation, instead of the seed set in the
+                experiment or qobj config.
 
         Returns:
              dict: A result dictionary which looks something like::
@@ -488,15 +709,8 @@ class QasmSimulatorPy(BackendV1):
         global_phase = experiment.header.global_phase
         # Validate the dimension of initial statevector if set
         self._validate_initial_statevector()
-        # Get the seed looking in circuit, qobj, and then random.
-        if hasattr(experiment.config, "seed_simulator"):
-            seed_simulator = experiment.config.seed_simulator
-        elif hasattr(self._qobj_config, "seed_simulator"):
-            seed_simulator = self._qobj_config.seed_simulator
-        else:
-            # For compatibility on Windows force dyte to be int32
-            # and set the maximum value to be (2 ** 31) - 1
-            seed_simulator = np.random.randint(2147483647, dtype="int32")
+        if seed_simulator is None:
+            seed_simulator = self._get_seed_simulator(experiment)
 
         self._local_random.seed(seed=seed_simulator)
         # Check if measure sampling is supported for current circuit
@@ -511,6 +725,23 @@ class QasmSimulatorPy(BackendV1):
             # Store (qubit, cmembit) pairs for all measure ops in circuit to
             # be sampled
             measure_sample_ops = []
+        elif (
+            self._shots > 1
+            and not self.SHOW_FINAL_STATE
+            and _BRANCH_MEMORY_LIMIT >= 2 * 16 * 2**self._number_of_qubits
+        ):
+            # Otherwise simulate the shots together, splitting them into branches at each
+            # measurement or reset with the same outcomes.  There are at most as many branches
+            # as shots, so the shots are simulated in chunks whose statevectors fit in the limit.
+            chunk_size = _BRANCH_MEMORY_LIMIT // (16 * 2**self._number_of_qubits)
+            shots = 0
+            for start in range(0, self._shots, chunk_size):
+                memory += self._run_shot_branches(
+                    experiment, global_phase, min(chunk_size, self._shots - start)
+                )
+            # The shots of a branch are not simulated in order, so shuffle them like the
+            # outcomes of independent shots.
+            self._local_random.shuffle(memory)
         else:
             shots = self._shots
         for _ in range(shots):
@@ -521,20 +752,10 @@ class QasmSimulatorPy(BackendV1):
             self._classical_memory = 0
             self._classical_register = 0
             for operation in experiment.instructions:
-                conditional = getattr(operation, "conditional", None)
-                if isinstance(conditional, int):
-                    conditional_bit_set = (self._classical_register >> conditional) & 1
-                    if not conditional_bit_set:
-                        continue
-                elif conditional is not None:
-                    mask = int(operation.conditional.mask, 16)
-                    if mask > 0:
-                        value = self._classical_memory & mask
-                        while (mask & 0x1) == 0:
-                            mask >>= 1
-                            value >>= 1
-                        if value != int(operation.conditional.val, 16):
-                            continue
+                if not _condition_is_met(
+                    operation, self._classical_memory, self._classical_register
+                ):
+                    continue
 
                 # Check if single  gate
                 if operation.name == "unitary":
@@ -575,29 +796,9 @@ class QasmSimulatorPy(BackendV1):
                         # If not sampling perform measurement as normal
                         self._add_qasm_measure(qubit, cmembit, cregbit)
                 elif operation.name == "bfunc":
-                    mask = int(operation.mask, 16)
-                    relation = operation.relation
-                    val = int(operation.val, 16)
-
                     cregbit = operation.register
                     cmembit = operation.memory if hasattr(operation, "memory") else None
-
-                    compared = (self._classical_register & mask) - val
-
-                    if relation == "==":
-                        outcome = compared == 0
-                    elif relation == "!=":
-                        outcome = compared != 0
-                    elif relation == "<":
-                        outcome = compared < 0
-                    elif relation == "<=":
-                        outcome = compared <= 0
-                    elif relation == ">":
-                        outcome = compared > 0
-                    elif relation == ">=":
-                        outcome = compared >= 0
-                    else:
-                        raise BasicAerError("Invalid boolean function relation.")
+                    outcome = _evaluate_bfunc(operation, self._classical_register)
 
                     # Store outcome in register and optionally memory slot
                     regbit = 1 << cregbit
@@ -669,3 +870,48 @@ class QasmSimulatorPy(BackendV1):
                     'No measurements in circuit "%s", classical register will remain all zeros.',
                     name,
                 )
+
+
+def _run_experiment(experiment_seed, backend):
+    """Run an experiment with a seed in a worker process."""
+    experiment, seed_simulator = experiment_seed
+    return backend.run_experiment(experiment, seed_simulator=seed_simulator)
+
+
+def _condition_is_met(operation, classical_memory, classical_register):
+    """Return whether the condition of an operation is met by the classical state of a shot."""
+    conditional = getattr(operation, "conditional", None)
+    if isinstance(conditional, int):
+        return bool((classical_register >> conditional) & 1)
+    if conditional is not None:
+        mask = int(operation.conditional.mask, 16)
+        if mask > 0:
+            value = classical_memory & mask
+            while (mask & 0x1) == 0:
+                mask >>= 1
+                value >>= 1
+            return value == int(operation.conditional.val, 16)
+    return True
+
+
+def _evaluate_bfunc(operation, classical_register):
+    """Evaluate the boolean function of a ``bfunc`` operation on a classical register."""
+    mask = int(operation.mask, 16)
+    relation = operation.relation
+    val = int(operation.val, 16)
+
+    compared = (classical_register & mask) - val
+
+    if relation == "==":
+        return compared == 0
+    elif relation == "!=":
+        return compared != 0
+    elif relation == "<":
+        return compared < 0
+    elif relation == "<=":
+        return compared <= 0
+    elif relation == ">":
+        return compared > 0
+    elif relation == ">=":
+        return compared >= 0
+    raise BasicAerError("Invalid boolean function relation.")
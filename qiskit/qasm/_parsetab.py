@@ -0,0 +1,141 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# fmt: off
+# This file is automatically generated by PLY from the grammar of QasmParser. Do not edit.
+# If the grammar changes, the tables are rebuilt in memory until this file is regenerated with
+#     ply.yacc.yacc(module=QasmParser(None), tabmodule="_parsetab", outputdir="qiskit/qasm")
+# and this header is restored.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "mainleft+-left*/leftnegativepositiveright^ASSIGN BARRIER CREG CX FORMAT GATE ID IF MATCHES MEASURE NNINTEGER OPAQUE PI QREG REAL RESET STRING U\n        main : program\n        \n        program : statement\n        \n        program : program statement\n        \n        statement : decl\n                  | quantum_op ';'\n                  | format ';'\n                  | ignore\n                  | quantum_op error\n                  | format error\n        \n        format : FORMAT\n        \n        id : ID\n        \n        id : error\n        \n        indexed_id : id '[' NNINTEGER ']'\n                   | id '[' NNINTEGER error\n                   | id '[' error\n        \n        primary : id\n                | indexed_id\n        \n        id_list : id\n        \n        id_list : id_list ',' id\n        \n        gate_id_list : id\n        \n        gate_id_list : gate_id_list ',' id\n        \n        bit_list : id\n        \n        bit_list : bit_list ',' id\n        \n        primary_list : primary\n        \n        primary_list : primary_list ',' primary\n        \n        decl : qreg_decl ';'\n             | creg_decl ';'\n             | qreg_decl error\n             | creg_decl error\n             | gate_decl\n        \n        qreg_decl : QREG indexed_id\n        \n        qreg_decl : QREG error\n        \n        creg_decl : CREG indexed_id\n        \n        creg_decl : CREG error\n        \n        gate_decl : GATE id gate_scope bit_list gate_body\n        \n        gate_decl : GATE id gate_scope '(' ')' bit_list gate_body\n        \n        gate_decl : GATE id gate_scope '(' gate_id_list ')' bit_list gate_body\n        \n        gate_scope :\n        \n        gate_body : '{' '}'\n        \n        gate_body : '{' gate_op_list '}'\n        \n        gate_op_list : gate_op\n        \n        gate_op_list : gate_op_list gate_op\n        \n        unitary_op : U '(' exp_list ')' primary\n        \n        unitary_op : CX primary ',' primary\n        \n        unitary_op : id primary_list\n        \n        unitary_op : id '(' ')' primary_list\n        \n        unitary_op : id '(' exp_list ')' primary_list\n        \n        gate_op : U '(' exp_list ')' id ';'\n        \n        gate_op : U '(' exp_list ')' error\n        \n        gate_op : U '(' exp_list error\n        \n        gate_op : CX id ',' id ';'\n        \n        gate_op : CX error\n        \n        gate_op : CX id ',' error\n        \n        gate_op : id id_list ';'\n        \n        gate_op : id  id_list error\n        \n        gate_op : id '(' ')' id_list ';'\n        \n        gate_op : id '(' exp_list ')' id_list ';'\n        \n        gate_op : id '(' ')'  error\n        \n        gate_op : id '('   error\n        \n        gate_op : BARRIER id_list ';'\n        \n        gate_op : BARRIER error\n        \n        opaque : OPAQUE id gate_scope bit_list\n        \n        opaque : OPAQUE id gate_scope '(' ')' bit_list\n        \n        opaque : OPAQUE id gate_scope '(' gate_id_list ')' bit_list\n        \n        opaque : OPAQUE id gate_scope '(' error\n        \n        measure : MEASURE primary ASSIGN primary\n        \n        measure : MEASURE primary error\n        \n        barrier : BARRIER primary_list\n        \n        reset : RESET primary\n        \n        if : IF '(' id MATCHES NNINTEGER ')' quantum_op\n        if : IF '(' id error\n        if : IF '(' id MATCHES error\n        if : IF '(' id MATCHES NNINTEGER error\n        if : IF error\n        \n        quantum_op : unitary_op\n                   | opaque\n                   | measure\n                   | barrier\n                   | reset\n                   | if\n        \n        unary : NNINTEGER\n        \n        unary : REAL\n        \n        unary : PI\n        \n        unary : id\n        \n        unary : '(' expression ')'\n        \n        unary : id '(' expression ')'\n        \n        expression : '-' expression %prec negative\n                    | '+' expression %prec positive\n        \n        expression : expression '*' expression\n                    | expression '/' expression\n                    | expression '+' expression\n                    | expression '-' expression\n                    | expression '^' expression\n        \n        expression : unary\n        \n        exp_list : expression\n        \n        exp_list : exp_list ',' expression\n        \n        ignore : STRING\n        "
+    
+_lr_action_items = {'FORMAT':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,144,154,168,],[18,18,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,-40,-36,-37,]),'STRING':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,144,154,168,],[19,19,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,-40,-36,-37,]),'QREG':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,144,154,168,],[20,20,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,-40,-36,-37,]),'CREG':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,144,154,168,],[21,21,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,-40,-36,-37,]),'GATE':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,144,154,168,],[22,22,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,-40,-36,-37,]),'U':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,109,129,130,131,142,144,145,151,153,154,160,161,165,167,168,170,173,176,178,179,181,182,183,],[24,24,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,132,-39,132,-41,24,-40,-42,-52,-61,-36,-54,-55,-59,-60,-37,-50,-58,-53,-49,-56,-51,-48,-57,]),'CX':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,109,129,130,131,142,144,145,151,153,154,160,161,165,167,168,170,173,176,178,179,181,182,183,],[25,25,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,134,-39,134,-41,25,-40,-42,-52,-61,-36,-54,-55,-59,-60,-37,-50,-58,-53,-49,-56,-51,-48,-57,]),'OPAQUE':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,142,144,154,168,],[26,26,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,26,-40,-36,-37,]),'MEASURE':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,142,144,154,168,],[27,27,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,27,-40,-36,-37,]),'BARRIER':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,109,129,130,131,142,144,145,151,153,154,160,161,165,167,168,170,173,176,178,179,181,182,183,],[28,28,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,135,-39,135,-41,28,-40,-42,-52,-61,-36,-54,-55,-59,-60,-37,-50,-58,-53,-49,-56,-51,-48,-57,]),'RESET':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,142,144,154,168,],[29,29,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,29,-40,-36,-37,]),'IF':([0,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,142,144,154,168,],[30,30,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,30,-40,-36,-37,]),'ID':([0,2,3,4,7,8,11,19,20,21,22,23,25,26,27,28,29,31,32,33,34,35,36,37,38,39,40,46,49,52,54,58,61,62,64,65,68,69,75,76,77,84,86,89,90,91,92,93,94,95,98,101,107,108,109,111,123,129,130,131,133,134,135,137,138,141,142,144,145,146,149,151,153,154,160,161,162,163,165,166,167,168,169,170,173,174,176,178,179,181,182,183,],[31,31,-2,-4,-7,-12,-30,-97,31,31,31,31,31,31,31,31,31,-11,-3,-5,-8,-6,-9,-26,-28,-27,-29,-38,31,31,-38,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,-35,31,31,31,31,-39,31,-41,31,31,31,31,31,31,31,-40,-42,31,31,-52,-61,-36,-54,-55,31,31,-59,31,-60,-37,31,-50,-58,31,-53,-49,-56,-51,-48,-57,]),'error':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,46,47,48,49,50,51,52,54,55,56,57,58,59,60,61,62,63,64,65,67,68,69,70,71,72,73,75,76,77,78,79,80,81,82,84,85,86,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,111,114,115,116,117,118,119,120,121,122,123,125,126,127,128,129,130,131,133,134,135,137,138,139,140,141,142,143,144,145,146,147,148,149,151,153,154,157,158,159,160,161,162,163,165,166,167,168,169,170,171,173,174,176,178,179,181,182,183,],[8,8,-2,-4,34,36,-7,-12,38,40,-30,-75,-76,-77,-78,-79,-80,-10,-97,42,45,8,8,8,8,8,8,8,59,-11,-3,-5,-8,-6,-9,-26,-28,-27,-29,-31,-32,-33,-34,-38,-16,-45,8,-24,-17,8,-38,78,-68,-69,8,-74,81,8,8,-84,8,8,-95,8,8,-94,-81,-82,-83,8,8,8,-67,104,106,-15,-22,8,-25,8,-46,8,8,8,8,8,8,8,-87,-88,8,-44,-62,125,-66,127,-71,-13,-14,-35,8,8,8,-85,-47,-96,-89,-90,-91,-92,-93,-43,8,-65,143,-72,-23,-39,8,-41,8,151,153,8,8,-86,-63,8,8,-73,-40,-42,8,-18,161,165,-52,-61,-36,-64,-70,170,-54,-55,8,173,-59,176,-60,-37,178,-50,-19,-58,8,-53,-49,-56,-51,-48,-57,]),'$end':([1,2,3,4,7,11,19,32,33,34,35,36,37,38,39,40,107,129,144,154,168,],[0,-1,-2,-4,-7,-30,-97,-3,-5,-8,-6,-9,-26,-28,-27,-29,-35,-39,-40,-36,-37,]),';':([5,6,8,9,10,12,13,14,15,16,17,18,31,41,42,44,45,47,48,50,51,56,57,59,78,81,82,85,88,99,100,102,104,105,106,115,122,125,127,128,140,143,147,148,152,153,157,158,171,172,173,175,176,177,178,180,],[33,35,-12,37,39,-75,-76,-77,-78,-79,-80,-10,-11,-31,-32,-33,-34,-16,-45,-24,-17,-68,-69,-74,-67,-15,-22,-25,-46,-44,-62,-66,-71,-13,-14,-47,-43,-65,-72,-23,-63,-73,-18,160,167,-12,-64,-70,-19,179,-12,181,-12,182,-12,183,]),'(':([8,23,24,30,31,46,49,52,54,61,63,64,68,69,76,86,90,91,92,93,94,95,132,133,146,149,165,],[-12,49,52,58,-11,-38,64,64,-38,84,86,64,64,64,101,64,64,64,64,64,64,64,146,149,64,64,-12,]),'[':([8,31,42,43,45,47,],[-12,-11,-12,60,-12,60,]),',':([8,31,47,48,50,51,53,56,63,66,67,70,71,72,73,74,81,82,83,85,88,96,97,100,105,106,110,112,114,115,116,117,118,119,120,121,124,125,128,136,139,140,147,148,150,151,152,153,155,156,157,159,164,165,171,172,173,180,],[-12,-11,-16,62,-24,-17,75,62,-84,90,-95,-94,-81,-82,-83,90,-15,-22,108,-25,62,-87,-88,108,-13,-14,-20,138,-85,62,-96,-89,-90,-91,-92,-93,138,-12,-23,108,-86,108,-18,162,166,-12,162,-12,108,-21,108,90,90,-12,-19,162,-12,162,]),'ASSIGN':([8,31,47,51,55,81,105,106,],[-12,-11,-16,-17,77,-15,-13,-14,]),'*':([8,31,63,67,70,71,72,73,87,96,97,113,114,116,117,118,119,120,121,139,165,],[-12,-11,-84,91,-94,-81,-82,-83,91,-87,-88,91,-85,91,-89,-90,91,91,-93,-86,-12,]),'/':([8,31,63,67,70,71,72,73,87,96,97,113,114,116,117,118,119,120,121,139,165,],[-12,-11,-84,92,-94,-81,-82,-83,92,-87,-88,92,-85,92,-89,-90,92,92,-93,-86,-12,]),'+':([8,31,49,52,63,64,67,68,69,70,71,72,73,86,87,90,91,92,93,94,95,96,97,113,114,116,117,118,119,120,121,139,146,149,165,],[-12,-11,69,69,-84,69,93,69,69,-94,-81,-82,-83,69,93,69,69,69,69,69,69,-87,-88,93,-85,93,-89,-90,-91,-92,-93,-86,69,69,-12,]),'-':([8,31,49,52,63,64,67,68,69,70,71,72,73,86,87,90,91,92,93,94,95,96,97,113,114,116,117,118,119,120,121,139,146,149,165,],[-12,-11,68,68,-84,68,94,68,68,-94,-81,-82,-83,68,94,68,68,68,68,68,68,-87,-88,94,-85,94,-89,-90,-91,-92,-93,-86,68,68,-12,]),'^':([8,31,63,67,70,71,72,73,87,96,97,113,114,116,117,118,119,120,121,139,165,],[-12,-11,-84,95,-94,-81,-82,-83,95,95,95,95,-85,95,95,95,95,95,95,-86,-12,]),')':([8,31,49,63,66,67,70,71,72,73,74,84,87,96,97,101,110,112,113,114,116,117,118,119,120,121,124,125,126,139,149,156,159,164,165,],[-12,-11,65,-84,89,-95,-94,-81,-82,-83,98,111,114,-87,-88,123,-20,137,139,-85,-96,-89,-90,-91,-92,-93,141,-12,142,-86,163,-21,169,174,-12,]),'MATCHES':([8,31,79,],[-12,-11,103,]),'{':([8,31,82,83,128,136,155,],[-12,-11,-22,109,-23,109,109,]),'NNINTEGER':([49,52,60,64,68,69,86,90,91,92,93,94,95,103,146,149,],[71,71,80,71,71,71,71,71,71,71,71,71,71,126,71,71,]),'REAL':([49,52,64,68,69,86,90,91,92,93,94,95,146,149,],[72,72,72,72,72,72,72,72,72,72,72,72,72,72,]),'PI':([49,52,64,68,69,86,90,91,92,93,94,95,146,149,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),']':([80,],[105,]),'}':([109,130,131,145,151,153,160,161,165,167,170,173,176,178,179,181,182,183,],[129,144,-41,-42,-52,-61,-54,-55,-59,-60,-50,-58,-53,-49,-56,-51,-48,-57,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'main':([0,],[1,]),'program':([0,],[2,]),'statement':([0,2,],[3,32,]),'decl':([0,2,],[4,4,]),'quantum_op':([0,2,142,],[5,5,158,]),'format':([0,2,],[6,6,]),'ignore':([0,2,],[7,7,]),'qreg_decl':([0,2,],[9,9,]),'creg_decl':([0,2,],[10,10,]),'gate_decl':([0,2,],[11,11,]),'unitary_op':([0,2,142,],[12,12,12,]),'opaque':([0,2,142,],[13,13,13,]),'measure':([0,2,142,],[14,14,14,]),'barrier':([0,2,142,],[15,15,15,]),'reset':([0,2,142,],[16,16,16,]),'if':([0,2,142,],[17,17,17,]),'id':([0,2,20,21,22,23,25,26,27,28,29,49,52,58,61,62,64,65,68,69,75,76,77,84,86,89,90,91,92,93,94,95,98,101,108,109,111,123,130,133,134,135,137,138,141,142,146,149,162,163,166,169,174,],[23,23,43,43,46,47,47,54,47,47,47,63,63,79,82,47,63,47,63,63,47,82,47,110,63,47,63,63,63,63,63,63,47,110,128,133,82,82,133,147,150,147,82,156,82,23,63,63,171,147,175,177,147,]),'indexed_id':([20,21,23,25,27,28,29,62,65,75,77,89,98,],[41,44,51,51,51,51,51,51,51,51,51,51,51,]),'primary_list':([23,28,65,89,],[48,56,88,115,]),'primary':([23,25,27,28,29,62,65,75,77,89,98,],[50,53,55,50,57,85,50,99,102,50,122,]),'gate_scope':([46,54,],[61,76,]),'exp_list':([49,52,146,149,],[66,74,159,164,]),'expression':([49,52,64,68,69,86,90,91,92,93,94,95,146,149,],[67,67,87,96,97,113,116,117,118,119,120,121,67,67,]),'unary':([49,52,64,68,69,86,90,91,92,93,94,95,146,149,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'bit_list':([61,76,111,123,137,141,],[83,100,136,140,155,157,]),'gate_body':([83,136,155,],[107,154,168,]),'gate_id_list':([84,101,],[112,124,]),'gate_op_list':([109,],[130,]),'gate_op':([109,130,],[131,145,]),'id_list':([133,135,163,174,],[148,152,172,180,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> main","S'",1,None,None,None),
+  ('main -> program','main',1,'p_main','qasmparser.py',330),
+  ('program -> statement','program',1,'p_program_0','qasmparser.py',340),
+  ('program -> program statement','program',2,'p_program_1','qasmparser.py',346),
+  ('statement -> decl','statement',1,'p_statement','qasmparser.py',358),
+  ('statement -> quantum_op ;','statement',2,'p_statement','qasmparser.py',359),
+  ('statement -> format ;','statement',2,'p_statement','qasmparser.py',360),
+  ('statement -> ignore','statement',1,'p_statement','qasmparser.py',361),
+  ('statement -> quantum_op error','statement',2,'p_statement','qasmparser.py',362),
+  ('statement -> format error','statement',2,'p_statement','qasmparser.py',363),
+  ('format -> FORMAT','format',1,'p_format','qasmparser.py',374),
+  ('id -> ID','id',1,'p_id','qasmparser.py',389),
+  ('id -> error','id',1,'p_id_e','qasmparser.py',395),
+  ('indexed_id -> id [ NNINTEGER ]','indexed_id',4,'p_indexed_id','qasmparser.py',404),
+  ('indexed_id -> id [ NNINTEGER error','indexed_id',4,'p_indexed_id','qasmparser.py',405),
+  ('indexed_id -> id [ error','indexed_id',3,'p_indexed_id','qasmparser.py',406),
+  ('primary -> id','primary',1,'p_primary','qasmparser.py',420),
+  ('primary -> indexed_id','primary',1,'p_primary','qasmparser.py',421),
+  ('id_list -> id','id_list',1,'p_id_list_0','qasmparser.py',431),
+  ('id_list -> id_list , id','id_list',3,'p_id_list_1','qasmparser.py',437),
+  ('gate_id_list -> id','gate_id_list',1,'p_gate_id_list_0','qasmparser.py',448),
+  ('gate_id_list -> gate_id_list , id','gate_id_list',3,'p_gate_id_list_1','qasmparser.py',455),
+  ('bit_list -> id','bit_list',1,'p_bit_list_0','qasmparser.py',467),
+  ('bit_list -> bit_list , id','bit_list',3,'p_bit_list_1','qasmparser.py',475),
+  ('primary_list -> primary','primary_list',1,'p_primary_list_0','qasmparser.py',488),
+  ('primary_list -> primary_list , primary','primary_list',3,'p_primary_list_1','qasmparser.py',494),
+  ('decl -> qreg_decl ;','decl',2,'p_decl','qasmparser.py',506),
+  ('decl -> creg_decl ;','decl',2,'p_decl','qasmparser.py',507),
+  ('decl -> qreg_decl error','decl',2,'p_decl','qasmparser.py',508),
+  ('decl -> creg_decl error','decl',2,'p_decl','qasmparser.py',509),
+  ('decl -> gate_decl','decl',1,'p_decl','qasmparser.py',510),
+  ('qreg_decl -> QREG indexed_id','qreg_decl',2,'p_qreg_decl','qasmparser.py',525),
+  ('qreg_decl -> QREG error','qreg_decl',2,'p_qreg_decl_e','qasmparser.py',538),
+  ('creg_decl -> CREG indexed_id','creg_decl',2,'p_creg_decl','qasmparser.py',549),
+  ('creg_decl -> CREG error','creg_decl',2,'p_creg_decl_e','qasmparser.py',562),
+  ('gate_decl -> GATE id gate_scope bit_list gate_body','gate_decl',5,'p_gate_decl_0','qasmparser.py',580),
+  ('gate_decl -> GATE id gate_scope ( ) bit_list gate_body','gate_decl',7,'p_gate_decl_1','qasmparser.py',592),
+  ('gate_decl -> GATE id gate_scope ( gate_id_list ) bit_list gate_body','gate_decl',8,'p_gate_decl_2','qasmparser.py',604),
+  ('gate_scope -> <empty>','gate_scope',0,'p_gate_scope','qasmparser.py',616),
+  ('gate_body -> { }','gate_body',2,'p_gate_body_0','qasmparser.py',632),
+  ('gate_body -> { gate_op_list }','gate_body',3,'p_gate_body_1','qasmparser.py',642),
+  ('gate_op_list -> gate_op','gate_op_list',1,'p_gate_op_list_0','qasmparser.py',655),
+  ('gate_op_list -> gate_op_list gate_op','gate_op_list',2,'p_gate_op_list_1','qasmparser.py',661),
+  ('unitary_op -> U ( exp_list ) primary','unitary_op',5,'p_unitary_op_0','qasmparser.py',681),
+  ('unitary_op -> CX primary , primary','unitary_op',4,'p_unitary_op_1','qasmparser.py',689),
+  ('unitary_op -> id primary_list','unitary_op',2,'p_unitary_op_2','qasmparser.py',700),
+  ('unitary_op -> id ( ) primary_list','unitary_op',4,'p_unitary_op_3','qasmparser.py',709),
+  ('unitary_op -> id ( exp_list ) primary_list','unitary_op',5,'p_unitary_op_4','qasmparser.py',718),
+  ('gate_op -> U ( exp_list ) id ;','gate_op',6,'p_gate_op_0','qasmparser.py',739),
+  ('gate_op -> U ( exp_list ) error','gate_op',5,'p_gate_op_0e1','qasmparser.py',747),
+  ('gate_op -> U ( exp_list error','gate_op',4,'p_gate_op_0e2','qasmparser.py',753),
+  ('gate_op -> CX id , id ;','gate_op',5,'p_gate_op_1','qasmparser.py',759),
+  ('gate_op -> CX error','gate_op',2,'p_gate_op_1e1','qasmparser.py',768),
+  ('gate_op -> CX id , error','gate_op',4,'p_gate_op_1e2','qasmparser.py',779),
+  ('gate_op -> id id_list ;','gate_op',3,'p_gate_op_2','qasmparser.py',790),
+  ('gate_op -> id id_list error','gate_op',3,'p_gate_op_2e','qasmparser.py',802),
+  ('gate_op -> id ( ) id_list ;','gate_op',5,'p_gate_op_3','qasmparser.py',808),
+  ('gate_op -> id ( exp_list ) id_list ;','gate_op',6,'p_gate_op_4','qasmparser.py',817),
+  ('gate_op -> id ( ) error','gate_op',4,'p_gate_op_4e0','qasmparser.py',827),
+  ('gate_op -> id ( error','gate_op',3,'p_gate_op_4e1','qasmparser.py',833),
+  ('gate_op -> BARRIER id_list ;','gate_op',3,'p_gate_op_5','qasmparser.py',839),
+  ('gate_op -> BARRIER error','gate_op',2,'p_gate_op_5e','qasmparser.py',847),
+  ('opaque -> OPAQUE id gate_scope bit_list','opaque',4,'p_opaque_0','qasmparser.py',860),
+  ('opaque -> OPAQUE id gate_scope ( ) bit_list','opaque',6,'p_opaque_1','qasmparser.py',873),
+  ('opaque -> OPAQUE id gate_scope ( gate_id_list ) bit_list','opaque',7,'p_opaque_2','qasmparser.py',881),
+  ('opaque -> OPAQUE id gate_scope ( error','opaque',5,'p_opaque_1e','qasmparser.py',893),
+  ('measure -> MEASURE primary ASSIGN primary','measure',4,'p_measure','qasmparser.py',902),
+  ('measure -> MEASURE primary error','measure',3,'p_measure_e','qasmparser.py',910),
+  ('barrier -> BARRIER primary_list','barrier',2,'p_barrier','qasmparser.py',921),
+  ('reset -> RESET primary','reset',2,'p_reset','qasmparser.py',932),
+  ('if -> IF ( id MATCHES NNINTEGER ) quantum_op','if',7,'p_if','qasmparser.py',942),
+  ('if -> IF ( id error','if',4,'p_if','qasmparser.py',943),
+  ('if -> IF ( id MATCHES error','if',5,'p_if','qasmparser.py',944),
+  ('if -> IF ( id MATCHES NNINTEGER error','if',6,'p_if','qasmparser.py',945),
+  ('if -> IF error','if',2,'p_if','qasmparser.py',946),
+  ('quantum_op -> unitary_op','quantum_op',1,'p_quantum_op','qasmparser.py',982),
+  ('quantum_op -> opaque','quantum_op',1,'p_quantum_op','qasmparser.py',983),
+  ('quantum_op -> measure','quantum_op',1,'p_quantum_op','qasmparser.py',984),
+  ('quantum_op -> barrier','quantum_op',1,'p_quantum_op','qasmparser.py',985),
+  ('quantum_op -> reset','quantum_op',1,'p_quantum_op','qasmparser.py',986),
+  ('quantum_op -> if','quantum_op',1,'p_quantum_op','qasmparser.py',987),
+  ('unary -> NNINTEGER','unary',1,'p_unary_0','qasmparser.py',1003),
+  ('unary -> REAL','unary',1,'p_unary_1','qasmparser.py',1009),
+  ('unary -> PI','unary',1,'p_unary_2','qasmparser.py',1015),
+  ('unary -> id','unary',1,'p_unary_3','qasmparser.py',1021),
+  ('unary -> ( expression )','unary',3,'p_unary_4','qasmparser.py',1027),
+  ('unary -> id ( expression )','unary',4,'p_unary_6','qasmparser.py',1033),
+  ('expression -> - expression','expression',2,'p_expression_1','qasmparser.py',1046),
+  ('expression -> + expression','expression',2,'p_expression_1','qasmparser.py',1047),
+  ('expression -> expression * expression','expression',3,'p_expression_0','qasmparser.py',1053),
+  ('expression -> expression / expression','expression',3,'p_expression_0','qasmparser.py',1054),
+  ('expression -> expression + expression','expression',3,'p_expression_0','qasmparser.py',1055),
+  ('expression -> expression - expression','expression',3,'p_expression_0','qasmparser.py',1056),
+  ('expression -> expression ^ expression','expression',3,'p_expression_0','qasmparser.py',1057),
+  ('expression -> unary','expression',1,'p_expression_2','qasmparser.py',1063),
+  ('exp_list -> expression','exp_list',1,'p_exp_list_0','qasmparser.py',1073),
+  ('exp_list -> exp_list , expression','exp_list',3,'p_exp_list_1','qasmparser.py',1079),
+  ('ignore -> STRING','ignore',1,'p_ignore','qasmparser.py',1086),
+]
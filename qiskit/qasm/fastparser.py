@@ -0,0 +1,542 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Direct construction of circuits from OpenQASM 2 programs.
+
+This is the fast path of :meth:`.QuantumCircuit.from_qasm_str` and
+:meth:`.QuantumCircuit.from_qasm_file`.  The program is split into tokens by a single regular
+expression, which follows the rules of :class:`.QasmLexer`, and a recursive-descent pass over the
+tokens appends the instructions to the circuit as their statements are read, without building the
+abstract syntax tree of :class:`.QasmParser` and interpreting it with :func:`.ast_to_dag`.
+
+The circuits are the same as those of the full parser, with the instructions in the order of the
+program.  The checks of the full parser are repeated, but any program that is not handled here,
+including every invalid program, is left to the full parser, so that its error messages are
+unchanged.
+"""
+
+import operator
+import os
+import re
+
+import numpy as np
+
+from qiskit.circuit import Barrier, Gate, Measure, QuantumCircuit, Reset
+from qiskit.circuit.classicalregister import ClassicalRegister
+from qiskit.circuit.library.standard_gates import CXGate
+from qiskit.circuit.quantumcircuitdata import CircuitInstruction
+from qiskit.circuit.quantumregister import QuantumRegister
+from qiskit.converters.ast_to_dag import AstInterpreter
+
+from .qasmlexer import CORE_LIBS_PATH
+
+# The token rules of QasmLexer, in the order in which it tries them, followed by its literals,
+# after any whitespace and comments.  Any other character is a token on its own, which makes the
+# program invalid, and the empty token at the end of the program stops the comments from being
+# split into literals by backtracking.
+_TOKEN = re.compile(
+    r"(?:[ \t\r\n]+|//.*)*("
+    r"(?:(?:[0-9]+|(?:[0-9]+)?\.[0-9]+|[0-9]+\.)[eE][+-]?[0-9]+)|(?:(?:[0-9]+)?\.[0-9]+|[0-9]+\.)"
+    r"|[1-9]+[0-9]*|0"
+    r"|->|=="
+    r'|"(?:[^\\"]|\\.)*"'
+    r"|include"
+    r"|OPENQASM\s+[0-9]+(?:\.[0-9]+)?"
+    r"|CX|U"
+    r"|[a-z][a-zA-Z0-9_]*"
+    r"|[^ \t\r\n]"
+    r"|\Z)"
+)
+_FORMAT = re.compile(r"(\w+)\s+(\d+)(\.(\d+))?")
+
+_KEYWORDS = frozenset(
+    ["barrier", "creg", "gate", "if", "measure", "opaque", "qreg", "pi", "reset", "include"]
+)
+_EXTERNAL_FUNCTIONS = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "exp": np.exp,
+    "ln": np.log,
+    "sqrt": np.sqrt,
+    "acos": np.arccos,
+    "atan": np.arctan,
+    "asin": np.arcsin,
+}
+# The binding powers of the binary operators, and that of the prefix operators, which only bind
+# less tightly than '^'.
+_BINARY_OPERATORS = {
+    "+": (1, operator.add),
+    "-": (1, operator.sub),
+    "*": (2, operator.mul),
+    "/": (2, operator.truediv),
+    "^": (4, operator.pow),
+}
+_PREFIX_OPERATORS = {"+": operator.pos, "-": operator.neg}
+_PREFIX_POWER = 4
+
+# The gates of the included core libraries, read once per process.
+_INCLUDE_CACHE = {}
+
+
+class _Unsupported(Exception):
+    """The program is not handled by the fast path."""
+
+
+def circuit_from_qasm(qasm):
+    """Build the circuit of an OpenQASM 2 program.
+
+    Args:
+        qasm (Qasm): the program.
+
+    Returns:
+        QuantumCircuit: the circuit of the program, or ``None`` if the program must be read by
+        the full parser.
+    """
+    filename = qasm.return_filename()
+    if filename:
+        with open(filename) as ifile:
+            data = ifile.read()
+    else:
+        data = qasm._data  # pylint: disable=protected-access
+    try:
+        return _CircuitParser(_tokenize(data)).parse()
+    # Whatever goes wrong, the full parser is the reference for the outcome.
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def _tokenize(data):
+    tokens = _TOKEN.findall(data)
+    while tokens and not tokens[-1]:
+        tokens.pop()
+    return tokens
+
+
+def _included_gates(filename):
+    """Return the gates declared by a core library, which are shared by all the programs."""
+    gates = _INCLUDE_CACHE.get(filename)
+    if gates is None:
+        with open(os.path.join(CORE_LIBS_PATH, filename)) as ifile:
+            parser = _CircuitParser(_tokenize(ifile.read()))
+        parser.parse()
+        if parser.qregs or parser.cregs or parser.circuit.data:
+            raise _Unsupported
+        gates = _INCLUDE_CACHE[filename] = parser.gates
+    return gates
+
+
+def _is_id(token):
+    return "a" <= token[0] <= "z" and token not in _KEYWORDS
+
+
+class _GateDefinition:
+    """A gate or opaque declaration.
+
+    The body is a list of ``(gate, expressions, positions)`` calls of other gates, whose
+    parameters are floats or functions of the mapping from the names of the parameters of this
+    gate to their values, and whose qubits are positions in the qubits of this gate."""
+
+    __slots__ = ("name", "params", "num_qubits", "body", "standard", "unsupported")
+
+    def __init__(self, name, params, num_qubits, body, unsupported):
+        self.name = name
+        self.params = params
+        self.num_qubits = num_qubits
+        self.body = body
+        self.standard = AstInterpreter.standard_extension.get(name)
+        # The body uses U, CX or barrier, whose definitions the full parser does not build.
+        self.unsupported = unsupported
+
+
+class _CircuitParser:
+    """Recursive-descent parser of an OpenQASM 2 program, which appends its instructions to a
+    circuit as it goes."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.symbols = set()
+        self.gates = {}
+        self.qregs = {}
+        self.cregs = {}
+        self.circuit = QuantumCircuit()
+
+    def parse(self):
+        """Parse the whole program and return its circuit."""
+        tokens = self.tokens
+        if not tokens:
+            raise _Unsupported
+        while self.pos < len(tokens):
+            token = tokens[self.pos]
+            if token in ("qreg", "creg"):
+                self._register_declaration(token)
+            elif token == "gate":
+                self._gate_declaration(opaque=False)
+            elif token == "opaque":
+                self._gate_declaration(opaque=True)
+                self._expect(";")
+            elif token == "include":
+                self._include()
+            elif token.startswith("OPENQASM"):
+                parts = _FORMAT.match(token)
+                if parts.group(2) != "2" or (parts.group(4) or "0") != "0":
+                    raise _Unsupported
+                self.pos += 1
+                self._expect(";")
+            elif token == "if":
+                self._if()
+            else:
+                self._quantum_op(None)
+        return self.circuit
+
+    def _expect(self, token):
+        if self.tokens[self.pos] != token:
+            raise _Unsupported
+        self.pos += 1
+
+    def _id(self):
+        token = self.tokens[self.pos]
+        if not _is_id(token):
+            raise _Unsupported
+        self.pos += 1
+        return token
+
+    def _int(self):
+        token = self.tokens[self.pos]
+        if not token.isdigit():
+            raise _Unsupported
+        self.pos += 1
+        return int(token)
+
+    def _declare(self, name):
+        if name in self.symbols:
+            raise _Unsupported
+        self.symbols.add(name)
+
+    def _include(self):
+        self.pos += 1
+        filename = self.tokens[self.pos]
+        if filename != '"qelib1.inc"':
+            raise _Unsupported
+        self.pos += 1
+        self._expect(";")
+        for name, gate in _included_gates(filename.strip('"')).items():
+            self._declare(name)
+            self.gates[name] = gate
+
+    def _register_declaration(self, kind):
+        self.pos += 1
+        name = self._id()
+        self._expect("[")
+        size = self._int()
+        self._expect("]")
+        self._expect(";")
+        if name in _EXTERNAL_FUNCTIONS or size == 0:
+            raise _Unsupported
+        self._declare(name)
+        if kind == "qreg":
+            register = QuantumRegister(size, name)
+            self.qregs[name] = list(register)
+        else:
+            register = ClassicalRegister(size, name)
+            self.cregs[name] = (register, list(register))
+        self.circuit.add_register(register)
+
+    def _id_list(self, scope):
+        """Parse the parameters or qubits of a gate declaration, which must all be distinct."""
+        names = [self._id()]
+        while self.tokens[self.pos] == ",":
+            self.pos += 1
+            names.append(self._id())
+        for name in names:
+            if name in scope:
+                raise _Unsupported
+            scope.add(name)
+        return names
+
+    def _gate_declaration(self, opaque):
+        self.pos += 1
+        name = self._id()
+        if name in _EXTERNAL_FUNCTIONS:
+            raise _Unsupported
+        scope = set()
+        params = []
+        if self.tokens[self.pos] == "(":
+            self.pos += 1
+            if self.tokens[self.pos] != ")":
+                params = self._id_list(scope)
+            self._expect(")")
+        bits = self._id_list(scope)
+        if opaque:
+            body, unsupported = None, False
+        else:
+            body, unsupported = self._gate_body(params, bits)
+        self._declare(name)
+        self.gates[name] = _GateDefinition(name, params, len(bits), body, unsupported)
+
+    def _gate_body(self, params, bits):
+        tokens = self.tokens
+        positions = {bit: position for position, bit in enumerate(bits)}
+        params = set(params)
+        body = []
+        unsupported = False
+        self._expect("{")
+        while tokens[self.pos] != "}":
+            token = tokens[self.pos]
+            self.pos += 1
+            if token == "U":
+                self._expect("(")
+                self._expression_list(params)
+                self._bit_positions(positions, 1)
+                unsupported = True
+            elif token == "CX":
+                self._bit_positions(positions, 2)
+                unsupported = True
+            elif token == "barrier":
+                self._bit_positions(positions, None)
+                unsupported = True
+            else:
+                gate = self.gates.get(token)
+                if gate is None:
+                    raise _Unsupported
+                expressions = []
+                if tokens[self.pos] == "(":
+                    self.pos += 1
+                    if tokens[self.pos] == ")":
+                        self.pos += 1
+                    else:
+                        expressions = self._expression_list(params)
+                if len(expressions) != len(gate.params):
+                    raise _Unsupported
+                body.append((gate, expressions, self._bit_positions(positions, gate.num_qubits)))
+        self.pos += 1
+        return body, unsupported
+
+    def _bit_positions(self, positions, count):
+        """Parse the distinct qubits of an operation in a gate body, up to the closing ';'."""
+        names = [self._id()]
+        while self.tokens[self.pos] == ",":
+            self.pos += 1
+            names.append(self._id())
+        self._expect(";")
+        if (count is not None and len(names) != count) or len(set(names)) != len(names):
+            raise _Unsupported
+        return tuple(positions[name] for name in names)
+
+    def _expression_list(self, params):
+        """Parse comma-separated expressions up to the closing ')'."""
+        expressions = [self._expression(params, 0)]
+        while self.tokens[self.pos] == ",":
+            self.pos += 1
+            expressions.append(self._expression(params, 0))
+        self._expect(")")
+        return expressions
+
+    def _expression(self, params, min_power):
+        """Parse an expression by precedence climbing.
+
+        The value is a float if the expression is constant, and otherwise a function of the
+        values of the gate parameters in ``params``."""
+        tokens = self.tokens
+        token = tokens[self.pos]
+        self.pos += 1
+        if token in _PREFIX_OPERATORS:
+            value = _apply(_PREFIX_OPERATORS[token], self._expression(params, _PREFIX_POWER))
+        elif token == "(":
+            value = self._expression(params, 0)
+            self._expect(")")
+        elif token == "pi":
+            value = float(np.pi)
+        elif token.isdigit():
+            value = float(int(token))
+        elif token[0].isdigit() or token[0] == ".":
+            value = float(token)
+        elif token in _EXTERNAL_FUNCTIONS:
+            self._expect("(")
+            value = _apply(_EXTERNAL_FUNCTIONS[token], self._expression(params, 0))
+            self._expect(")")
+        elif params is not None and token in params:
+            value = operator.itemgetter(token)
+        else:
+            raise _Unsupported
+        while True:
+            binary = _BINARY_OPERATORS.get(tokens[self.pos])
+            if binary is None or binary[0] < min_power:
+                return value
+            power, function = binary
+            self.pos += 1
+            # '^' is right-associative and the others are left-associative.
+            rhs = self._expression(params, power if power == 4 else power + 1)
+            value = _apply(function, value, rhs)
+
+    def _primary(self):
+        """Parse a register or one of its bits, as the register name and the index or -1."""
+        name = self._id()
+        if self.tokens[self.pos] != "[":
+            return name, -1
+        self.pos += 1
+        index = self._int()
+        self._expect("]")
+        return name, index
+
+    def _bits(self, registers, primary):
+        """Return the bits of a register, or one of its bits, of ``registers``."""
+        name, index = primary
+        bits = registers.get(name)
+        if bits is None:
+            raise _Unsupported
+        if registers is self.cregs:
+            bits = bits[1]
+        if index < 0:
+            return bits
+        if index >= len(bits):
+            raise _Unsupported
+        return [bits[index]]
+
+    def _qubit_lists(self):
+        """Parse comma-separated distinct qubit arguments, as the lists of their qubits."""
+        primaries = [self._primary()]
+        while self.tokens[self.pos] == ",":
+            self.pos += 1
+            primaries.append(self._primary())
+        qubit_lists = [self._bits(self.qregs, primary) for primary in primaries]
+        if len(qubit_lists) > 1:
+            _check_distinct(qubit_lists)
+        return qubit_lists
+
+    def _if(self):
+        self.pos += 1
+        self._expect("(")
+        name = self._id()
+        self._expect("==")
+        value = self._int()
+        self._expect(")")
+        if name not in self.cregs or self.tokens[self.pos] in ("if", "barrier", "opaque"):
+            raise _Unsupported
+        self._quantum_op((self.cregs[name][0], value))
+
+    def _quantum_op(self, condition):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        if token == "measure":
+            qubits = self._bits(self.qregs, self._primary())
+            self._expect("->")
+            clbits = self._bits(self.cregs, self._primary())
+            if len(qubits) != len(clbits):
+                raise _Unsupported
+            for qubit, clbit in zip(qubits, clbits):
+                self._append(Measure(), (qubit,), (clbit,), condition)
+        elif token == "reset":
+            for qubit in self._bits(self.qregs, self._primary()):
+                self._append(Reset(), (qubit,), (), condition)
+        elif token == "barrier":
+            qubits = [qubit for qubits in self._qubit_lists() for qubit in qubits]
+            self._append(Barrier(len(qubits)), tuple(qubits), (), condition)
+        elif token == "CX":
+            control = self._bits(self.qregs, self._primary())
+            self._expect(",")
+            target = self._bits(self.qregs, self._primary())
+            qubit_lists = [control, target]
+            _check_distinct(qubit_lists)
+            for qubits in _broadcast(qubit_lists):
+                self._append(CXGate(), qubits, (), condition)
+        elif token == "U":
+            gate = self.gates.get("u")
+            self._expect("(")
+            args = self._expression_list(None)
+            qubits = self._bits(self.qregs, self._primary())
+            if gate is None or gate.num_qubits != 1 or len(args) < len(gate.params):
+                raise _Unsupported
+            args = args[: len(gate.params)]
+            for qubit in qubits:
+                self._append(self._operation(gate, args), (qubit,), (), condition)
+        else:
+            gate = self.gates.get(token)
+            if gate is None:
+                raise _Unsupported
+            args = []
+            if self.tokens[self.pos] == "(":
+                self.pos += 1
+                if self.tokens[self.pos] == ")":
+                    self.pos += 1
+                else:
+                    args = self._expression_list(None)
+            qubit_lists = self._qubit_lists()
+            if len(args) != len(gate.params) or len(qubit_lists) != gate.num_qubits:
+                raise _Unsupported
+            for qubits in _broadcast(qubit_lists):
+                self._append(self._operation(gate, args), qubits, (), condition)
+        self._expect(";")
+
+    def _append(self, operation, qubits, clbits, condition):
+        if condition is not None:
+            operation.condition = condition
+        self.circuit._append(CircuitInstruction(operation, qubits, clbits))
+
+    def _operation(self, gate, params):
+        if gate.standard is not None:
+            return gate.standard(*params)
+        operation = Gate(name=gate.name, num_qubits=gate.num_qubits, params=params)
+        if gate.body is not None:
+            operation.definition = self._definition(gate, params)
+        return operation
+
+    def _definition(self, gate, params):
+        if gate.unsupported:
+            raise _Unsupported
+        qreg = QuantumRegister(gate.num_qubits)
+        qubits = list(qreg)
+        values = {name: float(value) for name, value in zip(gate.params, params)}
+        rules = []
+        for child, expressions, positions in gate.body:
+            child_params = [
+                expression(values) if callable(expression) else expression
+                for expression in expressions
+            ]
+            rules.append(
+                (self._operation(child, child_params), tuple(qubits[i] for i in positions))
+            )
+        definition = QuantumCircuit(qreg)
+        for operation, operation_qubits in rules:
+            definition._append(CircuitInstruction(operation, operation_qubits, ()))
+        return definition
+
+
+def _apply(function, *args):
+    """Apply ``function`` to the values of expressions, which are floats or functions of the
+    gate parameters."""
+    if not any(callable(arg) for arg in args):
+        return function(*args)
+    args = [arg if callable(arg) else (lambda _, value=arg: value) for arg in args]
+    if len(args) == 1:
+        return lambda values: function(args[0](values))
+    return lambda values: function(args[0](values), args[1](values))
+
+
+def _check_distinct(qubit_lists):
+    qubits = [id(qubit) for qubits in qubit_lists for qubit in qubits]
+    if len(set(qubits)) != len(qubits):
+        raise _Unsupported
+
+
+def _broadcast(qubit_lists):
+    """Yield the qubits of each operation of a gate applied to the qubit arguments, where whole
+    registers of the same size are applied bit by bit."""
+    size = max(map(len, qubit_lists))
+    if size == 1:
+        yield tuple(qubits[0] for qubits in qubit_lists)
+        return
+    if any(1 < len(qubits) != size for qubits in qubit_lists):
+        raise _Unsupported
+    for index in range(size):
+        yield tuple(qubits[index] if len(qubits) > 1 else qubits[0] for qubits in qubit_lists)
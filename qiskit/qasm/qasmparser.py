@@ -12,9 +12,8 @@
 
 """OpenQASM parser."""
 
-import os
-import shutil
-import tempfile
+import copy
+import threading
 
 import numpy as np
 from ply import yacc
@@ -23,6 +22,10 @@ from . import node
 from .exceptions import QasmError
 from .qasmlexer import QasmLexer
 
+# The LALR tables of the grammar, which are shared by all the parsers of a process.
+_PARSER_LOCK = threading.Lock()
+_PARSER_TEMPLATE = None
+
 
 class QasmParser:
     """OPENQASM Parser."""
@@ -35,15 +38,13 @@ class QasmParser:
             filename = ""
         self.lexer = QasmLexer(filename)
         self.tokens = self.lexer.tokens
-        self.parse_dir = tempfile.mkdtemp(prefix="qiskit")
         self.precedence = (
             ("left", "+", "-"),
             ("left", "*", "/"),
             ("left", "negative", "positive"),
             ("right", "^"),
         )
-        # For yacc, also, write_tables = Bool and optimize = Bool
-        self.parser = yacc.yacc(module=self, debug=False, outputdir=self.parse_dir)
+        self.parser = _bound_parser(self)
         self.qasm = None
         self.parse_deb = False
         self.global_symtab = {}  # global symtab
@@ -55,8 +56,7 @@ class QasmParser:
         return self
 
     def __exit__(self, *args):
-        if os.path.exists(self.parse_dir):
-            shutil.rmtree(self.parse_dir)
+        pass
 
     def update_symtab(self, obj):
         """Update a node in the symbol table.
@@ -1154,3 +1154,35 @@ class QasmParser:
         ast = self.parser.parse(data, debug=True)
         self.parser.parse(data, debug=True)
         ast.to_string(0)
+
+
+def _bound_parser(qasm_parser):
+    """Return a PLY parser that calls the grammar rules of ``qasm_parser``.
+
+    The LALR tables are built once per process, from the tables shipped in
+    :mod:`qiskit.qasm._parsetab` if they match the grammar, and only the productions of the
+    returned parser are bound to ``qasm_parser``."""
+    global _PARSER_TEMPLATE  # pylint: disable=global-statement
+    with _PARSER_LOCK:
+        if _PARSER_TEMPLATE is None:
+            template = yacc.yacc(
+                module=qasm_parser,
+                debug=False,
+                tabmodule="qiskit.qasm._parsetab",
+                write_tables=False,
+            )
+            # The template must not keep the parser it was built from alive.
+            for production in template.productions:
+                production.callable = None
+            template.errorfunc = None
+            _PARSER_TEMPLATE = template
+    parser = copy.copy(_PARSER_TEMPLATE)
+    parser.productions = [
+        yacc.MiniProduction(prod.str, prod.name, prod.len, prod.func, prod.file, prod.line)
+        for prod in parser.productions
+    ]
+    for production in parser.productions:
+        if production.func:
+            production.callable = getattr(qasm_parser, production.func)
+    parser.errorfunc = qasm_parser.p_error
+    return parser
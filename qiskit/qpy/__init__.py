@@ -50,6 +50,8 @@ API documentation
 
    load
    dump
+   QpyArchive
+   QpyArchiveEntry
 
 QPY Compatibility
 =================
@@ -100,6 +102,33 @@ There is a circuit payload for each circuit (where the total number is dictated
 by ``num_circuits`` in the file header). There is no padding between the
 circuits in the data.
 
+.. _qpy_archive:
+
+QPY Archive
+===========
+
+A :class:`.QpyArchive` is a QPY file whose last program is followed by a table of
+contents, and then by a footer pointing to the table of contents. The footer is
+the last 22 bytes of the file:
+
+.. code-block:: c
+
+    struct {
+        char preface[6];
+        uint64_t toc_offset;
+        uint64_t toc_size;
+    }
+
+where ``preface`` is the string ``QPYTOC``, and ``toc_offset`` and ``toc_size``
+are the position and the size in bytes of the table of contents in the file.
+The table of contents is a UTF8 encoded JSON array, with an array
+``[name, metadata, offset, size]`` for each program of the file, in order,
+where ``name`` and ``metadata`` are the name and the metadata of the program,
+and ``offset`` and ``size`` are the position and the size in bytes of its
+payload in the file. Programs are appended to an archive by writing them over
+the table of contents, followed by the new table of contents and footer, and
+then by updating ``num_circuits`` in the file header.
+
 .. _qpy_version_5:
 
 Version 5
@@ -946,6 +975,7 @@ this matches the internal C representation of Python's complex type. [#f3]_
 """
 
 from .interface import dump, load
+from .archive import QpyArchive, QpyArchiveEntry
 
 # For backward compatibility. Provide, Runtime, Experiment call these private functions.
 from .binary_io import (
@@ -0,0 +1,344 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Indexed QPY files with random access to their programs."""
+
+from collections import namedtuple
+from collections.abc import Iterable
+import json
+import mmap
+import os
+import struct
+
+from qiskit.exceptions import QiskitError
+from qiskit.qpy import common, formats, type_keys
+from qiskit.qpy.exceptions import QpyError
+from qiskit.qpy.interface import (
+    _program_loader,
+    _program_type_key,
+    _program_writer,
+    _read_file_header,
+    _write_file_header,
+)
+
+QpyArchiveEntry = namedtuple("QpyArchiveEntry", ["name", "metadata", "offset", "size"])
+QpyArchiveEntry.__doc__ = """An entry of the table of contents of a :class:`.QpyArchive`.
+
+The ``name`` and ``metadata`` are those of the program, and ``offset`` and ``size`` are the
+position and the size in bytes of the serialized program in the file.
+"""
+
+_ARCHIVE_PREFACE = b"QPYTOC"
+
+
+class QpyArchive:
+    """A QPY file with a table of contents, from which single programs can be loaded.
+
+    A QPY archive is a regular QPY file, which can also be read with :func:`.load`, followed by
+    a table of contents of the programs of the file (see :ref:`qpy_archive`).  The file is
+    memory-mapped, so that a program is only deserialized when it is accessed, and only the
+    bytes of that program are read from the disk.
+
+    For example:
+
+    .. code-block:: python
+
+        from qiskit import qpy
+
+        with qpy.QpyArchive('circuits.qpy', 'a') as archive:
+            archive.append(circuits)
+
+        with qpy.QpyArchive('circuits.qpy') as archive:
+            bell = archive['bell']
+            first = archive[0]
+            names = [entry.name for entry in archive.entries]
+            for circuit in archive:
+                ...
+
+    Accessing an archive by index or by name only loads the requested program.  Iterating over an
+    archive loads the programs one by one, in the order of the file, so that the programs which
+    are not referenced anymore are freed while iterating.  Programs are appended to an archive
+    after its last program, so the existing programs of the archive are not rewritten.
+
+    A QPY file without a table of contents, written by :func:`.dump`, can also be opened.  Its
+    table of contents is then built the first time it is used, by loading all the programs of the
+    file, and it is written to the file the first time programs are appended to it.
+    """
+
+    def __init__(self, path, mode="r", metadata_serializer=None, metadata_deserializer=None):
+        """Open a QPY archive.
+
+        Args:
+            path (str): The path of the file of the archive.
+            mode (str): ``"r"`` to open an existing archive for reading, ``"a"`` to open an
+                archive for reading and appending, which is created if it does not exist, and
+                ``"w"`` to create a new empty archive, which replaces any existing file.
+            metadata_serializer (JSONEncoder): An optional JSONEncoder class that is used for the
+                metadata of the appended programs, as in :func:`.dump`.
+            metadata_deserializer (JSONDecoder): An optional JSONDecoder class that is used for
+                the metadata of the loaded programs and of the table of contents, as in
+                :func:`.load`.
+
+        Raises:
+            ValueError: if ``mode`` is not a valid mode.
+            QiskitError: if the file is not a valid QPY file.
+        """
+        if mode not in ("r", "a", "w"):
+            raise ValueError(f"Invalid mode '{mode}', expected 'r', 'a' or 'w'.")
+        self._mode = mode
+        self._metadata_serializer = metadata_serializer
+        self._metadata_deserializer = metadata_deserializer
+        self._mmap = None
+        self._entries = None
+        self._indices = None
+        create = mode == "w" or (mode == "a" and not os.path.exists(path))
+        # The file stays open until the archive is closed, by :meth:`close` or by its context.
+        if mode == "r":
+            self._file = open(path, "rb")  # pylint: disable=consider-using-with
+        elif create:
+            self._file = open(path, "w+b")  # pylint: disable=consider-using-with
+        else:
+            self._file = open(path, "r+b")  # pylint: disable=consider-using-with
+        try:
+            if create:
+                _write_file_header(self._file, type_keys.Program.CIRCUIT, 0)
+                self._write_toc(b"[]", self._file.tell())
+                self._file.flush()
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self):
+        """Map the file and read its header and the position of its table of contents."""
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as ex:
+            raise QiskitError("Input file is not a valid QPY file") from ex
+        self._header, self._type_key = _read_file_header(self._mmap)
+        self._loader = _program_loader(self._type_key)
+        self._data_start = self._mmap.tell()
+        # The offset and the size of the table of contents, if the file has one.
+        self._toc = None
+        size = len(self._mmap)
+        if size >= self._data_start + formats.ARCHIVE_FOOTER_SIZE:
+            footer = formats.ARCHIVE_FOOTER._make(
+                struct.unpack(
+                    formats.ARCHIVE_FOOTER_PACK,
+                    self._mmap[size - formats.ARCHIVE_FOOTER_SIZE :],
+                )
+            )
+            if (
+                footer.preface == _ARCHIVE_PREFACE
+                and footer.toc_offset + footer.toc_size + formats.ARCHIVE_FOOTER_SIZE == size
+            ):
+                self._toc = (footer.toc_offset, footer.toc_size)
+        self._entries = None
+        self._indices = None
+
+    def _read_programs(self):
+        """Yield the offset, the size and the program of each program of the file, in order."""
+        offset = self._data_start
+        for _ in range(self._header.num_programs):
+            # Seek before each program, as the programs can be accessed while iterating.
+            self._mmap.seek(offset)
+            program = self._loader(
+                self._mmap,
+                self._header.qpy_version,
+                metadata_deserializer=self._metadata_deserializer,
+            )
+            end = self._mmap.tell()
+            yield offset, end - offset, program
+            offset = end
+
+    @property
+    def entries(self):
+        """The table of contents of the archive, as a tuple of :class:`.QpyArchiveEntry`."""
+        if self._entries is None:
+            if self._toc is not None:
+                offset, size = self._toc
+                toc = json.loads(
+                    self._mmap[offset : offset + size].decode(common.ENCODE),
+                    cls=self._metadata_deserializer,
+                )
+                self._entries = tuple(QpyArchiveEntry(*entry) for entry in toc)
+            else:
+                self._entries = tuple(
+                    QpyArchiveEntry(program.name, program.metadata, offset, size)
+                    for offset, size, program in self._read_programs()
+                )
+        return self._entries
+
+    def _data_end(self):
+        """Return the offset of the end of the last program of the file."""
+        if self._toc is not None:
+            return self._toc[0]
+        if not self.entries:
+            return self._data_start
+        return self.entries[-1].offset + self.entries[-1].size
+
+    def __len__(self):
+        return self._header.num_programs
+
+    def __iter__(self):
+        for _, _, program in self._read_programs():
+            yield program
+
+    def __contains__(self, name):
+        return name in self._name_indices()
+
+    def __getitem__(self, key):
+        """Load a single program of the archive.
+
+        Args:
+            key (int or str): The index of the program in the archive, or its name.  If several
+                programs have the same name, the first one is loaded.
+
+        Returns:
+            The loaded program.
+
+        Raises:
+            IndexError: if there is no program at the index ``key``.
+            KeyError: if there is no program named ``key``.
+        """
+        if isinstance(key, str):
+            try:
+                key = self._name_indices()[key]
+            except KeyError:
+                raise KeyError(f"No program named '{key}' in the archive.") from None
+        entry = self.entries[key]
+        self._mmap.seek(entry.offset)
+        return self._loader(
+            self._mmap,
+            self._header.qpy_version,
+            metadata_deserializer=self._metadata_deserializer,
+        )
+
+    def _name_indices(self):
+        """Return the mapping of the names of the programs to their first index."""
+        if self._indices is None:
+            self._indices = {}
+            for index, entry in enumerate(self.entries):
+                self._indices.setdefault(entry.name, index)
+        return self._indices
+
+    def append(self, programs):
+        """Append programs to the end of the archive.
+
+        The existing programs of the archive are not rewritten, only the header and the table of
+        contents of the file are updated.
+
+        Args:
+            programs (list or QuantumCircuit or ScheduleBlock): QPY supported object(s) to append
+                to the archive.  They must have the same type as the programs of the archive.
+
+        Raises:
+            QpyError: if the archive is read-only, if the programs have a different type than
+                those of the archive, or if the archive was written with another version of the
+                QPY format.
+            TypeError: When invalid data type is input.
+        """
+        if self._mode == "r":
+            raise QpyError("Cannot append to a QPY archive opened in read-only mode.")
+        if not isinstance(programs, Iterable):
+            programs = [programs]
+        programs = list(programs)
+        if not programs:
+            return
+        type_key = _program_type_key(programs)
+        num_programs = len(self)
+        if num_programs:
+            if type_key != self._type_key:
+                raise QpyError(
+                    "Input programs have a different data type than the programs of the archive."
+                )
+            if self._header.qpy_version != common.QPY_VERSION:
+                raise QpyError(
+                    f"Cannot append to a QPY archive of version {self._header.qpy_version}, "
+                    f"the current QPY version is {common.QPY_VERSION}."
+                )
+            offset = self._data_end()
+            if self._toc is None:
+                toc = self._dump_toc(self.entries)
+            else:
+                toc = self._mmap[self._toc[0] : self._toc[0] + self._toc[1]]
+        else:
+            offset = None
+            toc = b"[]"
+        self._mmap.close()
+        self._mmap = None
+
+        if offset is None:
+            # There is nothing to keep in an empty archive, whose type can change.
+            self._file.seek(0)
+            self._file.truncate()
+            _write_file_header(self._file, type_key, 0)
+            offset = self._file.tell()
+        self._file.seek(offset)
+        writer = _program_writer(type_key)
+        new_entries = []
+        for program in programs:
+            offset = self._file.tell()
+            writer(self._file, program, metadata_serializer=self._metadata_serializer)
+            new_entries.append(
+                QpyArchiveEntry(program.name, program.metadata, offset, self._file.tell() - offset)
+            )
+        new_toc = self._dump_toc(new_entries)
+        if toc == b"[]":
+            toc = new_toc
+        else:
+            toc = toc[:-1] + b"," + new_toc[1:]
+        self._write_toc(toc, self._file.tell())
+        # The number of programs of the header is updated last, so that the file is a valid QPY
+        # file with the previous programs until all the programs are written.
+        self._file.seek(0)
+        if num_programs:
+            self._file.write(
+                struct.pack(
+                    formats.FILE_HEADER_PACK,
+                    *self._header._replace(num_programs=num_programs + len(programs)),
+                )
+            )
+        else:
+            _write_file_header(self._file, type_key, len(programs))
+        self._file.flush()
+        self._open()
+
+    def _dump_toc(self, entries):
+        """Serialize the table of contents of ``entries``."""
+        return json.dumps(
+            [list(entry) for entry in entries],
+            separators=(",", ":"),
+            cls=self._metadata_serializer,
+        ).encode(common.ENCODE)
+
+    def _write_toc(self, toc, offset):
+        """Write the table of contents ``toc`` and the footer of the file at ``offset``."""
+        self._file.seek(offset)
+        self._file.write(toc)
+        self._file.write(
+            struct.pack(formats.ARCHIVE_FOOTER_PACK, _ARCHIVE_PREFACE, offset, len(toc))
+        )
+        self._file.truncate()
+
+    def close(self):
+        """Close the archive."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
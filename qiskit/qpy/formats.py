@@ -26,6 +26,11 @@ FILE_HEADER = namedtuple(
 FILE_HEADER_PACK = "!6sBBBBQ"
 FILE_HEADER_SIZE = struct.calcsize(FILE_HEADER_PACK)
 
+# ARCHIVE_FOOTER
+ARCHIVE_FOOTER = namedtuple("ARCHIVE_FOOTER", ["preface", "toc_offset", "toc_size"])
+ARCHIVE_FOOTER_PACK = "!6sQQ"
+ARCHIVE_FOOTER_SIZE = struct.calcsize(ARCHIVE_FOOTER_PACK)
+
 # CIRCUIT_HEADER_V2
 CIRCUIT_HEADER_V2 = namedtuple(
     "HEADER",
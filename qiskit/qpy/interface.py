@@ -130,39 +130,9 @@ def dump(
     if not isinstance(programs, Iterable):
         programs = [programs]
 
-    program_types = set()
-    for program in programs:
-        program_types.add(type(program))
-
-    if len(program_types) > 1:
-        raise QpyError(
-            "Input programs contain multiple data types. "
-            "Different data type must be serialized separately."
-        )
-    program_type = next(iter(program_types))
-
-    if issubclass(program_type, QuantumCircuit):
-        type_key = type_keys.Program.CIRCUIT
-        writer = binary_io.write_circuit
-    elif program_type is ScheduleBlock:
-        type_key = type_keys.Program.SCHEDULE_BLOCK
-        writer = binary_io.write_schedule_block
-    else:
-        raise TypeError(f"'{program_type}' is not supported data type.")
-
-    version_match = VERSION_PATTERN_REGEX.search(__version__)
-    version_parts = [int(x) for x in version_match.group("release").split(".")]
-    header = struct.pack(
-        formats.FILE_HEADER_PACK,
-        b"QISKIT",
-        common.QPY_VERSION,
-        version_parts[0],
-        version_parts[1],
-        version_parts[2],
-        len(programs),
-    )
-    file_obj.write(header)
-    common.write_type_key(file_obj, type_key)
+    type_key = _program_type_key(programs)
+    writer = _program_writer(type_key)
+    _write_file_header(file_obj, type_key, len(programs))
 
     for program in programs:
         writer(file_obj, program, metadata_serializer=metadata_serializer)
@@ -219,6 +189,88 @@ def load(
         QiskitError: if ``file_obj`` is not a valid QPY file
         TypeError: When invalid data type is loaded.
     """
+    data, type_key = _read_file_header(file_obj)
+    loader = _program_loader(type_key)
+
+    programs = []
+    for _ in range(data.num_programs):
+        programs.append(
+            loader(file_obj, data.qpy_version, metadata_deserializer=metadata_deserializer)
+        )
+    return programs
+
+
+def _program_type_key(programs):
+    """Return the type key of the QPY file of ``programs``.
+
+    Raises:
+        QpyError: When multiple data format is mixed in ``programs``.
+        TypeError: When invalid data type is input.
+    """
+    program_types = set()
+    for program in programs:
+        program_types.add(type(program))
+
+    if len(program_types) > 1:
+        raise QpyError(
+            "Input programs contain multiple data types. "
+            "Different data type must be serialized separately."
+        )
+    program_type = next(iter(program_types))
+
+    if issubclass(program_type, QuantumCircuit):
+        return type_keys.Program.CIRCUIT
+    if program_type is ScheduleBlock:
+        return type_keys.Program.SCHEDULE_BLOCK
+    raise TypeError(f"'{program_type}' is not supported data type.")
+
+
+def _program_writer(type_key):
+    """Return the function writing a single program of the type ``type_key``."""
+    if type_key == type_keys.Program.CIRCUIT:
+        return binary_io.write_circuit
+    return binary_io.write_schedule_block
+
+
+def _program_loader(type_key):
+    """Return the function reading a single program of the type ``type_key``.
+
+    Raises:
+        TypeError: When ``type_key`` is not a valid program type.
+    """
+    if type_key == type_keys.Program.CIRCUIT:
+        return binary_io.read_circuit
+    if type_key == type_keys.Program.SCHEDULE_BLOCK:
+        return binary_io.read_schedule_block
+    raise TypeError(f"Invalid payload format data kind '{type_key}'.")
+
+
+def _write_file_header(file_obj, type_key, num_programs):
+    """Write the file header of a QPY file of ``num_programs`` programs of the type ``type_key``."""
+    version_match = VERSION_PATTERN_REGEX.search(__version__)
+    version_parts = [int(x) for x in version_match.group("release").split(".")]
+    header = struct.pack(
+        formats.FILE_HEADER_PACK,
+        b"QISKIT",
+        common.QPY_VERSION,
+        version_parts[0],
+        version_parts[1],
+        version_parts[2],
+        num_programs,
+    )
+    file_obj.write(header)
+    common.write_type_key(file_obj, type_key)
+
+
+def _read_file_header(file_obj):
+    """Read the file header of a QPY file.
+
+    Returns:
+        tuple: The ``FILE_HEADER`` and the type key of the programs of the file.
+
+    Raises:
+        QiskitError: if ``file_obj`` is not a valid QPY file
+    """
     data = formats.FILE_HEADER._make(
         struct.unpack(
             formats.FILE_HEADER_PACK,
@@ -258,16 +310,4 @@ def load(
     else:
         type_key = common.read_type_key(file_obj)
 
-    if type_key == type_keys.Program.CIRCUIT:
-        loader = binary_io.read_circuit
-    elif type_key == type_keys.Program.SCHEDULE_BLOCK:
-        loader = binary_io.read_schedule_block
-    else:
-        raise TypeError(f"Invalid payload format data kind '{type_key}'.")
-
-    programs = []
-    for _ in range(data.num_programs):
-        programs.append(
-            loader(file_obj, data.qpy_version, metadata_deserializer=metadata_deserializer)
-        )
-    return programs
+    return data, type_key
@@ -225,8 +225,6 @@ class Operator(LinearOp):
         Returns:
             Operator: An operator representing the input circuit
         """
-        dimension = 2**circuit.num_qubits
-        op = cls(np.eye(dimension))
         if layout is None:
             if not ignore_set_layout:
                 layout = getattr(circuit, "_layout", None)
@@ -241,8 +239,7 @@ class Operator(LinearOp):
             }
         # Convert circuit to an instruction
         instruction = circuit.to_instruction()
-        op._append_instruction(instruction, qargs=qargs)
-        return op
+        return cls(_FusedUnitary.unitary(instruction, circuit.num_qubits, qargs=qargs))
 
     def is_unitary(self, atol=None, rtol=None):
         """Return True if operator is a unitary matrix."""
@@ -502,13 +499,10 @@ class Operator(LinearOp):
         if hasattr(instruction, "__array__"):
             return Operator(np.array(instruction, dtype=complex))
 
-        dimension = 2**instruction.num_qubits
-        op = Operator(np.eye(dimension))
         # Convert circuit to an instruction
         if isinstance(instruction, QuantumCircuit):
             instruction = instruction.to_instruction()
-        op._append_instruction(instruction)
-        return op
+        return Operator(_FusedUnitary.unitary(instruction))
 
     @classmethod
     def _instruction_to_matrix(cls, obj):
@@ -536,56 +530,219 @@ class Operator(LinearOp):
     def _append_instruction(self, obj, qargs=None):
         """Update the current Operator by apply an instruction."""
         from qiskit.circuit.barrier import Barrier
-        from .scalar_op import ScalarOp
 
         mat = self._instruction_to_matrix(obj)
+        if mat is None:
+            if isinstance(obj, Barrier):
+                return
+            # If the instruction doesn't have a matrix defined we build the unitary of its
+            # circuit decomposition definition from fused blocks of its gates.
+            mat = _FusedUnitary.unitary(obj)
+        # Perform the composition and inplace update the current state
+        # of the operator
+        op = self.compose(mat, qargs=qargs)
+        self._data = op.data
+
+
+# Update docstrings for API docs
+generate_apidocs(Operator)
+
+
+# Matrices of standard gates, keyed by the gate class, its number of qubits, its numeric
+# parameters and its control state.  The cached matrices are read-only, since they are shared.
+_STANDARD_GATE_MATRICES = {}
+_MAX_CACHED_MATRICES = 1024
+
+
+def _instruction_matrix(obj):
+    """Return the matrix of an instruction if it is defined or None otherwise, reusing the
+    cached matrix of a standard gate with the same numeric parameters."""
+    key = _standard_gate_key(obj)
+    if key is None:
+        return Operator._instruction_to_matrix(obj)
+    mat = _STANDARD_GATE_MATRICES.get(key)
+    if mat is None:
+        mat = Operator._instruction_to_matrix(obj)
+        if mat is None:
+            return None
+        mat = np.array(mat, dtype=complex)
+        mat.setflags(write=False)
+        if len(_STANDARD_GATE_MATRICES) >= _MAX_CACHED_MATRICES:
+            _STANDARD_GATE_MATRICES.clear()
+        _STANDARD_GATE_MATRICES[key] = mat
+    return mat
+
+
+def _standard_gate_key(obj):
+    """The cache key of the matrix of a standard gate, or None if it is not cacheable."""
+    if not type(obj).__module__.startswith("qiskit.circuit.library.standard_gates"):
+        return None
+    params = tuple(obj.params)
+    if not all(isinstance(param, Number) for param in params):
+        return None
+    return (type(obj), obj.num_qubits, params, getattr(obj, "ctrl_state", None))
+
+
+class _FusedBlocks:
+    """Fuse a stream of gate matrices into blocks.
+
+    Consecutive gates that act on at most :attr:`max_fused_qubits` qubits in total are fused
+    into a single matrix, which is passed to :meth:`_apply_block` once the next gate does not
+    fit in the block, or on :meth:`flush`.
+    """
+
+    max_fused_qubits = 5
+
+    def __init__(self):
+        # The fused gates that are not applied yet, as a matrix on ``block_qubits``, the first
+        # qubit being the least significant.
+        self.block = None
+        self.block_qubits = []
+
+    def apply_matrix(self, mat, qargs):
+        """Apply the matrix ``mat`` on the qubits ``qargs``, fusing it into the current block."""
+        new_qubits = [qubit for qubit in qargs if qubit not in self.block_qubits]
+        if self.block is not None and (
+            len(self.block_qubits) + len(new_qubits) > self.max_fused_qubits
+        ):
+            self.flush()
+            new_qubits = list(qargs)
+        if self.block is None:
+            self.block = np.eye(1, dtype=complex)
+        if new_qubits:
+            # The new qubits are more significant than the qubits of the block.
+            self.block = np.kron(np.eye(2 ** len(new_qubits), dtype=complex), self.block)
+            self.block_qubits = self.block_qubits + new_qubits
+        positions = [self.block_qubits.index(qubit) for qubit in qargs]
+        num_block = len(self.block_qubits)
+        block = np.reshape(self.block, num_block * (2,) + (2**num_block,))
+        self.block = np.reshape(
+            _contract(mat, block, [num_block - 1 - position for position in reversed(positions)]),
+            (2**num_block, 2**num_block),
+        )
+
+    def flush(self):
+        """Apply the current block of fused gates."""
+        if self.block is None:
+            return
+        block, qubits = self.block, list(reversed(self.block_qubits))
+        self.block = None
+        self.block_qubits = []
+        self._apply_block(block, qubits)
+
+    def _apply_block(self, mat, qubits):
+        """Apply the fused matrix ``mat`` on ``qubits``, the first being the most significant."""
+        raise NotImplementedError
+
+
+class _FusedUnitary(_FusedBlocks):
+    """Build the unitary matrix of an instruction on ``num_qubits`` qubits from fused blocks.
+
+    The unitary is kept as a tensor with one output axis for each qubit followed by one input
+    axis for each qubit.  A qubit only gets its pair of axes once a block acts on it, so that the
+    intermediate tensors stay small while few qubits are involved, and the output axes are
+    permuted by each contraction; the axes are only put back in order at the end.
+    """
+
+    def __init__(self, num_qubits):
+        super().__init__()
+        self.num_qubits = num_qubits
+        self.tensor = np.ones((), dtype=complex)
+        # The qubits of the output axes and of the input axes of the tensor, in axis order.
+        self.out_qubits = []
+        self.in_qubits = []
+        self.phase = 0.0
+
+    def apply_instruction(self, obj, qargs):
+        """Apply an instruction on the qubits ``qargs``."""
+        from qiskit.circuit.barrier import Barrier
+
+        mat = _instruction_matrix(obj)
         if mat is not None:
-            # Perform the composition and inplace update the current state
-            # of the operator
-            op = self.compose(mat, qargs=qargs)
-            self._data = op.data
-        elif isinstance(obj, Barrier):
+            self.apply_matrix(mat, qargs)
             return
-        else:
-            # If the instruction doesn't have a matrix defined we use its
-            # circuit decomposition definition if it exists, otherwise we
-            # cannot compose this gate and raise an error.
-            if obj.definition is None:
-                raise QiskitError(f"Cannot apply Operation: {obj.name}")
-            if not isinstance(obj.definition, QuantumCircuit):
+        if isinstance(obj, Barrier):
+            return
+
+        # If the instruction doesn't have a matrix defined we use its
+        # circuit decomposition definition if it exists, otherwise we
+        # cannot compose this gate and raise an error.
+        if obj.definition is None:
+            raise QiskitError(f"Cannot apply Operation: {obj.name}")
+        if not isinstance(obj.definition, QuantumCircuit):
+            raise QiskitError(
+                f'Operation "{obj.name}" '
+                f"definition is {type(obj.definition)} but expected QuantumCircuit."
+            )
+        if obj.definition.global_phase:
+            self.phase += float(obj.definition.global_phase)
+        qubits = {qubit: index for index, qubit in enumerate(obj.definition.qubits)}
+        for instruction in obj.definition:
+            if instruction.clbits:
                 raise QiskitError(
-                    'Operation "{}" '
-                    "definition is {} but expected QuantumCircuit.".format(
-                        obj.name, type(obj.definition)
-                    )
+                    "Cannot apply operation with classical bits:" f" {instruction.operation.name}"
                 )
-            if obj.definition.global_phase:
-                dimension = 2**obj.num_qubits
-                op = self.compose(
-                    ScalarOp(dimension, np.exp(1j * float(obj.definition.global_phase))),
-                    qargs=qargs,
-                )
-                self._data = op.data
-            flat_instr = obj.definition
-            bit_indices = {
-                bit: index
-                for bits in [flat_instr.qubits, flat_instr.clbits]
-                for index, bit in enumerate(bits)
-            }
-
-            for instruction in flat_instr:
-                if instruction.clbits:
-                    raise QiskitError(
-                        "Cannot apply operation with classical bits:"
-                        f" {instruction.operation.name}"
-                    )
-                # Get the integer position of the flat register
-                if qargs is None:
-                    new_qargs = [bit_indices[tup] for tup in instruction.qubits]
-                else:
-                    new_qargs = [qargs[bit_indices[tup]] for tup in instruction.qubits]
-                self._append_instruction(instruction.operation, qargs=new_qargs)
-
+            new_qargs = [qargs[qubits[tup]] for tup in instruction.qubits]
+            self.apply_instruction(instruction.operation, new_qargs)
+
+    def _expand(self, qubits):
+        """Add the axes of the identity on ``qubits`` to the tensor."""
+        num_new, num_old = len(qubits), len(self.out_qubits)
+        identity = np.reshape(np.eye(2**num_new, dtype=complex), (2 * num_new) * (2,))
+        tensor = np.multiply.outer(identity, self.tensor)
+        self.tensor = np.moveaxis(
+            tensor,
+            list(range(num_new, 2 * num_new)),
+            list(range(num_new + num_old, 2 * num_new + num_old)),
+        )
+        self.out_qubits = list(qubits) + self.out_qubits
+        self.in_qubits = list(qubits) + self.in_qubits
+
+    def _apply_block(self, mat, qubits):
+        new_qubits = [qubit for qubit in qubits if qubit not in self.out_qubits]
+        if new_qubits:
+            self._expand(new_qubits)
+        axes = [self.out_qubits.index(qubit) for qubit in qubits]
+        self.tensor = _contract(mat, self.tensor, axes, keep_order=False)
+        # The contracted output axes are now the leading axes of the tensor.
+        self.out_qubits = qubits + [qubit for qubit in self.out_qubits if qubit not in qubits]
+
+    def finish(self):
+        """Apply the remaining gates and return the unitary matrix."""
+        self.flush()
+        idle = [qubit for qubit in range(self.num_qubits) if qubit not in self.out_qubits]
+        if idle:
+            self._expand(idle)
+        num_qubits = self.num_qubits
+        order = [self.out_qubits.index(qubit) for qubit in reversed(range(num_qubits))]
+        order += [num_qubits + self.in_qubits.index(qubit) for qubit in reversed(range(num_qubits))]
+        mat = np.reshape(np.transpose(self.tensor, order), (2**num_qubits, 2**num_qubits))
+        if self.phase:
+            mat = mat * np.exp(1j * self.phase)
+        return mat
 
-# Update docstrings for API docs
-generate_apidocs(Operator)
+    @classmethod
+    def unitary(cls, obj, num_qubits=None, qargs=None):
+        """Return the unitary matrix of the instruction ``obj`` applied on the qubits ``qargs``
+        of ``num_qubits`` qubits."""
+        if num_qubits is None:
+            num_qubits = obj.num_qubits
+        if qargs is None:
+            qargs = range(obj.num_qubits)
+        fused = cls(num_qubits)
+        fused.apply_instruction(obj, [qargs[index] for index in range(obj.num_qubits)])
+        return fused.finish()
+
+
+def _contract(mat, tensor, axes, keep_order=True):
+    """Contract the matrix ``mat`` on the qubits ``axes`` of ``tensor``, the first of which is the
+    most significant qubit of ``mat``.
+
+    If ``keep_order`` is False, the contracted axes are the leading axes of the result instead
+    of being moved back to their original positions."""
+    num_axes = len(axes)
+    mat = np.reshape(mat, (2 * num_axes) * (2,))
+    result = np.tensordot(mat, tensor, axes=(list(range(num_axes, 2 * num_axes)), axes))
+    if keep_order:
+        result = np.moveaxis(result, list(range(num_axes)), axes)
+    return result
@@ -26,7 +26,12 @@ from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.states.quantum_state import QuantumState
 from qiskit.quantum_info.operators.mixins.tolerances import TolerancesMixin
-from qiskit.quantum_info.operators.operator import Operator
+from qiskit.quantum_info.operators.operator import (
+    Operator,
+    _FusedBlocks,
+    _contract,
+    _instruction_matrix,
+)
 from qiskit.quantum_info.operators.symplectic import Pauli, SparsePauliOp
 from qiskit.quantum_info.operators.op_shape import OpShape
 from qiskit.quantum_info.operators.predicates import matrix_equal
@@ -834,21 +839,50 @@ class Statevector(QuantumState, TolerancesMixin):
     @staticmethod
     def _evolve_instruction(statevec, obj, qargs=None):
         """Update the current Statevector by applying an instruction."""
+        if qargs is None:
+            qargs = list(range(obj.num_qubits))
+        evolution = _FusedEvolution(statevec)
+        evolution.apply_instruction(obj, qargs)
+        evolution.finish()
+        return statevec
+
+
+class _FusedEvolution(_FusedBlocks):
+    """Evolve a qubit statevector by a stream of instructions.
+
+    The gates are fused into blocks, which are applied to the state with one tensor contraction
+    each.  The state is kept as a tensor with one axis for each qubit, whose axes are permuted by
+    each contraction; they are only put back in order when the state is needed, at a reset or at
+    the end of the evolution.
+    """
+
+    def __init__(self, statevec):
+        super().__init__()
+        self.statevec = statevec
+        num_qubits = statevec.num_qubits
+        self.tensor = np.reshape(statevec.data, num_qubits * (2,))
+        # The qubit of each axis of the tensor, the first axis being the most significant.
+        self.axis_qubits = list(reversed(range(num_qubits)))
+        self.phase = 0.0
+
+    def apply_instruction(self, obj, qargs):
+        """Apply an instruction on the qubits ``qargs``."""
         from qiskit.circuit.reset import Reset
         from qiskit.circuit.barrier import Barrier
 
-        mat = Operator._instruction_to_matrix(obj)
+        mat = _instruction_matrix(obj)
         if mat is not None:
-            # Perform the composition and inplace update the current state
-            # of the operator
-            return Statevector._evolve_operator(statevec, Operator(mat), qargs=qargs)
-
-        # Special instruction types
+            self.apply_matrix(np.asarray(mat, dtype=complex), qargs)
+            return
         if isinstance(obj, Reset):
+            self.flush()
+            statevec = self.state()
             statevec._data = statevec.reset(qargs)._data
-            return statevec
+            self.tensor = np.reshape(statevec._data, statevec.num_qubits * (2,))
+            self.axis_qubits = list(reversed(range(statevec.num_qubits)))
+            return
         if isinstance(obj, Barrier):
-            return statevec
+            return
 
         # If the instruction doesn't have a matrix defined we use its
         # circuit decomposition definition if it exists, otherwise we
@@ -857,23 +891,41 @@ class Statevector(QuantumState, TolerancesMixin):
             raise QiskitError(f"Cannot apply Instruction: {obj.name}")
         if not isinstance(obj.definition, QuantumCircuit):
             raise QiskitError(
-                "{} instruction definition is {}; expected QuantumCircuit".format(
-                    obj.name, type(obj.definition)
-                )
+                f"{obj.name} instruction definition is {type(obj.definition)};"
+                " expected QuantumCircuit"
             )
 
         if obj.definition.global_phase:
-            statevec._data *= np.exp(1j * float(obj.definition.global_phase))
+            self.phase += float(obj.definition.global_phase)
         qubits = {qubit: i for i, qubit in enumerate(obj.definition.qubits)}
         for instruction in obj.definition:
             if instruction.clbits:
                 raise QiskitError(
                     f"Cannot apply instruction with classical bits: {instruction.operation.name}"
                 )
-            # Get the integer position of the flat register
-            if qargs is None:
-                new_qargs = [qubits[tup] for tup in instruction.qubits]
-            else:
-                new_qargs = [qargs[qubits[tup]] for tup in instruction.qubits]
-            Statevector._evolve_instruction(statevec, instruction.operation, qargs=new_qargs)
-        return statevec
+            new_qargs = [qargs[qubits[tup]] for tup in instruction.qubits]
+            self.apply_instruction(instruction.operation, new_qargs)
+
+    def _apply_block(self, mat, qubits):
+        axes = [self.axis_qubits.index(qubit) for qubit in qubits]
+        self.tensor = _contract(mat, self.tensor, axes, keep_order=False)
+        # The contracted axes are now the leading axes of the tensor.
+        self.axis_qubits = qubits + [qubit for qubit in self.axis_qubits if qubit not in qubits]
+
+    def state(self):
+        """Put the axes of the state back in order and return the statevector."""
+        num_qubits = len(self.axis_qubits)
+        order = [self.axis_qubits.index(qubit) for qubit in reversed(range(num_qubits))]
+        self.tensor = np.transpose(self.tensor, order)
+        self.axis_qubits = list(reversed(range(num_qubits)))
+        self.statevec._data = np.reshape(self.tensor, 2**num_qubits)
+        if self.phase:
+            self.statevec._data = self.statevec._data * np.exp(1j * self.phase)
+            self.phase = 0.0
+            self.tensor = np.reshape(self.statevec._data, num_qubits * (2,))
+        return self.statevec
+
+    def finish(self):
+        """Apply the remaining gates and write the final state to the statevector."""
+        self.flush()
+        self.state()
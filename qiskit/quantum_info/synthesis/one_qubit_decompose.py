@@ -54,6 +54,53 @@ ONE_QUBIT_EULER_BASIS_GATES = {
 }
 
 
+class _OneQubitGateSequence:
+    """The gates of a single-qubit circuit, in order, and its global phase.
+
+    This is the lightweight stand-in for a one-qubit :class:`.QuantumCircuit` that the
+    ``_circuit_*`` methods of :class:`.OneQubitEulerDecomposer` build, so that candidate
+    decompositions can be compared without constructing a circuit for each of them.  The global
+    phase is normalized like the one of a :class:`.QuantumCircuit`.
+    """
+
+    __slots__ = ("gates", "_global_phase")
+
+    def __init__(self, global_phase=0):
+        self.gates = []
+        self.global_phase = global_phase
+
+    @property
+    def global_phase(self):
+        """The global phase of the sequence, in the interval [0, 2π)."""
+        return self._global_phase
+
+    @global_phase.setter
+    def global_phase(self, angle):
+        angle = float(angle)
+        if not angle:
+            self._global_phase = 0
+        else:
+            self._global_phase = angle % (2 * np.pi)
+
+    def append(self, gate):
+        """Append ``gate`` to the end of the sequence."""
+        self.gates.append(gate)
+
+    def __len__(self):
+        return len(self.gates)
+
+    def __iter__(self):
+        return iter(self.gates)
+
+    def to_circuit(self):
+        """Return the sequence as a :class:`.QuantumCircuit` on a single qubit."""
+        qr = QuantumRegister(1, "qr")
+        circuit = QuantumCircuit(qr, global_phase=self._global_phase)
+        for gate in self.gates:
+            circuit._append(gate, [qr[0]], [])
+        return circuit
+
+
 class OneQubitEulerDecomposer:
     r"""A class for decomposing 1-qubit unitaries into Euler angle rotations.
 
@@ -165,7 +212,7 @@ class OneQubitEulerDecomposer:
     def _decompose(self, unitary, simplify=True, atol=DEFAULT_ATOL):
         theta, phi, lam, phase = self._params(unitary)
         circuit = self._circuit(theta, phi, lam, phase, simplify=simplify, atol=atol)
-        return circuit
+        return circuit.to_circuit()
 
     @property
     def basis(self):
@@ -224,7 +271,9 @@ class OneQubitEulerDecomposer:
 
         # We rescale the input matrix to be special unitary (det(U) = 1)
         # This ensures that the quaternion representation is real
-        coeff = la.det(mat) ** (-0.5)
+        # The matrices are products of gate matrices, so the finiteness check of scipy is skipped,
+        # which is most of the cost of the determinant of a 2x2 matrix.
+        coeff = la.det(mat, check_finite=False) ** (-0.5)
         phase = -cmath.phase(coeff)
         su_mat = coeff * mat  # U in SU(2)
         # OpenQASM SU(2) parameterization:
@@ -327,11 +376,10 @@ class OneQubitEulerDecomposer:
                 of theta.
 
         Returns:
-            QuantumCircuit: The assembled circuit.
+            _OneQubitGateSequence: The assembled gate sequence.
         """
         gphase = phase - (phi + lam) / 2
-        qr = QuantumRegister(1, "qr")
-        circuit = QuantumCircuit(qr)
+        circuit = _OneQubitGateSequence()
         if not simplify:
             atol = -1.0
         # Early return for the middle-gate-free case
@@ -343,7 +391,7 @@ class OneQubitEulerDecomposer:
             lam = _mod_2pi(lam, atol)
             if abs(lam) > atol:
 
-                circuit._append(k_gate(lam), [qr[0]], [])
+                circuit.append(k_gate(lam))
                 gphase += lam / 2
             circuit.global_phase = gphase
             return circuit
@@ -357,12 +405,12 @@ class OneQubitEulerDecomposer:
         lam = _mod_2pi(lam, atol)
         if abs(lam) > atol:
             gphase += lam / 2
-            circuit._append(k_gate(lam), [qr[0]], [])
-        circuit._append(a_gate(theta), [qr[0]], [])
+            circuit.append(k_gate(lam))
+        circuit.append(a_gate(theta))
         phi = _mod_2pi(phi, atol)
         if abs(phi) > atol:
             gphase += phi / 2
-            circuit._append(k_gate(phi), [qr[0]], [])
+            circuit.append(k_gate(phi))
         circuit.global_phase = gphase
         return circuit
 
@@ -428,40 +476,37 @@ class OneQubitEulerDecomposer:
 
     @staticmethod
     def _circuit_u3(theta, phi, lam, phase, simplify=True, atol=DEFAULT_ATOL):
-        qr = QuantumRegister(1, "qr")
-        circuit = QuantumCircuit(qr, global_phase=phase)
+        circuit = _OneQubitGateSequence(global_phase=phase)
         phi = _mod_2pi(phi, atol)
         lam = _mod_2pi(lam, atol)
         if not simplify or abs(theta) > atol or abs(phi) > atol or abs(lam) > atol:
-            circuit._append(U3Gate(theta, phi, lam), [qr[0]], [])
+            circuit.append(U3Gate(theta, phi, lam))
         return circuit
 
     @staticmethod
     def _circuit_u321(theta, phi, lam, phase, simplify=True, atol=DEFAULT_ATOL):
-        qr = QuantumRegister(1, "qr")
-        circuit = QuantumCircuit(qr, global_phase=phase)
+        circuit = _OneQubitGateSequence(global_phase=phase)
         if not simplify:
             atol = -1.0
         if abs(theta) < atol:
             tot = _mod_2pi(phi + lam, atol)
             if abs(tot) > atol:
-                circuit._append(U1Gate(tot), [qr[0]], [])
+                circuit.append(U1Gate(tot))
         elif abs(theta - np.pi / 2) < atol:
-            circuit._append(U2Gate(_mod_2pi(phi, atol), _mod_2pi(lam, atol)), [qr[0]], [])
+            circuit.append(U2Gate(_mod_2pi(phi, atol), _mod_2pi(lam, atol)))
         else:
-            circuit._append(U3Gate(theta, _mod_2pi(phi, atol), _mod_2pi(lam, atol)), [qr[0]], [])
+            circuit.append(U3Gate(theta, _mod_2pi(phi, atol), _mod_2pi(lam, atol)))
         return circuit
 
     @staticmethod
     def _circuit_u(theta, phi, lam, phase, simplify=True, atol=DEFAULT_ATOL):
-        qr = QuantumRegister(1, "qr")
-        circuit = QuantumCircuit(qr, global_phase=phase)
+        circuit = _OneQubitGateSequence(global_phase=phase)
         if not simplify:
             atol = -1.0
         phi = _mod_2pi(phi, atol)
         lam = _mod_2pi(lam, atol)
         if abs(theta) > atol or abs(phi) > atol or abs(lam) > atol:
-            circuit._append(UGate(theta, phi, lam), [qr[0]], [])
+            circuit.append(UGate(theta, phi, lam))
         return circuit
 
     @staticmethod
@@ -471,17 +516,16 @@ class OneQubitEulerDecomposer:
 
         NOTE: `pfun` is responsible for eliding gates where appropriate (e.g., at angle value 0).
         """
-        qr = QuantumRegister(1, "qr")
-        circuit = QuantumCircuit(qr, global_phase=phase)
+        circuit = _OneQubitGateSequence(global_phase=phase)
         # Early return for zero SX decomposition
         if np.abs(theta) < atol:
-            pfun(circuit, qr, lam + phi)
+            pfun(circuit, lam + phi)
             return circuit
         # Early return for single SX decomposition
         if abs(theta - np.pi / 2) < atol:
-            pfun(circuit, qr, lam - np.pi / 2)
-            xfun(circuit, qr)
-            pfun(circuit, qr, phi + np.pi / 2)
+            pfun(circuit, lam - np.pi / 2)
+            xfun(circuit)
+            pfun(circuit, phi + np.pi / 2)
             return circuit
         # General double SX decomposition
         if abs(theta - np.pi) < atol:
@@ -496,14 +540,14 @@ class OneQubitEulerDecomposer:
         theta, phi = theta + np.pi, phi + np.pi
         circuit.global_phase -= np.pi / 2
         # Emit circuit
-        pfun(circuit, qr, lam)
+        pfun(circuit, lam)
         if xpifun and abs(_mod_2pi(theta)) < atol:
-            xpifun(circuit, qr)
+            xpifun(circuit)
         else:
-            xfun(circuit, qr)
-            pfun(circuit, qr, theta)
-            xfun(circuit, qr)
-        pfun(circuit, qr, phi)
+            xfun(circuit)
+            pfun(circuit, theta)
+            xfun(circuit)
+        pfun(circuit, phi)
 
         return circuit
 
@@ -512,13 +556,13 @@ class OneQubitEulerDecomposer:
         if not simplify:
             atol = -1.0
 
-        def fnz(circuit, qr, phi):
+        def fnz(circuit, phi):
             phi = _mod_2pi(phi, atol)
             if abs(phi) > atol:
-                circuit._append(PhaseGate(phi), [qr[0]], [])
+                circuit.append(PhaseGate(phi))
 
-        def fnx(circuit, qr):
-            circuit._append(SXGate(), [qr[0]], [])
+        def fnx(circuit):
+            circuit.append(SXGate())
 
         return OneQubitEulerDecomposer._circuit_psx_gen(theta, phi, lam, phase, atol, fnz, fnx)
 
@@ -527,14 +571,14 @@ class OneQubitEulerDecomposer:
         if not simplify:
             atol = -1.0
 
-        def fnz(circuit, qr, phi):
+        def fnz(circuit, phi):
             phi = _mod_2pi(phi, atol)
             if abs(phi) > atol:
-                circuit._append(RZGate(phi), [qr[0]], [])
+                circuit.append(RZGate(phi))
                 circuit.global_phase += phi / 2
 
-        def fnx(circuit, qr):
-            circuit._append(SXGate(), [qr[0]], [])
+        def fnx(circuit):
+            circuit.append(SXGate())
 
         return OneQubitEulerDecomposer._circuit_psx_gen(theta, phi, lam, phase, atol, fnz, fnx)
 
@@ -543,14 +587,14 @@ class OneQubitEulerDecomposer:
         if not simplify:
             atol = -1.0
 
-        def fnz(circuit, qr, phi):
+        def fnz(circuit, phi):
             phi = _mod_2pi(phi, atol)
             if abs(phi) > atol:
-                circuit._append(U1Gate(phi), [qr[0]], [])
+                circuit.append(U1Gate(phi))
 
-        def fnx(circuit, qr):
+        def fnx(circuit):
             circuit.global_phase += np.pi / 4
-            circuit._append(RXGate(np.pi / 2), [qr[0]], [])
+            circuit.append(RXGate(np.pi / 2))
 
         return OneQubitEulerDecomposer._circuit_psx_gen(theta, phi, lam, phase, atol, fnz, fnx)
 
@@ -559,17 +603,17 @@ class OneQubitEulerDecomposer:
         if not simplify:
             atol = -1.0
 
-        def fnz(circuit, qr, phi):
+        def fnz(circuit, phi):
             phi = _mod_2pi(phi, atol)
             if abs(phi) > atol:
-                circuit._append(RZGate(phi), [qr[0]], [])
+                circuit.append(RZGate(phi))
                 circuit.global_phase += phi / 2
 
-        def fnx(circuit, qr):
-            circuit._append(SXGate(), [qr[0]], [])
+        def fnx(circuit):
+            circuit.append(SXGate())
 
-        def fnxpi(circuit, qr):
-            circuit._append(XGate(), [qr[0]], [])
+        def fnxpi(circuit):
+            circuit.append(XGate())
 
         return OneQubitEulerDecomposer._circuit_psx_gen(
             theta, phi, lam, phase, atol, fnz, fnx, fnxpi
@@ -577,15 +621,14 @@ class OneQubitEulerDecomposer:
 
     @staticmethod
     def _circuit_rr(theta, phi, lam, phase, simplify=True, atol=DEFAULT_ATOL):
-        qr = QuantumRegister(1, "qr")
-        circuit = QuantumCircuit(qr, global_phase=phase)
+        circuit = _OneQubitGateSequence(global_phase=phase)
         if not simplify:
             atol = -1.0
         if abs(theta) < atol and abs(phi) < atol and abs(lam) < atol:
             return circuit
         if abs(theta - np.pi) > atol:
-            circuit._append(RGate(theta - np.pi, _mod_2pi(np.pi / 2 - lam, atol)), [qr[0]], [])
-        circuit._append(RGate(np.pi, _mod_2pi(0.5 * (phi - lam + np.pi), atol)), [qr[0]], [])
+            circuit.append(RGate(theta - np.pi, _mod_2pi(np.pi / 2 - lam, atol)))
+        circuit.append(RGate(np.pi, _mod_2pi(0.5 * (phi - lam + np.pi), atol)))
         return circuit
 
 
@@ -23,9 +23,11 @@ Experiment Results (:mod:`qiskit.result`)
    Result
    ResultError
    Counts
+   PackedMemory
    marginal_counts
    marginal_distribution
    marginal_memory
+   marginal_int_memory
 
 Distributions
 =============
@@ -44,6 +46,7 @@ Mitigation
    BaseReadoutMitigator
    CorrelatedReadoutMitigator
    LocalReadoutMitigator
+   SubspaceReadoutMitigator
 
 """
 
@@ -52,10 +55,13 @@ from .exceptions import ResultError
 from .utils import marginal_counts
 from .utils import marginal_distribution
 from .utils import marginal_memory
+from .utils import marginal_int_memory
 from .counts import Counts
+from .packed_memory import PackedMemory
 
 from .distributions.probability import ProbDistribution
 from .distributions.quasi import QuasiDistribution
 from .mitigation.base_readout_mitigator import BaseReadoutMitigator
 from .mitigation.correlated_readout_mitigator import CorrelatedReadoutMitigator
 from .mitigation.local_readout_mitigator import LocalReadoutMitigator
+from .mitigation.subspace_readout_mitigator import SubspaceReadoutMitigator
@@ -0,0 +1,333 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Readout mitigator class restricted to the subspace of the observed bitstrings
+"""
+
+
+from typing import Optional, List, Tuple, Iterable, Union, Dict
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from qiskit.exceptions import QiskitError
+from ..distributions.quasi import QuasiDistribution
+from ..counts import Counts
+from ..packed_memory import PackedMemory
+from .local_readout_mitigator import LocalReadoutMitigator
+
+# The largest number of elements of the intermediate (pairs, bits) arrays used to build a block
+# of elements of the reduced assignment matrix.
+_MAX_BLOCK_ELEMENTS = 2**24
+
+
+class SubspaceReadoutMitigator(LocalReadoutMitigator):
+    """1-qubit tensor product readout error mitigator restricted to the observed bitstrings.
+
+    Mitigates :meth:`expectation_value` and :meth:`quasi_probabilities` like
+    :class:`LocalReadoutMitigator`, but the assignment matrix is only inverted over the subspace
+    of the bitstrings that occur in the counts, as in the matrix-free measurement mitigation
+    method of Nation *et al.*, PRX Quantum 2, 040326 (2021).  The reduced assignment matrix only
+    has the elements between bitstrings that differ in at most ``distance`` bits, its columns are
+    renormalized, and the mitigated quasi-probabilities are found with the preconditioned GMRES
+    iterative solver.  Memory and time thus scale with the number of distinct counts instead of
+    :math:`2^N`, which allows the mitigation of the counts of more than a hundred qubits.
+    """
+
+    def __init__(
+        self,
+        assignment_matrices: Optional[List[np.ndarray]] = None,
+        qubits: Optional[Iterable[int]] = None,
+        backend=None,
+        distance: Optional[int] = 3,
+        tol: float = 1e-8,
+        max_iter: Optional[int] = None,
+    ):
+        """Initialize a SubspaceReadoutMitigator
+
+        Args:
+            assignment_matrices: Optional, list of single-qubit readout error assignment matrices.
+            qubits: Optional, the measured physical qubits for mitigation.
+            backend: Optional, backend name.
+            distance: Optional, the largest Hamming distance between two bitstrings whose
+                assignment matrix element is kept.  If ``None``, all the elements between the
+                observed bitstrings are kept.
+            tol: The relative tolerance of the iterative solver.
+            max_iter: Optional, the maximum number of iterations of the iterative solver.
+
+        Raises:
+            QiskitError: matrices sizes do not agree with number of qubits
+        """
+        super().__init__(assignment_matrices, qubits, backend)
+        self._distance = distance
+        self._tol = tol
+        self._max_iter = max_iter
+        # The log of the probability that each qubit is read correctly in each state, and the
+        # log of the ratio of the probability that it is flipped to the probability that it is
+        # read correctly.  An element of the assignment matrix is the product of the correct
+        # readout probabilities of its column, times the flip ratios of the differing bits.
+        diag = np.array([np.diag(amat) for amat in self._assignment_mats], dtype=float)
+        flip = np.array([amat[::-1].diagonal() for amat in self._assignment_mats], dtype=float)
+        with np.errstate(divide="ignore"):
+            self._log_diag = np.log(diag)
+            self._log_flip_ratio = np.log(flip) - self._log_diag
+
+    @property
+    def settings(self) -> Dict:
+        """Return settings."""
+        return {
+            **super().settings,
+            "distance": self._distance,
+            "tol": self._tol,
+            "max_iter": self._max_iter,
+        }
+
+    def expectation_value(
+        self,
+        data: Counts,
+        diagonal: Union[dict, str, np.ndarray] = None,
+        qubits: Iterable[int] = None,
+        clbits: Optional[List[int]] = None,
+        shots: Optional[int] = None,
+    ) -> Tuple[float, float]:
+        r"""Compute the mitigated expectation value of a diagonal observable.
+
+        This computes the mitigated estimator of
+        :math:`\langle O \rangle = \mbox{Tr}[\rho. O]` of a diagonal observable
+        :math:`O = \sum_{x\in\{0, 1\}^n} O(x)|x\rangle\!\langle x|`, from the mitigated
+        quasi-probabilities of the observed bitstrings.
+
+        Args:
+            data: Counts object
+            diagonal: Optional, the diagonal of the observable, either as a string of ``I``,
+                      ``Z``, ``0`` and ``1`` characters, as a vector
+                      :math:`[O(0), ..., O(2^n -1)]` or as a dictionary of the values
+                      :math:`O(x)` of the integer outcomes :math:`x`, where missing outcomes
+                      have value 0.  If ``None`` the the default value is
+                      :math:`[1, -1]^\otimes n`.
+            qubits: Optional, the measured physical qubits the count
+                    bitstrings correspond to. If None qubits are assumed to be
+                    :math:`[0, ..., n-1]`.
+            clbits: Optional, if not None marginalize counts to the specified bits.
+            shots: the number of shots.
+
+        Returns:
+            (float, float): the expectation value and an upper bound of the standard deviation.
+
+        Raises:
+            QiskitError: if the diagonal or the qubit and clbit kwargs are not valid.
+        """
+        if qubits is None:
+            qubits = self._qubits
+        outcomes, bits, probs, shots = self._subspace_counts(data, qubits, clbits)
+        quasi = self._solve(bits, probs, qubits)
+
+        if diagonal is None:
+            values = 1 - 2 * (np.count_nonzero(bits, axis=1) % 2)
+        elif isinstance(diagonal, str):
+            values = np.ones(len(outcomes), dtype=float)
+            for bit, char in enumerate(reversed(diagonal)):
+                if char == "Z":
+                    values *= 1 - 2 * bits[:, bit].astype(float)
+                elif char in "01":
+                    values *= bits[:, bit] == (char == "1")
+                elif char != "I":
+                    raise QiskitError(f"Invalid diagonal string character {char}")
+        elif isinstance(diagonal, dict):
+            values = np.array([diagonal.get(outcome, 0) for outcome in outcomes], dtype=float)
+        else:
+            values = np.asarray(diagonal)[np.array(outcomes, dtype=np.int64)]
+
+        expval = float(np.dot(values, quasi))
+        return (expval, self.stddev_upper_bound(shots, qubits))
+
+    def quasi_probabilities(
+        self,
+        data: Counts,
+        qubits: Optional[List[int]] = None,
+        clbits: Optional[List[int]] = None,
+        shots: Optional[bool] = False,
+    ) -> QuasiDistribution:
+        """Compute mitigated quasi probabilities value.
+
+        Args:
+            data: counts object
+            qubits: qubits the count bitstrings correspond to.
+            clbits: Optional, marginalize counts to just these bits.
+            shots: the number of shots.
+
+        Returns:
+            QuasiDistibution: A dictionary containing pairs of [output, mean] where "output"
+                is the key in the dictionaries, which is the integer value of an observed
+                bitstring, and "mean" is its mitigated quasi-probability.
+
+        Raises:
+            QiskitError: if qubit and clbit kwargs are not valid.
+        """
+        if qubits is None:
+            qubits = self._qubits
+        outcomes, bits, probs, shots = self._subspace_counts(data, qubits, clbits)
+        quasi = self._solve(bits, probs, qubits)
+        return QuasiDistribution(
+            dict(zip(outcomes, quasi.tolist())),
+            stddev_upper_bound=self.stddev_upper_bound(shots, qubits),
+        )
+
+    def _subspace_counts(self, data, qubits, clbits):
+        """Return the distinct observed outcomes over ``qubits``, as integers and as a boolean
+        array whose column ``k`` is the bit of ``qubits[k]``, with their probabilities and the
+        number of shots."""
+        if clbits is None:
+            clbits = [self._qubit_index[qubit] for qubit in qubits]
+        elif len(clbits) != len(qubits):
+            raise QiskitError(
+                f"Num qubits ({len(qubits)}) does not match number of clbits ({len(clbits)})."
+            )
+        if not data:
+            raise QiskitError("Cannot mitigate empty counts.")
+        keys = [_outcome_int(key) for key in data]
+        num_bits = max(max(clbits) + 1, max(key.bit_length() for key in keys))
+        bits = PackedMemory.from_ints(keys, num_bits=num_bits).to_bits()[:, clbits]
+        # Merge the outcomes that are equal on the marginalized bits.
+        bits, inverse = np.unique(bits, axis=0, return_inverse=True)
+        counts = np.zeros(len(bits), dtype=float)
+        np.add.at(counts, inverse.ravel(), np.fromiter(data.values(), dtype=float))
+        shots = counts.sum()
+        outcomes = PackedMemory.from_bits(bits).to_ints().tolist()
+        return outcomes, bits, counts / shots, int(shots)
+
+    def _solve(self, bits, probs, qubits):
+        """Solve the reduced assignment matrix equation for the mitigated quasi-probabilities."""
+        amat = self._reduced_assignment_matrix(bits, qubits)
+        # Jacobi preconditioner.
+        inv_diag = 1 / amat.diagonal()
+        precond = sparse_linalg.LinearOperator(amat.shape, matvec=lambda x: inv_diag * x)
+        quasi, info = sparse_linalg.gmres(
+            amat, probs, x0=probs, tol=self._tol, atol=0, maxiter=self._max_iter, M=precond
+        )
+        if info > 0:
+            raise QiskitError(
+                f"Readout mitigation did not converge to tolerance {self._tol} "
+                f"within {info} iterations."
+            )
+        return quasi
+
+    def _reduced_assignment_matrix(self, bits, qubits):
+        """Return the sparse assignment matrix between the bitstrings of the rows of ``bits``,
+        with the elements beyond the Hamming distance dropped and normalized columns."""
+        qubit_indices = [self._qubit_index[qubit] for qubit in qubits]
+        log_diag = self._log_diag[qubit_indices]
+        log_flip_ratio = self._log_flip_ratio[qubit_indices]
+        num_outcomes, num_qubits = bits.shape
+        positions = np.arange(num_qubits)
+        col_log_diag = log_diag[positions, bits.astype(int)].sum(axis=1)
+        col_log_flip_ratio = log_flip_ratio[positions, bits.astype(int)]
+
+        distance = num_qubits if self._distance is None else self._distance
+        rows, cols, values = [], [], []
+        for row, col, flips in _pairs_within_distance(bits, distance):
+            pair, bit = np.nonzero(flips)
+            log_values = col_log_diag[col] + np.bincount(
+                pair, weights=col_log_flip_ratio[col[pair], bit], minlength=len(row)
+            )
+            rows.append(row)
+            cols.append(col)
+            values.append(np.exp(log_values))
+        amat = sparse.csc_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(num_outcomes, num_outcomes),
+        )
+        # Renormalize the columns to probability distributions over the subspace.
+        col_sums = np.asarray(amat.sum(axis=0)).ravel()
+        return amat @ sparse.diags(1 / col_sums)
+
+
+def _outcome_int(key):
+    if isinstance(key, int):
+        return key
+    key = key.replace(" ", "")
+    return int(key, 0) if key.startswith(("0x", "0b")) else int(key, 2)
+
+
+def _candidate_pairs(bits, distance):
+    """Yield blocks of pairs of rows of ``bits`` that include all the pairs of rows within the
+    Hamming ``distance``.
+
+    If the bits are split into ``distance + 1`` chunks, two rows within the distance are equal
+    on at least one chunk, so only the pairs of rows that share the value of a chunk are
+    candidates, instead of all the pairs.  A pair is only yielded for the first chunk that its
+    rows share."""
+    num_rows, num_bits = bits.shape
+    if distance + 1 > num_bits:
+        block_size = max(1, _MAX_BLOCK_ELEMENTS // max(1, num_rows * num_bits))
+        for start in range(0, num_rows, block_size):
+            stop = min(start + block_size, num_rows)
+            yield np.repeat(np.arange(start, stop), num_rows), np.tile(
+                np.arange(num_rows), stop - start
+            )
+        return
+
+    chunk_labels = []
+    for chunk in np.array_split(np.arange(num_bits), distance + 1):
+        _, labels = np.unique(bits[:, chunk], axis=0, return_inverse=True)
+        chunk_labels.append(labels.ravel())
+    block_size = max(1, _MAX_BLOCK_ELEMENTS // num_bits)
+    for index, labels in enumerate(chunk_labels):
+        order = np.argsort(labels, kind="stable")
+        group_sizes = np.bincount(labels)
+        group_starts = np.cumsum(group_sizes) - group_sizes
+        # Each row is paired with all the rows of its group of equal chunks, in blocks of rows.
+        sizes = group_sizes[labels[order]]
+        ends = np.cumsum(sizes)
+        start = 0
+        while start < num_rows:
+            stop = max(start + 1, np.searchsorted(ends, ends[start] - sizes[start] + block_size))
+            block_sizes = sizes[start:stop]
+            offsets = np.arange(block_sizes.sum()) - np.repeat(
+                np.cumsum(block_sizes) - block_sizes, block_sizes
+            )
+            rows = np.repeat(order[start:stop], block_sizes)
+            cols = order[np.repeat(group_starts[labels[order[start:stop]]], block_sizes) + offsets]
+            first = np.ones(len(rows), dtype=bool)
+            for previous in chunk_labels[:index]:
+                first &= previous[rows] != previous[cols]
+            yield rows[first], cols[first]
+            start = stop
+
+
+def _popcount(words):
+    """Count the set bits of each element of a ``uint64`` array."""
+    words = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    words = (words & np.uint64(0x3333333333333333)) + (
+        (words >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    words = (words + (words >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (words * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def _pairs_within_distance(bits, distance):
+    """Yield blocks of ``(rows, cols, flips)`` of the pairs of rows of ``bits`` within the
+    Hamming ``distance``, where ``flips`` are the bits that differ between the rows."""
+    num_rows, num_bits = bits.shape
+    num_words = -(-num_bits // 64)
+    packed = np.zeros((num_rows, 8 * num_words), dtype=np.uint8)
+    packed[:, : -(-num_bits // 8)] = np.packbits(bits, axis=1)
+    packed = packed.view(np.uint64)
+    block_size = max(1, _MAX_BLOCK_ELEMENTS // max(1, num_bits))
+    for rows, cols in _candidate_pairs(bits, distance):
+        for start in range(0, len(rows), block_size):
+            row = rows[start : start + block_size]
+            col = cols[start : start + block_size]
+            diff = packed[row] ^ packed[col]
+            keep = _popcount(diff).sum(axis=1) <= distance
+            flips = np.unpackbits(diff[keep].view(np.uint8), axis=1, count=num_bits)
+            yield row[keep], col[keep], flips.astype(bool)
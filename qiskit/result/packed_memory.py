@@ -0,0 +1,341 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""An array-backed container for the classified memory of a circuit execution."""
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.utils.multiprocessing import local_hardware_info
+from qiskit.result import postprocess
+from qiskit.result.counts import Counts
+
+
+class PackedMemory(Sequence):
+    """The per-shot outcomes of a circuit execution, stored as packed bits.
+
+    The outcome of each shot is stored as a row of a ``uint8`` array of ``ceil(num_bits / 8)``
+    bytes, which are the big-endian bytes of the integer value of the outcome, so that a million
+    shots of a hundred classical bits take about 13 MB instead of the hundreds of megabytes of a
+    list of strings.  Conversions to integers, hexadecimal strings, bit arrays, counts and
+    marginals work on the whole array at once, without building a string for each shot.
+
+    A :class:`PackedMemory` is also a sequence of the bitstrings of the shots, formatted
+    like the memory returned by :meth:`.Result.get_memory`, which are only built when they are
+    accessed::
+
+        memory = result.get_packed_memory()
+        memory[0]  # '00 101'
+        memory.marginal([0, 3]).get_counts()  # {'01': 515, '11': 509}
+    """
+
+    def __init__(self, array, num_bits, creg_sizes=None):
+        """Build a packed memory object
+
+        Args:
+            array (np.ndarray): A ``uint8`` array of shape ``(shots, ceil(num_bits / 8))``,
+                whose rows are the big-endian bytes of the outcomes of the shots.
+            num_bits (int): The number of classical bits of each outcome.
+            creg_sizes (list): a nested list where the inner element is a list
+                of tuples containing both the classical register name and
+                classical register size. For example,
+                ``[('c_reg', 2), ('my_creg', 4)]``, used to format the bitstrings.
+
+        Raises:
+            QiskitError: If the shape of ``array`` does not match ``num_bits``.
+        """
+        array = np.asarray(array, dtype=np.uint8)
+        if array.ndim != 2 or array.shape[1] != _num_bytes(num_bits):
+            raise QiskitError(
+                f"The shape of the array {array.shape} does not match {num_bits} bits per shot."
+            )
+        self._array = array
+        self._num_bits = num_bits
+        self.creg_sizes = creg_sizes
+
+    @classmethod
+    def from_ints(cls, memory, num_bits=None, creg_sizes=None):
+        """Build a packed memory object from the integer outcomes of the shots.
+
+        Args:
+            memory (Sequence[int]): The outcome of each shot.
+            num_bits (int): The number of classical bits of each outcome.  Defaults to the
+                number of bits of the largest outcome.
+            creg_sizes (list): The classical register names and sizes, as in
+                :meth:`__init__`.
+
+        Returns:
+            PackedMemory: The packed memory.
+        """
+        if num_bits is None:
+            num_bits = max((int(value).bit_length() for value in memory), default=0)
+        num_bytes = _num_bytes(num_bits)
+        if num_bytes <= 8:
+            values = np.asarray(memory, dtype=np.uint64).astype(">u8")
+            array = values.view(np.uint8).reshape(-1, 8)[:, 8 - num_bytes :]
+        else:
+            raw = b"".join(int(value).to_bytes(num_bytes, "big") for value in memory)
+            array = np.frombuffer(raw, dtype=np.uint8).reshape(-1, num_bytes)
+        return cls(np.ascontiguousarray(array), num_bits, creg_sizes)
+
+    @classmethod
+    def from_hex(cls, memory, num_bits=None, creg_sizes=None):
+        """Build a packed memory object from hexadecimal outcomes, like ``['0x0', '0x5']``.
+
+        Args:
+            memory (Sequence[str]): The hexadecimal outcome of each shot.
+            num_bits (int): The number of classical bits of each outcome.  Defaults to the
+                number of bits of the largest outcome.
+            creg_sizes (list): The classical register names and sizes, as in
+                :meth:`__init__`.
+
+        Returns:
+            PackedMemory: The packed memory.
+        """
+        return cls.from_ints([int(value, 16) for value in memory], num_bits, creg_sizes)
+
+    @classmethod
+    def from_bitstrings(cls, memory, creg_sizes=None):
+        """Build a packed memory object from bitstring outcomes, like ``['00 10', '01 11']``.
+
+        Args:
+            memory (Sequence[str]): The bitstring outcome of each shot, all of the same length.
+                Spaces and underscores are ignored.
+            creg_sizes (list): The classical register names and sizes, as in
+                :meth:`__init__`.
+
+        Returns:
+            PackedMemory: The packed memory.
+        """
+        memory = [bitstring.replace(" ", "").replace("_", "") for bitstring in memory]
+        num_bits = len(memory[0]) if memory else 0
+        chars = np.frombuffer("".join(memory).encode("ascii"), dtype=np.uint8)
+        # The first character of a bitstring is its most significant bit.
+        bits = (chars.reshape(len(memory), num_bits) == ord("1"))[:, ::-1]
+        return cls.from_bits(bits, creg_sizes)
+
+    @classmethod
+    def from_bits(cls, bits, creg_sizes=None):
+        """Build a packed memory object from an array of bits.
+
+        Args:
+            bits (np.ndarray): A boolean array of shape ``(shots, num_bits)``, whose column ``i``
+                is the classical bit ``i`` of the outcomes.
+            creg_sizes (list): The classical register names and sizes, as in
+                :meth:`__init__`.
+
+        Returns:
+            PackedMemory: The packed memory.
+        """
+        bits = np.asarray(bits, dtype=bool)
+        num_bits = bits.shape[1]
+        padding = 8 * _num_bytes(num_bits) - num_bits
+        # Most significant bit first, padded with zeros on the left to whole bytes.
+        bits = np.pad(bits[:, ::-1], ((0, 0), (padding, 0)))
+        return cls(np.packbits(bits, axis=1), num_bits, creg_sizes)
+
+    @property
+    def array(self):
+        """The ``uint8`` array of the big-endian bytes of the outcome of each shot."""
+        return self._array
+
+    @property
+    def num_bits(self):
+        """The number of classical bits of each outcome."""
+        return self._num_bits
+
+    @property
+    def shots(self):
+        """The number of shots."""
+        return self._array.shape[0]
+
+    def __len__(self):
+        return self.shots
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PackedMemory(self._array[index], self._num_bits, self.creg_sizes)
+        return self._format(int.from_bytes(self._array[index].tobytes(), "big"))
+
+    def __iter__(self):
+        return iter(self.to_bitstrings())
+
+    def __eq__(self, other):
+        if isinstance(other, PackedMemory):
+            return (
+                self._num_bits == other._num_bits
+                and self.creg_sizes == other.creg_sizes
+                and np.array_equal(self._array, other._array)
+            )
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return self.to_bitstrings() == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"PackedMemory(shots={self.shots}, num_bits={self._num_bits})"
+
+    def to_ints(self):
+        """Return the integer outcome of each shot.
+
+        Returns:
+            np.ndarray: The outcomes, as a ``uint64`` array if there are at most 64 bits per
+            shot, or else as an object array of Python integers.
+        """
+        num_bytes = self._array.shape[1]
+        if num_bytes <= 8:
+            padded = np.zeros((self.shots, 8), dtype=np.uint8)
+            padded[:, 8 - num_bytes :] = self._array
+            return padded.view(">u8").ravel().astype(np.uint64)
+        values = np.empty(self.shots, dtype=object)
+        values[:] = [int.from_bytes(row.tobytes(), "big") for row in self._array]
+        return values
+
+    def to_hex(self):
+        """Return the hexadecimal outcome of each shot, like the memory of an experiment
+        result.
+
+        Returns:
+            list[str]: The hexadecimal outcomes.
+        """
+        return [hex(value) for value in self.to_ints().tolist()]
+
+    def to_bitstrings(self):
+        """Return the bitstring outcome of each shot, formatted like :meth:`.Result.get_memory`.
+
+        Returns:
+            list[str]: The bitstring outcomes.
+        """
+        return [self._format(value) for value in self.to_ints().tolist()]
+
+    def to_bits(self):
+        """Return the outcomes as an array of bits.
+
+        Returns:
+            np.ndarray: A boolean array of shape ``(shots, num_bits)``, whose column ``i`` is
+            the classical bit ``i`` of the outcomes.
+        """
+        bits = np.unpackbits(self._array, axis=1)
+        return bits[:, ::-1][:, : self._num_bits].astype(bool)
+
+    def marginal(self, indices, parallel_threshold=2**18):
+        """Marginalize the memory onto some classical bits.
+
+        Args:
+            indices (Sequence[int]): The classical bits to keep.  The bit ``indices[k]`` is
+                the bit ``k`` of the marginalized outcomes, as in :func:`.marginal_memory`.
+            parallel_threshold (int): The number of shots from which the bits are extracted
+                in multiple threads.
+
+        Returns:
+            PackedMemory: The marginalized memory.
+
+        Raises:
+            QiskitError: If any value in ``indices`` is invalid.
+        """
+        indices = list(indices)
+        if not set(indices).issubset(range(self._num_bits)):
+            raise QiskitError(f"indices must be in range [0, {self._num_bits - 1}].")
+        if self._num_bits <= 64:
+            values = _marginal_ints(self.to_ints(), indices, parallel_threshold)
+            return PackedMemory.from_ints(values, num_bits=len(indices))
+        columns = [(self._array[:, -1 - index // 8] >> (index % 8)) & 1 for index in indices]
+        return PackedMemory.from_bits(np.stack(columns, axis=1).reshape(self.shots, -1))
+
+    def count_arrays(self):
+        """Return the distinct outcomes and the number of shots of each.
+
+        Returns:
+            tuple(np.ndarray, np.ndarray): The sorted distinct outcomes, as returned by
+            :meth:`to_ints`, and the number of shots with each outcome.
+        """
+        num_bytes = self._array.shape[1]
+        if num_bytes == 0:
+            num_outcomes = min(self.shots, 1)
+            return np.zeros(num_outcomes, dtype=np.uint64), np.full(num_outcomes, self.shots)
+        # Compare the outcomes as whole rows of bytes, which sort like their integer values.
+        rows = np.ascontiguousarray(self._array).view(np.dtype((np.void, num_bytes))).ravel()
+        _, first, counts = np.unique(rows, return_index=True, return_counts=True)
+        outcomes = PackedMemory(self._array[first], self._num_bits).to_ints()
+        return outcomes, counts
+
+    def get_counts(self):
+        """Return the histogram of the outcomes.
+
+        Returns:
+            Counts: The number of shots of each outcome, formatted with the classical registers
+            of the memory.
+        """
+        outcomes, counts = self.count_arrays()
+        return Counts(
+            dict(zip(outcomes.tolist(), counts.tolist())),
+            creg_sizes=self.creg_sizes,
+            memory_slots=self._num_bits,
+        )
+
+    def _format(self, value):
+        bitstring = format(value, f"0{self._num_bits}b") if self._num_bits else ""
+        if self.creg_sizes:
+            bitstring = postprocess._separate_bitstring(bitstring, self.creg_sizes)
+        return bitstring
+
+
+def _num_bytes(num_bits):
+    return (num_bits + 7) // 8
+
+
+def _bit_runs(indices):
+    """Split ``indices`` into runs of consecutive bits, as ``(source, target, length)`` tuples
+    that move the bits ``source:source+length`` of an outcome to ``target:target+length``."""
+    runs = []
+    for target, index in enumerate(indices):
+        if runs and runs[-1][0] + runs[-1][2] == index:
+            source, start, length = runs[-1]
+            runs[-1] = (source, start, length + 1)
+        else:
+            runs.append((index, target, 1))
+    return runs
+
+
+def _marginal_ints(values, indices, parallel_threshold=2**18):
+    """Marginalize integer outcomes onto the bits ``indices``, with masks and shifts.
+
+    ``values`` is either a ``uint64`` array or an object array of Python integers.  The bit
+    ``indices[k]`` of an outcome is the bit ``k`` of the marginal outcome, which is returned as a
+    ``uint64`` array if there are at most 64 indices.  Long ``uint64`` arrays are split across
+    threads, since NumPy releases the GIL in its bitwise operations.
+    """
+    runs = _bit_runs(indices)
+    if values.dtype == object:
+        out = np.zeros(len(values), dtype=object)
+        for source, target, length in runs:
+            out |= ((values >> source) & ((1 << length) - 1)) << target
+        return out.astype(np.uint64) if len(indices) <= 64 else out
+
+    runs = [
+        (np.uint64(source), np.uint64(target), np.uint64((1 << length) - 1))
+        for source, target, length in runs
+    ]
+
+    def kernel(chunk):
+        out = np.zeros(len(chunk), dtype=np.uint64)
+        for source, target, mask in runs:
+            out |= ((chunk >> source) & mask) << target
+        return out
+
+    num_chunks = min(local_hardware_info()["cpus"], len(values) // max(parallel_threshold, 1))
+    if num_chunks < 2:
+        return kernel(values)
+    with ThreadPoolExecutor(max_workers=num_chunks) as executor:
+        return np.concatenate(list(executor.map(kernel, np.array_split(values, num_chunks))))
@@ -22,6 +22,7 @@ from qiskit.quantum_info.states import statevector
 from qiskit.result.models import ExperimentResult
 from qiskit.result import postprocess
 from qiskit.result.counts import Counts
+from qiskit.result.packed_memory import PackedMemory
 from qiskit.qobj.utils import MeasLevel
 from qiskit.qobj import QobjHeader
 
@@ -226,6 +227,8 @@ class Result:
             memory = self.data(experiment)["memory"]
 
             if meas_level == MeasLevel.CLASSIFIED:
+                if isinstance(memory, PackedMemory):
+                    return memory.to_bitstrings()
                 return postprocess.format_level_2_memory(memory, header)
             elif meas_level == MeasLevel.KERNELED:
                 return postprocess.format_level_1_memory(memory)
@@ -242,6 +245,46 @@ class Result:
                 "or a measurement level 0/1 job.".format(repr(experiment))
             ) from ex
 
+    def get_packed_memory(self, experiment=None):
+        """Get the memory states (readouts) of each shot of an experiment as packed bits.
+
+        Unlike :meth:`get_memory`, the outcomes are not expanded to a bitstring for each shot,
+        but are stored in a :class:`~.PackedMemory`, which converts them to integers, counts
+        and marginals without building intermediate strings.
+
+        Args:
+            experiment (str or QuantumCircuit or Schedule or int or None): the index of the
+                experiment, as specified by ``data()``.
+
+        Returns:
+            PackedMemory: The outcome of each shot.
+
+        Raises:
+            QiskitError: if there is no measurement level 2 memory data for the circuit.
+        """
+        exp_result = self._get_experiment(experiment)
+        if exp_result.meas_level != MeasLevel.CLASSIFIED:
+            raise QiskitError(
+                f"Packed memory is only available for measurement level {MeasLevel.CLASSIFIED}."
+            )
+        try:
+            memory = self.data(experiment)["memory"]
+        except KeyError as ex:
+            raise QiskitError(
+                f'No memory for experiment "{repr(experiment)}". '
+                "Please verify that you ran a measurement level 2 job "
+                'with the memory flag set, eg., "memory=True".'
+            ) from ex
+        if isinstance(memory, PackedMemory):
+            return memory
+        try:
+            header = exp_result.header.to_dict()
+        except (AttributeError, QiskitError):  # header is not available
+            header = {}
+        memory_slots = header.get("memory_slots")
+        creg_sizes = header.get("creg_sizes") if memory_slots else None
+        return PackedMemory.from_hex(memory, num_bits=memory_slots, creg_sizes=creg_sizes)
+
     def get_counts(self, experiment=None):
         """Get the histogram data of an experiment.
 
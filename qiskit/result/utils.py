@@ -23,6 +23,7 @@ import numpy as np
 from qiskit.exceptions import QiskitError
 from qiskit.result.result import Result
 from qiskit.result.counts import Counts
+from qiskit.result.packed_memory import PackedMemory, _marginal_ints
 from qiskit.result.distributions.probability import ProbDistribution
 from qiskit.result.distributions.quasi import QuasiDistribution
 
@@ -128,13 +129,13 @@ def _adjust_creg_sizes(creg_sizes, indices):
 
 
 def marginal_memory(
-    memory: Union[List[str], np.ndarray],
+    memory: Union[List[str], np.ndarray, PackedMemory],
     indices: Optional[List[int]] = None,
     int_return: bool = False,
     hex_return: bool = False,
     avg_data: bool = False,
     parallel_threshold: int = 1000,
-) -> Union[List[str], np.ndarray]:
+) -> Union[List[str], np.ndarray, PackedMemory]:
     """Marginalize shot memory
 
     This function is multithreaded and will launch a thread pool with threads equal to the number
@@ -145,7 +146,10 @@ def marginal_memory(
     Args:
         memory: The input memory list, this is either a list of hexadecimal strings to be marginalized
             representing measure level 2 memory or a numpy array representing level 0 measurement
-            memory (single or avg) or level 1 measurement memory (single or avg).
+            memory (single or avg) or level 1 measurement memory (single or avg). Level 2
+            memory can also be a :class:`~.PackedMemory`, which is marginalized without
+            building intermediate strings, to a :class:`~.PackedMemory` unless ``int_return``
+            or ``hex_return`` is set.
         indices: The bit positions of interest to marginalize over. If
             ``None`` (default), do not marginalize at all.
         int_return: If set to ``True`` the output will be a list of integers.
@@ -169,9 +173,12 @@ def marginal_memory(
     Raises:
         ValueError: if both ``int_return`` and ``hex_return`` are set to ``True``
     """
+    # pylint: disable=too-many-return-statements
     if int_return and hex_return:
         raise ValueError("Either int_return or hex_return can be specified but not both")
 
+    if isinstance(memory, PackedMemory):
+        return _marginal_packed_memory(memory, indices, int_return, hex_return, parallel_threshold)
     if isinstance(memory, np.ndarray):
         if int_return:
             raise ValueError("int_return option only works with memory list input")
@@ -198,6 +205,61 @@ def marginal_memory(
     )
 
 
+def _marginal_packed_memory(memory, indices, int_return, hex_return, parallel_threshold):
+    if indices is not None:
+        memory = memory.marginal(indices, parallel_threshold=parallel_threshold)
+    if int_return:
+        return memory.to_ints().tolist()
+    if hex_return:
+        return memory.to_hex()
+    return memory
+
+
+def marginal_int_memory(
+    memory: Union[np.ndarray, Sequence[int], PackedMemory],
+    indices: Sequence[int],
+    parallel_threshold: int = 2**18,
+) -> np.ndarray:
+    """Marginalize shot memory stored as integers or bits, without formatting strings.
+
+    The bits of interest are extracted from the outcome of every shot at once, by shifting and
+    masking runs of consecutive indices, and long memories are split across threads.  The
+    returned integer outcomes can be counted with :func:`numpy.unique` or used as the keys of a
+    :class:`~.QuasiDistribution`.
+
+    Args:
+        memory: The outcome of each shot, either as a sequence or a 1-dimensional array of
+            integers, as a 2-dimensional boolean array of shape ``(shots, num_bits)`` whose
+            column ``i`` is the classical bit ``i``, or as a :class:`~.PackedMemory`.
+        indices: The bit positions of interest.  The bit ``indices[k]`` of an outcome is the
+            bit ``k`` of the marginalized outcome.
+        parallel_threshold: The number of shots from which the marginalization runs in
+            multiple threads.
+
+    Returns:
+        The marginalized outcome of each shot, as a ``uint64`` array if there are at most 64
+        indices, or else as an object array of Python integers.
+
+    Raises:
+        QiskitError: If any value in ``indices`` is invalid.
+    """
+    indices = list(indices)
+    if isinstance(memory, PackedMemory):
+        return memory.marginal(indices, parallel_threshold=parallel_threshold).to_ints()
+    memory = np.asarray(memory)
+    if memory.ndim == 2:
+        if not set(indices).issubset(range(memory.shape[1])):
+            raise QiskitError(f"indices must be in range [0, {memory.shape[1] - 1}].")
+        return PackedMemory.from_bits(memory[:, indices]).to_ints()
+    if any(index < 0 for index in indices):
+        raise QiskitError("indices must be non-negative.")
+    if memory.dtype != object:
+        if max(indices, default=0) >= 64:
+            raise QiskitError("indices must be in range [0, 63] for a 64-bit integer memory.")
+        memory = memory.astype(np.uint64)
+    return _marginal_ints(memory, indices, parallel_threshold)
+
+
 def marginal_distribution(
     counts: dict,
     indices: Optional[Sequence[int]] = None,
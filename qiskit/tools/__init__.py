@@ -24,6 +24,10 @@ Parallel Routines
    :toctree: ../stubs/
 
    parallel_map
+   parallel_imap
+   parallel.WorkerPool
+   parallel.get_worker_pool
+   parallel.shutdown_worker_pool
 
 Monitoring
 ==========
@@ -37,5 +41,5 @@ Monitoring
 
 """
 
-from .parallel import parallel_map
+from .parallel import parallel_map, parallel_imap
 from .monitor import job_monitor, backend_monitor, backend_overview
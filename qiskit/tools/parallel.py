@@ -48,8 +48,16 @@ Routines for running Python functions in parallel using process pools
 from the multiprocessing library.
 """
 
+import atexit
+import collections
+import hashlib
+import multiprocessing
 import os
-from concurrent.futures import ProcessPoolExecutor
+import pickle
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import sys
 
 from qiskit.exceptions import QiskitError
@@ -100,13 +108,244 @@ else:
     CPU_COUNT = CONFIG.get("num_process", local_hardware_info()["cpus"])
 
 
-def _task_wrapper(param):
-    (task, value, task_args, task_kwargs) = param
-    return task(value, *task_args, **task_kwargs)
+def _chunk_task_wrapper(param):
+    (task, chunk, task_args, task_kwargs) = param
+    return [task(value, *task_args, **task_kwargs) for value in chunk]
+
+
+def _worker_initializer():
+    os.environ["QISKIT_IN_PARALLEL"] = "TRUE"
+
+
+# Upper bound on the number of values sent to a worker in a single message by default.
+_MAX_CHUNKSIZE = 64
+
+
+def _default_chunksize(num_values, num_processes):
+    # Aim for roughly four chunks per worker: few enough to amortize the per-message IPC cost
+    # over many values, but enough that the load stays balanced when some tasks are slower.
+    return max(1, min(num_values // (4 * num_processes), _MAX_CHUNKSIZE))
+
+
+def _iter_chunks(executor, task, values, task_args, task_kwargs, chunksize, ordered):
+    """Submit ``values`` to ``executor`` in chunks and yield ``(start, results)`` for each chunk,
+    either in submission order or in the order that the chunks finish."""
+    futures = {}
+    for start in range(0, len(values), chunksize):
+        chunk = values[start : start + chunksize]
+        param = (task, chunk, task_args, task_kwargs)
+        futures[executor.submit(_chunk_task_wrapper, param)] = start
+    try:
+        for future in futures if ordered else as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # Only does anything if the consumer stopped early or a task raised.
+        for future in futures:
+            future.cancel()
+
+
+# Objects deserialized inside worker processes, keyed on a digest of their serialized payload.
+_WORKER_CACHE = collections.OrderedDict()
+_WORKER_CACHE_SIZE = 4
+
+
+def cached_loads(payload, loads=pickle.loads):
+    """Deserialize ``payload``, reusing a previous result when running in a worker process.
+
+    Worker processes (both those of a :class:`.WorkerPool` and the short-lived ones spawned by
+    :func:`parallel_map`) typically receive the same serialized pass manager or shared transpiler
+    arguments for every task they run.  This keeps a small LRU cache of the deserialized objects
+    keyed on a digest of the payload, so that they are only deserialized once per worker.  In the
+    main process this is equivalent to calling ``loads(payload)``.
+
+    Args:
+        payload (bytes): The serialized object.
+        loads (Callable): The function used to deserialize ``payload``.
+
+    Returns:
+        The deserialized object.  Callers must not rely on getting an object that is distinct
+        from the one returned to earlier tasks in the same worker.
+    """
+    if multiprocessing.current_process().name == "MainProcess":
+        return loads(payload)
+    key = (getattr(loads, "__module__", None), hashlib.sha1(payload).digest())
+    try:
+        _WORKER_CACHE.move_to_end(key)
+        return _WORKER_CACHE[key]
+    except KeyError:
+        pass
+    out = loads(payload)
+    _WORKER_CACHE[key] = out
+    if len(_WORKER_CACHE) > _WORKER_CACHE_SIZE:
+        _WORKER_CACHE.popitem(last=False)
+    return out
+
+
+_ALL_POOLS = weakref.WeakSet()
+_ACTIVE_POOLS = []
+_DEFAULT_POOL = None
+
+
+class WorkerPool:
+    """A long-lived pool of worker processes used by :func:`parallel_map`.
+
+    By default every call to :func:`parallel_map` (and so every parallel call to
+    :func:`~.transpile` or :meth:`.PassManager.run`) starts a new set of worker processes and
+    tears them down again once it has finished.  A ``WorkerPool`` instead keeps its worker
+    processes alive between calls, and the workers keep the deserialized pass managers and
+    transpiler arguments (including the :class:`~.Target`) they have seen cached between tasks.
+
+    A pool is used either as a context manager, in which case every call to
+    :func:`parallel_map` made inside the ``with`` block runs on it and it is shut down on exit::
+
+        from qiskit import transpile
+        from qiskit.tools.parallel import WorkerPool
+
+        with WorkerPool(num_processes=4):
+            for batch in batches:
+                transpile(batch, backend)
+
+    or implicitly, by setting ``persistent_pool = true`` in the user config file, in which case a
+    default pool is created on first use and reused for the lifetime of the interpreter (see
+    :func:`get_worker_pool`).  All pools are shut down when the interpreter exits.
+    """
+
+    def __init__(self, num_processes=None):
+        """
+        Args:
+            num_processes (int): The number of worker processes.  Defaults to the number of
+                processes used by :func:`parallel_map`.
+
+        Raises:
+            QiskitError: If ``num_processes`` is not a positive integer.
+        """
+        if num_processes is None:
+            num_processes = CPU_COUNT
+        if num_processes < 1:
+            raise QiskitError(f"The number of processes must be positive, not {num_processes}.")
+        self._num_processes = num_processes
+        self._executor = None
+        self._lock = threading.Lock()
+        _ALL_POOLS.add(self)
+
+    @property
+    def num_processes(self):
+        """The number of worker processes in the pool."""
+        return self._num_processes
+
+    @property
+    def running(self):
+        """Whether the worker processes of the pool have been started and not shut down."""
+        return self._executor is not None
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._num_processes, initializer=_worker_initializer
+                )
+            return self._executor
+
+    def map(self, task, values, task_args=tuple(), task_kwargs=None, chunksize=None):
+        """Evaluate ``task`` for each of ``values`` on the worker processes.
+
+        Unlike :func:`parallel_map`, this always dispatches to the workers and does not publish
+        any progress events.
+
+        Args:
+            task (func): Function that is to be called for each value in ``values``.
+            values (array_like): List or array of values for which the ``task``
+                function is to be evaluated.
+            task_args (list): Optional additional arguments to the ``task`` function.
+            task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
+            chunksize (int): The number of values sent to a worker at a time.  If not set, this
+                is chosen based on the number of values and the size of the pool.
+
+        Returns:
+            list: The values of ``task(value, *task_args, **task_kwargs)`` for each value in
+            ``values``.
+        """
+        out = []
+        for _, results in self._iter_chunks(task, values, task_args, task_kwargs, chunksize):
+            out.extend(results)
+        return out
+
+    def _iter_chunks(self, task, values, task_args, task_kwargs, chunksize, ordered=True):
+        task_kwargs = {} if task_kwargs is None else task_kwargs
+        if chunksize is None:
+            chunksize = _default_chunksize(len(values), self._num_processes)
+        try:
+            yield from _iter_chunks(
+                self._get_executor(), task, values, task_args, task_kwargs, chunksize, ordered
+            )
+        except BrokenProcessPool:
+            # A worker died; drop the executor so the next call starts a fresh set of workers.
+            self.shutdown(wait=False)
+            raise
+
+    def shutdown(self, wait=True):
+        """Shut down the worker processes.
+
+        The pool can still be used afterwards, in which case new worker processes are started.
+
+        Args:
+            wait (bool): Whether to block until all the worker processes have exited.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        _ACTIVE_POOLS.append(self)
+        return self
+
+    def __exit__(self, *_exc):
+        _ACTIVE_POOLS.remove(self)
+        self.shutdown()
+
+    def __getstate__(self):
+        raise TypeError("WorkerPool objects cannot be pickled.")
+
+
+def get_worker_pool():
+    """Get the :class:`.WorkerPool` that :func:`parallel_map` currently dispatches to.
+
+    This is the innermost pool entered as a context manager if there is one.  Otherwise, if the
+    ``persistent_pool`` option is set in the user config file, it is a default pool that is
+    created on the first call and lives until :func:`shutdown_worker_pool` is called or the
+    interpreter exits.
+
+    Returns:
+        Optional[WorkerPool]: The pool, or ``None`` if :func:`parallel_map` should spawn
+        short-lived workers for each call.
+    """
+    global _DEFAULT_POOL  # pylint: disable=global-statement
+    if _ACTIVE_POOLS:
+        return _ACTIVE_POOLS[-1]
+    if CONFIG.get("persistent_pool", False):
+        if _DEFAULT_POOL is None:
+            _DEFAULT_POOL = WorkerPool()
+        return _DEFAULT_POOL
+    return None
+
+
+def shutdown_worker_pool():
+    """Shut down the default persistent :class:`.WorkerPool`, if it has been started."""
+    global _DEFAULT_POOL  # pylint: disable=global-statement
+    pool, _DEFAULT_POOL = _DEFAULT_POOL, None
+    if pool is not None:
+        pool.shutdown()
+
+
+@atexit.register
+def _shutdown_all_pools():
+    for pool in list(_ALL_POOLS):
+        pool.shutdown(wait=False)
 
 
 def parallel_map(  # pylint: disable=dangerous-default-value
-    task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT
+    task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT, chunksize=None
 ):
     """
     Parallel execution of a mapping of `values` to the function `task`. This
@@ -117,6 +356,10 @@ def parallel_map(  # pylint: disable=dangerous-default-value
     On Windows this function defaults to a serial implementation to avoid the
     overhead from spawning processes in Windows.
 
+    If a :class:`.WorkerPool` is active (see :func:`get_worker_pool`), the tasks are run on its
+    long-lived worker processes instead of a newly spawned set of processes, and
+    ``num_processes`` is ignored in favor of the size of the pool.
+
     Args:
         task (func): Function that is to be called for each value in ``values``.
         values (array_like): List or array of values for which the ``task``
@@ -124,6 +367,8 @@ def parallel_map(  # pylint: disable=dangerous-default-value
         task_args (list): Optional additional arguments to the ``task`` function.
         task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
         num_processes (int): Number of processes to spawn.
+        chunksize (int): The number of values sent to a worker process at a time.  If not set,
+            this is chosen based on the number of values and processes.
 
     Returns:
         result: The result list contains the value of
@@ -142,49 +387,122 @@ def parallel_map(  # pylint: disable=dangerous-default-value
         return []
     if len(values) == 1:
         return [task(values[0], *task_args, **task_kwargs)]
+    return list(
+        parallel_imap(
+            task,
+            values,
+            task_args=task_args,
+            task_kwargs=task_kwargs,
+            num_processes=num_processes,
+            chunksize=chunksize,
+        )
+    )
+
+
+def parallel_imap(
+    task,
+    values,
+    task_args=tuple(),
+    task_kwargs=None,
+    num_processes=None,
+    chunksize=None,
+    ordered=True,
+):
+    """
+    Iterator version of :func:`parallel_map`, yielding results as soon as they are available.
+
+    With ``ordered=True`` this is functionally equivalent to::
+
+        for value in values:
+            yield task(value, *task_args, **task_kwargs)
+
+    but, when running in parallel, the values are evaluated in chunks on the worker processes
+    and each result is yielded as soon as it and all those before it have been computed.  With
+    ``ordered=False``, this instead yields ``(index, result)`` pairs in the order the chunks
+    finish, where ``index`` is the position of the corresponding value in ``values``.
+
+    The same conditions as :func:`parallel_map` decide whether the tasks are run in parallel.
+    While the iterator is not exhausted, any further calls to :func:`parallel_map` run serially,
+    so the iterator should be consumed completely or explicitly closed.
+
+    Args:
+        task (func): Function that is to be called for each value in ``values``.
+        values (array_like): List or array of values for which the ``task``
+                            function is to be evaluated.
+        task_args (list): Optional additional arguments to the ``task`` function.
+        task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
+        num_processes (int): Number of processes to spawn.  Defaults to the number of CPUs.
+        chunksize (int): The number of values sent to a worker process at a time.  If not set,
+            this is chosen based on the number of values and processes.
+        ordered (bool): Whether to yield the results in the order of ``values``, rather than as
+            ``(index, result)`` pairs in the order they are computed.
+
+    Yields:
+        The value of ``task(value, *task_args, **task_kwargs)`` for each value in ``values``, or
+        ``(index, result)`` pairs if ``ordered`` is ``False``.
+
+    Raises:
+        QiskitError: If user interrupts via keyboard.
+
+    Events:
+        terra.parallel.start: The collection of parallel tasks are about to start.
+        terra.parallel.done: Some of the parallel tasks have finished.  The event data is the
+            total number of tasks that have finished so far.
+        terra.parallel.finish: All the parallel tasks have finished.
+    """
+    task_kwargs = {} if task_kwargs is None else task_kwargs
+    num_processes = CPU_COUNT if num_processes is None else num_processes
+    if len(values) == 0:
+        return
 
     Publisher().publish("terra.parallel.start", len(values))
-    nfinished = [0]
+    nfinished = 0
 
-    def _callback(_):
-        nfinished[0] += 1
-        Publisher().publish("terra.parallel.done", nfinished[0])
+    pool = get_worker_pool() if os.getenv("QISKIT_IN_PARALLEL") == "FALSE" else None
+    if pool is not None:
+        num_processes = pool.num_processes
 
     # Run in parallel if not Win and not in parallel already
     if (
         num_processes > 1
         and os.getenv("QISKIT_IN_PARALLEL") == "FALSE"
-        and CONFIG.get("parallel_enabled", PARALLEL_DEFAULT)
+        and (pool is not None or CONFIG.get("parallel_enabled", PARALLEL_DEFAULT))
     ):
         os.environ["QISKIT_IN_PARALLEL"] = "TRUE"
+        executor = None
         try:
-            results = []
-            with ProcessPoolExecutor(max_workers=num_processes) as executor:
-                param = map(lambda value: (task, value, task_args, task_kwargs), values)
-                future = executor.map(_task_wrapper, param)
-
-            results = list(future)
-            Publisher().publish("terra.parallel.done", len(results))
-
-        except (KeyboardInterrupt, Exception) as error:
-            if isinstance(error, KeyboardInterrupt):
-                Publisher().publish("terra.parallel.finish")
-                os.environ["QISKIT_IN_PARALLEL"] = "FALSE"
-                raise QiskitError("Keyboard interrupt in parallel_map.") from error
-            # Otherwise just reset parallel flag and error
+            if pool is not None:
+                chunks = pool._iter_chunks(
+                    task, values, task_args, task_kwargs, chunksize, ordered=ordered
+                )
+            else:
+                if chunksize is None:
+                    chunksize = _default_chunksize(len(values), num_processes)
+                executor = ProcessPoolExecutor(max_workers=num_processes)
+                chunks = _iter_chunks(
+                    executor, task, values, task_args, task_kwargs, chunksize, ordered
+                )
+            for start, results in chunks:
+                nfinished += len(results)
+                Publisher().publish("terra.parallel.done", nfinished)
+                if ordered:
+                    yield from results
+                else:
+                    yield from enumerate(results, start)
+        except KeyboardInterrupt as error:
+            raise QiskitError("Keyboard interrupt in parallel_map.") from error
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            Publisher().publish("terra.parallel.finish")
             os.environ["QISKIT_IN_PARALLEL"] = "FALSE"
-            raise error
-
-        Publisher().publish("terra.parallel.finish")
-        os.environ["QISKIT_IN_PARALLEL"] = "FALSE"
-        return results
+        return
 
     # Cannot do parallel on Windows , if another parallel_map is running in parallel,
     # or len(values) == 1.
-    results = []
-    for _, value in enumerate(values):
+    for index, value in enumerate(values):
         result = task(value, *task_args, **task_kwargs)
-        results.append(result)
-        _callback(0)
+        nfinished += 1
+        Publisher().publish("terra.parallel.done", nfinished)
+        yield result if ordered else (index, result)
     Publisher().publish("terra.parallel.finish")
-    return results
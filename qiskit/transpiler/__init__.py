@@ -690,6 +690,23 @@ Pass Manager Construction
    ConditionalController
    DoWhileController
 
+Profiling
+---------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   PassProfiler
+   PassProfile
+
+Caching
+-------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   TranspileCache
+
 Layout and Topology
 -------------------
 
@@ -739,6 +756,8 @@ from .runningpassmanager import FlowController, ConditionalController, DoWhileCo
 from .passmanager import PassManager
 from .passmanager_config import PassManagerConfig
 from .passmanager import StagedPassManager
+from .profiler import PassProfiler, PassProfile
+from .cache import TranspileCache
 from .propertyset import PropertySet
 from .exceptions import TranspilerError, TranspilerAccessError
 from .fencedobjs import FencedDAGCircuit, FencedPropertySet
@@ -0,0 +1,515 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Content-addressed cache of transpiled circuits."""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import logging
+import os
+import pickle
+from typing import Optional
+
+import numpy as np
+
+from qiskit.circuit import (
+    AncillaRegister,
+    Barrier,
+    Clbit,
+    ControlFlowOp,
+    ControlledGate,
+    Delay,
+    Instruction,
+    Measure,
+    Parameter,
+    ParameterExpression,
+    QuantumCircuit,
+    QuantumRegister,
+    Reset,
+)
+from qiskit.transpiler.coupling import CouplingMap
+from qiskit.transpiler.layout import Layout
+from qiskit.transpiler.target import Target
+
+logger = logging.getLogger(__name__)
+
+# The key of the circuit metadata in which the layout of a circuit is kept in the on-disk store.
+_LAYOUT_METADATA_KEY = "transpile_cache_layout"
+
+
+class _Uncacheable(Exception):
+    """Raised while building a key for an input that cannot be safely cached."""
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _pickle_token(obj):
+    try:
+        return ("pickle", _digest(pickle.dumps(obj, protocol=4)))
+    except Exception as err:  # pylint: disable=broad-except
+        raise _Uncacheable(f"cannot fingerprint {type(obj)}") from err
+
+
+def _value_token(param):  # pylint: disable=too-many-return-statements
+    if param is None or isinstance(param, (bool, int, float, complex, str)):
+        return (type(param).__name__, repr(param))
+    if isinstance(param, np.number):
+        return (type(param).__name__, repr(param.item()))
+    if isinstance(param, np.ndarray):
+        return ("ndarray", param.dtype.str, param.shape, _digest(param.tobytes()))
+    if isinstance(param, QuantumCircuit):
+        return ("circuit", _circuit_digest(param))
+    if isinstance(param, ParameterExpression):
+        return _expression_token(param)
+    if isinstance(param, CouplingMap):
+        return ("CouplingMap", tuple(param.graph.node_indices()), tuple(param.get_edges()))
+    if isinstance(param, Target):
+        return _target_token(param)
+    return _pickle_token(param)
+
+
+def _expression_token(expression):
+    import sympy
+
+    if isinstance(expression, Parameter):
+        return ("Parameter", expression.name, str(expression._uuid))
+    # The exact representation of the numbers in the expression, unlike ``str(expression)``.
+    return (
+        "ParameterExpression",
+        sympy.srepr(sympy.sympify(expression._symbol_expr)),
+        tuple(sorted((param.name, str(param._uuid)) for param in expression.parameters)),
+    )
+
+
+def _target_token(target):
+    # Pickling the target would include the caches it builds lazily.
+    operations = []
+    for name, properties in target._gate_map.items():
+        operation = target._gate_name_map[name]
+        if isinstance(operation, Instruction):
+            operation = _operation_token(None, operation)
+        else:
+            operation = f"{operation.__module__}.{operation.__qualname__}"
+        operations.append(
+            (
+                name,
+                operation,
+                tuple(
+                    (qargs, None if props is None else _pickle_token(props))
+                    for qargs, props in properties.items()
+                ),
+            )
+        )
+    return (
+        "Target",
+        target.num_qubits,
+        target.dt,
+        target.granularity,
+        target.min_length,
+        target.pulse_alignment,
+        target.aquire_alignment,
+        _pickle_token(target.qubit_properties),
+        tuple(operations),
+    )
+
+
+def _bit_index(circuit, bit):
+    try:
+        return circuit.find_bit(bit).index
+    except Exception as err:  # pylint: disable=broad-except
+        raise _Uncacheable("bit not in circuit") from err
+
+
+def _condition_token(circuit, condition):
+    if condition is None:
+        return None
+    target, value = condition
+    if isinstance(target, Clbit):
+        return ("clbit", _bit_index(circuit, target), value)
+    return (
+        "creg",
+        target.name,
+        tuple(_bit_index(circuit, bit) for bit in target),
+        value,
+    )
+
+
+def _has_fixed_definition(operation):
+    """Whether the definition of ``operation`` is fully determined by its class and params."""
+    from qiskit.extensions import UnitaryGate  # pylint: disable=cyclic-import
+
+    if type(operation).__module__.startswith("qiskit.circuit.library.standard_gates"):
+        return True
+    return isinstance(operation, (Measure, Reset, Barrier, Delay, ControlFlowOp, UnitaryGate))
+
+
+def _operation_token(circuit, operation):
+    if not isinstance(operation, Instruction):
+        return (type(operation).__qualname__, _pickle_token(operation))
+    cls = type(operation)
+    token = [
+        f"{cls.__module__}.{cls.__qualname__}",
+        operation.name,
+        operation.num_qubits,
+        operation.num_clbits,
+        tuple(_value_token(param) for param in operation.params),
+        _condition_token(circuit, operation.condition),
+        getattr(operation, "label", None),
+        operation.duration,
+        operation.unit,
+    ]
+    if isinstance(operation, ControlledGate):
+        token.append(operation.ctrl_state)
+        if cls is ControlledGate:
+            token.append(_operation_token(circuit, operation.base_gate))
+    if not _has_fixed_definition(operation):
+        try:
+            definition = operation.definition
+        except Exception as err:  # pylint: disable=broad-except
+            raise _Uncacheable(f"cannot build the definition of {operation.name}") from err
+        token.append(None if definition is None else _circuit_digest(definition))
+    return tuple(token)
+
+
+def _register_token(circuit, register):
+    return (
+        type(register).__name__,
+        register.name,
+        tuple(_bit_index(circuit, bit) for bit in register),
+    )
+
+
+def _circuit_digest(circuit: QuantumCircuit) -> str:
+    """A digest of the structure of ``circuit``.
+
+    The name and metadata of the circuit are not part of it, since they do not affect how it is
+    compiled.  Parameters are identified by their uuid, so circuits with equal structure but
+    distinct :class:`.Parameter` objects have different digests.
+    """
+    hasher = hashlib.sha256()
+    header = (
+        circuit.num_qubits,
+        circuit.num_clbits,
+        tuple(_register_token(circuit, register) for register in circuit.qregs),
+        tuple(_register_token(circuit, register) for register in circuit.cregs),
+        _value_token(circuit.global_phase),
+        _pickle_token(circuit.calibrations) if circuit.calibrations else None,
+        None if circuit._layout is None else _layout_token(circuit._layout, circuit),
+    )
+    hasher.update(repr(header).encode())
+    # Operations that appear several times are usually the same object (e.g. the gates of
+    # a repeated block), so only build their token once.
+    operation_tokens = {}
+    for instruction in circuit.data:
+        operation = instruction.operation
+        token = operation_tokens.get(id(operation))
+        if token is None:
+            token = operation_tokens[id(operation)] = (
+                operation,
+                _operation_token(circuit, operation),
+            )
+        hasher.update(
+            repr(
+                (
+                    token[1],
+                    tuple(circuit._qubit_indices[bit].index for bit in instruction.qubits),
+                    tuple(circuit._clbit_indices[bit].index for bit in instruction.clbits),
+                )
+            ).encode()
+        )
+    return hasher.hexdigest()
+
+
+def _encode_layout(layout: Layout, circuit: QuantumCircuit):
+    """Encode ``layout`` as JSON-compatible data, with the virtual qubits of ``circuit`` given
+    by index so it can be applied to any circuit of the same structure."""
+    registers = list(layout._regs)
+    encoded_registers = []
+    for register in registers:
+        if register in circuit.qregs:
+            encoded_registers.append(["input", circuit.qregs.index(register)])
+        else:
+            kind = "ancilla" if isinstance(register, AncillaRegister) else "qreg"
+            encoded_registers.append([kind, register.name, register.size])
+    encoded_bits = []
+    for physical, virtual in layout.get_physical_bits().items():
+        if virtual is None:
+            encoded_bits.append([physical, None])
+            continue
+        location = circuit._qubit_indices.get(virtual)
+        if location is not None:
+            encoded_bits.append([physical, ["input", location.index]])
+            continue
+        for position, register in enumerate(registers):
+            if virtual in register:
+                encoded_bits.append([physical, [position, register.index(virtual)]])
+                break
+        else:
+            raise _Uncacheable("layout refers to an unknown qubit")
+    return {"registers": encoded_registers, "bits": encoded_bits}
+
+
+def _decode_layout(encoded, circuit: QuantumCircuit) -> Layout:
+    """Inverse of :func:`_encode_layout`, with the virtual qubits taken from ``circuit``."""
+    registers = []
+    for register in encoded["registers"]:
+        if register[0] == "input":
+            registers.append(circuit.qregs[register[1]])
+        elif register[0] == "ancilla":
+            registers.append(AncillaRegister(register[2], register[1]))
+        else:
+            registers.append(QuantumRegister(register[2], register[1]))
+    mapping = {}
+    for physical, virtual in encoded["bits"]:
+        if virtual is None:
+            mapping[physical] = None
+        elif virtual[0] == "input":
+            mapping[physical] = circuit.qubits[virtual[1]]
+        else:
+            mapping[physical] = registers[virtual[0]][virtual[1]]
+    layout = Layout(mapping)
+    for register in registers:
+        layout.add_register(register)
+    return layout
+
+
+def _layout_token(layout, circuit):
+    return repr(_encode_layout(layout, circuit))
+
+
+class TranspileCache:
+    """Context manager that caches the output of :func:`~.transpile` by content.
+
+    While the context is active, every circuit given to :func:`~.transpile` or
+    :func:`~.transpile_iter` is looked up by a key made of a structural digest of the circuit
+    (its qubits, clbits, registers and operations, but not its name or metadata) and a
+    fingerprint of all the other transpile arguments, including the optimization level, the
+    seed, the :class:`.Target`, the coupling map and the basis gates.  Circuits that are found
+    are not compiled again; instead a copy of the stored output is returned, with the name and
+    metadata of the new input circuit and its layout mapped onto the qubits of the new input.
+    Identical circuits in a single batch are only compiled once::
+
+        from qiskit import transpile
+        from qiskit.transpiler import TranspileCache
+
+        with TranspileCache() as cache:
+            for _ in range(10):
+                transpile(circuit, backend, optimization_level=3, seed_transpiler=42)
+        print(cache.hits, cache.misses)
+
+    Circuits that are transpiled with a ``callback``, or whose operations or arguments cannot
+    be fingerprinted, are always compiled.  :class:`.Parameter` objects are identified by their
+    uuid, so a circuit built with new :class:`.Parameter` objects is a different key.
+
+    The same cache object can be entered several times, and keeps its contents between uses.
+
+    Args:
+        max_size: The maximum number of circuits kept in memory.  When it is exceeded, the
+            least recently used circuit is evicted.
+        directory: If given, the path of a directory in which the transpiled circuits are also
+            stored as QPY files, so they can be reused by other processes or sessions.  Circuits
+            that cannot be serialized with QPY are only kept in memory.
+        max_disk_size: The maximum number of circuits kept in ``directory``, or ``None`` for no
+            limit.  When it is exceeded, the least recently used files are removed.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        directory: Optional[str] = None,
+        max_disk_size: Optional[int] = None,
+    ):
+        self.max_size = max_size
+        self.directory = directory
+        self.max_disk_size = max_disk_size
+        self.hits = 0
+        """The number of circuits that were served from the cache."""
+        self.misses = 0
+        """The number of cacheable circuits that had to be compiled."""
+        self._entries = collections.OrderedDict()
+        self._pid = None
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all the circuits from the memory cache, and from the on-disk store if any."""
+        self._entries.clear()
+        if self.directory is not None:
+            for path in self._disk_files():
+                os.remove(path)
+
+    def __enter__(self):
+        self._pid = os.getpid()
+        _ACTIVE_CACHES.append(self)
+        return self
+
+    def __exit__(self, *_exc):
+        _ACTIVE_CACHES.remove(self)
+
+    def shared_fingerprint(self, shared_args) -> Optional[str]:
+        """Fingerprint the transpile arguments that are shared by all circuits of a call.
+
+        Returns ``None`` if the arguments cannot be fingerprinted.
+        """
+        from qiskit import __version__  # pylint: disable=cyclic-import
+
+        try:
+            return _digest(
+                repr(
+                    (__version__, sorted((k, _value_token(v)) for k, v in shared_args.items()))
+                ).encode()
+            )
+        except _Uncacheable as err:
+            logger.debug("Transpile arguments are not cacheable: %s", err)
+            return None
+
+    def key(self, circuit: QuantumCircuit, unique_args, shared_fingerprint) -> Optional[str]:
+        """Build the key of ``circuit`` transpiled with the per-circuit arguments ``unique_args``.
+
+        Returns ``None`` if the circuit cannot be cached.
+        """
+        if shared_fingerprint is None or unique_args["callback"] is not None:
+            return None
+        try:
+            tokens = [
+                shared_fingerprint,
+                _circuit_digest(circuit),
+                _value_token(unique_args["faulty_qubits_map"]),
+                unique_args["backend_num_qubits"],
+            ]
+            for name, value in sorted(unique_args["pass_manager_config"].items()):
+                if isinstance(value, Layout):
+                    tokens.append((name, _layout_token(value, circuit)))
+                else:
+                    tokens.append((name, _value_token(value)))
+        except _Uncacheable as err:
+            logger.debug("Circuit %s is not cacheable: %s", circuit.name, err)
+            return None
+        return _digest(repr(tokens).encode())
+
+    def get(self, key: str, circuit: QuantumCircuit, output_name: str) -> Optional[QuantumCircuit]:
+        """Get a copy of the transpiled circuit stored for ``key``, applied to ``circuit``.
+
+        Returns ``None`` if there is no such circuit.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self.directory is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self._insert(key, entry)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        compiled, layout = entry
+        output = compiled.copy(output_name)
+        output.metadata = circuit.metadata
+        output._layout = None if layout is None else _decode_layout(layout, circuit)
+        return output
+
+    def put(self, key: str, circuit: QuantumCircuit, output: QuantumCircuit):
+        """Store the transpiled circuit ``output`` of the input ``circuit`` for ``key``."""
+        try:
+            layout = None if output._layout is None else _encode_layout(output._layout, circuit)
+        except _Uncacheable as err:
+            logger.debug("Output of circuit %s is not cacheable: %s", circuit.name, err)
+            return
+        compiled = output.copy()
+        compiled.metadata = None
+        compiled._layout = None
+        entry = (compiled, layout)
+        self._insert(key, entry)
+        if self.directory is not None:
+            self._store(key, entry)
+
+    def _insert(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.qpy")
+
+    def _disk_files(self):
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".qpy")
+        ]
+
+    def _load(self, key):
+        from qiskit import qpy  # pylint: disable=cyclic-import
+
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as fd:
+                compiled = qpy.load(fd)[0]
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning("Could not load cached circuit %s: %s", path, err)
+            return None
+        # Refresh the access time used for the eviction of the least recently used files.
+        os.utime(path)
+        layout = compiled.metadata[_LAYOUT_METADATA_KEY]
+        compiled.metadata = None
+        return compiled, layout
+
+    def _store(self, key, entry):
+        from qiskit import qpy  # pylint: disable=cyclic-import
+
+        compiled, layout = entry
+        compiled = compiled.copy()
+        compiled.metadata = {_LAYOUT_METADATA_KEY: layout}
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as fd:
+                qpy.dump(compiled, fd)
+            # Atomic, so that concurrent processes never read a partially written file.
+            os.replace(temp_path, path)
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug("Could not store circuit %s on disk: %s", compiled.name, err)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        if self.max_disk_size is not None:
+            files = self._disk_files()
+            if len(files) > self.max_disk_size:
+                files.sort(key=os.path.getmtime)
+                for old_path in files[: len(files) - self.max_disk_size]:
+                    try:
+                        os.remove(old_path)
+                    except FileNotFoundError:
+                        pass
+
+
+_ACTIVE_CACHES = []
+
+
+def get_active_cache() -> Optional[TranspileCache]:
+    """Get the innermost active :class:`.TranspileCache` of this process, if any."""
+    # Worker processes forked while a cache was active inherit it, but lookups are only done by
+    # the process that called transpile().
+    if _ACTIVE_CACHES and _ACTIVE_CACHES[-1]._pid == os.getpid():
+        return _ACTIVE_CACHES[-1]
+    return None
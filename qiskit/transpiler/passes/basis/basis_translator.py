@@ -14,14 +14,18 @@
 
 import time
 import logging
+import numbers
 
 from itertools import zip_longest
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from functools import singledispatch
 
+import numpy as np
 import retworkx
 
 from qiskit.circuit import Gate, ParameterVector, QuantumRegister, ControlFlowOp, QuantumCircuit
+from qiskit.circuit._batch_binding import _copy_with_params, _has_derived_definition, _vectorize
+from qiskit.circuit.parameterexpression import ParameterExpression
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.circuit.equivalence import Key
@@ -31,6 +35,18 @@ from qiskit.transpiler.exceptions import TranspilerError
 
 logger = logging.getLogger(__name__)
 
+# The results of _basis_search and _compose_transforms, keyed on the version of the equivalence
+# library and on the source and target bases. They are kept for the lifetime of the process, so
+# they are reused by all the BasisTranslator passes of a process, including the passes run by
+# the persistent worker processes of a WorkerPool.
+_BASIS_CACHE_SIZE = 256
+_basis_search_cache = OrderedDict()
+_compose_transforms_cache = OrderedDict()
+# The graphs of the equivalence rules of the libraries searched by _basis_search, keyed on the
+# version of the library.
+_SEARCH_GRAPH_CACHE_SIZE = 16
+_search_graph_cache = OrderedDict()
+
 
 class BasisTranslator(TransformationPass):
     """Translates gates to a target basis by searching for a set of translations
@@ -138,9 +154,10 @@ class BasisTranslator(TransformationPass):
 
         # Search for a path from source to target basis.
         search_start_time = time.time()
-        basis_transforms = _basis_search(self._equiv_lib, source_basis, target_basis)
+        basis_transforms = _cached_basis_search(self._equiv_lib, source_basis, target_basis)
 
         qarg_local_basis_transforms = {}
+        expanded_targets = {}
         for qarg, local_source_basis in qargs_local_source_basis.items():
             expanded_target = set(target_basis)
             # For any multiqubit operation that contains a subset of qubits that
@@ -161,7 +178,7 @@ class BasisTranslator(TransformationPass):
                 expanded_target,
                 qarg,
             )
-            local_basis_transforms = _basis_search(
+            local_basis_transforms = _cached_basis_search(
                 self._equiv_lib, local_source_basis, expanded_target
             )
 
@@ -174,6 +191,7 @@ class BasisTranslator(TransformationPass):
                 )
 
             qarg_local_basis_transforms[qarg] = local_basis_transforms
+            expanded_targets[qarg] = expanded_target
 
         search_end_time = time.time()
         logger.info(
@@ -189,9 +207,18 @@ class BasisTranslator(TransformationPass):
         # Compose found path into a set of instruction substitution rules.
 
         compose_start_time = time.time()
-        instr_map = _compose_transforms(basis_transforms, source_basis, dag)
+        example_gates = _get_example_gates(dag)
+        instr_map = _cached_compose_transforms(
+            self._equiv_lib, basis_transforms, source_basis, target_basis, example_gates
+        )
         extra_instr_map = {
-            qarg: _compose_transforms(transforms, qargs_local_source_basis[qarg], dag)
+            qarg: _cached_compose_transforms(
+                self._equiv_lib,
+                transforms,
+                qargs_local_source_basis[qarg],
+                expanded_targets[qarg],
+                example_gates,
+            )
             for qarg, transforms in qarg_local_basis_transforms.items()
         }
 
@@ -220,7 +247,7 @@ class BasisTranslator(TransformationPass):
                             else:
                                 flow_circ_block = block
                             flow_blocks.append(flow_circ_block)
-                        node.op = node.op.replace_blocks(flow_blocks)
+                        dag.substitute_node(node, node.op.replace_blocks(flow_blocks), inplace=True)
                     continue
                 if (
                     node_qargs in self._qargs_with_non_global_operation
@@ -249,36 +276,23 @@ class BasisTranslator(TransformationPass):
         return dag
 
     def _replace_node(self, dag, node, instr_map):
-        target_params, target_dag = instr_map[node.op.name, node.op.num_qubits]
-        if len(node.op.params) != len(target_params):
+        rule = instr_map[node.op.name, node.op.num_qubits]
+        if len(node.op.params) != len(rule.params):
             raise TranspilerError(
                 "Translation num_params not equal to op num_params."
                 "Op: {} {} Translation: {}\n{}".format(
-                    node.op.params, node.op.name, target_params, target_dag
+                    node.op.params, node.op.name, rule.params, rule.dag
                 )
             )
 
-        if node.op.params:
-            # Convert target to circ and back to assign_parameters, since
-            # DAGCircuits won't have a ParameterTable.
-            target_circuit = dag_to_circuit(target_dag)
-
-            target_circuit.assign_parameters(
-                dict(zip_longest(target_params, node.op.params)), inplace=True
-            )
-
-            bound_target_dag = circuit_to_dag(target_circuit)
-        else:
-            bound_target_dag = target_dag
+        # The rules are cached across runs, so the bound DAG has its own copies of the operations
+        # of the rule, which can't be shared by the nodes of the output circuits.
+        bound_target_dag = rule.bind(node.op.params)
 
         if len(bound_target_dag.op_nodes()) == 1 and len(
             bound_target_dag.op_nodes()[0].qargs
         ) == len(node.qargs):
             dag_op = bound_target_dag.op_nodes()[0].op
-            # dag_op may be the same instance as other ops in the dag,
-            # so if there is a condition, need to copy
-            if getattr(node.op, "condition", None):
-                dag_op = dag_op.copy()
             dag.substitute_node(node, dag_op, inplace=True)
 
             if bound_target_dag.global_phase:
@@ -440,6 +454,175 @@ class BasisSearchVisitor(retworkx.visit.DijkstraVisitor):
         return self._basis_transforms
 
 
+def _cache_get(cache, key):
+    """Return the value of ``key`` in an LRU cache, or raise ``KeyError``."""
+    value = cache[key]
+    cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache, key, value, size=_BASIS_CACHE_SIZE):
+    """Insert ``value`` in an LRU cache, evicting the least recently used entry if it is full."""
+    cache[key] = value
+    if len(cache) > size:
+        cache.popitem(last=False)
+
+
+def _cached_basis_search(equiv_lib, source_basis, target_basis):
+    """Call :func:`_basis_search`, reusing the results of previous searches.
+
+    The results are reused until the equivalences of ``equiv_lib`` are changed.
+    """
+    key = (equiv_lib._get_version(), frozenset(source_basis), frozenset(target_basis))
+    try:
+        basis_transforms = _cache_get(_basis_search_cache, key)
+    except KeyError:
+        basis_transforms = _basis_search(equiv_lib, source_basis, target_basis)
+        _cache_put(_basis_search_cache, key, basis_transforms)
+    else:
+        logger.debug("Reusing basis search from %s to %s.", source_basis, target_basis)
+    return basis_transforms
+
+
+def _cached_compose_transforms(
+    equiv_lib, basis_transforms, source_basis, target_basis, example_gates
+):
+    """Call :func:`_compose_transforms`, reusing the results of previous compositions.
+
+    ``basis_transforms`` must be the result of the basis search from ``source_basis`` to
+    ``target_basis`` over ``equiv_lib``. The composed transforms are shared by all their users, so
+    they must not be modified.
+    """
+    source_gates = frozenset(
+        (gate_name, gate_num_qubits, len(example_gates[gate_name, gate_num_qubits].params))
+        for gate_name, gate_num_qubits in source_basis
+    )
+    key = (equiv_lib._get_version(), source_gates, frozenset(target_basis))
+    try:
+        instr_map = _cache_get(_compose_transforms_cache, key)
+    except KeyError:
+        instr_map = {
+            gate: _TranslationRule(params, dag)
+            for gate, (params, dag) in _compose_transforms(
+                basis_transforms, source_basis, example_gates
+            ).items()
+        }
+        _cache_put(_compose_transforms_cache, key, instr_map)
+    return instr_map
+
+
+class _TranslationRule:
+    """The composed translation of a gate, from :func:`_compose_transforms`.
+
+    The translation is a DAG whose parameters are expressions of the placeholder parameters of
+    the gate. When the rule is bound to numeric values, the expressions are evaluated with a
+    compiled function and the bound DAG is built directly from the operations of the rule, instead
+    of binding a circuit copy of the rule with :meth:`.QuantumCircuit.assign_parameters`.
+    """
+
+    __slots__ = ("params", "dag", "_operations", "_slots", "_evaluate")
+
+    def __init__(self, params, dag):
+        self.params = params
+        self.dag = dag
+        # The (operation, qargs, cargs) of the nodes of the rule, in topological order.
+        self._operations = None
+        # The slots of the parameter expressions of the rule, as (node index, parameter index)
+        # pairs with the global phase as (None, None), and the function evaluating them. They
+        # are compiled on the first binding, _slots is empty if the rule has nothing to bind and
+        # False if the rule can't be bound numerically.
+        self._slots = None
+        self._evaluate = None
+
+    def bind(self, values):
+        """Return the DAG of the rule with its parameters bound to ``values``.
+
+        The operations of the returned DAG are copies of the operations of the rule."""
+        if self._slots is None:
+            self._compile()
+        if self._slots is False:
+            return self._assign(values)
+        if not self._slots:
+            return self._bind([])
+        if all(
+            isinstance(value, numbers.Real) and not isinstance(value, ParameterExpression)
+            for value in values
+        ):
+            try:
+                slot_values = self._evaluate(np.array([values], dtype=float))[0]
+            except Exception:  # pylint: disable=broad-except
+                # The rule can't be evaluated numerically, so it is always assigned.
+                self._slots = False
+                return self._assign(values)
+            if np.iscomplexobj(slot_values):
+                imaginary = np.abs(slot_values.imag) > 1e-10
+                if self._slots[-1] == (None, None):
+                    imaginary[-1] = False
+                if imaginary.any():
+                    return self._assign(values)
+                slot_values = slot_values.real
+            return self._bind(slot_values.tolist())
+        return self._assign(values)
+
+    def _compile(self):
+        self._slots = []
+        expressions = []
+        self._operations = [
+            (node.op, node.qargs, node.cargs) for node in self.dag.topological_op_nodes()
+        ]
+        for index, (operation, _, _) in enumerate(self._operations):
+            for param_index, param in enumerate(operation.params):
+                if isinstance(param, ParameterExpression) and param.parameters:
+                    if not _has_derived_definition(operation):
+                        self._slots = False
+                        return
+                    self._slots.append((index, param_index))
+                    expressions.append(param)
+                elif isinstance(param, QuantumCircuit):
+                    self._slots = False
+                    return
+        global_phase = self.dag.global_phase
+        if isinstance(global_phase, ParameterExpression) and global_phase.parameters:
+            self._slots.append((None, None))
+            expressions.append(global_phase)
+        if not self._slots:
+            # Nothing to bind, the rule is only copied.
+            return
+        try:
+            self._evaluate = _vectorize(
+                expressions, {param: index for index, param in enumerate(self.params)}
+            )
+        except Exception:  # pylint: disable=broad-except
+            # The expressions of the rule can't be compiled, so the rule is always assigned.
+            self._slots = False
+
+    def _bind(self, slot_values):
+        operations = self._operations.copy()
+        for value, (index, param_index) in zip(slot_values, self._slots):
+            if index is None:
+                continue
+            operation, qargs, cargs = operations[index]
+            if operation is self._operations[index][0]:
+                operation = _copy_with_params(operation)
+                operations[index] = (operation, qargs, cargs)
+            operation.params[param_index] = operation.validate_parameter(value)
+        for index, (operation, qargs, cargs) in enumerate(operations):
+            if operation is self._operations[index][0]:
+                operations[index] = (operation.copy(), qargs, cargs)
+        bound_dag = self.dag.copy_empty_like()
+        if self._slots and self._slots[-1] == (None, None):
+            bound_dag.global_phase = slot_values[-1]
+        bound_dag._apply_operations_back(operations)
+        return bound_dag
+
+    def _assign(self, values):
+        # Convert target to circ and back to assign_parameters, since
+        # DAGCircuits won't have a ParameterTable.
+        target_circuit = dag_to_circuit(self.dag)
+        target_circuit.assign_parameters(dict(zip_longest(self.params, values)), inplace=True)
+        return circuit_to_dag(target_circuit)
+
+
 def _basis_search(equiv_lib, source_basis, target_basis):
     """Search for a set of transformations from source_basis to target_basis.
 
@@ -467,6 +650,54 @@ def _basis_search(equiv_lib, source_basis, target_basis):
     if not source_basis:
         return []
 
+    graph, nodes_to_indices, num_gates_for_rule, all_gates_in_lib = _search_graph(equiv_lib)
+    # The dummy starting node is only added to a copy of the graph of the library.
+    graph = graph.copy()
+
+    # This is only neccessary since gates in target basis are currently reported by
+    # their names and we need to have in addition the number of qubits they act on.
+    target_basis_keys = [
+        key
+        for gate in target_basis
+        for key in filter(lambda key, name=gate: key.name == name, all_gates_in_lib)
+    ]
+
+    vis = BasisSearchVisitor(graph, source_basis, target_basis_keys, num_gates_for_rule)
+    # we add a dummy node and connect it with gates in the target basis.
+    # we'll start the search from this dummy node.
+    dummy = graph.add_node("dummy starting node")
+    graph.add_edges_from_no_data([(dummy, nodes_to_indices[key]) for key in target_basis_keys])
+    rtn = None
+    try:
+        retworkx.digraph_dijkstra_search(graph, [dummy], vis.edge_cost, vis)
+    except StopIfBasisRewritable:
+        rtn = vis.basis_transforms
+
+        logger.debug("Transformation path:")
+        for gate_name, gate_num_qubits, params, equiv in rtn:
+            logger.debug("%s/%s => %s\n%s", gate_name, gate_num_qubits, params, equiv)
+
+    return rtn
+
+
+def _search_graph(equiv_lib):
+    """Return the graph of the equivalence rules of ``equiv_lib`` searched by
+    :func:`_basis_search`.
+
+    The graph is built once for each version of the library.
+
+    Returns:
+        Tuple[PyDiGraph, Dict[Key, int], Dict[int, int], Set[Key]]: The graph, whose nodes are
+            the gates of the library and whose edges are the rules from their source gates to
+            their target gate, the node index of each gate, the number of source gates of each
+            rule, and the gates of the library.
+    """
+    version = equiv_lib._get_version()
+    try:
+        return _cache_get(_search_graph_cache, version)
+    except KeyError:
+        pass
+
     all_gates_in_lib = set()
 
     graph = retworkx.PyDiGraph()
@@ -501,33 +732,12 @@ def _basis_search(equiv_lib, source_basis, target_basis):
             graph.add_edges_from(edges)
             rcounter += 1
 
-    # This is only neccessary since gates in target basis are currently reported by
-    # their names and we need to have in addition the number of qubits they act on.
-    target_basis_keys = [
-        key
-        for gate in target_basis
-        for key in filter(lambda key, name=gate: key.name == name, all_gates_in_lib)
-    ]
-
-    vis = BasisSearchVisitor(graph, source_basis, target_basis_keys, num_gates_for_rule)
-    # we add a dummy node and connect it with gates in the target basis.
-    # we'll start the search from this dummy node.
-    dummy = graph.add_node("dummy starting node")
-    graph.add_edges_from_no_data([(dummy, nodes_to_indices[key]) for key in target_basis_keys])
-    rtn = None
-    try:
-        retworkx.digraph_dijkstra_search(graph, [dummy], vis.edge_cost, vis)
-    except StopIfBasisRewritable:
-        rtn = vis.basis_transforms
-
-        logger.debug("Transformation path:")
-        for gate_name, gate_num_qubits, params, equiv in rtn:
-            logger.debug("%s/%s => %s\n%s", gate_name, gate_num_qubits, params, equiv)
-
-    return rtn
+    search_graph = (graph, nodes_to_indices, num_gates_for_rule, all_gates_in_lib)
+    _cache_put(_search_graph_cache, version, search_graph, _SEARCH_GRAPH_CACHE_SIZE)
+    return search_graph
 
 
-def _compose_transforms(basis_transforms, source_basis, source_dag):
+def _compose_transforms(basis_transforms, source_basis, example_gates):
     """Compose a set of basis transforms into a set of replacements.
 
     Args:
@@ -535,8 +745,9 @@ def _compose_transforms(basis_transforms, source_basis, source_dag):
             transforms to compose.
         source_basis (Set[Tuple[gate_name: str, gate_num_qubits: int]]): Names
             of gates which need to be translated.
-        source_dag (DAGCircuit): DAG with example gates from source_basis.
-            (Used to determine num_params for gate in source_basis.)
+        example_gates (Dict[Tuple[gate_name, gate_num_qubits], Instruction]): Example gates
+            of source_basis, from :func:`_get_example_gates`. (Used to determine num_params
+            for gate in source_basis.)
 
     Returns:
         Dict[gate_name, Tuple(params, dag)]: Dictionary mapping between each gate
@@ -544,7 +755,6 @@ def _compose_transforms(basis_transforms, source_basis, source_dag):
             source_basis but not affected by basis_transforms will be included
             as a key mapping to itself.
     """
-    example_gates = _get_example_gates(source_dag)
     mapped_instrs = {}
 
     for gate_name, gate_num_qubits in source_basis:
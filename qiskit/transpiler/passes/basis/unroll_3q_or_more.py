@@ -66,7 +66,7 @@ class Unroll3qOrMore(TransformationPass):
                 continue
 
             if isinstance(node.op, ControlFlowOp):
-                node.op = control_flow.map_blocks(self.run, node.op)
+                dag.substitute_node(node, control_flow.map_blocks(self.run, node.op), inplace=True)
                 continue
 
             # TODO: allow choosing other possible decompositions
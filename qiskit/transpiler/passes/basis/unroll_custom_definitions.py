@@ -58,7 +58,7 @@ class UnrollCustomDefinitions(TransformationPass):
 
         for node in dag.op_nodes():
             if isinstance(node.op, ControlFlowOp):
-                node.op = control_flow.map_blocks(self.run, node.op)
+                dag.substitute_node(node, control_flow.map_blocks(self.run, node.op), inplace=True)
                 continue
 
             if getattr(node.op, "_directive", False):
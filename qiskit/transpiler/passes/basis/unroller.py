@@ -70,7 +70,7 @@ class Unroller(TransformationPass):
                     continue
 
             if isinstance(node.op, ControlFlowOp):
-                node.op = control_flow.map_blocks(self.run, node.op)
+                dag.substitute_node(node, control_flow.map_blocks(self.run, node.op), inplace=True)
                 continue
 
             try:
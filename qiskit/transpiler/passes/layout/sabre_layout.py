@@ -13,19 +13,31 @@
 """Layout selection using the SABRE bidirectional search approach from Li et al.
 """
 
+import copy
 import logging
+
 import numpy as np
+import retworkx
 
 from qiskit.converters import dag_to_circuit
 from qiskit.transpiler.passes.layout.set_layout import SetLayout
 from qiskit.transpiler.passes.layout.full_ancilla_allocation import FullAncillaAllocation
 from qiskit.transpiler.passes.layout.enlarge_with_ancilla import EnlargeWithAncilla
 from qiskit.transpiler.passes.layout.apply_layout import ApplyLayout
-from qiskit.transpiler.passes.routing import SabreSwap
 from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.tools.parallel import CPU_COUNT
+
+# pylint: disable=import-error
+from qiskit._accelerate.sabre_swap import (
+    build_swap_map,
+    Heuristic,
+    NeighborTable,
+    SabreDAG,
+)
+from qiskit._accelerate.stochastic_swap import NLayout  # pylint: disable=import-error
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +54,13 @@ class SabreLayout(AnalysisPass):
     This method exploits the reversibility of quantum circuits, and tries to
     include global circuit information in the choice of initial_layout.
 
+    By default, the forward and backward routings are done directly on the
+    graph of the interactions of the circuit, with the routing engine of
+    :class:`~.SabreSwap`, without building the routed circuits. The
+    ``layout_trials`` argument sets a number of independent random initial
+    layouts to iterate from, and the layout which needs the fewest swaps to
+    route the circuit is selected.
+
     **References:**
 
     [1] Li, Gushu, Yufei Ding, and Yuan Xie. "Tackling the qubit mapping problem
@@ -50,7 +69,13 @@ class SabreLayout(AnalysisPass):
     """
 
     def __init__(
-        self, coupling_map, routing_pass=None, seed=None, max_iterations=3, swap_trials=None
+        self,
+        coupling_map,
+        routing_pass=None,
+        seed=None,
+        max_iterations=3,
+        swap_trials=None,
+        layout_trials=None,
     ):
         """SabreLayout initializer.
 
@@ -71,20 +96,31 @@ class SabreLayout(AnalysisPass):
                 on the number of trials run. This option is mutually exclusive
                 with the ``routing_pass`` argument and an error will be raised
                 if both are used.
+            layout_trials (int): The number of random initial layouts to run
+                the forward-backward iterations from. The layout which needs
+                the fewest swaps in a final forward routing is selected. If
+                this is not specified a single initial layout is used. This
+                option is mutually exclusive with the ``routing_pass``
+                argument and an error will be raised if both are used.
 
         Raises:
-            TranspilerError: If both ``routing_pass`` and ``swap_trials`` are
-                specified
+            TranspilerError: If both ``routing_pass`` and ``swap_trials`` or
+                ``layout_trials`` are specified
         """
         super().__init__()
         self.coupling_map = coupling_map
         if routing_pass is not None and swap_trials is not None:
             raise TranspilerError("Both routing_pass and swap_trials can't be set at the same time")
+        if routing_pass is not None and layout_trials is not None:
+            raise TranspilerError(
+                "Both routing_pass and layout_trials can't be set at the same time"
+            )
         self.routing_pass = routing_pass
         self.seed = seed
         self.max_iterations = max_iterations
         self.trials = swap_trials
         self.swap_trials = swap_trials
+        self.layout_trials = layout_trials
 
     def run(self, dag):
         """Run the SabreLayout pass on `dag`.
@@ -98,21 +134,20 @@ class SabreLayout(AnalysisPass):
         if len(dag.qubits) > self.coupling_map.size():
             raise TranspilerError("More virtual qubits exist than physical.")
 
-        # Choose a random initial_layout.
         if self.seed is None:
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
         rng = np.random.default_rng(self.seed)
 
+        if self.routing_pass is None:
+            self._run_sabre_dag(dag, rng)
+            return
+
+        # Choose a random initial_layout.
         physical_qubits = rng.choice(self.coupling_map.size(), len(dag.qubits), replace=False)
         physical_qubits = rng.permutation(physical_qubits)
         initial_layout = Layout({q: dag.qubits[i] for i, q in enumerate(physical_qubits)})
 
-        if self.routing_pass is None:
-            self.routing_pass = SabreSwap(
-                self.coupling_map, "decay", seed=self.seed, fake_run=True, trials=self.swap_trials
-            )
-        else:
-            self.routing_pass.fake_run = True
+        self.routing_pass.fake_run = True
 
         # Do forward-backward iterations.
         circ = dag_to_circuit(dag)
@@ -140,6 +175,88 @@ class SabreLayout(AnalysisPass):
         self.property_set["layout"] = initial_layout
         self.routing_pass.fake_run = False
 
+    def _run_sabre_dag(self, dag, rng):
+        """Find the layout with forward-backward routings of the interactions of ``dag``.
+
+        The routings are done with the routing engine of :class:`~.SabreSwap` on a
+        :class:`.SabreDAG` of the circuit and one of its reverse, without building the routed
+        circuits or composing intermediate :class:`.Layout` objects.
+        """
+        coupling_map = self.coupling_map
+        if not coupling_map.is_symmetric:
+            coupling_map = copy.deepcopy(coupling_map)
+            coupling_map.make_symmetric()
+        neighbor_table = NeighborTable(retworkx.adjacency_matrix(coupling_map.graph))
+        dist_matrix = coupling_map.distance_matrix
+        num_physical = coupling_map.size()
+        swap_trials = CPU_COUNT if self.swap_trials is None else self.swap_trials
+        layout_trials = 1 if self.layout_trials is None else self.layout_trials
+
+        qubit_indices = {bit: idx for idx, bit in enumerate(dag.qubits)}
+        clbit_indices = {bit: idx for idx, bit in enumerate(dag.clbits)}
+        nodes = [
+            (
+                node._node_id,
+                [qubit_indices[x] for x in node.qargs],
+                [clbit_indices[x] for x in node.cargs],
+            )
+            for node in dag.topological_op_nodes()
+        ]
+        forward_dag = _sabre_dag(num_physical, len(dag.clbits), nodes)
+        backward_dag = _sabre_dag(num_physical, len(dag.clbits), nodes[::-1])
+
+        best_layout = None
+        best_swaps = None
+        for _ in range(layout_trials):
+            physical_qubits = rng.choice(num_physical, len(dag.qubits), replace=False)
+            physical_qubits = rng.permutation(physical_qubits)
+            # The ancillas are the next virtual qubits, on the free physical qubits in order.
+            used = set(physical_qubits.tolist())
+            physical_qubits = physical_qubits.tolist() + [
+                q for q in range(num_physical) if q not in used
+            ]
+            layout = NLayout(dict(enumerate(physical_qubits)), num_physical, num_physical)
+            for _ in range(self.max_iterations):
+                for sabre_dag in (forward_dag, backward_dag):
+                    # The layout is updated in place to the final layout of the routing, which is
+                    # the initial layout of the next routing.
+                    build_swap_map(
+                        num_physical,
+                        sabre_dag,
+                        neighbor_table,
+                        dist_matrix,
+                        Heuristic.Decay,
+                        self.seed,
+                        layout,
+                        swap_trials,
+                    )
+            if layout_trials > 1:
+                swap_map, gate_order = build_swap_map(
+                    num_physical,
+                    forward_dag,
+                    neighbor_table,
+                    dist_matrix,
+                    Heuristic.Decay,
+                    self.seed,
+                    layout.copy(),
+                    swap_trials,
+                )
+                num_swaps = sum(len(swap_map[x]) for x in gate_order if x in swap_map)
+                logger.debug("layout trial with %s swaps", num_swaps)
+                if best_swaps is not None and num_swaps >= best_swaps:
+                    continue
+                best_swaps = num_swaps
+            best_layout = layout
+
+        initial_layout = Layout(
+            {best_layout.logical_to_physical(i): bit for i, bit in enumerate(dag.qubits)}
+        )
+        logger.info("new initial layout")
+        logger.info(initial_layout)
+        for qreg in dag.qregs.values():
+            initial_layout.add_register(qreg)
+        self.property_set["layout"] = initial_layout
+
     def _layout_and_route_passmanager(self, initial_layout):
         """Return a passmanager for a full layout and routing.
 
@@ -168,3 +285,19 @@ class SabreLayout(AnalysisPass):
         qubit_map = Layout.combine_into_edge_map(initial_layout, trivial_layout)
         final_layout = {v: pass_final_layout._v2p[qubit_map[v]] for v in initial_layout._v2p}
         return Layout(final_layout)
+
+
+def _sabre_dag(num_qubits, num_clbits, nodes):
+    """Return the :class:`.SabreDAG` of the ``(node_id, qargs, cargs)`` of ``nodes``.
+
+    The nodes are in topological order, and the front layer is the nodes which are the first on
+    all their wires.
+    """
+    seen = set()
+    front_layer = []
+    for node_id, qargs, cargs in nodes:
+        wires = [("q", x) for x in qargs] + [("c", x) for x in cargs]
+        if seen.isdisjoint(wires):
+            front_layer.append(node_id)
+        seen.update(wires)
+    return SabreDAG(num_qubits, num_clbits, nodes, np.asarray(front_layer, dtype=np.uintp))
@@ -13,8 +13,8 @@
 """VF2Layout pass to find a layout using subgraph isomorphism"""
 from enum import Enum
 import logging
-import time
 
+import numpy as np
 from retworkx import vf2_mapping
 
 from qiskit.transpiler.layout import Layout
@@ -139,57 +139,63 @@ class VF2Layout(AnalysisPass):
         )
         chosen_layout = None
         chosen_layout_score = None
-        start_time = time.time()
-        trials = 0
-        for mapping in mappings:
-            trials += 1
-            logger.debug("Running trial: %s", trials)
-            stop_reason = VF2LayoutStopReason.SOLUTION_FOUND
-            layout = Layout(
-                {reverse_im_graph_node_map[im_i]: cm_nodes[cm_i] for cm_i, im_i in mapping.items()}
-            )
-            # If the graphs have the same number of nodes we don't need to score or do multiple
-            # trials as the score heuristic currently doesn't weigh nodes based on gates on a
-            # qubit so the scores will always all be the same
-            if len(cm_graph) == len(im_graph):
-                chosen_layout = layout
-                break
-            layout_score = vf2_utils.score_layout(
-                self.avg_error_map,
-                layout,
-                im_graph_node_map,
-                reverse_im_graph_node_map,
-                im_graph,
-                self.strict_direction,
+        # If the graphs have the same number of nodes we don't need to score or do multiple
+        # trials as the score heuristic currently doesn't weigh nodes based on gates on a
+        # qubit so the scores will always all be the same
+        if len(cm_graph) == len(im_graph):
+            mapping = next(iter(mappings), None)
+            if mapping is not None:
+                logger.debug("Running trial: %s", 1)
+                chosen_layout = Layout(
+                    {
+                        reverse_im_graph_node_map[im_i]: cm_nodes[cm_i]
+                        for cm_i, im_i in mapping.items()
+                    }
+                )
+        else:
+            error_arrays = vf2_utils.build_average_error_arrays(
+                self.avg_error_map, max(cm_nodes, default=-1) + 1, self.strict_direction
             )
-            logger.debug("Trial %s has score %s", trials, layout_score)
-            if chosen_layout is None:
-                chosen_layout = layout
-                chosen_layout_score = layout_score
-            elif layout_score < chosen_layout_score:
-                logger.debug(
-                    "Found layout %s has a lower score (%s) than previous best %s (%s)",
-                    layout,
-                    layout_score,
-                    chosen_layout,
-                    chosen_layout_score,
+            # The mappings are scored in batches, and only the layout with the best score of
+            # each batch is built.
+            trials = 0
+            for layouts in vf2_utils.layout_batches(
+                mappings,
+                cm_nodes,
+                max_trials=self.max_trials,
+                time_limit=self.time_limit,
+                pass_logger=logger,
+                pass_name="VF2Layout",
+            ):
+                layout_scores = vf2_utils.score_layouts(
+                    error_arrays, layouts, im_graph_node_map, im_graph
+                )
+                vf2_utils.log_trial_scores(logger, trials + 1, layout_scores)
+                trials += len(layouts)
+                best_index = np.argmin(layout_scores)
+                layout_score = layout_scores[best_index]
+                if chosen_layout is not None and layout_score >= chosen_layout_score:
+                    continue
+                layout = Layout(
+                    {
+                        reverse_im_graph_node_map[im_i]: int(physical)
+                        for im_i, physical in enumerate(layouts[best_index])
+                    }
                 )
+                if chosen_layout is not None:
+                    logger.debug(
+                        "Found layout %s has a lower score (%s) than previous best %s (%s)",
+                        layout,
+                        layout_score,
+                        chosen_layout,
+                        chosen_layout_score,
+                    )
                 chosen_layout = layout
                 chosen_layout_score = layout_score
-            if self.max_trials is not None and self.max_trials > 0 and trials >= self.max_trials:
-                logger.debug("Trial %s is >= configured max trials %s", trials, self.max_trials)
-                break
-            elapsed_time = time.time() - start_time
-            if self.time_limit is not None and elapsed_time >= self.time_limit:
-                logger.debug(
-                    "VF2Layout has taken %s which exceeds configured max time: %s",
-                    elapsed_time,
-                    self.time_limit,
-                )
-                break
         if chosen_layout is None:
             stop_reason = VF2LayoutStopReason.NO_SOLUTION_FOUND
         else:
+            stop_reason = VF2LayoutStopReason.SOLUTION_FOUND
             self.property_set["layout"] = chosen_layout
             for reg in dag.qregs.values():
                 self.property_set["layout"].add_register(reg)
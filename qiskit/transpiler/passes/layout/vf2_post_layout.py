@@ -13,8 +13,8 @@
 """VF2PostLayout pass to find a layout after transpile using subgraph isomorphism"""
 from enum import Enum
 import logging
-import time
 
+import numpy as np
 from retworkx import PyDiGraph, vf2_mapping, PyGraph
 
 from qiskit.transpiler.layout import Layout
@@ -205,30 +205,38 @@ class VF2PostLayout(AnalysisPass):
 
         logger.debug("Initial layout has score %s", chosen_layout_score)
 
-        start_time = time.time()
-        trials = 0
-        for mapping in mappings:
-            trials += 1
-            logger.debug("Running trial: %s", trials)
-            stop_reason = VF2PostLayoutStopReason.SOLUTION_FOUND
-            layout = Layout(
-                {reverse_im_graph_node_map[im_i]: cm_nodes[cm_i] for cm_i, im_i in mapping.items()}
+        if not self.strict_direction:
+            error_arrays = vf2_utils.build_average_error_arrays(
+                self.avg_error_map, max(cm_nodes, default=-1) + 1, self.strict_direction
             )
+        trials = 0
+        for layouts in vf2_utils.layout_batches(
+            mappings,
+            cm_nodes,
+            time_limit=self.time_limit,
+            pass_logger=logger,
+            pass_name="VF2PostLayout",
+        ):
             if self.strict_direction:
-                layout_score = self._score_layout(
-                    layout, im_graph_node_map, reverse_im_graph_node_map, im_graph
-                )
+                layout_scores = [
+                    self._score_layout(
+                        self._build_layout(layout, reverse_im_graph_node_map),
+                        im_graph_node_map,
+                        reverse_im_graph_node_map,
+                        im_graph,
+                    )
+                    for layout in layouts
+                ]
             else:
-                layout_score = vf2_utils.score_layout(
-                    self.avg_error_map,
-                    layout,
-                    im_graph_node_map,
-                    reverse_im_graph_node_map,
-                    im_graph,
-                    self.strict_direction,
+                layout_scores = vf2_utils.score_layouts(
+                    error_arrays, layouts, im_graph_node_map, im_graph
                 )
-            logger.debug("Trial %s has score %s", trials, layout_score)
+            vf2_utils.log_trial_scores(logger, trials + 1, layout_scores)
+            trials += len(layouts)
+            best_index = np.argmin(layout_scores)
+            layout_score = layout_scores[best_index]
             if layout_score < chosen_layout_score:
+                layout = self._build_layout(layouts[best_index], reverse_im_graph_node_map)
                 logger.debug(
                     "Found layout %s has a lower score (%s) than previous best %s (%s)",
                     layout,
@@ -238,17 +246,10 @@ class VF2PostLayout(AnalysisPass):
                 )
                 chosen_layout = layout
                 chosen_layout_score = layout_score
-            elapsed_time = time.time() - start_time
-            if self.time_limit is not None and elapsed_time >= self.time_limit:
-                logger.debug(
-                    "VFPostLayout has taken %s which exceeds configured max time: %s",
-                    elapsed_time,
-                    self.time_limit,
-                )
-                break
         if chosen_layout is None:
             stop_reason = VF2PostLayoutStopReason.NO_SOLUTION_FOUND
         else:
+            stop_reason = VF2PostLayoutStopReason.SOLUTION_FOUND
             existing_layout = self.property_set["layout"]
             # If any ancillas in initial layout map them back to the final layout output
             if existing_layout is not None and len(existing_layout) > len(chosen_layout):
@@ -268,6 +269,13 @@ class VF2PostLayout(AnalysisPass):
 
         self.property_set["VF2PostLayout_stop_reason"] = stop_reason
 
+    @staticmethod
+    def _build_layout(layout, reverse_bit_map):
+        """Return the :class:`.Layout` of a row of the layouts of a batch."""
+        return Layout(
+            {reverse_bit_map[im_i]: int(physical) for im_i, physical in enumerate(layout)}
+        )
+
     def _score_layout(self, layout, bit_map, reverse_bit_map, im_graph):
         bits = layout.get_virtual_bits()
         fidelity = 1
@@ -13,11 +13,16 @@
 """This module contains common utils for vf2 layout passes."""
 
 from collections import defaultdict
+import logging
 import statistics
 import random
+import time
 
+import numpy as np
 from retworkx import PyDiGraph, PyGraph
 
+logger = logging.getLogger(__name__)
+
 
 def build_interaction_graph(dag, strict_direction=True):
     """Build an interaction graph from a dag."""
@@ -73,6 +78,139 @@ def score_layout(avg_error_map, layout, bit_map, reverse_bit_map, im_graph, stri
     return 1 - fidelity
 
 
+def build_average_error_arrays(avg_error_map, num_qubits, strict_direction=False):
+    """Build the arrays of the success rates of an average error map.
+
+    The success rate of qubits or edges which are not in the error map is ``NaN``. If
+    ``strict_direction`` is ``False``, the success rate of an edge which is not in the error map
+    is the one of the reversed edge.
+
+    Returns:
+        tuple: The 1d array of the success rates of the qubits and the 2d array of the success
+        rates of the edges, to pass to :func:`score_layouts`.
+    """
+    qubit_rates = np.full(num_qubits, np.nan)
+    edge_rates = np.full((num_qubits, num_qubits), np.nan)
+    for qargs, error in avg_error_map.items():
+        if max(qargs) >= num_qubits:
+            continue
+        if len(qargs) == 1:
+            qubit_rates[qargs] = 1 - error
+        elif len(qargs) == 2:
+            edge_rates[qargs] = 1 - error
+    if not strict_direction:
+        missing = np.isnan(edge_rates)
+        edge_rates[missing] = edge_rates.T[missing]
+    return qubit_rates, edge_rates
+
+
+def score_layouts(error_arrays, layouts, bit_map, im_graph):
+    """Score layouts given the arrays of an average error map.
+
+    This gives the same scores as :func:`score_layout` for many layouts at once.
+
+    Args:
+        error_arrays (tuple): The arrays of the success rates of the average error map, from
+            :func:`build_average_error_arrays`.
+        layouts (ndarray): A 2d array of the layouts to score, whose rows are the physical
+            qubits of the nodes of ``im_graph`` in each layout.
+        bit_map (dict): The mapping of the virtual bits to the nodes of ``im_graph``.
+        im_graph (PyGraph or PyDiGraph): The interaction graph of the circuit.
+
+    Returns:
+        ndarray: The score of each layout.
+
+    Raises:
+        KeyError: If a layout uses a qubit or an edge which is not in the error map.
+    """
+    qubit_rates, edge_rates = error_arrays
+    # The factors are multiplied in the same order as in score_layout, so that the scores are
+    # the same.
+    fidelity = np.ones(len(layouts))
+    for node_index in bit_map.values():
+        gate_count = sum(im_graph[node_index].values())
+        fidelity *= qubit_rates[layouts[:, node_index]] ** gate_count
+    for edge in im_graph.edge_index_map().values():
+        gate_count = sum(edge[2].values())
+        fidelity *= edge_rates[layouts[:, edge[0]], layouts[:, edge[1]]] ** gate_count
+    if np.isnan(fidelity).any():
+        raise KeyError("A layout uses qubits which are not in the average error map.")
+    return 1 - fidelity
+
+
+def layout_batches(
+    mappings,
+    cm_nodes,
+    max_trials=None,
+    time_limit=None,
+    batch_size=1024,
+    pass_logger=logger,
+    pass_name="VF2",
+):
+    """Yield the layouts of VF2 mappings in batches.
+
+    Args:
+        mappings (Iterable): The iterator of the VF2 mappings from the nodes of the coupling graph to the
+            nodes of the interaction graph.
+        cm_nodes (list): The physical qubit of each node of the coupling graph.
+        max_trials (int): The maximum number of mappings, if it is positive.
+        time_limit (float): The time in seconds after which no more mappings are consumed.
+        batch_size (int): The maximum number of layouts in a batch.
+        pass_logger (Logger): The logger of the calling pass.
+        pass_name (str): The name of the calling pass in the log messages.
+
+    Yields:
+        ndarray: A 2d array whose rows are the physical qubits of the nodes of the interaction
+        graph in each layout of the batch.
+    """
+    cm_nodes = np.asarray(cm_nodes, dtype=np.intp)
+    log_trials = pass_logger.isEnabledFor(logging.DEBUG)
+    start_time = time.time()
+    trials = 0
+    batch = []
+    for mapping in mappings:
+        trials += 1
+        if log_trials:
+            pass_logger.debug("Running trial: %s", trials)
+        batch.append(list(mapping.items()))
+        stop = False
+        if max_trials is not None and 0 < max_trials <= trials:
+            pass_logger.debug("Trial %s is >= configured max trials %s", trials, max_trials)
+            stop = True
+        else:
+            elapsed_time = time.time() - start_time
+            if time_limit is not None and elapsed_time >= time_limit:
+                pass_logger.debug(
+                    "%s has taken %s which exceeds configured max time: %s",
+                    pass_name,
+                    elapsed_time,
+                    time_limit,
+                )
+                stop = True
+        if stop or len(batch) == batch_size:
+            yield _mapping_layouts(batch, cm_nodes)
+            batch = []
+        if stop:
+            return
+    if batch:
+        yield _mapping_layouts(batch, cm_nodes)
+
+
+def log_trial_scores(pass_logger, first_trial, layout_scores):
+    """Log the score of each trial of a batch, numbered from ``first_trial``."""
+    if pass_logger.isEnabledFor(logging.DEBUG):
+        for trial, layout_score in enumerate(layout_scores, first_trial):
+            pass_logger.debug("Trial %s has score %s", trial, layout_score)
+
+
+def _mapping_layouts(batch, cm_nodes):
+    """Return the 2d array of the layouts of the items of a batch of VF2 mappings."""
+    items = np.array(batch, dtype=np.intp).reshape((len(batch), -1, 2))
+    layouts = np.empty(items.shape[:2], dtype=np.intp)
+    layouts[np.arange(len(batch))[:, np.newaxis], items[:, :, 1]] = cm_nodes[items[:, :, 0]]
+    return layouts
+
+
 def build_average_error_map(target, properties, coupling_map):
     """Build an average error map used for scoring layouts pre-basis translation."""
     avg_map = {}
@@ -18,9 +18,10 @@ import logging
 import numpy as np
 
 from qiskit.circuit.library.standard_gates import U3Gate
+from qiskit.circuit.quantumregister import QuantumRegister
+from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.quantum_info.synthesis import one_qubit_decompose
-from qiskit.converters import circuit_to_dag
 
 logger = logging.getLogger(__name__)
 
@@ -70,18 +71,63 @@ class Optimize1qGatesDecomposition(TransformationPass):
         Returns (basis, circuit) containing the newly synthesized circuit in the indicated basis, or
         (None, None) if no synthesis routine applied.
         """
+        new_basis, new_sequence = self._resynthesize_operators(self._run_operators([run]))[0]
+        if new_sequence is None:
+            return None, None
+        return new_basis, new_sequence.to_circuit()
 
-        operator = run[0].op.to_matrix()
-        for gate in run[1:]:
-            operator = gate.op.to_matrix().dot(operator)
+    @staticmethod
+    def _run_operators(runs):
+        """
+        Returns the unitary matrices of the `runs`, as an array of shape `(len(runs), 2, 2)`.
 
-        new_circs = {k: v._decompose(operator) for k, v in self._decomposers.items()}
+        The matrices are composed for all the runs at once, one gate position at a time, with the
+        runs sorted by decreasing length so that the runs which are still being composed at a
+        position are a prefix of the array.
+        """
+        if not runs:
+            return np.empty((0, 2, 2), dtype=complex)
+        lengths = np.array([len(run) for run in runs])
+        order = np.argsort(-lengths, kind="stable")
+        lengths = lengths[order]
+        matrices = np.array(
+            [node.op.to_matrix() for index in order for node in runs[index]], dtype=complex
+        )
+        offsets = np.cumsum(lengths) - lengths
+        operators = matrices[offsets]
+        # The number of runs which are longer than each gate position.
+        num_active = len(runs) - np.searchsorted(lengths[::-1], np.arange(lengths[0]), "right")
+        for position in range(1, lengths[0]):
+            active = num_active[position]
+            operators[:active] = np.matmul(
+                matrices[offsets[:active] + position], operators[:active]
+            )
+        result = np.empty_like(operators)
+        result[order] = operators
+        return result
 
-        new_basis, new_circ = None, None
-        if len(new_circs) > 0:
-            new_basis, new_circ = min(new_circs.items(), key=lambda x: len(x[1]))
+    def _resynthesize_operators(self, operators):
+        """
+        Resynthesizes each of the 2x2 unitary `operators`.
 
-        return new_basis, new_circ
+        Returns a list of (basis, sequence) containing the shortest gate sequence of the
+        decomposers of each operator, as a `_OneQubitGateSequence`, or (None, None) if no synthesis
+        routine applied.  The Euler angles are computed only once for the decomposers which share
+        the same parametrization, and no circuit is built for the candidate sequences.
+        """
+        out = []
+        for operator in operators:
+            angles = {}
+            new_basis, new_sequence = None, None
+            for basis, decomposer in self._decomposers.items():
+                params = angles.get(decomposer._params)
+                if params is None:
+                    params = angles[decomposer._params] = decomposer._params(operator)
+                sequence = decomposer._circuit(*params)
+                if new_sequence is None or len(sequence) < len(new_sequence):
+                    new_basis, new_sequence = basis, sequence
+            out.append((new_basis, new_sequence))
+        return out
 
     def _substitution_checks(self, dag, old_run, new_circ, new_basis):
         """
@@ -113,7 +159,7 @@ class Optimize1qGatesDecomposition(TransformationPass):
                 "Resynthesized \n\n"
                 + "\n".join([str(node.op) for node in old_run])
                 + "\n\nand got\n\n"
-                + "\n".join([str(node[0]) for node in new_circ])
+                + "\n".join([str(getattr(node, "operation", node)) for node in new_circ])
                 + f"\n\nbut the original was native (for {self._target_basis}) and the new value "
                 "is longer.  This indicates an efficiency bug in synthesis.  Please report it by "
                 "opening an issue here: "
@@ -152,8 +198,8 @@ class Optimize1qGatesDecomposition(TransformationPass):
             logger.info("Skipping pass because no basis is set")
             return dag
 
-        runs = dag.collect_1q_runs()
-        for run in runs:
+        runs = []
+        for run in dag.collect_1q_runs():
             # SPECIAL CASE: Don't bother to optimize single U3 gates which are in the basis set.
             #     The U3 decomposer is only going to emit a sequence of length 1 anyhow.
             if "u3" in self._target_basis and len(run) == 1 and isinstance(run[0].op, U3Gate):
@@ -164,14 +210,29 @@ class Optimize1qGatesDecomposition(TransformationPass):
                 # We might rewrite into lower `u`s if they're available.
                 if "u2" not in self._target_basis and "u1" not in self._target_basis:
                     continue
-
-            new_basis, new_circ = self._resynthesize_run(run)
-
-            if new_circ is not None and self._substitution_checks(dag, run, new_circ, new_basis):
-                new_dag = circuit_to_dag(new_circ)
-                dag.substitute_node_with_dag(run[0], new_dag)
+            runs.append(run)
+
+        # The runs are disjoint, so they can all be resynthesized before any of them is replaced,
+        # and a DAG is only built for the sequences which replace a run.
+        new_sequences = self._resynthesize_operators(self._run_operators(runs))
+        for run, (new_basis, new_sequence) in zip(runs, new_sequences):
+            if new_sequence is not None and self._substitution_checks(
+                dag, run, new_sequence, new_basis
+            ):
+                dag.substitute_node_with_dag(run[0], _sequence_to_dag(new_sequence))
                 # Delete the other nodes in the run
                 for current_node in run[1:]:
                     dag.remove_op_node(current_node)
 
         return dag
+
+
+def _sequence_to_dag(sequence):
+    """Return the DAG of a single-qubit gate sequence of the Euler decomposers."""
+    qr = QuantumRegister(1, "qr")
+    dag = DAGCircuit()
+    dag.add_qreg(qr)
+    dag.global_phase = sequence.global_phase
+    for gate in sequence:
+        dag.apply_operation_back(gate, [qr[0]], [])
+    return dag
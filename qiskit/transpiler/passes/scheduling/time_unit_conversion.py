@@ -89,13 +89,14 @@ class TimeUnitConversion(TransformationPass):
         bit_indices = {bit: index for index, bit in enumerate(dag.qubits)}
         for node in dag.op_nodes():
             try:
-                node.op = node.op.copy()
-                node.op.duration = self.inst_durations.get(
+                op = node.op.copy()
+                op.duration = self.inst_durations.get(
                     node.op, [bit_indices[qarg] for qarg in node.qargs], unit=time_unit
                 )
-                node.op.unit = time_unit
+                op.unit = time_unit
             except TranspilerError:
-                pass
+                continue
+            dag.substitute_node(node, op, inplace=True)
 
         self.property_set["time_unit"] = time_unit
         return dag
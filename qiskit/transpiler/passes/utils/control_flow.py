@@ -42,7 +42,7 @@ def trivial_recurse(method):
     use :func:`map_blocks` as::
 
         if isinstance(node.op, ControlFlowOp):
-            node.op = map_blocks(self.run, node.op)
+            dag.substitute_node(node, map_blocks(self.run, node.op), inplace=True)
 
     from with :meth:`.BasePass.run`."""
 
@@ -52,7 +52,7 @@ def trivial_recurse(method):
             return out(self, dag)
 
         for node in dag.op_nodes(ControlFlowOp):
-            node.op = map_blocks(bound_wrapped_method, node.op)
+            dag.substitute_node(node, map_blocks(bound_wrapped_method, node.op), inplace=True)
         return method(self, dag)
 
     return out
@@ -18,10 +18,11 @@ from typing import Union, List, Tuple, Callable, Dict, Any, Optional, Iterator,
 
 import dill
 
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools.parallel import parallel_map, cached_loads
 from qiskit.circuit import QuantumCircuit
 from .basepasses import BasePass
 from .exceptions import TranspilerError
+from .profiler import PassProfiler, get_active_profiler
 from .runningpassmanager import RunningPassManager, FlowController
 
 
@@ -233,11 +234,19 @@ class PassManager:
         return running_passmanager
 
     @staticmethod
-    def _in_parallel(circuit, pm_dill=None) -> QuantumCircuit:
-        """Task used by the parallel map tools from ``_run_several_circuits``."""
-        running_passmanager = dill.loads(pm_dill)._create_running_passmanager()
-        result = running_passmanager.run(circuit)
-        return result
+    def _in_parallel(circuit, pm_dill=None, profile=None) -> QuantumCircuit:
+        """Task used by the parallel map tools from ``_run_several_circuits``.
+
+        If ``profile`` is not ``None``, the circuit is run inside a :class:`.PassProfiler` with
+        ``track_memory=profile`` and a tuple of the circuit and the profiler report is returned.
+        """
+        pass_manager = cached_loads(pm_dill, dill.loads)
+        if profile is None:
+            running_passmanager = pass_manager._create_running_passmanager()
+            return running_passmanager.run(circuit)
+        with PassProfiler(track_memory=profile) as profiler:
+            result = pass_manager._run_single_circuit(circuit)
+        return result, profiler.report
 
     def _run_several_circuits(
         self, circuits: List[QuantumCircuit], output_name: str = None, callback: Callable = None
@@ -257,9 +266,19 @@ class PassManager:
         del output_name
         del callback
 
-        return parallel_map(
-            PassManager._in_parallel, circuits, task_kwargs={"pm_dill": dill.dumps(self)}
+        profiler = get_active_profiler()
+        if profiler is None:
+            return parallel_map(
+                PassManager._in_parallel, circuits, task_kwargs={"pm_dill": dill.dumps(self)}
+            )
+        results = parallel_map(
+            PassManager._in_parallel,
+            circuits,
+            task_kwargs={"pm_dill": dill.dumps(self), "profile": profiler.track_memory},
         )
+        for _, report in results:
+            profiler.report.merge(report)
+        return [circuit for circuit, _ in results]
 
     def _run_single_circuit(
         self, circuit: QuantumCircuit, output_name: str = None, callback: Callable = None
@@ -276,7 +295,20 @@ class PassManager:
             The transformed circuit.
         """
         running_passmanager = self._create_running_passmanager()
-        result = running_passmanager.run(circuit, output_name=output_name, callback=callback)
+        profiler = get_active_profiler()
+        if profiler is None or profiler._in_run:
+            # Pass managers run from inside a pass are accounted to that pass.
+            result = running_passmanager.run(circuit, output_name=output_name, callback=callback)
+        else:
+            running_passmanager.profile = profiler.report
+            running_passmanager.profile_memory = profiler.track_memory
+            profiler._in_run = True
+            try:
+                result = running_passmanager.run(
+                    circuit, output_name=output_name, callback=callback
+                )
+            finally:
+                profiler._in_run = False
         self.property_set = running_passmanager.property_set
         return result
 
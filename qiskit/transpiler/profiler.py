@@ -0,0 +1,215 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Collection of per-pass profiling data from the pass manager."""
+
+from __future__ import annotations
+
+import os
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class PassStatistics:
+    """Profiling data of all the executions of one kind of pass."""
+
+    name: str
+    """The name of the pass."""
+    runs: int = 0
+    """The number of times the pass was run."""
+    skipped: int = 0
+    """The number of times the pass was scheduled but not run because its results were still
+    valid."""
+    total_time: float = 0.0
+    """The total wall time spent in the pass, in seconds."""
+    max_time: float = 0.0
+    """The longest wall time of a single run of the pass, in seconds."""
+    peak_memory: Optional[int] = None
+    """The largest amount of memory allocated by a single run of the pass above what was in use
+    when it started, in bytes, or ``None`` if memory was not tracked."""
+    size_before: int = 0
+    """The total number of operations in the DAGs the pass was run on."""
+    size_after: int = 0
+    """The total number of operations in the DAGs the pass returned."""
+
+    def merge(self, other: PassStatistics):
+        """Add the statistics of ``other`` to these ones in place."""
+        self.runs += other.runs
+        self.skipped += other.skipped
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+        if other.peak_memory is not None:
+            self.peak_memory = max(self.peak_memory or 0, other.peak_memory)
+        self.size_before += other.size_before
+        self.size_after += other.size_after
+
+
+@dataclass
+class LoopStatistics:
+    """Profiling data of all the executions of one :class:`.DoWhileController` loop."""
+
+    name: str
+    """A description of the loop, built from the names of the passes in it."""
+    runs: int = 0
+    """The number of times the loop was run."""
+    iterations: int = 0
+    """The total number of iterations over all the runs of the loop."""
+    max_iterations: int = 0
+    """The largest number of iterations of a single run of the loop."""
+
+    def merge(self, other: LoopStatistics):
+        """Add the statistics of ``other`` to these ones in place."""
+        self.runs += other.runs
+        self.iterations += other.iterations
+        self.max_iterations = max(self.max_iterations, other.max_iterations)
+
+
+@dataclass
+class PassProfile:
+    """A report of the time and memory spent in each pass of one or more pass manager runs.
+
+    The statistics of every pass are aggregated by pass name over all the circuits that were
+    run, including those that ran in parallel worker processes.
+    """
+
+    num_circuits: int = 0
+    """The number of circuits that were profiled."""
+    passes: Dict[str, PassStatistics] = field(default_factory=dict)
+    """The statistics of each pass, keyed by pass name in the order they were first run."""
+    loops: Dict[str, LoopStatistics] = field(default_factory=dict)
+    """The statistics of each :class:`.DoWhileController` loop, keyed by loop name."""
+
+    @property
+    def total_time(self) -> float:
+        """The total wall time spent in all passes, in seconds."""
+        return sum(stats.total_time for stats in self.passes.values())
+
+    def record_pass(self, name, run_time, size_before, size_after, peak_memory=None):
+        """Record a single run of a pass."""
+        stats = self.passes.get(name)
+        if stats is None:
+            stats = self.passes[name] = PassStatistics(name)
+        stats.merge(
+            PassStatistics(name, 1, 0, run_time, run_time, peak_memory, size_before, size_after)
+        )
+
+    def record_skip(self, name):
+        """Record that a pass was not run because its results were still valid."""
+        stats = self.passes.get(name)
+        if stats is None:
+            stats = self.passes[name] = PassStatistics(name)
+        stats.skipped += 1
+
+    def record_loop(self, name, iterations):
+        """Record a single run of a loop."""
+        stats = self.loops.get(name)
+        if stats is None:
+            stats = self.loops[name] = LoopStatistics(name)
+        stats.merge(LoopStatistics(name, 1, iterations, iterations))
+
+    def merge(self, other: PassProfile):
+        """Add the statistics of ``other`` to this profile in place.
+
+        Args:
+            other: The profile to merge in.
+
+        Returns:
+            PassProfile: This profile.
+        """
+        self.num_circuits += other.num_circuits
+        for name, stats in other.passes.items():
+            self.passes.setdefault(name, PassStatistics(name)).merge(stats)
+        for name, stats in other.loops.items():
+            self.loops.setdefault(name, LoopStatistics(name)).merge(stats)
+        return self
+
+    def __str__(self):
+        lines = [
+            f"Pass profile of {self.num_circuits} circuit(s), "
+            f"total pass time {self.total_time * 1000:.3f} ms",
+            f"{'pass':<40}{'runs':>8}{'skipped':>9}{'total (ms)':>13}{'max (ms)':>11}"
+            f"{'peak mem (kB)':>15}{'size in':>10}{'size out':>10}",
+        ]
+        for stats in sorted(self.passes.values(), key=lambda x: x.total_time, reverse=True):
+            memory = "-" if stats.peak_memory is None else f"{stats.peak_memory / 1024:.1f}"
+            lines.append(
+                f"{stats.name:<40}{stats.runs:>8}{stats.skipped:>9}"
+                f"{stats.total_time * 1000:>13.3f}{stats.max_time * 1000:>11.3f}"
+                f"{memory:>15}{stats.size_before:>10}{stats.size_after:>10}"
+            )
+        for stats in self.loops.values():
+            lines.append(
+                f"loop {stats.name}: {stats.runs} run(s), {stats.iterations} iteration(s), "
+                f"at most {stats.max_iterations} in one run"
+            )
+        return "\n".join(lines)
+
+
+_ACTIVE_PROFILERS = []
+
+
+class PassProfiler:
+    """Context manager that profiles every pass manager run made inside it.
+
+    While the context is active, every call to :func:`~.transpile` and :meth:`.PassManager.run`
+    records the wall time, peak memory and DAG size before and after of each pass it runs, and
+    the number of iterations of each :class:`.DoWhileController` loop.  Pass managers that are
+    run from inside a pass (for example by :class:`.SabreLayout`) are not profiled separately;
+    their cost is included in that of the pass.  Runs that happen in parallel worker processes
+    send their statistics back to be merged into the same report::
+
+        from qiskit import transpile
+        from qiskit.transpiler import PassProfiler
+
+        with PassProfiler() as profiler:
+            transpile(circuits, backend, optimization_level=3)
+        print(profiler.report)
+
+    Args:
+        track_memory: Whether to track the peak memory of each pass using :mod:`tracemalloc`.
+            Tracking memory has a significant overhead of its own, so the wall times reported
+            with it enabled are inflated.  The peak memory is only available on Python 3.9 and
+            later.
+    """
+
+    def __init__(self, track_memory: bool = True):
+        self.track_memory = track_memory and hasattr(tracemalloc, "reset_peak")
+        self.report = PassProfile()
+        self._pid = None
+        self._started_tracemalloc = False
+        # Whether a profiled pass manager run is in progress.
+        self._in_run = False
+
+    def __enter__(self):
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._pid = os.getpid()
+        _ACTIVE_PROFILERS.append(self)
+        return self
+
+    def __exit__(self, *_exc):
+        _ACTIVE_PROFILERS.remove(self)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+
+def get_active_profiler() -> Optional[PassProfiler]:
+    """Get the innermost active :class:`.PassProfiler` of this process, if any."""
+    # Worker processes forked while a profiler was active inherit it; their runs are instead
+    # profiled explicitly and sent back to the parent.
+    if _ACTIVE_PROFILERS and _ACTIVE_PROFILERS[-1]._pid == os.getpid():
+        return _ACTIVE_PROFILERS[-1]
+    return None
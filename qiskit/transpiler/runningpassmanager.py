@@ -17,6 +17,7 @@ from functools import partial
 from collections import OrderedDict
 import logging
 from time import time
+import tracemalloc
 
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
@@ -57,6 +58,10 @@ class RunningPassManager:
 
         self.count = 0
 
+        # a PassProfile to record the statistics of each pass into, if profiling
+        self.profile = None
+        self.profile_memory = False
+
     def append(self, passes, **flow_controller_conditions):
         """Append a Pass to the schedule of passes.
 
@@ -118,9 +123,11 @@ class RunningPassManager:
 
         if callback:
             self.callback = callback
+        if self.profile is not None:
+            self.profile.num_circuits += 1
 
         for passset in self.working_list:
-            for pass_ in passset:
+            for pass_ in self._iter_controller(passset):
                 dag = self._do_pass(pass_, dag, passset.options)
 
         circuit = dag_to_circuit(dag)
@@ -164,10 +171,22 @@ class RunningPassManager:
 
             # Run the pass itself, if not already run
             if pass_ not in self.valid_passes:
-                dag = self._run_this_pass(pass_, dag)
+                modification_count = dag._modification_count
+                properties = dict(self.property_set)
+                new_dag = self._run_this_pass(pass_, dag)
+                # A transformation pass that left both the DAG and the property set alone does
+                # not invalidate any analysis.
+                modified = pass_.is_transformation_pass and (
+                    new_dag is not dag
+                    or new_dag._modification_count != modification_count
+                    or _property_set_changed(properties, self.property_set)
+                )
+                dag = new_dag
 
                 # update the valid_passes property
-                self._update_valid_passes(pass_)
+                self._update_valid_passes(pass_, modified)
+            elif self.profile is not None:
+                self.profile.record_skip(pass_.name())
 
         # if provided a nested flow controller
         elif isinstance(pass_, FlowController):
@@ -180,7 +199,7 @@ class RunningPassManager:
             elif isinstance(pass_, DoWhileController) and not isinstance(pass_.do_while, partial):
                 pass_.do_while = partial(pass_.do_while, self.fenced_property_set)
 
-            for _pass in pass_:
+            for _pass in self._iter_controller(pass_):
                 self._do_pass(_pass, dag, pass_.options)
         else:
             raise TranspilerError(
@@ -188,8 +207,33 @@ class RunningPassManager:
             )
         return dag
 
+    def _iter_controller(self, controller):
+        """Iterate over the passes of ``controller``, recording the number of iterations of
+        do-while loops if profiling."""
+        if self.profile is None or not isinstance(controller, DoWhileController):
+            yield from controller
+            return
+        # Each iteration of the loop yields every item of its pass list exactly once.
+        passes = controller._passes
+        per_iteration = len(passes) if isinstance(passes, list) else 0
+        num_yielded = 0
+        for _pass in controller:
+            num_yielded += 1
+            yield _pass
+        if per_iteration:
+            name = "DoWhileController(%s)" % ", ".join(
+                type(_pass).__name__ if isinstance(_pass, FlowController) else _pass.name()
+                for _pass in passes
+            )
+            self.profile.record_loop(name, -(-num_yielded // per_iteration))
+
     def _run_this_pass(self, pass_, dag):
         pass_.property_set = self.property_set
+        if self.profile is not None:
+            size_before = dag.size()
+            if self.profile_memory:
+                tracemalloc.reset_peak()
+                memory_before = tracemalloc.get_traced_memory()[0]
         if pass_.is_transformation_pass:
             # Measure time if we have a callback or logging set
             start_time = time()
@@ -207,13 +251,13 @@ class RunningPassManager:
                 )
                 self.count += 1
             self._log_pass(start_time, end_time, pass_.name())
-            if isinstance(new_dag, DAGCircuit):
-                new_dag.calibrations = dag.calibrations
-            else:
+            if not isinstance(new_dag, DAGCircuit):
                 raise TranspilerError(
                     "Transformation passes should return a transformed dag."
                     "The pass %s is returning a %s" % (type(pass_).__name__, type(new_dag))
                 )
+            if new_dag is not dag:
+                new_dag.calibrations = dag.calibrations
             dag = new_dag
         elif pass_.is_analysis_pass:
             # Measure time if we have a callback or logging set
@@ -234,16 +278,45 @@ class RunningPassManager:
             self._log_pass(start_time, end_time, pass_.name())
         else:
             raise TranspilerError("I dont know how to handle this type of pass")
+        if self.profile is not None:
+            peak_memory = None
+            if self.profile_memory:
+                peak_memory = tracemalloc.get_traced_memory()[1] - memory_before
+            self.profile.record_pass(pass_.name(), run_time, size_before, dag.size(), peak_memory)
         return dag
 
     def _log_pass(self, start_time, end_time, name):
         log_msg = f"Pass: {name} - {(end_time - start_time) * 1000:.5f} (ms)"
         logger.info(log_msg)
 
-    def _update_valid_passes(self, pass_):
-        self.valid_passes.add(pass_)
-        if not pass_.is_analysis_pass:  # Analysis passes preserve all
+    def _update_valid_passes(self, pass_, modified=True):
+        if pass_.is_analysis_pass:  # Analysis passes preserve all
+            self.valid_passes.add(pass_)
+        elif modified:
+            self.valid_passes.add(pass_)
             self.valid_passes.intersection_update(set(pass_.preserves))
+        else:
+            # Nothing changed, so the analyses are still valid.  The fixed-point checks compare
+            # against their own previous run instead, so they have to be rerun after every
+            # transformation pass for fixed-point loops to terminate.
+            # pylint: disable=cyclic-import
+            from qiskit.transpiler.passes.utils.fixed_point import FixedPoint
+            from qiskit.transpiler.passes.utils.dag_fixed_point import DAGFixedPoint
+
+            self.valid_passes.difference_update(
+                [
+                    valid
+                    for valid in self.valid_passes
+                    if isinstance(valid, (FixedPoint, DAGFixedPoint))
+                ]
+            )
+
+
+def _property_set_changed(before, after):
+    """Whether any property was added, removed or replaced since ``before`` was copied."""
+    return before.keys() != after.keys() or any(
+        after[key] is not value for key, value in before.items()
+    )
 
 
 class FlowController:
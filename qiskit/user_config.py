@@ -33,6 +33,7 @@ class UserConfig:
     transpile_optimization_level = 1
     parallel = False
     num_processes = 4
+    persistent_pool = False
 
     """
 
@@ -142,6 +143,13 @@ class UserConfig:
                     )
                 self.settings["num_processes"] = num_processes
 
+            # Parse persistent_pool
+            persistent_pool = self.config_parser.getboolean(
+                "default", "persistent_pool", fallback=None
+            )
+            if persistent_pool is not None:
+                self.settings["persistent_pool"] = persistent_pool
+
 
 def set_config(key, value, section=None, file_path=None):
     """Adds or modifies a user configuration
@@ -180,6 +188,7 @@ def set_config(key, value, section=None, file_path=None):
         "transpile_optimization_level",
         "parallel",
         "num_processes",
+        "persistent_pool",
     }
 
     if section in [None, "default"]:
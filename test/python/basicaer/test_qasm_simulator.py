@@ -15,8 +15,10 @@
 import os
 import unittest
 import io
+from collections import Counter
 from logging import StreamHandler, getLogger
 import sys
+from unittest import mock
 
 import numpy as np
 
@@ -24,6 +26,7 @@ from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.compiler import transpile, assemble
 from qiskit.providers.basicaer import QasmSimulatorPy
+from qiskit.providers.basicaer import qasm_simulator
 from qiskit.test import providers
 
 
@@ -374,6 +377,85 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
             counts = result.get_counts(0)
             self.assertEqual(counts, target_counts)
 
+    def test_mid_circuit_measure_branches(self):
+        """Test the shots of a circuit with mid-circuit measurements and resets."""
+        qr = QuantumRegister(3, "qr")
+        cr = ClassicalRegister(3, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[2])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[1]).c_if(cr[0], 1)
+        circuit.reset(qr[0])
+        circuit.h(qr[2])
+        circuit.reset(qr[2])
+        circuit.measure(qr, cr)
+        shots = 4000
+        result = execute(
+            circuit, self.backend, shots=shots, memory=True, seed_simulator=self.seed
+        ).result()
+        counts = result.get_counts()
+        self.assertEqual(set(counts), {"000", "010"})
+        self.assertAlmostEqual(counts["010"] / shots, 0.5, delta=0.05)
+        memory = result.get_memory()
+        self.assertEqual(len(memory), shots)
+        self.assertEqual(Counter(memory), counts)
+        # The shots are not grouped by outcome
+        self.assertLess(memory.index("010"), shots / 2)
+        self.assertLess(memory.index("000"), shots / 2)
+
+    def test_branches_memory_limit(self):
+        """Test that the shots are simulated in chunks whose branches fit in the memory limit, and
+        one by one when the statevectors are too large."""
+        circuit = QuantumCircuit(3, 3)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        circuit.x(1).c_if(circuit.clbits[0], 1)
+        circuit.h(2)
+        circuit.measure([1, 2], [1, 2])
+        circuit = transpile(circuit, self.backend)
+        shots = 1000
+        # The statevectors of 3 qubits take 128 bytes.
+        for limit, num_chunks in [(128 * 100, 10), (128, 0)]:
+            with self.subTest(limit=limit):
+                with mock.patch.object(qasm_simulator, "_BRANCH_MEMORY_LIMIT", limit):
+                    with mock.patch.object(
+                        QasmSimulatorPy,
+                        "_run_shot_branches",
+                        autospec=True,
+                        side_effect=QasmSimulatorPy._run_shot_branches,
+                    ) as run_shot_branches:
+                        result = self.backend.run(
+                            circuit, shots=shots, memory=True, seed_simulator=self.seed
+                        ).result()
+                self.assertEqual(run_shot_branches.call_count, num_chunks)
+                counts = result.get_counts()
+                self.assertEqual(set(counts), {"000", "011", "100", "111"})
+                self.assertEqual(sum(counts.values()), shots)
+                self.assertEqual(len(result.get_memory()), shots)
+                for outcome in counts:
+                    self.assertAlmostEqual(counts[outcome] / shots, 0.25, delta=0.06)
+
+    def test_parallel_experiments(self):
+        """Test that running experiments in parallel processes gives the same results."""
+        circuits = []
+        for angle in [0.1, 0.7, 1.3]:
+            circuit = QuantumCircuit(2, 2)
+            circuit.ry(angle, 0)
+            circuit.measure(0, 0)
+            circuit.x(1).c_if(circuit.clbits[0], 0)
+            circuit.measure(1, 1)
+            circuits.append(circuit)
+        circuits = transpile(circuits, self.backend)
+        expected = self.backend.run(circuits, shots=200, seed_simulator=self.seed).result()
+        with mock.patch.object(qasm_simulator, "_PARALLEL_MIN_COST", 0):
+            with mock.patch.object(
+                qasm_simulator, "parallel_map", wraps=qasm_simulator.parallel_map
+            ) as parallel_map:
+                result = self.backend.run(circuits, shots=200, seed_simulator=self.seed).result()
+        parallel_map.assert_called_once()
+        self.assertEqual(result.get_counts(), expected.get_counts())
+
 
 if __name__ == "__main__":
     unittest.main()
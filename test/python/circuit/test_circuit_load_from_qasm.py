@@ -15,12 +15,17 @@
 
 import os
 
+from numpy import pi
+
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
 from qiskit.circuit import Gate, Parameter
 from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 from qiskit.transpiler.passes import Unroller
+from qiskit.converters import ast_to_dag, dag_to_circuit
 from qiskit.converters.circuit_to_dag import circuit_to_dag
+from qiskit.qasm import Qasm, QasmError
+from qiskit.qasm.fastparser import circuit_from_qasm
 
 
 class LoadFromQasmTest(QiskitTestCase):
@@ -492,6 +497,57 @@ class LoadFromQasmTest(QiskitTestCase):
         expected.delay(172, qr[0])
         self.assertEqualUnroll("u", circuit, expected)
 
+    def test_qasm_fast_path_matches_parser(self):
+        """Test that the circuits built directly from the tokens are those of the full parser."""
+        for filename in ["entangled_registers.qasm", "example_if.qasm", "all_gates.qasm"]:
+            with self.subTest(filename=filename):
+                qasm = Qasm(filename=os.path.join(self.qasm_dir, filename))
+                circuit = circuit_from_qasm(qasm)
+                self.assertIsNotNone(circuit)
+                self.assertEqual(circuit, dag_to_circuit(ast_to_dag(qasm.parse())))
+
+    def test_qasm_fast_path_order(self):
+        """Test that the instructions of the fast path are in the order of the program."""
+        qasm_string = """OPENQASM 2.0;
+                         include "qelib1.inc";
+                         qreg q[2];
+                         creg c[2];
+                         rz(-pi / 2 ^ 2) q[1];
+                         h q[0];
+                         if (c == 1) cx q[1], q[0];
+                         measure q -> c;"""
+        circuit = QuantumCircuit.from_qasm_str(qasm_string)
+
+        qr = QuantumRegister(2, "q")
+        cr = ClassicalRegister(2, "c")
+        expected = QuantumCircuit(qr, cr)
+        expected.rz(-pi / 4, qr[1])
+        expected.h(qr[0])
+        expected.cx(qr[1], qr[0]).c_if(cr, 1)
+        expected.measure(qr, cr)
+        self.assertEqual(circuit, expected)
+        self.assertEqual(
+            [instruction.operation.name for instruction in circuit.data],
+            ["rz", "h", "cx", "measure", "measure"],
+        )
+
+    def test_qasm_fast_path_fallback(self):
+        """Test that the programs the fast path does not handle are left to the full parser."""
+        invalid = """OPENQASM 2.0;
+                     include "qelib1.inc";
+                     qreg q[2];
+                     cx q[0], q[0];"""
+        self.assertIsNone(circuit_from_qasm(Qasm(data=invalid)))
+        with self.assertRaisesRegex(QasmError, "duplicate identifiers"):
+            QuantumCircuit.from_qasm_str(invalid)
+
+        # The definitions of gates using U are left to the full parser, which fails to build them.
+        unsupported = """OPENQASM 2.0;
+                         include "qelib1.inc";
+                         qreg q[1];
+                         u0(1) q[0];"""
+        self.assertIsNone(circuit_from_qasm(Qasm(data=unsupported)))
+
     def assertEqualUnroll(self, basis, circuit, expected):
         """Compares the dags after unrolling to basis"""
         circuit_dag = circuit_to_dag(circuit)
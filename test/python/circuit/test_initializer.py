@@ -271,7 +271,8 @@ class TestInitialize(QiskitTestCase):
         qc.measure(qr, cr)
         # statevector simulator does not support reset
         shots = 2000
-        threshold = 0.005 * shots
+        # The standard deviation of the counts of each outcome is about 0.01 * shots.
+        threshold = 0.04 * shots
         job = execute(qc, BasicAer.get_backend("qasm_simulator"), shots=shots, seed_simulator=42)
         result = job.result()
         counts = result.get_counts()
@@ -186,6 +186,57 @@ class TestParameters(QiskitTestCase):
                 bqc_list = getattr(qc, assign_fun)(param_dict)
                 self.assertEqual(bqc_anonymous, bqc_list)
 
+    def test_assign_batch_of_values(self):
+        """Test assigning a 2D array of values returns one bound circuit per row."""
+        phase = Parameter("phase")
+        x = Parameter("x")
+        v = ParameterVector("v", 2)
+        qc = QuantumCircuit(2, global_phase=phase / 2)
+        qc.rx(x, 0)
+        qc.h(1)
+        qc.crz(2 * v[0] + x, 0, 1)
+        qc.ry(v[1].sin(), 1)
+        values = numpy.random.default_rng(11).uniform(-1, 1, (4, qc.num_parameters))
+        for assign_fun in ["bind_parameters", "assign_parameters"]:
+            for batch in (values, values.tolist()):
+                with self.subTest(assign_fun=assign_fun, batch_type=type(batch)):
+                    bound = getattr(qc, assign_fun)(batch)
+                    self.assertEqual(len(bound), 4)
+                    for row, circuit in zip(values, bound):
+                        expected = qc.assign_parameters(row)
+                        self.assertEqual(circuit, expected)
+                        self.assertAlmostEqual(
+                            float(circuit.global_phase), float(expected.global_phase)
+                        )
+                        self.assertEqual(circuit.num_parameters, 0)
+        self.assertEqual(qc.num_parameters, 4)
+
+    def test_assign_batch_of_values_symengine_fallback(self):
+        """Test assigning a batch of values to expressions that symengine can't compile."""
+        x = Parameter("x")
+        qc = QuantumCircuit(1)
+        qc.rx(x.conjugate(), 0)
+        bound = qc.assign_parameters([[0.5], [0.25]])
+        self.assertEqual(bound, [qc.assign_parameters([0.5]), qc.assign_parameters([0.25])])
+
+    def test_assign_empty_batch_of_values(self):
+        """Test assigning a batch without any row of values returns no circuits."""
+        qc = QuantumCircuit(1)
+        qc.rx(Parameter("x"), 0)
+        qc.ry(2 * Parameter("y"), 0)
+        self.assertEqual(qc.assign_parameters(numpy.zeros((0, 2))), [])
+
+    def test_assign_batch_of_values_raises(self):
+        """Test assigning a batch of values of the wrong shape or in place raises."""
+        qc = QuantumCircuit(1)
+        qc.rx(Parameter("x"), 0)
+        with self.assertRaises(ValueError):
+            qc.assign_parameters([[0.1, 0.2]])
+        with self.assertRaises(ValueError):
+            qc.assign_parameters(numpy.zeros((3, 2)))
+        with self.assertRaises(ValueError):
+            qc.assign_parameters([[0.1], [0.2]], inplace=True)
+
     def test_bind_half_single_precision(self):
         """Test binding with 16bit and 32bit floats."""
         phase = Parameter("phase")
@@ -1235,6 +1286,35 @@ class TestParameterExpressions(QiskitTestCase):
         with self.assertRaisesRegex(TypeError, "unbound parameters"):
             int(bound_expr)
 
+    def test_lambdify_matches_bind(self):
+        """Verify a compiled expression evaluates to the bound value, also for arrays."""
+        x = Parameter("x")
+        y = Parameter("y")
+        expr = (2 * x - y).sin() * y.exp() / 3 + x.arctan()
+        evaluate = expr.lambdify([y, x])
+        for x_value, y_value in [(0.3, -1.2), (2.5, 0.0)]:
+            with self.subTest(x=x_value, y=y_value):
+                expected = float(expr.bind({x: x_value, y: y_value}))
+                self.assertAlmostEqual(evaluate(y_value, x_value), expected)
+        x_values = numpy.linspace(-1, 1, 12).reshape(3, 4)
+        result = evaluate(0.7, x_values)
+        self.assertEqual(result.shape, (3, 4))
+        expected = [float(expr.bind({x: value, y: 0.7})) for value in x_values.flat]
+        numpy.testing.assert_allclose(result.flatten(), expected)
+
+    def test_lambdify_complex_and_constant(self):
+        """Verify compiled complex expressions, constants and unused parameters."""
+        x = Parameter("x")
+        y = Parameter("y")
+        self.assertAlmostEqual(complex((x * 1j + 2).lambdify()(3.0)), 2 + 3j)
+        self.assertEqual(x.lambdify([y, x])(1.0, 5.0), 5.0)
+        constant = x.bind({x: 0.5}) * 2
+        numpy.testing.assert_allclose(constant.lambdify([y])(numpy.zeros(4)), numpy.ones(4))
+        with self.assertRaises(CircuitError):
+            (x + y).lambdify([x])
+        with self.assertRaises(TypeError):
+            x.lambdify([x])(1.0, 2.0)
+
     def test_raise_if_sub_unknown_parameters(self):
         """Verify we raise if asked to sub a parameter not in self."""
         x = Parameter("x")
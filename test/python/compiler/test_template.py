@@ -0,0 +1,156 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for binding transpiled templates."""
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Delay, Parameter, ParameterVector
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.library import EfficientSU2
+from qiskit.compiler import TranspiledTemplate, transpile_template
+from qiskit.quantum_info import Operator
+from qiskit.test import QiskitTestCase
+from qiskit.transpiler import CouplingMap
+
+
+class TestTranspiledTemplate(QiskitTestCase):
+    """Tests for TranspiledTemplate."""
+
+    def test_bind_matches_assign_parameters(self):
+        """Test that the bound circuits are those of assign_parameters on the template."""
+        ansatz = EfficientSU2(3, reps=1)
+        template = transpile_template(
+            ansatz,
+            basis_gates=["rz", "sx", "cx"],
+            coupling_map=CouplingMap.from_line(3),
+            seed_transpiler=42,
+        )
+        values = np.random.default_rng(7).uniform(-np.pi, np.pi, (5, ansatz.num_parameters))
+        bound = template.bind(values)
+        self.assertEqual(len(bound), 5)
+        for row, circuit in zip(values, bound):
+            expected = template.circuit.assign_parameters(row)
+            self.assertEqual(circuit.num_parameters, 0)
+            self.assertEqual(circuit, expected)
+            self.assertAlmostEqual(float(circuit.global_phase), float(expected.global_phase))
+        self.assertEqual(template.circuit.num_parameters, ansatz.num_parameters)
+
+    def test_expressions_and_global_phase(self):
+        """Test binding parameter expressions and a parameterized global phase."""
+        theta, phi = Parameter("θ"), Parameter("φ")
+        circuit = QuantumCircuit(2, global_phase=theta / 2)
+        circuit.rz(2 * theta + phi, 0)
+        circuit.rx(phi.sin(), 1)
+        circuit.rz(theta, 1)
+        template = TranspiledTemplate(circuit)
+        values = [[0.1, 0.2], [0.3, -0.4]]
+        for row, bound in zip(values, template.bind(values)):
+            expected = circuit.assign_parameters(row)
+            self.assertEqual(bound, expected)
+            self.assertAlmostEqual(float(bound.global_phase), float(expected.global_phase))
+            self.assertEqual(bound.parameters, expected.parameters)
+        self.assertEqual(len(circuit.parameters), 2)
+
+    def test_bind_mapping(self):
+        """Test binding a mapping of parameters to arrays of values."""
+        params = ParameterVector("p", 2)
+        circuit = QuantumCircuit(1)
+        circuit.rx(params[0], 0)
+        circuit.ry(params[1], 0)
+        template = TranspiledTemplate(circuit)
+        bound = template.bind({params[1]: [0.5, 0.6], params[0]: [0.1, 0.2]})
+        self.assertEqual(bound[1], circuit.assign_parameters([0.2, 0.6]))
+        with self.assertRaises(CircuitError):
+            template.bind({params[0]: [0.1]})
+
+    def test_removed_parameters_ignored(self):
+        """Test that values of parameters that are not in the circuit are ignored."""
+        theta, phi = Parameter("θ"), Parameter("φ")
+        circuit = QuantumCircuit(1)
+        circuit.rz(theta, 0)
+        template = TranspiledTemplate(circuit, [phi, theta])
+        self.assertEqual(template.num_parameters, 2)
+        bound = template.bind([[0.3, 0.7]])
+        self.assertEqual(bound[0], circuit.assign_parameters([0.7]))
+
+    def test_transpile_template_parameter_order(self):
+        """Test that transpile_template takes values in the order of the input parameters."""
+        params = ParameterVector("p", 3)
+        circuit = QuantumCircuit(2)
+        circuit.rx(params[2], 0)
+        circuit.ry(params[0], 1)
+        circuit.cx(0, 1)
+        circuit.rz(params[1], 1)
+        template = transpile_template(circuit, basis_gates=["rz", "sx", "cx"], seed_transpiler=1)
+        self.assertEqual(template.parameters, list(circuit.parameters))
+        values = [0.1, 0.2, 0.3]
+        bound = template.bind(values)
+        self.assertTrue(Operator(bound[0]).equiv(Operator(circuit.assign_parameters(values))))
+
+    def test_shape_mismatch(self):
+        """Test that values of the wrong shape raise."""
+        circuit = QuantumCircuit(1)
+        circuit.rx(Parameter("a"), 0)
+        template = TranspiledTemplate(circuit)
+        with self.assertRaises(ValueError):
+            template.bind([[0.1, 0.2]])
+
+    def test_missing_template_parameter(self):
+        """Test that a circuit depending on parameters not in the template raises."""
+        circuit = QuantumCircuit(1)
+        circuit.rx(Parameter("a"), 0)
+        with self.assertRaises(CircuitError):
+            TranspiledTemplate(circuit, [Parameter("b")])
+
+    def test_template_unchanged(self):
+        """Test that binding does not modify the template."""
+        theta = Parameter("θ")
+        circuit = QuantumCircuit(1)
+        circuit.rx(theta, 0)
+        circuit.x(0)
+        template = TranspiledTemplate(circuit)
+        bound = template.bind([[0.1], [0.2]])
+        self.assertEqual(circuit.parameters, {theta})
+        self.assertEqual(circuit.data[0].operation.params, [theta])
+        self.assertEqual(bound[0].data[0].operation.params, [0.1])
+        self.assertEqual(bound[1].data[0].operation.params, [0.2])
+        self.assertNotEqual(bound[0].name, bound[1].name)
+
+    def test_validate_parameter(self):
+        """Test that values are validated by the operation, e.g. integer durations of delays."""
+        duration = Parameter("t")
+        circuit = QuantumCircuit(1)
+        circuit.append(Delay(duration, "dt"), [0])
+        bound = TranspiledTemplate(circuit).bind([[16.0]])
+        self.assertEqual(bound[0].data[0].operation.params, [16])
+        self.assertIsInstance(bound[0].data[0].operation.params[0], int)
+
+    def test_complex_value_raises(self):
+        """Test that an expression evaluating to a complex number raises."""
+        theta = Parameter("θ")
+        circuit = QuantumCircuit(1)
+        circuit.rx(theta * 1j, 0)
+        with self.assertRaises(CircuitError):
+            TranspiledTemplate(circuit).bind([[0.5]])
+
+    def test_parameterized_block_falls_back(self):
+        """Test that circuits with parameterized control flow blocks are bound correctly."""
+        theta = Parameter("θ")
+        body = QuantumCircuit(1, 1)
+        body.rx(theta, 0)
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        circuit.if_test((circuit.clbits[0], True), body, [0], [0])
+        bound = TranspiledTemplate(circuit).bind([[0.1], [0.2]])
+        self.assertEqual(bound[1], circuit.assign_parameters([0.2]))
@@ -29,7 +29,7 @@ from qiskit.exceptions import QiskitError
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, pulse
 from qiskit.circuit import Parameter, Gate, Qubit, Clbit
-from qiskit.compiler import transpile
+from qiskit.compiler import transpile, transpile_iter
 from qiskit.dagcircuit import DAGOutNode
 from qiskit.converters import circuit_to_dag
 from qiskit.circuit.library import CXGate, U3Gate, U2Gate, U1Gate, RXGate, RYGate, RZGate, UGate
@@ -1528,3 +1528,44 @@ class TestTranspileCustomPM(QiskitTestCase):
         self.assertEqual(len(transpiled), 2)
         self.assertEqual(transpiled[0], expected)
         self.assertEqual(transpiled[1], expected)
+
+
+class TestTranspileIter(QiskitTestCase):
+    """Test the streaming transpile_iter function"""
+
+    def setUp(self):
+        super().setUp()
+        self.circuits = []
+        for i in range(6):
+            qc = QuantumCircuit(3, name=f"circ{i}")
+            qc.h(0)
+            qc.cx(0, 1)
+            qc.cx(0, 2)
+            qc.rz(0.1 * i, 2)
+            self.circuits.append(qc)
+        self.kwargs = {
+            "basis_gates": ["u", "cx"],
+            "coupling_map": CouplingMap.from_line(3),
+            "seed_transpiler": 42,
+        }
+
+    def test_ordered_matches_transpile(self):
+        """Test that the ordered iterator gives the same circuits as transpile."""
+        expected = transpile(self.circuits, **self.kwargs)
+        self.assertEqual(list(transpile_iter(self.circuits, **self.kwargs)), expected)
+
+    def test_unordered_indices(self):
+        """Test that the unordered iterator yields each index exactly once."""
+        expected = transpile(self.circuits, **self.kwargs)
+        out = dict(transpile_iter(self.circuits, ordered=False, **self.kwargs))
+        self.assertEqual(sorted(out), list(range(len(self.circuits))))
+        self.assertEqual([out[i] for i in range(len(self.circuits))], expected)
+
+    def test_invalid_args_raise_eagerly(self):
+        """Test that bad arguments raise before iterating."""
+        with self.assertRaises(TranspilerError):
+            transpile_iter(self.circuits, coupling_map=CouplingMap.from_line(2))
+
+    def test_empty(self):
+        """Test that no circuits give an empty iterator."""
+        self.assertEqual(list(transpile_iter([], **self.kwargs)), [])
@@ -15,6 +15,7 @@
 import unittest
 
 from qiskit.converters import dag_to_circuit, circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.test import QiskitTestCase
 
@@ -51,6 +52,64 @@ class TestCircuitToDag(QiskitTestCase):
         circuit_out = dag_to_circuit(dag)
         self.assertEqual(len(circuit_out.calibrations), 1)
 
+    def test_copy_operations(self):
+        """Test that the operations are copied unless copy_operations=False."""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit_in = QuantumCircuit(qr, cr)
+        circuit_in.h(qr[0])
+        circuit_in.cx(qr[0], qr[1])
+        circuit_in.measure(qr, cr)
+        circuit_in.rz(0.5, qr[1]).c_if(cr, 2)
+
+        dag = circuit_to_dag(circuit_in)
+        for node, instruction in zip(dag.topological_op_nodes(), circuit_in.data):
+            self.assertIsNot(node.op, instruction.operation)
+        circuit_out = dag_to_circuit(dag)
+        self.assertEqual(circuit_out, circuit_in)
+        for node, instruction in zip(dag.topological_op_nodes(), circuit_out.data):
+            self.assertIsNot(node.op, instruction.operation)
+
+        dag = circuit_to_dag(circuit_in, copy_operations=False)
+        for node, instruction in zip(dag.topological_op_nodes(), circuit_in.data):
+            self.assertIs(node.op, instruction.operation)
+        circuit_out = dag_to_circuit(dag, copy_operations=False)
+        self.assertEqual(circuit_out, circuit_in)
+        for node, instruction in zip(dag.topological_op_nodes(), circuit_out.data):
+            self.assertIs(node.op, instruction.operation)
+
+    def test_same_as_apply_operation_back(self):
+        """Test that the DAG is the same as the one built by apply_operation_back."""
+        qr = QuantumRegister(3)
+        cr = ClassicalRegister(2)
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[2])
+        circuit.measure(qr[0], cr[1])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.barrier()
+        circuit.y(qr[2]).c_if(cr[0], 0)
+        circuit.measure(qr[2], cr[0])
+
+        expected = DAGCircuit()
+        expected.add_qreg(qr)
+        expected.add_creg(cr)
+        for instruction in circuit.data:
+            expected.apply_operation_back(
+                instruction.operation, instruction.qubits, instruction.clbits
+            )
+        dag = circuit_to_dag(circuit)
+        self.assertEqual(dag, expected)
+        for node, expected_node in zip(dag.nodes(), expected.nodes()):
+            self.assertEqual(
+                list(dag._multi_graph.out_edges(node._node_id)),
+                list(expected._multi_graph.out_edges(expected_node._node_id)),
+            )
+            self.assertEqual(
+                list(dag._multi_graph.in_edges(node._node_id)),
+                list(expected._multi_graph.in_edges(expected_node._node_id)),
+            )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -13,16 +13,17 @@
 """Tests for Estimator."""
 
 import unittest
+from unittest import mock
 
 import numpy as np
 
-from qiskit.circuit import QuantumCircuit
-from qiskit.circuit.library import RealAmplitudes
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.circuit.library import EfficientSU2, RealAmplitudes
 from qiskit.exceptions import QiskitError
 from qiskit.opflow import PauliSumOp
-from qiskit.primitives import Estimator, EstimatorResult
+from qiskit.primitives import Estimator, EstimatorResult, estimator as estimator_module, utils
 from qiskit.providers import JobV1
-from qiskit.quantum_info import Operator, SparsePauliOp
+from qiskit.quantum_info import Operator, SparsePauliOp, Statevector
 from qiskit.test import QiskitTestCase
 
 
@@ -568,6 +569,56 @@ class TestEstimator(QiskitTestCase):
         self.assertIsInstance(result, EstimatorResult)
         np.testing.assert_allclose(result.values, [-1.307397243478641])
 
+    def test_run_batch_of_parameters(self):
+        """Test many parameter sets of circuits with mixed observables, evaluated in batches."""
+        ansatz = EfficientSU2(3, reps=1)
+        initialized = QuantumCircuit(3)
+        initialized.initialize([0, 1, 0, 0, 0, 0, 0, 0], range(3))
+        initialized.ry(Parameter("x"), 1)
+        observables = [
+            SparsePauliOp.from_list([("XYZ", 0.5), ("IIZ", -1)]),
+            SparsePauliOp.from_list([("ZZI", 1), ("XIX", 2)]),
+        ]
+        rng = np.random.default_rng(5)
+        circuits, obs, params, expected = [], [], [], []
+        for k in range(12):
+            circuit = ansatz if k % 3 else initialized
+            values = rng.uniform(-np.pi, np.pi, circuit.num_parameters).tolist()
+            circuits.append(circuit)
+            obs.append(observables[k % 2])
+            params.append(values)
+            state = Statevector(circuit.assign_parameters(values))
+            expected.append(state.expectation_value(observables[k % 2]))
+        estimator = Estimator()
+        result = estimator.run(circuits, obs, params).result()
+        np.testing.assert_allclose(result.values, expected, atol=1e-10)
+
+        result = estimator.run(circuits, obs, params, shots=1000, seed=7).result()
+        for k, metadatum in enumerate(result.metadata):
+            square = (obs[k] @ obs[k]).simplify()
+            state = Statevector(circuits[k].assign_parameters(params[k]))
+            variance = state.expectation_value(square).real - expected[k].real ** 2
+            self.assertAlmostEqual(metadatum["variance"], variance)
+            self.assertEqual(metadatum["shots"], 1000)
+
+    def test_run_batch_in_chunks(self):
+        """Test that a batch of parameters is evaluated in chunks within the memory limit."""
+        ansatz = EfficientSU2(3, reps=1)
+        observable = SparsePauliOp.from_list([("XYZ", 0.5), ("ZZI", -1)])
+        rng = np.random.default_rng(5)
+        params = rng.uniform(-np.pi, np.pi, (8, ansatz.num_parameters)).tolist()
+        expected = [
+            Statevector(ansatz.assign_parameters(values)).expectation_value(observable)
+            for values in params
+        ]
+        # The statevectors of 3 qubits take 128 bytes, so the batch is split into chunks of 3.
+        with mock.patch.object(utils, "_BATCH_MEMORY_LIMIT", 3 * 128), mock.patch.object(
+            estimator_module, "_bound_statevectors", wraps=utils._bound_statevectors
+        ) as bound_statevectors:
+            result = Estimator().run([ansatz] * 8, [observable] * 8, params).result()
+        self.assertEqual(bound_statevectors.call_count, 3)
+        np.testing.assert_allclose(result.values, expected, atol=1e-10)
+
     def test_options(self):
         """Test for options"""
         with self.subTest("init"):
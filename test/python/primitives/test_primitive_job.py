@@ -0,0 +1,126 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for PrimitiveJob."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.primitives import Estimator, Sampler
+from qiskit.primitives.primitive_job import PrimitiveJob
+from qiskit.providers import JobStatus
+from qiskit.quantum_info import SparsePauliOp
+from qiskit.test import QiskitTestCase
+
+
+class TestPrimitiveJob(QiskitTestCase):
+    """Test PrimitiveJob"""
+
+    def setUp(self):
+        super().setUp()
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        PrimitiveJob.set_executor(self.executor, num_workers=4)
+        self.addCleanup(PrimitiveJob.set_executor, None)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_submit_does_not_wait(self):
+        """Test that submitting a job returns before the job is done."""
+        event = threading.Event()
+        job = PrimitiveJob(event.wait)
+        job.submit()
+        self.assertIn(job.status(), [JobStatus.QUEUED, JobStatus.RUNNING])
+        PrimitiveJob.set_executor(ThreadPoolExecutor(max_workers=1))
+        blocking = PrimitiveJob(event.wait)
+        blocking.submit()
+        blocked = PrimitiveJob(lambda: 1)
+        blocked.submit()
+        self.assertEqual(blocked.status(), JobStatus.QUEUED)
+        self.assertTrue(blocked.cancel())
+        self.assertEqual(blocked.status(), JobStatus.CANCELLED)
+        event.set()
+        self.assertTrue(job.result())
+        self.assertEqual(job.status(), JobStatus.DONE)
+        PrimitiveJob.get_executor().shutdown()
+
+    def test_await(self):
+        """Test awaiting jobs in a coroutine."""
+        estimator = Estimator()
+        circuit = RealAmplitudes(2, reps=1)
+        observable = SparsePauliOp("ZZ")
+        values = np.random.default_rng(1).random((2, circuit.num_parameters))
+
+        async def evaluate():
+            jobs = [estimator.run([circuit], [observable], [row]) for row in values]
+            return await asyncio.gather(*jobs)
+
+        results = asyncio.run(evaluate())
+        expected = estimator.run([circuit] * 2, [observable] * 2, values).result()
+        np.testing.assert_allclose([result.values[0] for result in results], expected.values)
+
+    def test_split_batches(self):
+        """Test that large jobs are split across the workers and combined in order."""
+        circuit = RealAmplitudes(2, reps=1)
+        circuit.measure_all()
+        values = np.random.default_rng(2).random((300, circuit.num_parameters))
+        self.assertEqual(len(PrimitiveJob._batch_slices(300, {})), 4)
+        self.assertEqual(len(PrimitiveJob._batch_slices(300, {"shots": 10, "seed": 1})), 1)
+        PrimitiveJob.set_executor(self.executor)
+        self.assertEqual(len(PrimitiveJob._batch_slices(300, {})), 1)
+        PrimitiveJob.set_executor(self.executor, num_workers=4)
+
+        sampler = Sampler()
+        job = sampler.run([circuit] * 300, values)
+        self.assertEqual(len(job._futures), 4)
+        result = job.result()
+        self.assertEqual(len(result.quasi_dists), 300)
+        PrimitiveJob.set_executor(ThreadPoolExecutor(max_workers=1))
+        expected = sampler.run([circuit] * 300, values).result()
+        PrimitiveJob.get_executor().shutdown()
+        for dist, expected_dist in zip(result.quasi_dists, expected.quasi_dists):
+            self.assertDictAlmostEqual(dist, expected_dist)
+
+    def test_nested_jobs(self):
+        """Test that jobs submitted from within a job do not wait for a free worker."""
+        PrimitiveJob.set_executor(ThreadPoolExecutor(max_workers=1))
+
+        def outer():
+            inner = PrimitiveJob(lambda: 2)
+            inner.submit()
+            return inner.result() + 1
+
+        job = PrimitiveJob(outer)
+        job.submit()
+        self.assertEqual(job.result(), 3)
+        PrimitiveJob.get_executor().shutdown()
+
+    def test_default_executor_workers(self):
+        """Test that jobs are split across the workers of the default executor."""
+        PrimitiveJob.set_executor(None)
+        executor = PrimitiveJob.get_executor()
+        self.addCleanup(executor.shutdown)
+        self.assertIsInstance(executor, ThreadPoolExecutor)
+        self.assertGreater(PrimitiveJob._num_workers, 1)
+        self.assertEqual(len(PrimitiveJob._batch_slices(10000, {})), PrimitiveJob._num_workers)
+        with self.assertRaises(ValueError):
+            PrimitiveJob.set_executor(executor, num_workers=0)
+
+    def test_error_status(self):
+        """Test the status of a job that raised."""
+        job = PrimitiveJob(lambda: 1 / 0)
+        job.submit()
+        with self.assertRaises(ZeroDivisionError):
+            job.result()
+        self.assertEqual(job.status(), JobStatus.ERROR)
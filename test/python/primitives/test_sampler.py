@@ -14,6 +14,7 @@
 
 import unittest
 from test import combine
+from unittest import mock
 
 import numpy as np
 from ddt import ddt
@@ -22,10 +23,11 @@ from qiskit import QuantumCircuit, pulse, transpile
 from qiskit.circuit import Parameter
 from qiskit.circuit.library import RealAmplitudes
 from qiskit.exceptions import QiskitError
-from qiskit.primitives import Sampler, SamplerResult
+from qiskit.primitives import Sampler, SamplerResult, sampler as sampler_module, utils
 from qiskit.primitives.utils import _circuit_key
 from qiskit.providers import JobStatus, JobV1
 from qiskit.providers.fake_provider import FakeAlmaden
+from qiskit.quantum_info import Statevector
 from qiskit.test import QiskitTestCase
 
 
@@ -672,8 +674,64 @@ class TestSampler(QiskitTestCase):
         bell = self._circuit[1]
         sampler = Sampler()
         job = sampler.run(circuits=[bell])
+        job.result()
         self.assertEqual(job.status(), JobStatus.DONE)
 
+    def test_run_batch_of_parameters(self):
+        """Test many parameter sets of circuits measuring different qubits, sampled in batches."""
+        pqc = RealAmplitudes(num_qubits=3, reps=1)
+        pqc.measure_all()
+        partial = QuantumCircuit(3, 2)
+        partial.h(0)
+        partial.ry(Parameter("x"), 2)
+        partial.cx(2, 1)
+        partial.measure([2, 0], [0, 1])
+        rng = np.random.default_rng(5)
+        circuits, params, expected = [], [], []
+        for k in range(12):
+            circuit = pqc if k % 3 else partial
+            values = rng.uniform(-np.pi, np.pi, circuit.num_parameters).tolist()
+            circuits.append(circuit)
+            params.append(values)
+            state = Statevector(
+                circuit.remove_final_measurements(inplace=False).bind_parameters(values)
+            )
+            expected.append(state.probabilities([0, 1, 2] if k % 3 else [2, 0]))
+        sampler = Sampler()
+        result = sampler.run(circuits, params).result()
+        self.assertIsInstance(result.quasi_dists, list)
+        for quasi_dist, probabilities in zip(result.quasi_dists, expected):
+            self.assertEqual(len(quasi_dist), len(probabilities))
+            for key, probability in enumerate(probabilities):
+                self.assertAlmostEqual(quasi_dist[key], probability)
+
+        result = sampler.run(circuits, params, shots=1000, seed=7).result()
+        seeded = np.random.default_rng(7)
+        for quasi_dist, probabilities, metadatum in zip(
+            result.quasi_dists, expected, result.metadata
+        ):
+            counts = seeded.multinomial(1000, probabilities)
+            self.assertEqual(quasi_dist, dict(enumerate(counts / 1000)))
+            self.assertEqual(metadatum, {"shots": 1000})
+
+    def test_run_batch_in_chunks(self):
+        """Test that a batch of parameters is sampled in chunks within the memory limit."""
+        pqc = RealAmplitudes(num_qubits=3, reps=1)
+        pqc.measure_all()
+        rng = np.random.default_rng(5)
+        params = rng.uniform(-np.pi, np.pi, (8, pqc.num_parameters)).tolist()
+        bound = pqc.remove_final_measurements(inplace=False)
+        expected = [Statevector(bound.bind_parameters(values)).probabilities() for values in params]
+        # The statevectors of 3 qubits take 128 bytes, so the batch is split into chunks of 3.
+        with mock.patch.object(utils, "_BATCH_MEMORY_LIMIT", 3 * 128), mock.patch.object(
+            sampler_module, "_bound_statevectors", wraps=utils._bound_statevectors
+        ) as bound_statevectors:
+            result = Sampler().run([pqc] * 8, params).result()
+        self.assertEqual(bound_statevectors.call_count, 3)
+        for quasi_dist, probabilities in zip(result.quasi_dists, expected):
+            for key, probability in enumerate(probabilities):
+                self.assertAlmostEqual(quasi_dist[key], probability)
+
     def test_options(self):
         """Test for options"""
         with self.subTest("init"):
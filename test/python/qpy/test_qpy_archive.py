@@ -0,0 +1,118 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test cases for the indexed QPY archives."""
+
+import os
+import tempfile
+
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.pulse import builder
+from qiskit.pulse.channels import DriveChannel
+from qiskit.pulse.library import Constant
+from qiskit.qpy import QpyArchive, dump, load
+from qiskit.qpy.exceptions import QpyError
+from qiskit.test import QiskitTestCase
+
+
+class TestQpyArchive(QiskitTestCase):
+    """Test the QPY archives."""
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "archive.qpy")
+        self.circuits = []
+        theta = Parameter("theta")
+        for i in range(5):
+            circuit = QuantumCircuit(2, 2, name=f"circuit_{i}", metadata={"index": i})
+            circuit.h(0)
+            circuit.rz(theta * i, 1)
+            circuit.cx(0, 1)
+            circuit.measure([0, 1], [0, 1])
+            self.circuits.append(circuit)
+
+    def test_append_and_load(self):
+        """Test loading programs by index and by name after appending them."""
+        with QpyArchive(self.path, "w") as archive:
+            self.assertEqual(len(archive), 0)
+            archive.append(self.circuits[:2])
+            archive.append(self.circuits[2:])
+            self.assertEqual(archive[3], self.circuits[3])
+
+        with QpyArchive(self.path) as archive:
+            self.assertEqual(len(archive), 5)
+            self.assertEqual(archive[0], self.circuits[0])
+            self.assertEqual(archive[-1], self.circuits[-1])
+            self.assertEqual(archive["circuit_2"], self.circuits[2])
+            self.assertIn("circuit_1", archive)
+            self.assertNotIn("circuit_5", archive)
+            with self.assertRaises(KeyError):
+                archive["circuit_5"]  # pylint: disable=pointless-statement
+            with self.assertRaises(IndexError):
+                archive[5]  # pylint: disable=pointless-statement
+
+    def test_entries(self):
+        """Test the table of contents of an archive."""
+        with QpyArchive(self.path, "a") as archive:
+            archive.append(self.circuits)
+        with QpyArchive(self.path) as archive:
+            entries = archive.entries
+        self.assertEqual([entry.name for entry in entries], [c.name for c in self.circuits])
+        self.assertEqual([entry.metadata for entry in entries], [c.metadata for c in self.circuits])
+        for entry, next_entry in zip(entries, entries[1:]):
+            self.assertEqual(entry.offset + entry.size, next_entry.offset)
+
+    def test_iterate(self):
+        """Test iterating over the programs of an archive."""
+        with QpyArchive(self.path, "w") as archive:
+            archive.append(self.circuits)
+            self.assertEqual(list(archive), self.circuits)
+
+    def test_load_archive(self):
+        """Test that an archive is a valid QPY file."""
+        with QpyArchive(self.path, "w") as archive:
+            archive.append(self.circuits[:3])
+            archive.append(self.circuits[3:])
+        with open(self.path, "rb") as file_obj:
+            self.assertEqual(load(file_obj), self.circuits)
+
+    def test_qpy_file(self):
+        """Test opening and appending to a QPY file without a table of contents."""
+        with open(self.path, "wb") as file_obj:
+            dump(self.circuits[:3], file_obj)
+        with QpyArchive(self.path, "a") as archive:
+            self.assertEqual(archive["circuit_1"], self.circuits[1])
+            archive.append(self.circuits[3:])
+        with QpyArchive(self.path) as archive:
+            self.assertEqual(list(archive), self.circuits)
+            self.assertEqual(archive["circuit_4"], self.circuits[4])
+
+    def test_schedule_blocks(self):
+        """Test an archive of schedule blocks."""
+        with builder.build(name="block") as block:
+            builder.play(Constant(160, 0.1), DriveChannel(0))
+        with QpyArchive(self.path, "w") as archive:
+            archive.append(block)
+            with self.assertRaises(QpyError):
+                archive.append(self.circuits)
+        with QpyArchive(self.path) as archive:
+            self.assertEqual(archive["block"], block)
+
+    def test_read_only(self):
+        """Test that appending to an archive opened for reading fails."""
+        with QpyArchive(self.path, "w") as archive:
+            archive.append(self.circuits[0])
+        with QpyArchive(self.path) as archive:
+            with self.assertRaises(QpyError):
+                archive.append(self.circuits[1])
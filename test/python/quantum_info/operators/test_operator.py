@@ -191,6 +191,36 @@ class TestOperator(OperatorTestCase):
         circuit = self.simple_circuit_with_measure()
         self.assertRaises(QiskitError, Operator, circuit)
 
+    def test_circuit_init_fused_gates(self):
+        """Test initialization from a circuit whose gates are fused into blocks."""
+        circuit = QuantumCircuit(7, global_phase=0.3)
+        for layer in range(4):
+            for qubit in range(7):
+                circuit.u(0.1 * qubit, 0.2 * layer, 0.3, qubit)
+            for qubit in range(layer % 2, 6, 2):
+                circuit.cx(qubit, qubit + 1)
+            circuit.barrier()
+            circuit.ccx(layer, layer + 2, 6)
+            circuit.append(QFT(3), [5, layer, 6])
+        target = Operator(np.eye(2**7)).compose(np.exp(0.3j) * np.eye(2**7))
+        for instruction in circuit.decompose(["QFT"], reps=3):
+            if instruction.operation.name == "barrier":
+                continue
+            qargs = [circuit.find_bit(qubit).index for qubit in instruction.qubits]
+            target = target.compose(Operator(instruction.operation), qargs=qargs)
+        op = Operator(circuit)
+        assert_allclose(op.data, target.data, atol=1e-10)
+        self.assertTrue(op.data.flags.writeable)
+
+    def test_circuit_init_idle_qubits(self):
+        """Test initialization from a circuit with qubits that no gate acts on."""
+        circuit = QuantumCircuit(4)
+        circuit.h(2)
+        circuit.cx(2, 0)
+        op = Operator(circuit)
+        target = Operator(np.eye(16)).compose(HGate(), qargs=[2]).compose(CXGate(), qargs=[2, 0])
+        self.assertEqual(op, target)
+
     def test_equal(self):
         """Test __eq__ method"""
         mat = self.rand_matrix(2, 2, real=True)
@@ -321,6 +321,46 @@ class TestStatevector(QiskitTestCase):
         target = Statevector([0, 1]) * np.exp(1j * phase)
         self.assertEqual(state_f, target)
 
+    def test_evolve_fused_gates(self):
+        """Test evolving by circuits whose gates are fused into larger blocks."""
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                rng = np.random.default_rng(seed)
+                circ = QuantumCircuit(8)
+                for _ in range(40):
+                    num_qubits = rng.integers(1, 4)
+                    qubits = rng.choice(8, num_qubits, replace=False).tolist()
+                    circ.append(random_unitary(2**num_qubits, seed=rng), qubits)
+                vec = self.rand_vec(2**9)
+                target = Statevector(vec).evolve(Operator(circ), qargs=[8, 0, 3, 1, 5, 2, 7, 4])
+                state = Statevector(vec).evolve(circ, qargs=[8, 0, 3, 1, 5, 2, 7, 4])
+                self.assertEqual(state, target)
+                target = Statevector(Operator(circ).data[:, 0])
+                self.assertEqual(Statevector.from_instruction(circ), target)
+
+    def test_evolve_does_not_mutate(self):
+        """Test that evolving by a circuit leaves the original state unchanged."""
+        vec = self.rand_vec(4)
+        state = Statevector(vec)
+        circ = QuantumCircuit(2, global_phase=0.3)
+        circ.barrier()
+        state.evolve(circ)
+        circ.h(0)
+        state.evolve(circ)
+        assert_allclose(state.data, vec)
+
+    def test_evolve_reset_between_gates(self):
+        """Test that a reset is applied after the preceding gates."""
+        circ = QuantumCircuit(3)
+        circ.x(0)
+        circ.h(2)
+        circ.cx(0, 1)
+        circ.reset(1)
+        circ.cx(1, 2)
+        circ.x(1)
+        target = Statevector.from_label("+11")
+        self.assertEqual(Statevector(circ), target)
+
     def test_conjugate(self):
         """Test conjugate method."""
         for _ in range(10):
@@ -12,10 +12,13 @@
 
 """Test marginal_memory() function."""
 
+from unittest import mock
+
 import numpy as np
 
+from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
-from qiskit.result import marginal_memory
+from qiskit.result import PackedMemory, QuasiDistribution, marginal_int_memory, marginal_memory
 
 
 class TestMarginalMemory(QiskitTestCase):
@@ -51,6 +54,58 @@ class TestMarginalMemory(QiskitTestCase):
         res = marginal_memory(memory, indices=[0], parallel_threshold=1)
         self.assertEqual(res, [bin(ii % 2)[2:] for ii in range(15)])
 
+    def test_marginalize_int_memory(self):
+        """Test that integer and bit memory marginalizes correctly without strings."""
+        values = np.random.default_rng(7).integers(0, 2**40, size=100, dtype=np.uint64)
+        indices = [0, 1, 2, 9, 33, 34, 5]
+        expected = [
+            sum(((int(value) >> index) & 1) << bit for bit, index in enumerate(indices))
+            for value in values
+        ]
+        packed = PackedMemory.from_ints(values, num_bits=40)
+        for memory in [values, values.tolist(), packed, packed.to_bits()]:
+            res = marginal_int_memory(memory, indices)
+            self.assertEqual(res.dtype, np.uint64)
+            self.assertEqual(res.tolist(), expected)
+
+    def test_marginalize_int_memory_quasi_distribution(self):
+        """Test that marginalized integer memory can be counted into a distribution."""
+        memory = [0b101, 0b001, 0b111, 0b100]
+        outcomes, counts = np.unique(marginal_int_memory(memory, [0, 2]), return_counts=True)
+        dist = QuasiDistribution(dict(zip(outcomes.tolist(), counts / 4)), shots=4)
+        self.assertEqual(dist, {3: 0.5, 1: 0.25, 2: 0.25})
+
+    def test_marginalize_int_memory_over_64_bits(self):
+        """Test that integer memory with more than 64 bits marginalizes correctly."""
+        memory = np.array([2**70 + 3, 5, 2**100], dtype=object)
+        res = marginal_int_memory(memory, [70, 0, 1])
+        self.assertEqual(res.tolist(), [0b111, 0b010, 0])
+        res = marginal_int_memory(memory, list(range(101)))
+        self.assertEqual(res.tolist(), memory.tolist())
+        with self.assertRaises(QiskitError):
+            marginal_int_memory(np.array([1, 2]), [64])
+
+    def test_marginalize_int_memory_in_parallel(self):
+        """Test that integer memory marginalizes correctly multithreaded."""
+        values = np.arange(1000, dtype=np.uint64)
+        with mock.patch(
+            "qiskit.result.packed_memory.local_hardware_info", return_value={"cpus": 4}
+        ):
+            res = marginal_int_memory(values, [3, 0], parallel_threshold=100)
+        self.assertEqual(res.tolist(), [((ii >> 3) & 1) | ((ii & 1) << 1) for ii in range(1000)])
+
+    def test_marginalize_packed_memory_in_parallel(self):
+        """Test that packed memory marginalizes correctly multithreaded."""
+        packed = PackedMemory.from_ints(np.arange(1000, dtype=np.uint64), num_bits=10)
+        with mock.patch(
+            "qiskit.result.packed_memory.local_hardware_info", return_value={"cpus": 4}
+        ), mock.patch.object(
+            PackedMemory, "marginal", autospec=True, side_effect=PackedMemory.marginal
+        ) as marginal:
+            res = marginal_memory(packed, [3, 0], int_return=True, parallel_threshold=100)
+        marginal.assert_called_once_with(packed, [3, 0], parallel_threshold=100)
+        self.assertEqual(res, [((ii >> 3) & 1) | ((ii & 1) << 1) for ii in range(1000)])
+
     def test_error_on_multiple_return_types(self):
         """Test that ValueError raised if multiple return types are requested."""
         with self.assertRaises(ValueError):
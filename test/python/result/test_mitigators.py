@@ -25,6 +25,7 @@ from qiskit.result import (
     CorrelatedReadoutMitigator,
     Counts,
     LocalReadoutMitigator,
+    SubspaceReadoutMitigator,
 )
 from qiskit.result.mitigation.utils import (
     counts_probability_vector,
@@ -66,7 +67,8 @@ class TestReadoutMitigation(QiskitTestCase):
             full_assignment_matrix = np.kron(full_assignment_matrix, m)
         CRM = CorrelatedReadoutMitigator(full_assignment_matrix, qubits)
         LRM = LocalReadoutMitigator(assignment_matrices, qubits)
-        mitigators = [CRM, LRM]
+        SRM = SubspaceReadoutMitigator(assignment_matrices, qubits)
+        mitigators = [CRM, LRM, SRM]
         return mitigators
 
     @staticmethod
@@ -459,5 +461,62 @@ class TestLocalReadoutMitigation(QiskitTestCase):
         self.assertTrue(matrix_equal(expected_assignment_matrix, LRM.assignment_matrix()))
 
 
+class TestSubspaceReadoutMitigation(QiskitTestCase):
+    """Tests specific to the subspace readout mitigator"""
+
+    @staticmethod
+    def assignment_matrices(num_qubits, seed):
+        """Random single-qubit assignment matrices"""
+        rng = np.random.default_rng(seed)
+        errors = rng.uniform(0.005, 0.05, size=(num_qubits, 2))
+        return [np.array([[1 - e0, e1], [e0, 1 - e1]]) for e0, e1 in errors]
+
+    def test_full_subspace(self):
+        """Test that mitigating over all the outcomes matches the local mitigator"""
+        assignment_matrices = self.assignment_matrices(4, seed=1)
+        rng = np.random.default_rng(2)
+        counts = Counts({format(i, "04b"): int(rng.integers(1, 100)) for i in range(16)})
+        LRM = LocalReadoutMitigator(assignment_matrices)
+        SRM = SubspaceReadoutMitigator(assignment_matrices, distance=None)
+        expected = LRM.quasi_probabilities(counts)
+        quasi = SRM.quasi_probabilities(counts)
+        self.assertDictAlmostEqual(quasi, expected, delta=1e-6)
+        for diagonal in [None, "IZ1Z", np.arange(16)]:
+            self.assertAlmostEqual(
+                SRM.expectation_value(counts, diagonal)[0],
+                LRM.expectation_value(counts, diagonal)[0],
+            )
+
+    def test_distance(self):
+        """Test that outcomes beyond the Hamming distance are mitigated independently"""
+        assignment_matrices = self.assignment_matrices(3, seed=3)
+        counts = Counts({"000": 300, "111": 100})
+        SRM = SubspaceReadoutMitigator(assignment_matrices, distance=2)
+        self.assertDictAlmostEqual(SRM.quasi_probabilities(counts), {0: 0.75, 7: 0.25})
+        SRM = SubspaceReadoutMitigator(assignment_matrices, distance=3)
+        self.assertDictAlmostEqual(
+            SRM.quasi_probabilities(counts),
+            SubspaceReadoutMitigator(assignment_matrices, distance=None).quasi_probabilities(
+                counts
+            ),
+        )
+
+    def test_many_qubits(self):
+        """Test the mitigation of the counts of 127 qubits"""
+        num_qubits = 127
+        assignment_matrices = [np.array([[0.98, 0.03], [0.02, 0.97]])] * num_qubits
+        ideal = 2**num_qubits - 1
+        counts = {hex(ideal): 800}
+        for qubit in range(num_qubits):
+            counts[hex(ideal ^ (1 << qubit))] = 20
+        SRM = SubspaceReadoutMitigator(assignment_matrices)
+        quasi = SRM.quasi_probabilities(Counts(counts))
+        self.assertEqual(len(quasi), num_qubits + 1)
+        self.assertAlmostEqual(sum(quasi.values()), 1)
+        self.assertGreater(quasi[ideal], 800 / sum(counts.values()))
+        expval, _ = SRM.expectation_value(Counts(counts), "Z" + "I" * (num_qubits - 1))
+        self.assertLess(expval, -0.9)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test PackedMemory."""
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.result import PackedMemory, marginal_memory
+from qiskit.result import marginal_distribution
+from qiskit.test import QiskitTestCase
+
+
+class TestPackedMemory(QiskitTestCase):
+    """PackedMemory tests."""
+
+    def test_from_hex(self):
+        """Test that hexadecimal memory is packed and formatted."""
+        memory = PackedMemory.from_hex(
+            ["0x1", "0x4", "0x6"], num_bits=3, creg_sizes=[["c0", 1], ["c1", 2]]
+        )
+        self.assertEqual(memory.shots, 3)
+        self.assertEqual(memory.array.dtype, np.uint8)
+        self.assertEqual(memory.array.shape, (3, 1))
+        self.assertEqual(list(memory), ["00 1", "10 0", "11 0"])
+        self.assertEqual(memory[1], "10 0")
+        self.assertEqual(memory.to_hex(), ["0x1", "0x4", "0x6"])
+        np.testing.assert_array_equal(memory.to_ints(), [1, 4, 6])
+
+    def test_round_trips(self):
+        """Test that the constructors and conversions are consistent."""
+        values = [0, 5, 12, 7, 12]
+        memory = PackedMemory.from_ints(values, num_bits=4)
+        self.assertEqual(memory.to_bitstrings(), [format(value, "04b") for value in values])
+        self.assertEqual(PackedMemory.from_bitstrings(memory.to_bitstrings()), memory)
+        self.assertEqual(PackedMemory.from_bits(memory.to_bits()), memory)
+        np.testing.assert_array_equal(memory.to_bits()[:, 2], [False, True, True, True, True])
+        self.assertEqual(memory[1:3], ["0101", "1100"])
+
+    def test_more_than_64_bits(self):
+        """Test outcomes that do not fit in a 64-bit integer."""
+        values = [2**100 + 5, 3, 2**99]
+        memory = PackedMemory.from_ints(values, num_bits=101)
+        self.assertEqual(memory.array.shape, (3, 13))
+        self.assertEqual(memory.to_ints().tolist(), values)
+        self.assertEqual(memory.to_hex(), [hex(value) for value in values])
+        self.assertEqual(memory.marginal([100, 0, 99]).to_bitstrings(), ["011", "010", "100"])
+
+    def test_get_counts(self):
+        """Test the histogram of the outcomes."""
+        rng = np.random.default_rng(1234)
+        values = rng.integers(0, 2**10, size=1000).tolist()
+        memory = PackedMemory.from_ints(values, num_bits=10, creg_sizes=[["c", 10]])
+        counts = memory.get_counts()
+        self.assertEqual(counts.int_outcomes(), {value: values.count(value) for value in values})
+        outcomes, shots = memory.count_arrays()
+        self.assertEqual(outcomes.tolist(), sorted(set(values)))
+        self.assertEqual(shots.sum(), 1000)
+
+    def test_marginal(self):
+        """Test that marginalizing packed memory matches marginalizing strings."""
+        rng = np.random.default_rng(4321)
+        hex_memory = [hex(value) for value in rng.integers(0, 2**20, size=200).tolist()]
+        memory = PackedMemory.from_hex(hex_memory, num_bits=20)
+        indices = [19, 3, 0, 7]
+        expected = [
+            "".join(str((int(value, 16) >> index) & 1) for index in reversed(indices))
+            for value in hex_memory
+        ]
+        self.assertEqual(memory.marginal(indices).to_bitstrings(), expected)
+        self.assertEqual(marginal_memory(memory, indices), expected)
+        self.assertEqual(
+            marginal_memory(memory, indices, int_return=True), [int(bits, 2) for bits in expected]
+        )
+        self.assertEqual(
+            marginal_memory(memory, indices, hex_return=True),
+            [hex(int(bits, 2)) for bits in expected],
+        )
+        self.assertEqual(
+            memory.marginal(indices).get_counts(),
+            marginal_distribution(memory.get_counts(), indices),
+        )
+
+    def test_invalid(self):
+        """Test invalid shapes and indices."""
+        with self.assertRaises(QiskitError):
+            PackedMemory(np.zeros((3, 2), dtype=np.uint8), num_bits=3)
+        with self.assertRaises(QiskitError):
+            PackedMemory.from_ints([1, 2], num_bits=2).marginal([2])
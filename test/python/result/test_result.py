@@ -476,6 +476,24 @@ class TestResultOperations(QiskitTestCase):
 
         self.assertEqual(result.get_memory(0), no_header_processed_memory)
 
+    def test_packed_memory_header(self):
+        """Test that packed memory is formatted with the header."""
+        raw_memory = ["0x0", "0x0", "0x2", "0x2", "0x2", "0x2", "0xb"]
+        data = models.ExperimentResultData(memory=raw_memory)
+        exp_result_header = QobjExperimentHeader(
+            creg_sizes=[["c0", 2], ["c0", 1], ["c1", 1]], memory_slots=4
+        )
+        exp_result = models.ExperimentResult(
+            shots=14, success=True, meas_level=2, memory=True, data=data, header=exp_result_header
+        )
+        result = Result(results=[exp_result], **self.base_result_args)
+        memory = result.get_packed_memory(0)
+
+        self.assertEqual(memory.array.shape, (7, 1))
+        self.assertEqual(memory, result.get_memory(0))
+        self.assertEqual(memory.to_hex(), raw_memory)
+        self.assertEqual(memory.get_counts(), {"0 0 00": 2, "0 0 10": 4, "1 0 11": 1})
+
     def test_meas_level_1_avg(self):
         """Test measurement level 1 average result."""
         # 3 qubits
@@ -15,9 +15,11 @@
 import os
 import unittest
 import ply
+import ply.yacc
 import ddt
 
-from qiskit.qasm import Qasm, QasmError
+from qiskit.qasm import Qasm, QasmError, _parsetab
+from qiskit.qasm.qasmparser import QasmParser
 from qiskit.qasm.node.node import Node
 from qiskit.test import QiskitTestCase
 
@@ -115,6 +117,15 @@ class TestParser(QiskitTestCase):
         res_if = qasm_if.parse()
         inspect(res_if)
 
+    def test_shipped_parse_tables(self):
+        """Test that the shipped parse tables are those of the grammar."""
+        qasm_parser = QasmParser(None)
+        parser_info = ply.yacc.ParserReflect(
+            {name: getattr(qasm_parser, name) for name in dir(qasm_parser)}
+        )
+        parser_info.get_all()
+        self.assertEqual(parser_info.signature(), _parsetab._lr_signature)
+
     def test_generate_tokens(self):
         """Test whether we get only valid tokens."""
         qasm = Qasm(self.qasm_file_path)
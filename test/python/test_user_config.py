@@ -120,6 +120,19 @@ class TestUserConfig(QiskitTestCase):
             config.read_config_file()
             self.assertEqual({"parallel_enabled": False}, config.settings)
 
+    def test_valid_persistent_pool(self):
+        test_config = """
+        [default]
+        persistent_pool = true
+        """
+        self.addCleanup(os.remove, self.file_path)
+        with open(self.file_path, "w") as file:
+            file.write(test_config)
+            file.flush()
+            config = user_config.UserConfig(self.file_path)
+            config.read_config_file()
+            self.assertEqual({"persistent_pool": True}, config.settings)
+
     def test_all_options_valid(self):
         test_config = """
         [default]
@@ -16,10 +16,20 @@ import time
 
 from unittest.mock import patch
 
-from qiskit.tools.parallel import get_platform_parallel_default, parallel_map
+from qiskit.tools.parallel import (
+    get_platform_parallel_default,
+    parallel_map,
+    parallel_imap,
+    get_worker_pool,
+    WorkerPool,
+)
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.exceptions import QiskitError
 from qiskit.pulse import Schedule
 from qiskit.test import QiskitTestCase
+from qiskit.tools.events.pubsub import Subscriber
+from qiskit.transpiler import PassManager
+from qiskit.transpiler.passes import Unroller
 
 
 def _parfunc(x):
@@ -39,6 +49,21 @@ def _build_simple_schedule(_):
     return Schedule()
 
 
+def _get_pid(_):
+    time.sleep(0.1)
+    return os.getpid()
+
+
+def _square(x):
+    return x * x
+
+
+def _sleep_reverse(x):
+    """Later values finish first."""
+    time.sleep(0.1 * (4 - x))
+    return x
+
+
 class TestGetPlatformParallelDefault(QiskitTestCase):
     """Tests get_parallel_default_for_platform."""
 
@@ -92,3 +117,121 @@ class TestParallel(QiskitTestCase):
         out_schedules = parallel_map(_build_simple_schedule, list(range(10)))
         names = [schedule.name for schedule in out_schedules]
         self.assertEqual(len(names), len(set(names)))
+
+
+class TestParallelImap(QiskitTestCase):
+    """Tests for the streaming parallel_imap."""
+
+    def test_ordered(self):
+        """Test results come back in submission order."""
+        out = list(parallel_imap(_square, list(range(100)), chunksize=7))
+        self.assertEqual(out, [x * x for x in range(100)])
+
+    def test_unordered_indices(self):
+        """Test that the unordered results carry their input index."""
+        out = list(parallel_imap(_sleep_reverse, list(range(4)), chunksize=1, ordered=False))
+        self.assertEqual(sorted(out), [(i, i) for i in range(4)])
+        for index, value in out:
+            self.assertEqual(index, value)
+
+    def test_parallel_map_chunksize(self):
+        """Test that the chunk size does not change the result of parallel_map."""
+        for chunksize in (None, 1, 3, 1000):
+            with self.subTest(chunksize=chunksize):
+                out = parallel_map(_square, list(range(50)), chunksize=chunksize)
+                self.assertEqual(out, [x * x for x in range(50)])
+
+    def test_events(self):
+        """Test that the progress events are still published."""
+        events = {"start": [], "done": [], "finish": 0}
+
+        def _start(num):
+            events["start"].append(num)
+
+        def _done(num):
+            events["done"].append(num)
+
+        def _finish():
+            events["finish"] += 1
+
+        subscriber = Subscriber()
+        subscriber.subscribe("terra.parallel.start", _start)
+        subscriber.subscribe("terra.parallel.done", _done)
+        subscriber.subscribe("terra.parallel.finish", _finish)
+        self.addCleanup(subscriber.clear)
+        list(parallel_imap(_square, list(range(20)), chunksize=5))
+        self.assertEqual(events["start"], [20])
+        self.assertEqual(events["done"][-1], 20)
+        self.assertEqual(events["done"], sorted(events["done"]))
+        self.assertEqual(events["finish"], 1)
+
+    def test_early_close_resets_flag(self):
+        """Test that closing the iterator early leaves parallel_map usable."""
+        iterator = parallel_imap(_square, list(range(20)), chunksize=2)
+        self.assertEqual(next(iterator), 0)
+        iterator.close()
+        self.assertEqual(os.getenv("QISKIT_IN_PARALLEL"), "FALSE")
+
+
+class TestWorkerPool(QiskitTestCase):
+    """Tests for the persistent WorkerPool."""
+
+    def test_pool_context(self):
+        """Test that the pool is active only inside its context."""
+        self.assertIsNone(get_worker_pool())
+        with WorkerPool(2) as pool:
+            self.assertIs(get_worker_pool(), pool)
+            with WorkerPool(2) as inner:
+                self.assertIs(get_worker_pool(), inner)
+            self.assertIs(get_worker_pool(), pool)
+        self.assertIsNone(get_worker_pool())
+        self.assertFalse(pool.running)
+
+    def test_parallel_map_reuses_workers(self):
+        """Test that the worker processes survive between calls to parallel_map."""
+        with WorkerPool(2) as pool:
+            first = set(parallel_map(_get_pid, list(range(4))))
+            self.assertTrue(pool.running)
+            second = set(parallel_map(_get_pid, list(range(4))))
+        self.assertNotIn(os.getpid(), first)
+        self.assertTrue(second <= first)
+        self.assertEqual(os.getenv("QISKIT_IN_PARALLEL"), "FALSE")
+
+    def test_pool_map_values(self):
+        """Test that results come back in order."""
+        with WorkerPool(2) as pool:
+            out = parallel_map(_build_simple_circuit, list(range(10)))
+            self.assertEqual(pool.map(abs, [-1, -2, 3]), [1, 2, 3])
+        self.assertEqual(len(out), 10)
+
+    def test_pool_restarts_after_shutdown(self):
+        """Test that a shut down pool starts new workers when it is used again."""
+        pool = WorkerPool(2)
+        self.addCleanup(pool.shutdown)
+        self.assertEqual(pool.map(_parfunc, [1, 2]), [1, 2])
+        pool.shutdown()
+        self.assertFalse(pool.running)
+        self.assertEqual(pool.map(abs, [-3]), [3])
+        self.assertTrue(pool.running)
+
+    def test_passmanager_run_in_pool(self):
+        """Test running several circuits through a pass manager in a pool."""
+        circuits = []
+        for i in range(4):
+            circuit = QuantumCircuit(2)
+            circuit.h(0)
+            circuit.cx(0, 1)
+            circuit.rz(0.1 * i, 1)
+            circuits.append(circuit)
+        pass_manager = PassManager(Unroller(["u", "cx"]))
+        expected = [pass_manager.run(circuit) for circuit in circuits]
+        with WorkerPool(2):
+            first = pass_manager.run(circuits)
+            second = pass_manager.run(circuits)
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+
+    def test_invalid_num_processes(self):
+        """Test that a pool needs at least one process."""
+        with self.assertRaises(QiskitError):
+            WorkerPool(0)
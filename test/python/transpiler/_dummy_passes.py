@@ -27,6 +27,9 @@ class DummyTP(TransformationPass):
 
     def run(self, dag):
         logging.getLogger(logger).info("run transformation pass %s", self.name())
+        # Stand in for a real transformation, so that the pass manager sees a modified DAG and
+        # invalidates the analysis passes that are not preserved.
+        dag.global_phase += 0
         return dag
 
 
@@ -245,3 +248,15 @@ class PassN_AP_NR_NP(DummyAP):
         logging.getLogger(logger).info("property %s deleted", self.to_delete)
         self.property_set[self.to_none] = None
         logging.getLogger(logger).info("property %s noned", self.to_none)
+
+
+class PassO_TP_no_change(TransformationPass):
+    """A dummy transformation pass that leaves the DAG untouched.
+    TP: Transformation Pass
+    NR: No Requires
+    NP: No Preserves
+    """
+
+    def run(self, dag):
+        logging.getLogger(logger).info("run transformation pass %s", self.name())
+        return dag
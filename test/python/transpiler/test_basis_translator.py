@@ -13,7 +13,10 @@
 
 """Test the BasisTranslator pass"""
 
+import contextlib
 import os
+import pickle
+from unittest import mock
 
 from numpy import pi
 
@@ -39,6 +42,7 @@ from qiskit.quantum_info import Operator
 from qiskit.transpiler.target import Target, InstructionProperties
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.passes.basis import BasisTranslator, UnrollCustomDefinitions
+from qiskit.transpiler.passes.basis import basis_translator
 
 
 from qiskit.circuit.library.standard_gates.equivalence_library import (
@@ -454,6 +458,144 @@ class TestBasisTranslator(QiskitTestCase):
         self.assertEqual(dag_translated, dag_expected)
 
 
+class TestBasisSearchCache(QiskitTestCase):
+    """Test the reuse of the basis searches and of the translation rules across runs."""
+
+    def setUp(self):
+        super().setUp()
+        basis_translator._basis_search_cache.clear()
+        basis_translator._compose_transforms_cache.clear()
+        basis_translator._search_graph_cache.clear()
+        self.eq_lib = EquivalenceLibrary()
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi), [0])
+        self.eq_lib.add_equivalence(OneQubitZeroParamGate(), equiv)
+        self.circuit = QuantumCircuit(1)
+        self.circuit.append(OneQubitZeroParamGate(), [0])
+
+    def _translate(self, eq_lib):
+        """Translate the circuit, and return the result and the number of basis searches."""
+        with mock.patch.object(
+            basis_translator, "_basis_search", wraps=basis_translator._basis_search
+        ) as search:
+            dag = BasisTranslator(eq_lib, ["1q1p"]).run(circuit_to_dag(self.circuit))
+        return dag_to_circuit(dag), search.call_count
+
+    def test_search_reused(self):
+        """Test that the basis search is only done once for the same bases."""
+        expected = QuantumCircuit(1)
+        expected.append(OneQubitOneParamGate(pi), [0])
+        self.assertEqual(self._translate(self.eq_lib), (expected, 1))
+        self.assertEqual(self._translate(self.eq_lib), (expected, 0))
+        self.assertEqual(self._translate(pickle.loads(pickle.dumps(self.eq_lib))), (expected, 0))
+
+    def test_new_equivalence(self):
+        """Test that the basis search is done again after the library is changed."""
+        self._translate(self.eq_lib)
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi / 2), [0])
+        self.eq_lib.set_entry(OneQubitZeroParamGate(), [equiv])
+        expected = QuantumCircuit(1)
+        expected.append(OneQubitOneParamGate(pi / 2), [0])
+        self.assertEqual(self._translate(self.eq_lib), (expected, 1))
+
+    def test_new_base_equivalence(self):
+        """Test that the basis search is done again after the base library is changed."""
+        eq_lib = EquivalenceLibrary(base=self.eq_lib)
+        self._translate(eq_lib)
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi / 2), [0])
+        self.eq_lib.set_entry(OneQubitZeroParamGate(), [equiv])
+        expected = QuantumCircuit(1)
+        expected.append(OneQubitOneParamGate(pi / 2), [0])
+        self.assertEqual(self._translate(eq_lib), (expected, 1))
+
+    def test_search_graph_reused(self):
+        """Test that the graph of the library is built once for searches to different bases."""
+        circuit = QuantumCircuit(1)
+        circuit.h(0)
+        BasisTranslator(std_eqlib, ["rz", "sx", "cx"]).run(circuit_to_dag(circuit))
+        BasisTranslator(std_eqlib, ["u", "cx"]).run(circuit_to_dag(circuit))
+        self.assertEqual(len(basis_translator._search_graph_cache), 1)
+
+    def test_numeric_binding(self):
+        """Test that the translations of gates with numeric parameters are bound without
+        assigning the parameters of a circuit."""
+        circuit = QuantumCircuit(2)
+        circuit.rx(0.3, 0)
+        circuit.u(0.1, 0.2, 0.3, 1)
+        circuit.crz(0.4, 0, 1)
+        circuit.rx(0.5, 1)
+        pass_ = BasisTranslator(std_eqlib, ["rz", "sx", "cx"])
+        with mock.patch.object(basis_translator._TranslationRule, "_assign") as assign:
+            translated = dag_to_circuit(pass_.run(circuit_to_dag(circuit)))
+            # The operations of the rules are not modified by the binding.
+            translated_again = dag_to_circuit(pass_.run(circuit_to_dag(circuit)))
+        assign.assert_not_called()
+        self.assertEqual(translated.parameters, set())
+        self.assertEqual(Operator(translated), Operator(circuit))
+        self.assertEqual(Operator(translated_again), Operator(circuit))
+
+    def test_symbolic_binding(self):
+        """Test that the translations of gates with unbound parameters keep their parameters."""
+        theta = Parameter("theta")
+        circuit = QuantumCircuit(1)
+        circuit.rx(0.3, 0)
+        circuit.rx(2 * theta, 0)
+        translated = dag_to_circuit(
+            BasisTranslator(std_eqlib, ["rz", "sx"]).run(circuit_to_dag(circuit))
+        )
+        self.assertEqual(translated.parameters, {theta})
+        self.assertEqual(
+            Operator(translated.assign_parameters({theta: 0.7})),
+            Operator(circuit.assign_parameters({theta: 0.7})),
+        )
+
+    def test_binding_fallback(self):
+        """Test that rules whose expressions can't be compiled or evaluated numerically are
+        translated by assigning their parameters."""
+        theta = Parameter("theta")
+        eq_lib = EquivalenceLibrary()
+        equiv = QuantumCircuit(1)
+        equiv.rz(theta.conjugate(), 0)
+        eq_lib.add_equivalence(OneQubitOneParamGate(theta), equiv)
+        circuit = QuantumCircuit(1)
+        circuit.append(OneQubitOneParamGate(0.3), [0])
+        expected = QuantumCircuit(1)
+        expected.rz(0.3, 0)
+
+        def failing_evaluate(_):
+            raise RuntimeError("Not Implemented")
+
+        for name, patch in [
+            ("compiled", contextlib.nullcontext()),
+            (
+                "compile fails",
+                mock.patch.object(
+                    basis_translator, "_vectorize", side_effect=RuntimeError("Not Implemented")
+                ),
+            ),
+            (
+                "evaluation fails",
+                mock.patch.object(basis_translator, "_vectorize", return_value=failing_evaluate),
+            ),
+        ]:
+            with self.subTest(name):
+                basis_translator._compose_transforms_cache.clear()
+                with patch:
+                    dag = BasisTranslator(eq_lib, ["rz"]).run(circuit_to_dag(circuit))
+                self.assertEqual(dag_to_circuit(dag), expected)
+
+    def test_outputs_do_not_share_operations(self):
+        """Test that modifying a translated circuit doesn't modify the later translations."""
+        circuit = QuantumCircuit(1)
+        circuit.h(0)
+        translated = transpile(circuit, basis_gates=["rz", "sx", "x", "cx"])
+        translated.data[0].operation.params[0] = 0.3
+        translated_again = transpile(circuit, basis_gates=["rz", "sx", "x", "cx"])
+        self.assertTrue(Operator(translated_again).equiv(Operator(circuit)))
+
+
 class TestUnrollerCompatability(QiskitTestCase):
     """Tests backward compatability with the Unroller pass.
 
@@ -609,6 +609,38 @@ class TestHoareOptimizer(QiskitTestCase):
 
         self.assertEqual(result, circuit_to_dag(expected))
 
+    def test_control_removal_node_in_dag(self):
+        """The base gate that replaces a controlled gate should be tracked with its node in the
+        DAG, so that it can be removed as part of an identity sequence."""
+
+        #      ┌───┐
+        # q_0: ┤ X ├──■───────
+        #      └───┘┌─┴─┐┌───┐
+        # q_1: ─────┤ X ├┤ X ├
+        #           └───┘└───┘
+        circuit = QuantumCircuit(2)
+        circuit.x(0)
+        circuit.cx(0, 1)
+        circuit.x(1)
+
+        #      ┌───┐
+        # q_0: ┤ X ├
+        #      └───┘
+        # q_1: ─────
+        expected = QuantumCircuit(2)
+        expected.x(0)
+
+        stv = Statevector.from_label("0" * circuit.num_qubits)
+        self.assertEqual(stv & circuit, stv & expected)
+
+        dag = circuit_to_dag(circuit)
+        modification_count = dag._modification_count
+        pass_ = HoareOptimizer(size=5)
+        result = pass_.run(dag)
+
+        self.assertEqual(result, circuit_to_dag(expected))
+        self.assertNotEqual(result._modification_count, modification_count)
+
     def test_is_identity(self):
         """The is_identity function determines whether a pair of gates
         forms the identity, when ignoring control qubits.
@@ -13,6 +13,7 @@
 """Test the optimize-1q-gate pass"""
 
 import unittest
+from unittest.mock import patch
 
 import ddt
 import numpy as np
@@ -27,6 +28,7 @@ from qiskit.transpiler.passes import Optimize1qGatesDecomposition
 from qiskit.transpiler.passes import BasisTranslator
 from qiskit.circuit.equivalence_library import SessionEquivalenceLibrary as sel
 from qiskit.quantum_info import Operator
+from qiskit.quantum_info.synthesis.one_qubit_decompose import _OneQubitGateSequence
 from qiskit.test import QiskitTestCase
 from qiskit.circuit import Parameter
 
@@ -542,6 +544,42 @@ class TestOptimize1qGatesDecomposition(QiskitTestCase):
         msg = f"expected:\n{expected}\nresult:\n{result}"
         self.assertEqual(expected, result, msg=msg)
 
+    def test_runs_of_different_lengths(self):
+        """Test the resynthesis of runs of different lengths on the same circuit."""
+        qc = QuantumCircuit(3)
+        for i in range(12):
+            qc.rz(0.1 * (i + 1), 0)
+            qc.sx(0)
+            if i < 5:
+                qc.h(1)
+                qc.t(1)
+        qc.cx(0, 2)
+        qc.sx(2)
+        qc.cx(1, 2)
+        for i in range(3):
+            qc.ry(0.2 * i + 0.1, 2)
+        basis = ["rz", "sx", "x", "cx"]
+        result = Optimize1qGatesDecomposition(basis)(qc)
+        self.assertEqual(Operator(qc), Operator(result))
+        self.assertLessEqual(result.size(), 3 * 5 + 2)
+        self.assertEqual(result.count_ops()["cx"], 2)
+
+    def test_candidates_are_not_circuits(self):
+        """Test that no circuit is built for the candidate decompositions of the runs."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.t(0)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.u(0.1, 0.2, 0.3, 1)
+        qc.s(1)
+        basis = ["u", "p", "sx", "rz", "cx"]
+        with patch.object(_OneQubitGateSequence, "to_circuit") as to_circuit:
+            result = Optimize1qGatesDecomposition(basis)(qc)
+        to_circuit.assert_not_called()
+        self.assertEqual(Operator(qc), Operator(result))
+        self.assertEqual(result.size(), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,143 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the PassProfiler."""
+
+import sys
+import unittest
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.test import QiskitTestCase
+from qiskit.tools.parallel import WorkerPool
+from qiskit.transpiler import PassManager, PassProfiler, PassProfile, CouplingMap
+from qiskit.transpiler.passes import (
+    CommutativeCancellation,
+    Depth,
+    FixedPoint,
+    Optimize1qGates,
+    Size,
+    Unroller,
+)
+
+
+def _circuit(angle):
+    circuit = QuantumCircuit(3)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    circuit.cx(0, 1)
+    circuit.rz(angle, 2)
+    circuit.cx(1, 2)
+    return circuit
+
+
+class TestPassProfiler(QiskitTestCase):
+    """Tests for collecting per-pass statistics."""
+
+    def _loop_pass_manager(self):
+        pass_manager = PassManager(Unroller(["u", "cx"]))
+        pass_manager.append(
+            [Depth(), FixedPoint("depth"), Optimize1qGates(), CommutativeCancellation()],
+            do_while=lambda property_set: not property_set["depth_fixed_point"],
+        )
+        return pass_manager
+
+    def test_single_circuit(self):
+        """Test the statistics of a single circuit run."""
+        pass_manager = PassManager([Unroller(["u", "cx"]), Size()])
+        with PassProfiler(track_memory=False) as profiler:
+            out = pass_manager.run(_circuit(0.1))
+        report = profiler.report
+        self.assertIsInstance(report, PassProfile)
+        self.assertEqual(report.num_circuits, 1)
+        self.assertEqual(list(report.passes), ["Unroller", "Size"])
+        unroller = report.passes["Unroller"]
+        self.assertEqual(unroller.runs, 1)
+        self.assertEqual(unroller.size_before, 5)
+        self.assertEqual(unroller.size_after, out.size())
+        self.assertIsNone(unroller.peak_memory)
+        self.assertGreaterEqual(report.total_time, unroller.total_time)
+
+    def test_loop_iterations(self):
+        """Test that reruns inside a do-while loop are counted."""
+        with PassProfiler(track_memory=False) as profiler:
+            self._loop_pass_manager().run(_circuit(0.1))
+        report = profiler.report
+        self.assertEqual(len(report.loops), 1)
+        loop = next(iter(report.loops.values()))
+        self.assertEqual(loop.runs, 1)
+        self.assertGreaterEqual(loop.iterations, 2)
+        self.assertEqual(report.passes["FixedPoint"].runs, loop.iterations)
+        self.assertIn("FixedPoint", loop.name)
+
+    @unittest.skipIf(sys.version_info < (3, 9), "tracemalloc.reset_peak needs Python 3.9")
+    def test_track_memory(self):
+        """Test that the peak memory is recorded."""
+        with PassProfiler() as profiler:
+            PassManager(Unroller(["u", "cx"])).run(_circuit(0.1))
+        self.assertIsNotNone(profiler.report.passes["Unroller"].peak_memory)
+
+    def test_no_profile_outside_context(self):
+        """Test that nothing is recorded after the context exits."""
+        pass_manager = PassManager(Unroller(["u", "cx"]))
+        with PassProfiler(track_memory=False) as profiler:
+            pass_manager.run(_circuit(0.1))
+        pass_manager.run(_circuit(0.2))
+        self.assertEqual(profiler.report.num_circuits, 1)
+
+    def test_several_circuits_aggregated(self):
+        """Test that parallel pass manager runs are merged into one report."""
+        circuits = [_circuit(0.1 * i) for i in range(4)]
+        with WorkerPool(2):
+            with PassProfiler(track_memory=False) as profiler:
+                self._loop_pass_manager().run(circuits)
+        report = profiler.report
+        self.assertEqual(report.num_circuits, 4)
+        self.assertEqual(report.passes["Unroller"].runs, 4)
+        self.assertEqual(next(iter(report.loops.values())).runs, 4)
+
+    def test_transpile(self):
+        """Test profiling a transpile call, both serially and in parallel."""
+        circuits = [_circuit(0.1 * i) for i in range(4)]
+        kwargs = {
+            "basis_gates": ["u", "cx"],
+            "coupling_map": CouplingMap.from_line(3),
+            "optimization_level": 3,
+            "seed_transpiler": 42,
+        }
+        with PassProfiler(track_memory=False) as serial:
+            transpile(circuits[0], **kwargs)
+        with WorkerPool(2):
+            with PassProfiler(track_memory=False) as parallel:
+                transpile(circuits, **kwargs)
+        self.assertEqual(serial.report.num_circuits, 1)
+        self.assertEqual(parallel.report.num_circuits, 4)
+        self.assertEqual(set(serial.report.passes), set(parallel.report.passes))
+        self.assertIn("UnitarySynthesis", str(parallel.report))
+
+    def test_merge(self):
+        """Test merging two reports."""
+        first = PassProfile()
+        first.record_pass("A", 1.0, 10, 8, 100)
+        first.record_loop("loop", 3)
+        second = PassProfile()
+        second.record_pass("A", 2.0, 8, 8, None)
+        second.record_skip("A")
+        second.record_loop("loop", 5)
+        first.merge(second)
+        stats = first.passes["A"]
+        self.assertEqual((stats.runs, stats.skipped), (2, 1))
+        self.assertEqual(stats.total_time, 3.0)
+        self.assertEqual(stats.max_time, 2.0)
+        self.assertEqual(stats.peak_memory, 100)
+        self.assertEqual((stats.size_before, stats.size_after), (18, 16))
+        loop = first.loops["loop"]
+        self.assertEqual((loop.runs, loop.iterations, loop.max_iterations), (2, 8, 5))
@@ -19,6 +19,7 @@ import sys
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import PassManager, TranspilerError
+from qiskit.transpiler.passes import RemoveBarriers, Size
 from qiskit.transpiler.runningpassmanager import (
     DoWhileController,
     ConditionalController,
@@ -36,6 +37,7 @@ from ._dummy_passes import (
     PassJ_Bad_NoReturn,
     PassK_check_fixed_point_property,
     PassM_AP_NR_NP,
+    PassO_TP_no_change,
 )
 
 
@@ -384,6 +386,56 @@ class TestUseCases(SchedulerTestCase):
             ],
         )
 
+    def test_ap_before_and_after_an_unchanging_tp(self):
+        """A transformation pass that does not change the DAG keeps analysis passes valid."""
+        passmanager = PassManager()
+        passmanager.append(PassE_AP_NR_NP(argument1=1))
+        passmanager.append(PassO_TP_no_change())
+        passmanager.append(PassE_AP_NR_NP(argument1=1))
+        self.assertScheduler(
+            self.circuit,
+            passmanager,
+            [
+                "run analysis pass PassE_AP_NR_NP",
+                "set property as 1",
+                "run transformation pass PassO_TP_no_change",
+            ],
+        )
+
+    def test_fixed_point_with_unchanging_tp(self):
+        """A fixed point is reached when the transformation passes do not change the DAG, even
+        though the analysis the fixed point is checked on is not rerun."""
+        self.passmanager.append(
+            [PassK_check_fixed_point_property(), PassO_TP_no_change()],
+            do_while=lambda property_set: not property_set["property_fixed_point"],
+        )
+        self.assertScheduler(
+            self.circuit,
+            self.passmanager,
+            [
+                "run analysis pass PassG_calculates_dag_property",
+                "set property as 8 (from dag.property)",
+                "run analysis pass PassK_check_fixed_point_property",
+                "run transformation pass PassO_TP_no_change",
+                "run analysis pass PassK_check_fixed_point_property",
+                "run transformation pass PassO_TP_no_change",
+            ],
+        )
+
+    def test_real_passes_rerun_only_after_changes(self):
+        """Analysis passes are rerun after a transformation pass only if it changed the DAG."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        with_barrier = circuit.copy()
+        with_barrier.barrier()
+        passmanager = PassManager([Size(), RemoveBarriers(), Size()])
+
+        for qc, expected in [(circuit, 1), (with_barrier, 2)]:
+            runs = []
+            passmanager.run(qc, callback=lambda pass_, runs=runs, **_: runs.append(pass_.name()))
+            self.assertEqual(runs.count("Size"), expected)
+
     def test_pass_no_return(self):
         """Transformation passes that don't return a DAG raise error."""
         self.passmanager.append(PassJ_Bad_NoReturn())
@@ -13,7 +13,8 @@
 """Tests PassManager.run()"""
 
 from qiskit import QuantumRegister, QuantumCircuit
-from qiskit.circuit.library import CXGate
+from qiskit.circuit.library import CXGate, RZGate
+from qiskit.transpiler import PassManager, TransformationPass
 from qiskit.transpiler.preset_passmanagers import level_1_pass_manager
 from qiskit.test import QiskitTestCase
 from qiskit.providers.fake_provider import FakeMelbourne
@@ -117,3 +118,28 @@ class TestPassManagerRun(QiskitTestCase):
             for instruction in new_circuit.data:
                 if isinstance(instruction.operation, CXGate):
                     self.assertIn([bit_indices[x] for x in instruction.qubits], coupling_map)
+
+    def test_output_operations_not_shared(self):
+        """Test that the instructions of the output circuit don't share their operations, even
+        if a pass put the same operation in several nodes."""
+
+        class SharedRZ(TransformationPass):
+            """Replace every H gate with the same RZ gate."""
+
+            def __init__(self):
+                super().__init__()
+                self.gate = RZGate(0.5)
+
+            def run(self, dag):
+                for node in dag.named_nodes("h"):
+                    dag.substitute_node(node, self.gate, inplace=True)
+                return dag
+
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.h(1)
+        pass_manager = PassManager(SharedRZ())
+        result = pass_manager.run(circuit)
+        result.data[0].operation.params[0] = 0.3
+        self.assertEqual(result.data[1].operation.params, [0.5])
+        self.assertEqual(pass_manager.run(circuit).data[0].operation.params, [0.5])
@@ -725,25 +725,25 @@ class TestFinalLayouts(QiskitTestCase):
         }
 
         sabre_layout = {
-            11: qr[0],
-            17: qr[1],
-            16: qr[2],
-            6: qr[3],
-            18: qr[4],
+            6: qr[0],
+            11: qr[1],
+            10: qr[2],
+            5: qr[3],
+            16: qr[4],
             0: ancilla[0],
             1: ancilla[1],
             2: ancilla[2],
             3: ancilla[3],
             4: ancilla[4],
-            5: ancilla[5],
-            7: ancilla[6],
-            8: ancilla[7],
-            9: ancilla[8],
-            10: ancilla[9],
-            12: ancilla[10],
-            13: ancilla[11],
-            14: ancilla[12],
-            15: ancilla[13],
+            7: ancilla[5],
+            8: ancilla[6],
+            9: ancilla[7],
+            12: ancilla[8],
+            13: ancilla[9],
+            14: ancilla[10],
+            15: ancilla[11],
+            17: ancilla[12],
+            18: ancilla[13],
             19: ancilla[14],
         }
 
@@ -15,8 +15,8 @@
 import unittest
 
 from qiskit import QuantumRegister, QuantumCircuit
-from qiskit.transpiler import CouplingMap
-from qiskit.transpiler.passes import SabreLayout
+from qiskit.transpiler import CouplingMap, TranspilerError
+from qiskit.transpiler.passes import SabreLayout, SabreSwap
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 from qiskit.compiler.transpiler import transpile
@@ -59,11 +59,11 @@ class TestSabreLayout(QiskitTestCase):
         pass_.run(dag)
 
         layout = pass_.property_set["layout"]
-        self.assertEqual(layout[qr[0]], 10)
-        self.assertEqual(layout[qr[1]], 12)
-        self.assertEqual(layout[qr[2]], 7)
-        self.assertEqual(layout[qr[3]], 11)
-        self.assertEqual(layout[qr[4]], 13)
+        self.assertEqual(layout[qr[0]], 13)
+        self.assertEqual(layout[qr[1]], 11)
+        self.assertEqual(layout[qr[2]], 12)
+        self.assertEqual(layout[qr[3]], 10)
+        self.assertEqual(layout[qr[4]], 7)
 
     def test_6q_circuit_20q_coupling(self):
         """Test finds layout for 6q circuit on 20q device."""
@@ -132,12 +132,12 @@ rz(0) q4835[1];
         res = transpile(qc, FakeKolkata(), layout_method="sabre", seed_transpiler=1234)
         self.assertIsInstance(res, QuantumCircuit)
         layout = res._layout
-        self.assertEqual(layout[qc.qubits[0]], 14)
-        self.assertEqual(layout[qc.qubits[1]], 19)
+        self.assertEqual(layout[qc.qubits[0]], 13)
+        self.assertEqual(layout[qc.qubits[1]], 4)
         self.assertEqual(layout[qc.qubits[2]], 7)
-        self.assertEqual(layout[qc.qubits[3]], 13)
+        self.assertEqual(layout[qc.qubits[3]], 12)
         self.assertEqual(layout[qc.qubits[4]], 6)
-        self.assertEqual(layout[qc.qubits[5]], 16)
+        self.assertEqual(layout[qc.qubits[5]], 14)
         self.assertEqual(layout[qc.qubits[6]], 18)
         self.assertEqual(layout[qc.qubits[7]], 26)
 
@@ -193,21 +193,64 @@ barrier q18585[5],q18585[2],q18585[8],q18585[3],q18585[6];
         )
         self.assertIsInstance(res, QuantumCircuit)
         layout = res._layout
-        self.assertEqual(layout[qc.qubits[0]], 19)
+        self.assertEqual(layout[qc.qubits[0]], 11)
         self.assertEqual(layout[qc.qubits[1]], 22)
         self.assertEqual(layout[qc.qubits[2]], 17)
-        self.assertEqual(layout[qc.qubits[3]], 14)
+        self.assertEqual(layout[qc.qubits[3]], 12)
         self.assertEqual(layout[qc.qubits[4]], 18)
         self.assertEqual(layout[qc.qubits[5]], 9)
-        self.assertEqual(layout[qc.qubits[6]], 11)
+        self.assertEqual(layout[qc.qubits[6]], 16)
         self.assertEqual(layout[qc.qubits[7]], 25)
-        self.assertEqual(layout[qc.qubits[8]], 16)
+        self.assertEqual(layout[qc.qubits[8]], 19)
         self.assertEqual(layout[qc.qubits[9]], 3)
-        self.assertEqual(layout[qc.qubits[10]], 12)
-        self.assertEqual(layout[qc.qubits[11]], 13)
+        self.assertEqual(layout[qc.qubits[10]], 14)
+        self.assertEqual(layout[qc.qubits[11]], 15)
         self.assertEqual(layout[qc.qubits[12]], 20)
         self.assertEqual(layout[qc.qubits[13]], 8)
 
+    def test_layout_trials(self):
+        """Test that several initial layouts give a reproducible complete layout."""
+        qr = QuantumRegister(5, "q")
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[2])
+        circuit.cx(qr[1], qr[3])
+        circuit.cx(qr[3], qr[0])
+        circuit.cx(qr[4], qr[2])
+        circuit.cx(qr[1], qr[2])
+        circuit.cx(qr[4], qr[0])
+
+        dag = circuit_to_dag(circuit)
+        layouts = []
+        for _ in range(2):
+            pass_ = SabreLayout(CouplingMap(self.cmap20), seed=0, swap_trials=2, layout_trials=4)
+            pass_.run(dag)
+            layouts.append([pass_.property_set["layout"][qubit] for qubit in qr])
+        self.assertEqual(len(set(layouts[0])), 5)
+        self.assertTrue(all(0 <= physical < 20 for physical in layouts[0]))
+        self.assertEqual(layouts[0], layouts[1])
+
+    def test_custom_routing_pass(self):
+        """Test the layout with a custom routing pass."""
+        qr = QuantumRegister(3, "q")
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.cx(qr[2], qr[0])
+
+        coupling_map = CouplingMap(self.cmap20)
+        pass_ = SabreLayout(
+            coupling_map, routing_pass=SabreSwap(coupling_map, "basic", seed=0, trials=1), seed=0
+        )
+        pass_.run(circuit_to_dag(circuit))
+        layout = pass_.property_set["layout"]
+        self.assertEqual(len({layout[qubit] for qubit in qr}), 3)
+
+    def test_routing_pass_and_layout_trials(self):
+        """Test that a routing pass and layout trials can't be both set."""
+        coupling_map = CouplingMap(self.cmap20)
+        with self.assertRaises(TranspilerError):
+            SabreLayout(coupling_map, routing_pass=SabreSwap(coupling_map), layout_trials=2)
+
 
 if __name__ == "__main__":
     unittest.main()
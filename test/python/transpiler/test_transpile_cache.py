@@ -0,0 +1,177 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the TranspileCache."""
+
+import tempfile
+
+from qiskit import QuantumCircuit, QuantumRegister, transpile
+from qiskit.circuit import Gate, Parameter
+from qiskit.compiler import transpile_iter
+from qiskit.test import QiskitTestCase
+from qiskit.transpiler import CouplingMap, TranspileCache
+
+
+def _circuit(angle=0.1, name=None):
+    circuit = QuantumCircuit(QuantumRegister(3, "q"), name=name)
+    circuit.h(0)
+    circuit.cx(0, 2)
+    circuit.rz(angle, 2)
+    circuit.cx(1, 2)
+    circuit.measure_all()
+    return circuit
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Tests for caching the output of transpile."""
+
+    def setUp(self):
+        super().setUp()
+        self.kwargs = {
+            "coupling_map": CouplingMap.from_line(5),
+            "basis_gates": ["rz", "sx", "cx"],
+            "optimization_level": 1,
+            "seed_transpiler": 42,
+        }
+
+    def test_hit_returns_equal_copy(self):
+        """Test that a repeated circuit is served from the cache."""
+        expected = transpile(_circuit(), **self.kwargs)
+        with TranspileCache() as cache:
+            first = transpile(_circuit(name="first"), **self.kwargs)
+            second_input = _circuit(name="second")
+            second_input.metadata = {"index": 2}
+            second = transpile(second_input, **self.kwargs)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.name, "second")
+        self.assertEqual(second.metadata, {"index": 2})
+        self.assertEqual(second._layout.get_physical_bits(), expected._layout.get_physical_bits())
+        self.assertIsNot(second._layout, first._layout)
+
+    def test_changed_arguments_miss(self):
+        """Test that changing the circuit or the transpile arguments is a miss."""
+        with TranspileCache() as cache:
+            transpile(_circuit(), **self.kwargs)
+            transpile(_circuit(0.2), **self.kwargs)
+            transpile(_circuit(), **{**self.kwargs, "seed_transpiler": 7})
+            transpile(_circuit(), **{**self.kwargs, "optimization_level": 2})
+            transpile(_circuit(), **{**self.kwargs, "basis_gates": ["u", "cx"]})
+            transpile(_circuit(), **{**self.kwargs, "coupling_map": CouplingMap.from_ring(5)})
+        self.assertEqual((cache.hits, cache.misses), (0, 6))
+
+    def test_batch_duplicates_compiled_once(self):
+        """Test that identical circuits in a batch are only compiled once."""
+        circuits = [_circuit(name="a"), _circuit(0.2, name="b"), _circuit(name="c")]
+        with TranspileCache() as cache:
+            outputs = transpile(circuits, **self.kwargs)
+            unordered = dict(transpile_iter(circuits, ordered=False, **self.kwargs))
+        self.assertEqual((cache.hits, cache.misses), (4, 2))
+        self.assertEqual([circuit.name for circuit in outputs], ["a", "b", "c"])
+        self.assertEqual(outputs[0], outputs[2])
+        self.assertEqual([unordered[i] for i in range(3)], outputs)
+
+    def test_parameters_identified_by_uuid(self):
+        """Test that circuits with distinct Parameter objects of the same name are not mixed."""
+        theta = Parameter("θ")
+        with TranspileCache() as cache:
+            first = transpile(_circuit(theta), **self.kwargs)
+            second = transpile(_circuit(theta), **self.kwargs)
+            third = transpile(_circuit(Parameter("θ")), **self.kwargs)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertEqual(first.parameters, second.parameters)
+        self.assertNotEqual(first.parameters, third.parameters)
+
+    def test_custom_gate_definition(self):
+        """Test that custom gates of the same name but different definitions are not mixed."""
+
+        def circuit_with_gate(definition_gate):
+            definition = QuantumCircuit(1)
+            getattr(definition, definition_gate)(0)
+            gate = Gate("custom", 1, [])
+            gate.definition = definition
+            circuit = QuantumCircuit(1)
+            circuit.append(gate, [0])
+            return circuit
+
+        with TranspileCache() as cache:
+            first = transpile(circuit_with_gate("x"), basis_gates=["x", "z"])
+            second = transpile(circuit_with_gate("z"), basis_gates=["x", "z"])
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(first.count_ops(), {"x": 1})
+        self.assertEqual(second.count_ops(), {"z": 1})
+
+    def test_callback_not_cached(self):
+        """Test that circuits transpiled with a callback are always compiled."""
+        calls = []
+        with TranspileCache() as cache:
+            for _ in range(2):
+                transpile(_circuit(), callback=lambda **_: calls.append(1), **self.kwargs)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+        self.assertEqual(len(cache), 0)
+        self.assertGreater(len(calls), 0)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used circuit is evicted."""
+        with TranspileCache(max_size=2) as cache:
+            transpile(_circuit(0.1), **self.kwargs)
+            transpile(_circuit(0.2), **self.kwargs)
+            transpile(_circuit(0.1), **self.kwargs)
+            transpile(_circuit(0.3), **self.kwargs)
+            transpile(_circuit(0.1), **self.kwargs)
+            transpile(_circuit(0.2), **self.kwargs)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_inactive_outside_context(self):
+        """Test that the cache is only used inside its context."""
+        cache = TranspileCache()
+        with cache:
+            transpile(_circuit(), **self.kwargs)
+        transpile(_circuit(), **self.kwargs)
+        with cache:
+            transpile(_circuit(), **self.kwargs)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_disk_store(self):
+        """Test that circuits stored on disk are reused by another cache."""
+        with tempfile.TemporaryDirectory() as directory:
+            with TranspileCache(directory=directory) as cache:
+                expected = transpile(_circuit(), **self.kwargs)
+            with TranspileCache(directory=directory) as cache:
+                circuit = _circuit(name="from_disk")
+                output = transpile(circuit, **self.kwargs)
+            self.assertEqual((cache.hits, cache.misses), (1, 0))
+            self.assertEqual(output, expected)
+            self.assertEqual(output.name, "from_disk")
+            self.assertEqual(
+                output._layout.get_physical_bits(), expected._layout.get_physical_bits()
+            )
+
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+            with TranspileCache(directory=directory) as cache:
+                transpile(_circuit(), **self.kwargs)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_disk_store_max_size(self):
+        """Test that the least recently used files are removed from the disk store."""
+        with tempfile.TemporaryDirectory() as directory:
+            with TranspileCache(directory=directory, max_disk_size=1) as cache:
+                transpile(_circuit(0.1), **self.kwargs)
+                transpile(_circuit(0.2), **self.kwargs)
+            with TranspileCache(directory=directory) as cache:
+                transpile(_circuit(0.1), **self.kwargs)
+                transpile(_circuit(0.2), **self.kwargs)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
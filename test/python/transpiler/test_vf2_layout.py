@@ -18,6 +18,8 @@ import retworkx
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import CouplingMap, Target, TranspilerError
+from qiskit.transpiler.layout import Layout
+from qiskit.transpiler.passes.layout import vf2_utils
 from qiskit.transpiler.passes.layout.vf2_layout import VF2Layout, VF2LayoutStopReason
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
@@ -521,5 +523,107 @@ class TestMultipleTrials(QiskitTestCase):
         self.assertEqual(set(property_set["layout"].get_physical_bits()), {3, 1, 2})
 
 
+class TestScoreLayouts(QiskitTestCase):
+    """Test the batched scoring of the layouts."""
+
+    def setUp(self):
+        super().setUp()
+        backend = FakeManhattan()
+        self.coupling_map = CouplingMap(backend.configuration().coupling_map)
+        qc = QuantumCircuit(4)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.cx(1, 2)
+        qc.cx(1, 2)
+        qc.cx(2, 3)
+        qc.x(3)
+        self.dag = circuit_to_dag(qc)
+        self.avg_error_map = vf2_utils.build_average_error_map(
+            None, backend.properties(), self.coupling_map
+        )
+
+    def _mappings(self, strict_direction):
+        """Return the interaction graph and the VF2 mappings of the circuit."""
+        im_graph, im_graph_node_map, reverse_im_graph_node_map = vf2_utils.build_interaction_graph(
+            self.dag, strict_direction
+        )
+        cm_graph = self.coupling_map.graph
+        if not strict_direction:
+            cm_graph = cm_graph.to_undirected(multigraph=False)
+        mappings = retworkx.vf2_mapping(cm_graph, im_graph, subgraph=True, id_order=False)
+        return im_graph, im_graph_node_map, reverse_im_graph_node_map, mappings
+
+    def test_same_scores(self):
+        """Test that score_layouts gives the same scores as score_layout."""
+        cm_nodes = self.coupling_map.physical_qubits
+        for strict_direction in (True, False):
+            with self.subTest(strict_direction=strict_direction):
+                im_graph, bit_map, reverse_bit_map, mappings = self._mappings(strict_direction)
+                error_arrays = vf2_utils.build_average_error_arrays(
+                    self.avg_error_map, len(cm_nodes), strict_direction
+                )
+                for layouts in vf2_utils.layout_batches(
+                    mappings, cm_nodes, max_trials=100, batch_size=30
+                ):
+                    scores = vf2_utils.score_layouts(error_arrays, layouts, bit_map, im_graph)
+                    for row, score in zip(layouts, scores):
+                        layout = Layout(
+                            {reverse_bit_map[i]: int(physical) for i, physical in enumerate(row)}
+                        )
+                        expected = vf2_utils.score_layout(
+                            self.avg_error_map,
+                            layout,
+                            bit_map,
+                            reverse_bit_map,
+                            im_graph,
+                            strict_direction,
+                        )
+                        self.assertEqual(score, expected)
+
+    def test_layout_batches(self):
+        """Test that the batches hold the layouts of the mappings in order."""
+        cm_nodes = self.coupling_map.physical_qubits
+        _, _, _, mappings = self._mappings(False)
+        batches = list(vf2_utils.layout_batches(mappings, cm_nodes, max_trials=25, batch_size=10))
+        self.assertEqual([len(layouts) for layouts in batches], [10, 10, 5])
+        _, _, _, mappings = self._mappings(False)
+        expected = []
+        for mapping in mappings:
+            row = [None] * 4
+            for cm_i, im_i in mapping.items():
+                row[im_i] = cm_nodes[cm_i]
+            expected.append(row)
+            if len(expected) == 25:
+                break
+        self.assertEqual(numpy.concatenate(batches).tolist(), expected)
+
+    def test_trial_logging(self):
+        """Test that each trial and its score are logged at debug level."""
+        vf2_pass = VF2Layout(
+            self.coupling_map, seed=42, max_trials=25, properties=FakeManhattan().properties()
+        )
+        logger_name = "qiskit.transpiler.passes.layout.vf2_layout"
+        with self.assertLogs(logger_name, level="DEBUG") as log:
+            vf2_pass.run(self.dag)
+        prefix = f"DEBUG:{logger_name}:"
+        for trial in range(1, 26):
+            self.assertIn(f"{prefix}Running trial: {trial}", log.output)
+            score_prefix = f"{prefix}Trial {trial} has score "
+            self.assertTrue(any(line.startswith(score_prefix) for line in log.output))
+        self.assertFalse(any("Scoring trials" in line for line in log.output))
+
+    def test_missing_error_rate(self):
+        """Test that scoring a layout on a qubit without an error rate raises."""
+        im_graph, bit_map, _, mappings = self._mappings(False)
+        del self.avg_error_map[(0,)]
+        error_arrays = vf2_utils.build_average_error_arrays(
+            self.avg_error_map, self.coupling_map.size(), False
+        )
+        layouts = next(vf2_utils.layout_batches(mappings, self.coupling_map.physical_qubits))
+        layouts[0, 0] = 0
+        with self.assertRaises(KeyError):
+            vf2_utils.score_layouts(error_arrays, layouts, bit_map, im_graph)
+
+
 if __name__ == "__main__":
     unittest.main()